@@ -71,9 +71,10 @@ class AIConversationAdmin(admin.ModelAdmin):
     related_policy_link.short_description = "Related Policy"
 
     def messages_display(self, obj):
-        if obj.messages:
+        recent_messages = obj.recent_messages(5)  # Show last 5 messages
+        if recent_messages:
             formatted_messages = []
-            for msg in obj.messages[-5:]:  # Show last 5 messages
+            for msg in recent_messages:
                 role = msg.get("role", "unknown")
                 content = (
                     msg.get("content", "")[:100] + "..."
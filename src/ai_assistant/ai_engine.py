@@ -8,6 +8,7 @@ from django.conf import settings
 from django.utils import timezone
 
 from .cultural_context import BangsomoroCulturalContext
+from .services import semantic_cache
 
 logger = logging.getLogger(__name__)
 
@@ -196,14 +197,38 @@ Current date: {timezone.now().strftime('%Y-%m-%d')}"""
         conversation_type: str = "policy_chat",
         context_data: Optional[Dict] = None,
         conversation_history: Optional[List[Dict]] = None,
+        conversation_summary: Optional[str] = None,
+        cache_scope: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Generate AI response using Gemini 2.5 Flash."""
+        """
+        Generate AI response using Gemini 2.5 Flash.
+
+        ``cache_scope`` (``semantic_cache.scope_for_user``) enables the
+        semantic answer cache when AI_SEMANTIC_CACHE_ENABLED is set. Only
+        pass it for questions that do not depend on earlier turns.
+        """
         start_time = time.time()
 
+        semantic_namespace = None
+        if cache_scope and getattr(settings, "AI_SEMANTIC_CACHE_ENABLED", False):
+            semantic_namespace = semantic_cache.namespace_for(
+                settings.GEMINI_MODEL,
+                conversation_type,
+                json.dumps(context_data or {}, sort_keys=True, default=str),
+                cache_scope,
+            )
+            cached = self._semantic_lookup(prompt, semantic_namespace, conversation_type)
+            if cached is not None:
+                return cached
+
         try:
             # Build conversation context
             full_prompt = self._build_conversation_prompt(
-                prompt, conversation_type, context_data, conversation_history
+                prompt,
+                conversation_type,
+                context_data,
+                conversation_history,
+                conversation_summary,
             )
 
             # Generate response using Gemini
@@ -233,6 +258,8 @@ Current date: {timezone.now().strftime('%Y-%m-%d')}"""
                 )
 
             logger.info(f"Gemini AI response generated in {response_time:.2f}s")
+            if semantic_namespace is not None:
+                self._semantic_store(prompt, semantic_namespace, result)
             return result
 
         except Exception as e:
@@ -246,12 +273,59 @@ Current date: {timezone.now().strftime('%Y-%m-%d')}"""
                 "timestamp": timezone.now().isoformat(),
             }
 
+    def _semantic_lookup(
+        self, prompt: str, namespace: str, conversation_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return a response reusing the answer to a similar question."""
+        start_time = time.time()
+        try:
+            hit = semantic_cache.get_semantic_cache().lookup(prompt, namespace)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+        if hit is None:
+            return None
+
+        logger.info(
+            f"Semantic cache hit (similarity {hit['similarity']:.3f}), "
+            f"saved ~{hit['saved_seconds']:.2f}s"
+        )
+        result = {
+            "success": True,
+            "response": hit["answer"]["response"],
+            "model_used": "gemini-2.5-flash",
+            "response_time": time.time() - start_time,
+            "timestamp": timezone.now().isoformat(),
+            "conversation_type": conversation_type,
+            "metadata": {"cached": True, "semantic_similarity": hit["similarity"]},
+        }
+        if "insights" in hit["answer"]:
+            result["insights"] = hit["answer"]["insights"]
+        return result
+
+    def _semantic_store(self, prompt: str, namespace: str, result: Dict[str, Any]) -> None:
+        """Remember a generated response for similar future questions."""
+        answer = {"response": result["response"]}
+        if "insights" in result:
+            answer["insights"] = result["insights"]
+        try:
+            semantic_cache.get_semantic_cache().store(
+                prompt,
+                answer,
+                namespace=namespace,
+                response_time=result["response_time"],
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
+
     def _build_conversation_prompt(
         self,
         prompt: str,
         conversation_type: str,
         context_data: Optional[Dict] = None,
         conversation_history: Optional[List[Dict]] = None,
+        conversation_summary: Optional[str] = None,
     ) -> str:
         """Build the full conversation prompt with system context."""
 
@@ -274,10 +348,14 @@ Current date: {timezone.now().strftime('%Y-%m-%d')}"""
                 communities = context_data["communities"]
                 full_prompt += f"Related Communities: {', '.join(communities)}\n"
 
+        # Add summary of earlier turns if the conversation is long
+        if conversation_summary:
+            full_prompt += f"\n\nEarlier in this conversation:\n{conversation_summary}\n"
+
         # Add conversation history if provided
         if conversation_history:
             full_prompt += "\n\nConversation History:\n"
-            for msg in conversation_history[-5:]:  # Last 5 messages for context
+            for msg in conversation_history:
                 role = msg.get("role", "user")
                 content = msg.get("content", "")
                 full_prompt += f"{role.title()}: {content}\n"
@@ -0,0 +1,101 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:57
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.utils.dateparse import parse_datetime
+
+
+def copy_messages_to_turns(apps, schema_editor):
+    AIConversation = apps.get_model("ai_assistant", "AIConversation")
+    AIConversationMessage = apps.get_model("ai_assistant", "AIConversationMessage")
+
+    for conversation in AIConversation.objects.exclude(messages=[]).iterator():
+        turns = []
+        for sequence, message in enumerate(conversation.messages or [], start=1):
+            created_at = parse_datetime(message.get("timestamp") or "")
+            turns.append(
+                AIConversationMessage(
+                    conversation_id=conversation.pk,
+                    sequence=sequence,
+                    role=message.get("role", "user"),
+                    content=message.get("content", ""),
+                    metadata=message.get("metadata") or {},
+                    created_at=created_at or conversation.updated_at,
+                )
+            )
+        AIConversationMessage.objects.bulk_create(turns, batch_size=500)
+        AIConversation.objects.filter(pk=conversation.pk).update(
+            message_total=len(turns),
+            last_message_at=turns[-1].created_at if turns else None,
+        )
+
+
+def copy_turns_to_messages(apps, schema_editor):
+    AIConversation = apps.get_model("ai_assistant", "AIConversation")
+    AIConversationMessage = apps.get_model("ai_assistant", "AIConversationMessage")
+
+    for conversation in AIConversation.objects.filter(message_total__gt=0).iterator():
+        conversation.messages = [
+            {
+                "role": turn.role,
+                "content": turn.content,
+                "timestamp": turn.created_at.isoformat(),
+                "metadata": turn.metadata,
+            }
+            for turn in AIConversationMessage.objects.filter(
+                conversation_id=conversation.pk
+            ).order_by("sequence")
+        ]
+        conversation.save(update_fields=["messages"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_assistant', '0002_aioperation_documentembedding'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aiconversation',
+            name='last_message_at',
+            field=models.DateTimeField(blank=True, help_text='When the latest message was added', null=True),
+        ),
+        migrations.AddField(
+            model_name='aiconversation',
+            name='message_total',
+            field=models.PositiveIntegerField(default=0, help_text='Number of messages in this conversation'),
+        ),
+        migrations.AddField(
+            model_name='aiconversation',
+            name='summary',
+            field=models.TextField(blank=True, help_text='Compact rolling summary of turns older than the context window'),
+        ),
+        migrations.AddField(
+            model_name='aiconversation',
+            name='summary_through',
+            field=models.PositiveIntegerField(default=0, help_text='Sequence number of the last turn folded into the summary'),
+        ),
+        migrations.CreateModel(
+            name='AIConversationMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sequence', models.PositiveIntegerField(help_text='Position of the message within the conversation (1-based)')),
+                ('role', models.CharField(choices=[('user', 'User'), ('assistant', 'Assistant')], max_length=20)),
+                ('content', models.TextField()),
+                ('metadata', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('conversation', models.ForeignKey(help_text='Conversation this message belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='turns', to='ai_assistant.aiconversation')),
+            ],
+            options={
+                'ordering': ['conversation', 'sequence'],
+                'constraints': [models.UniqueConstraint(fields=('conversation', 'sequence'), name='ai_conversation_message_sequence_unique')],
+            },
+        ),
+        migrations.RunPython(copy_messages_to_turns, copy_turns_to_messages),
+        migrations.RemoveField(
+            model_name='aiconversation',
+            name='messages',
+        ),
+    ]
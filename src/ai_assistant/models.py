@@ -5,7 +5,7 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from recommendations.policy_tracking.models import PolicyRecommendation
@@ -25,6 +25,12 @@ class AIConversation(models.Model):
         ("cultural_guidance", "Cultural Guidance"),
     ]
 
+    # Unsummarized turns are passed verbatim to the model. Once more than
+    # twice this many pile up, all but the last CONTEXT_TURNS are summarized.
+    CONTEXT_TURNS = 10
+    SUMMARY_MAX_CHARS = 2000
+    SUMMARY_LINE_CHARS = 200
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     user = models.ForeignKey(
@@ -57,9 +63,22 @@ class AIConversation(models.Model):
         help_text="Policy recommendation this conversation relates to",
     )
 
-    # Conversation metadata
-    messages = models.JSONField(
-        default=list, help_text="Array of conversation messages with roles and content"
+    # Conversation metadata (turns live in AIConversationMessage)
+    message_total = models.PositiveIntegerField(
+        default=0, help_text="Number of messages in this conversation"
+    )
+
+    last_message_at = models.DateTimeField(
+        null=True, blank=True, help_text="When the latest message was added"
+    )
+
+    summary = models.TextField(
+        blank=True,
+        help_text="Compact rolling summary of turns older than the context window",
+    )
+
+    summary_through = models.PositiveIntegerField(
+        default=0, help_text="Sequence number of the last turn folded into the summary"
     )
 
     context_data = models.JSONField(
@@ -94,29 +113,148 @@ class AIConversation(models.Model):
         return self.title or f"{self.conversation_type} - {date_str}"
 
     def add_message(self, role, content, metadata=None):
-        """Add a message to the conversation."""
-        message = {
-            "role": role,  # 'user' or 'assistant'
-            "content": content,
-            "timestamp": timezone.now().isoformat(),
-            "metadata": metadata or {},
-        }
-        self.messages.append(message)
-        self.save(update_fields=["messages", "updated_at"])
+        """
+        Append a message to the conversation.
+
+        Each turn is its own AIConversationMessage row, so adding one costs
+        the same regardless of conversation length. Turns that fall out of
+        the context window are folded into ``summary`` in batches.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            # Lock the row and refresh the counters this instance may hold
+            # stale copies of (another request may have added turns)
+            total, self.summary_through, self.summary = (
+                AIConversation.objects.select_for_update()
+                .values_list("message_total", "summary_through", "summary")
+                .get(pk=self.pk)
+            )
+            message = AIConversationMessage.objects.create(
+                conversation=self,
+                sequence=total + 1,
+                role=role,  # 'user' or 'assistant'
+                content=content,
+                metadata=metadata or {},
+                created_at=now,
+            )
+            AIConversation.objects.filter(pk=self.pk).update(
+                message_total=message.sequence, last_message_at=now, updated_at=now
+            )
+            self.message_total = message.sequence
+            self.last_message_at = now
+            self.updated_at = now
+
+            if self.message_total - self.summary_through > 2 * self.CONTEXT_TURNS:
+                self._fold_into_summary()
+
+        return message
+
+    def recent_messages(self, limit=None):
+        """
+        Messages not yet folded into ``summary``, oldest first.
+
+        With ``limit``, the last ``limit`` messages instead.
+        """
+        turns = self.turns.order_by("-sequence")
+        if limit is None:
+            turns = turns.filter(sequence__gt=self.summary_through)
+        else:
+            turns = turns[:limit]
+        return [turn.as_dict() for turn in reversed(list(turns))]
+
+    def _fold_into_summary(self):
+        """Fold turns older than the context window into ``summary``."""
+        fold_through = self.message_total - self.CONTEXT_TURNS
+        turns = self.turns.filter(
+            sequence__gt=self.summary_through, sequence__lte=fold_through
+        ).order_by("sequence")
+
+        lines = [self.summary] if self.summary else []
+        for turn in turns:
+            content = " ".join(turn.content.split())
+            if len(content) > self.SUMMARY_LINE_CHARS:
+                content = content[: self.SUMMARY_LINE_CHARS - 3] + "..."
+            lines.append(f"{turn.role.title()}: {content}")
+
+        summary = "\n".join(lines)
+        if len(summary) > self.SUMMARY_MAX_CHARS:
+            # Keep the most recent lines that fit
+            summary = summary[-self.SUMMARY_MAX_CHARS :]
+            summary = summary[summary.find("\n") + 1 :]
+
+        self.summary = summary
+        self.summary_through = fold_through
+        AIConversation.objects.filter(pk=self.pk).update(
+            summary=summary, summary_through=fold_through
+        )
+
+    @property
+    def messages(self):
+        """All messages, oldest first (reads every turn; prefer recent_messages)."""
+        return [turn.as_dict() for turn in self.turns.order_by("sequence")]
 
     @property
     def message_count(self):
         """Get the number of messages in this conversation."""
-        return len(self.messages)
+        return self.message_total
 
     @property
     def last_message_time(self):
         """Get the timestamp of the last message."""
-        if self.messages:
-            return self.messages[-1].get("timestamp")
+        if self.last_message_at:
+            return self.last_message_at.isoformat()
         return None
 
 
+class AIConversationMessage(models.Model):
+    """A single turn of an AI assistant conversation (append-only)."""
+
+    ROLE_CHOICES = [
+        ("user", "User"),
+        ("assistant", "Assistant"),
+    ]
+
+    conversation = models.ForeignKey(
+        AIConversation,
+        on_delete=models.CASCADE,
+        related_name="turns",
+        help_text="Conversation this message belongs to",
+    )
+
+    sequence = models.PositiveIntegerField(
+        help_text="Position of the message within the conversation (1-based)"
+    )
+
+    role = models.CharField(max_length=20, choices=ROLE_CHOICES)
+
+    content = models.TextField()
+
+    metadata = models.JSONField(default=dict, blank=True)
+
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ["conversation", "sequence"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["conversation", "sequence"],
+                name="ai_conversation_message_sequence_unique",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.conversation_id} #{self.sequence} ({self.role})"
+
+    def as_dict(self):
+        """Message in the format conversation history is passed around in."""
+        return {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.created_at.isoformat(),
+            "metadata": self.metadata,
+        }
+
+
 class AIInsight(models.Model):
     """Model for storing AI-generated insights about policies and communities."""
 
@@ -8,11 +8,13 @@ This module provides core AI services including:
 - Embedding generation for semantic search
 - Vector store for similarity matching
 - Semantic search across OBCMS modules
+- Semantic answer cache for rephrased assistant questions
 """
 
 from .cache_service import CacheService, PolicyCacheManager
 from .gemini_service import GeminiService
 from .prompt_templates import PromptTemplates
+from .semantic_cache import SemanticCache, get_semantic_cache
 
 # Import existing services if they exist
 try:
@@ -25,6 +27,8 @@ try:
         'CacheService',
         'PolicyCacheManager',
         'PromptTemplates',
+        'SemanticCache',
+        'get_semantic_cache',
         'EmbeddingService',
         'VectorStore',
         'SimilaritySearchService',
@@ -36,4 +40,6 @@ except ImportError:
         'CacheService',
         'PolicyCacheManager',
         'PromptTemplates',
+        'SemanticCache',
+        'get_semantic_cache',
     ]
@@ -7,22 +7,100 @@ This service provides:
 - Rate limiting with exponential backoff
 - Token counting and cost estimation
 - Cultural context integration
+- Concurrent batch generation with single-flight de-duplication
 """
 
+import asyncio
 import hashlib
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import google.generativeai as genai
 from django.conf import settings
 from django.core.cache import cache
 
 from ai_assistant.cultural_context import BangsomoroCulturalContext
+from ai_assistant.services import semantic_cache
 
 logger = logging.getLogger(__name__)
 
+# Prompt hash -> Future of the generation currently in flight for it, shared by
+# every GeminiService instance in the process so identical concurrent prompts
+# result in a single API call.
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _claim_flight(key: str) -> Tuple[Future, bool]:
+    """Return the in-flight future for ``key`` and whether the caller owns it."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            return future, False
+        future = Future()
+        _inflight[key] = future
+        return future, True
+
+
+def _release_flight(key: str, future: Future, result: Dict[str, Any]) -> None:
+    """Publish ``result`` to callers waiting on ``key`` and drop the entry."""
+    with _inflight_lock:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+    future.set_result(result)
+
+
+def _run_coroutine(coro):
+    """Run ``coro`` to completion from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # Called from inside an event loop (e.g. an async view): run on a
+    # separate thread with its own loop rather than nesting loops.
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(asyncio.run, coro).result()
+
+
+class _TokenBucket:
+    """
+    Token-per-minute budget shared by the requests of one batch.
+
+    Requests reserve their estimated prompt tokens before calling the API and
+    are charged for the response afterwards, which may push the balance below
+    zero; later requests then wait until the budget has refilled.
+    """
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens: int) -> None:
+        tokens = min(float(tokens), self.capacity)
+        async with self.lock:
+            self._refill()
+            while self.tokens < tokens:
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= tokens
+
+    def charge(self, tokens: int) -> None:
+        self._refill()
+        self.tokens -= tokens
+
 
 class GeminiService:
     """
@@ -130,37 +208,169 @@ class GeminiService:
                 logger.info("Returning cached response")
                 return cached_response
 
-        # Generate with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                response = self.model.generate_content(full_prompt)
+        # Collapse identical prompts already being generated elsewhere
+        future, owner = _claim_flight(cache_key)
+        if not owner:
+            logger.info("Waiting for identical in-flight request")
+            result = dict(future.result())
+            result["response_time"] = time.time() - start_time
+            return result
 
-                # Calculate metrics
-                response_time = time.time() - start_time
-                tokens_used = self._estimate_tokens(full_prompt, response.text)
-                cost = self._calculate_cost(tokens_used)
-
-                result = {
-                    "success": True,
-                    "text": response.text,
-                    "tokens_used": tokens_used,
-                    "cost": float(cost),
-                    "response_time": response_time,
-                    "model": self.model_name,
-                    "cached": False,
-                    "prompt_hash": cache_key,
-                }
+        result = None
+        try:
+            result = self._generate_with_retry(full_prompt, cache_key, start_time)
+
+            # Cache successful response
+            if use_cache and result["success"]:
+                cache.set(cache_key, result, cache_ttl)
+        finally:
+            if result is None:
+                result = self._failure_result("Generation aborted", start_time)
+            _release_flight(cache_key, future, result)
 
-                # Cache successful response
-                if use_cache:
-                    cache.set(cache_key, result, cache_ttl)
+        return result
 
-                logger.info(
-                    f"Generated response in {response_time:.2f}s, "
-                    f"{tokens_used} tokens, ${cost:.6f}"
+    def generate_batch(
+        self,
+        prompts: List[Union[str, Dict[str, Any]]],
+        system_context: Optional[str] = None,
+        use_cache: bool = True,
+        cache_ttl: int = 86400,  # 24 hours
+        include_cultural_context: bool = True,
+        max_concurrency: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate text for many prompts concurrently.
+
+        Identical prompts are sent once, whether they repeat within the batch
+        or are already in flight from another caller. Responses are cached
+        under the same keys as ``generate_text``, and failed attempts back off
+        without blocking the other requests.
+
+        Args:
+            prompts: Prompt strings, or dicts with ``prompt`` and optional
+                ``system_context``/``include_cultural_context`` overrides
+            system_context: Default system context for every prompt
+            use_cache: Whether to use caching (default: True)
+            cache_ttl: Cache time-to-live in seconds (default: 24 hours)
+            include_cultural_context: Default for including cultural context
+            max_concurrency: Simultaneous API calls
+                (default: settings.GEMINI_BATCH_MAX_CONCURRENCY)
+            tokens_per_minute: Estimated token budget per minute, unlimited
+                when unset (default: settings.GEMINI_BATCH_TOKENS_PER_MINUTE)
+
+        Returns:
+            One ``generate_text``-style result dict per prompt, in input order.
+
+        Example:
+            >>> results = service.generate_batch(
+            ...     ["Summarize project A", "Summarize project B"],
+            ...     include_cultural_context=False,
+            ... )
+            >>> [r["text"] for r in results if r["success"]]
+        """
+        start_time = time.time()
+
+        full_prompts = []
+        for item in prompts:
+            if isinstance(item, dict):
+                full_prompts.append(
+                    self._build_prompt(
+                        item["prompt"],
+                        item.get("system_context", system_context),
+                        item.get("include_cultural_context", include_cultural_context),
+                    )
                 )
+            else:
+                full_prompts.append(
+                    self._build_prompt(item, system_context, include_cultural_context)
+                )
+
+        keys = [self._get_cache_key(full_prompt) for full_prompt in full_prompts]
+        unique = dict(zip(keys, full_prompts))
+
+        results: Dict[str, Dict[str, Any]] = {}
+        if use_cache and unique:
+            for key, cached_response in cache.get_many(list(unique)).items():
+                if cached_response:
+                    cached_response["cached"] = True
+                    cached_response["response_time"] = time.time() - start_time
+                    results[key] = cached_response
+
+        pending = {key: prompt for key, prompt in unique.items() if key not in results}
+        if pending:
+            if max_concurrency is None:
+                max_concurrency = getattr(settings, "GEMINI_BATCH_MAX_CONCURRENCY", 4)
+            if tokens_per_minute is None:
+                tokens_per_minute = getattr(
+                    settings, "GEMINI_BATCH_TOKENS_PER_MINUTE", None
+                )
+
+            generated = _run_coroutine(
+                self._generate_many(pending, max(1, max_concurrency), tokens_per_minute)
+            )
+
+            if use_cache:
+                successful = {
+                    key: result for key, result in generated.items() if result["success"]
+                }
+                if successful:
+                    cache.set_many(successful, cache_ttl)
+
+            results.update(generated)
+
+        logger.info(
+            f"Batch of {len(keys)} prompts: {len(unique) - len(pending)} cached, "
+            f"{len(pending)} generated in {time.time() - start_time:.2f}s"
+        )
 
-                return result
+        return [dict(results[key]) for key in keys]
+
+    async def _generate_many(
+        self,
+        prompts: Dict[str, str],
+        max_concurrency: int,
+        tokens_per_minute: Optional[int],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Generate ``{cache_key: full_prompt}`` concurrently."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="gemini-batch"
+        ) as executor:
+
+            async def run(cache_key: str, full_prompt: str):
+                future, owner = _claim_flight(cache_key)
+                if not owner:
+                    return cache_key, dict(await asyncio.wrap_future(future))
+
+                result = None
+                try:
+                    result = await self._agenerate_with_retry(
+                        full_prompt, cache_key, executor, semaphore, bucket
+                    )
+                finally:
+                    if result is None:
+                        result = self._failure_result("Generation aborted", time.time())
+                    _release_flight(cache_key, future, result)
+                return cache_key, result
+
+            pairs = await asyncio.gather(
+                *(run(cache_key, full_prompt) for cache_key, full_prompt in prompts.items())
+            )
+
+        return dict(pairs)
+
+    def _generate_with_retry(
+        self, full_prompt: str, cache_key: str, start_time: float
+    ) -> Dict[str, Any]:
+        """Call the API with exponential backoff (blocking)."""
+        for attempt in range(self.max_retries):
+            try:
+                response = self.model.generate_content(full_prompt)
+                return self._success_result(full_prompt, response.text, cache_key, start_time)
 
             except Exception as e:
                 logger.warning(
@@ -175,16 +385,83 @@ class GeminiService:
                 else:
                     # Final attempt failed
                     logger.error(f"All retry attempts failed: {str(e)}")
-                    return {
-                        "success": False,
-                        "error": str(e),
-                        "text": None,
-                        "tokens_used": 0,
-                        "cost": 0.0,
-                        "response_time": time.time() - start_time,
-                        "model": self.model_name,
-                        "cached": False,
-                    }
+                    return self._failure_result(str(e), start_time)
+
+    async def _agenerate_with_retry(
+        self,
+        full_prompt: str,
+        cache_key: str,
+        executor: ThreadPoolExecutor,
+        semaphore: asyncio.Semaphore,
+        bucket: Optional[_TokenBucket],
+    ) -> Dict[str, Any]:
+        """Call the API on ``executor`` with non-blocking exponential backoff."""
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+
+        for attempt in range(self.max_retries):
+            try:
+                async with semaphore:
+                    if bucket is not None:
+                        await bucket.acquire(self._estimate_tokens(full_prompt, ""))
+                    response = await loop.run_in_executor(
+                        executor, self.model.generate_content, full_prompt
+                    )
+                    text = response.text
+                    if bucket is not None:
+                        bucket.charge(self._estimate_tokens("", text))
+                return self._success_result(full_prompt, text, cache_key, start_time)
+
+            except Exception as e:
+                logger.warning(
+                    f"Attempt {attempt + 1}/{self.max_retries} failed: {str(e)}"
+                )
+
+                if attempt < self.max_retries - 1:
+                    # Exponential backoff outside the semaphore so other
+                    # prompts keep the concurrency slots busy meanwhile
+                    await asyncio.sleep(2**attempt)
+                else:
+                    logger.error(f"All retry attempts failed: {str(e)}")
+                    return self._failure_result(str(e), start_time)
+
+    def _success_result(
+        self, full_prompt: str, text: str, cache_key: str, start_time: float
+    ) -> Dict[str, Any]:
+        """Build the result dict for a generated response."""
+        # Calculate metrics
+        response_time = time.time() - start_time
+        tokens_used = self._estimate_tokens(full_prompt, text)
+        cost = self._calculate_cost(tokens_used)
+
+        logger.info(
+            f"Generated response in {response_time:.2f}s, "
+            f"{tokens_used} tokens, ${cost:.6f}"
+        )
+
+        return {
+            "success": True,
+            "text": text,
+            "tokens_used": tokens_used,
+            "cost": float(cost),
+            "response_time": response_time,
+            "model": self.model_name,
+            "cached": False,
+            "prompt_hash": cache_key,
+        }
+
+    def _failure_result(self, error: str, start_time: float) -> Dict[str, Any]:
+        """Build the result dict for a request whose retries were exhausted."""
+        return {
+            "success": False,
+            "error": error,
+            "text": None,
+            "tokens_used": 0,
+            "cost": 0.0,
+            "response_time": time.time() - start_time,
+            "model": self.model_name,
+            "cached": False,
+        }
 
     def generate_stream(
         self,
@@ -289,6 +566,8 @@ class GeminiService:
         user_message: str,
         context: Optional[str] = None,
         conversation_history: Optional[list] = None,
+        use_semantic_cache: Optional[bool] = None,
+        cache_scope: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Helper function specifically for the OBCMS chat widget.
@@ -300,6 +579,12 @@ class GeminiService:
             context: Optional additional context (e.g., current page, user role)
             conversation_history: Optional list of previous exchanges
                 Format: [{"role": "user", "content": "..."}, {"role": "assistant", "content": "..."}]
+            use_semantic_cache: Reuse answers to similar earlier questions
+                (default: settings.AI_SEMANTIC_CACHE_ENABLED). Only applies to
+                messages without conversation history.
+            cache_scope: Semantic cache scope (``semantic_cache.scope_for_user``);
+                answers are only reused within the same scope, and not cached
+                at all without one
 
         Returns:
             Dict containing:
@@ -322,6 +607,17 @@ class GeminiService:
             >>> print(result['suggestions'])
             ['Show me details about these communities', 'Which provinces have the most?']
         """
+        if use_semantic_cache is None:
+            use_semantic_cache = getattr(settings, "AI_SEMANTIC_CACHE_ENABLED", False)
+        semantic_namespace = None
+        if use_semantic_cache and cache_scope and not conversation_history:
+            semantic_namespace = semantic_cache.namespace_for(
+                self.model_name, self.temperature, context, cache_scope
+            )
+            cached_answer = self._semantic_lookup(user_message, semantic_namespace)
+            if cached_answer is not None:
+                return cached_answer
+
         try:
             # Build OBCMS chat system context
             system_context = self._build_chat_system_context(context)
@@ -359,6 +655,14 @@ class GeminiService:
             # Parse AI response to extract message and suggestions
             parsed_response = self._parse_chat_response(response_result["text"])
 
+            if semantic_namespace is not None and not response_result.get("cached"):
+                self._semantic_store(
+                    user_message,
+                    semantic_namespace,
+                    parsed_response,
+                    response_result,
+                )
+
             return {
                 "success": True,
                 "message": parsed_response["message"],
@@ -381,6 +685,56 @@ class GeminiService:
                 "cached": False,
             }
 
+    def _semantic_lookup(
+        self, user_message: str, namespace: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return a chat result reusing the answer to a similar question."""
+        start_time = time.time()
+        try:
+            hit = semantic_cache.get_semantic_cache().lookup(user_message, namespace)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+        if hit is None:
+            return None
+
+        logger.info(
+            f"Semantic cache hit (similarity {hit['similarity']:.3f}), "
+            f"saved ~{hit['saved_seconds']:.2f}s"
+        )
+        return {
+            "success": True,
+            "message": hit["answer"]["message"],
+            "tokens_used": 0,
+            "cost": 0.0,
+            "response_time": time.time() - start_time,
+            "suggestions": list(hit["answer"]["suggestions"]),
+            "cached": True,
+            "semantic_similarity": hit["similarity"],
+        }
+
+    def _semantic_store(
+        self,
+        user_message: str,
+        namespace: str,
+        parsed_response: Dict[str, Any],
+        response_result: Dict[str, Any],
+    ) -> None:
+        """Remember a generated chat answer for similar future questions."""
+        try:
+            semantic_cache.get_semantic_cache().store(
+                user_message,
+                {
+                    "message": parsed_response["message"],
+                    "suggestions": parsed_response["suggestions"],
+                },
+                namespace=namespace,
+                response_time=response_result["response_time"],
+            )
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed: {e}")
+
     def _build_chat_system_context(self, additional_context: Optional[str] = None) -> str:
         """
         Build system context specifically for OBCMS chat assistant.
@@ -0,0 +1,315 @@
+"""
+Semantic Cache - Reuse assistant answers for rephrased questions.
+
+The Gemini prompt cache only hits on byte-identical prompts, so "How many
+communities are in Region IX?" and "how many OBC communities does region 9
+have" each pay a full LLM round trip. This cache embeds the normalized
+question with ``EmbeddingService`` and keeps answers in a small in-process
+vector index; a lookup returns the closest stored answer when its cosine
+similarity reaches the configured threshold.
+
+Answers are only shared within a cache scope (``scope_for_user``): the
+asking user in their current organization, so organization-scoped data in
+one answer is never served to another organization or user.
+
+Each entry records the source-data version it was generated from: the
+generations of the models the assistant answers about
+(``AI_SEMANTIC_CACHE_SOURCE_MODELS``), which ``common.signals`` bumps on
+every save and delete. Entries generated from older data are never served.
+
+Settings:
+    AI_SEMANTIC_CACHE_ENABLED: Turn the cache on (default: False)
+    AI_SEMANTIC_CACHE_THRESHOLD: Minimum cosine similarity (default: 0.92)
+    AI_SEMANTIC_CACHE_MAX_ENTRIES: Index size per process (default: 1000)
+    AI_SEMANTIC_CACHE_TTL: Entry lifetime in seconds (default: 3600)
+    AI_SEMANTIC_CACHE_SOURCE_MODELS: Model labels the answers depend on
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+
+try:
+    from prometheus_client import Counter
+except ImportError:  # pragma: no cover - prometheus_client ships with django-prometheus
+    Counter = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.92
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL = 3600
+DEFAULT_SOURCE_MODELS = (
+    "communities.OBCCommunity",
+    "mana.Assessment",
+    "mana.Need",
+    "coordination.Partnership",
+    "policy_tracking.PolicyRecommendation",
+    "monitoring.MonitoringEntry",
+)
+
+if Counter is not None:
+    CACHE_LOOKUPS = Counter(
+        "obcms_ai_semantic_cache_lookups_total",
+        "Semantic answer cache lookups by outcome (hit, miss, stale).",
+        ["outcome"],
+    )
+    SAVED_SECONDS = Counter(
+        "obcms_ai_semantic_cache_saved_seconds_total",
+        "LLM response time avoided by semantic cache hits.",
+    )
+else:  # pragma: no cover
+    CACHE_LOOKUPS = SAVED_SECONDS = None
+
+_OUTCOME_LABELS = {"hits": "hit", "misses": "miss", "stale": "stale"}
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(text: str) -> str:
+    """Lowercase and strip punctuation and repeated whitespace."""
+    text = _PUNCTUATION.sub(" ", (text or "").lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def current_source_version() -> str:
+    """Version of the data assistant answers are generated from."""
+    from common.services.cache_generations import model_generations
+
+    labels = getattr(settings, "AI_SEMANTIC_CACHE_SOURCE_MODELS", DEFAULT_SOURCE_MODELS)
+    generations = model_generations(labels)
+    return "|".join(f"{label}={generations[label]}" for label in sorted(generations))
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour answer cache over question embeddings.
+
+    Entries live in per-namespace numpy matrices of L2-normalized embeddings,
+    so a lookup is one matrix-vector product. Namespaces separate answers
+    that were generated under different prompts (model, temperature, page
+    context). The oldest entries are evicted once ``max_entries`` is reached.
+
+    Example:
+        >>> cache = get_semantic_cache()
+        >>> cache.store("How many communities in Region IX?", {"message": "..."},
+        ...             response_time=2.1)
+        >>> hit = cache.lookup("how many communities are in region ix")
+        >>> hit["answer"]["message"] if hit else None
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Callable[[str], np.ndarray]] = None,
+        threshold: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        ttl: Optional[int] = None,
+        version_provider: Callable[[], str] = current_source_version,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embedder: Text -> normalized vector (default: EmbeddingService)
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum entries kept across namespaces
+            ttl: Entry lifetime in seconds
+            version_provider: Returns the current source-data version
+        """
+        self.threshold = (
+            threshold
+            if threshold is not None
+            else getattr(settings, "AI_SEMANTIC_CACHE_THRESHOLD", DEFAULT_THRESHOLD)
+        )
+        self.max_entries = (
+            max_entries
+            if max_entries is not None
+            else getattr(settings, "AI_SEMANTIC_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        )
+        self.ttl = ttl if ttl is not None else getattr(settings, "AI_SEMANTIC_CACHE_TTL", DEFAULT_TTL)
+        self.version_provider = version_provider
+        self._embedder = embedder
+
+        # namespace -> (matrix of shape (n, dimension), list of entry dicts)
+        self._indices: Dict[str, Tuple[np.ndarray, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "saved_seconds": 0.0}
+
+    def _embed(self, normalized: str) -> np.ndarray:
+        if self._embedder is None:
+            from ai_assistant.services.embedding_service import get_embedding_service
+
+            self._embedder = get_embedding_service().generate_embedding
+        return np.asarray(self._embedder(normalized), dtype="float32")
+
+    def lookup(self, question: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
+        """
+        Return the cached answer for the closest question, if close enough.
+
+        Args:
+            question: User question
+            namespace: Prompt namespace the answer must come from
+
+        Returns:
+            Dict with ``answer``, ``similarity``, ``question`` and
+            ``saved_seconds``, or None on a miss.
+        """
+        normalized = normalize_question(question)
+        if not normalized:
+            return None
+
+        vector = self._embed(normalized)
+        version = self.version_provider()
+        now = time.time()
+
+        with self._lock:
+            matrix, entries = self._indices.get(namespace, (None, []))
+            if matrix is None or not entries:
+                self._count("misses")
+                return None
+
+            similarities = matrix @ vector
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            entry = entries[best]
+
+            if similarity < self.threshold:
+                self._count("misses")
+                return None
+
+            if entry["version"] != version or entry["expires_at"] <= now:
+                # Generated from data that has changed since: drop it so the
+                # next answer for this question can take its place.
+                self._remove(namespace, best)
+                self._count("stale")
+                return None
+
+            self._count("hits", entry["response_time"])
+            return {
+                "answer": entry["answer"],
+                "similarity": similarity,
+                "question": entry["question"],
+                "saved_seconds": entry["response_time"],
+            }
+
+    def store(
+        self,
+        question: str,
+        answer: Dict[str, Any],
+        namespace: str = "default",
+        response_time: float = 0.0,
+    ) -> None:
+        """
+        Add an answer to the index.
+
+        Args:
+            question: User question the answer was generated for
+            answer: Answer payload returned on later hits
+            namespace: Prompt namespace
+            response_time: Seconds the LLM took, reported as saved on hits
+        """
+        normalized = normalize_question(question)
+        if not normalized or self.max_entries <= 0:
+            return
+
+        vector = self._embed(normalized).reshape(1, -1)
+        entry = {
+            "question": normalized,
+            "answer": answer,
+            "version": self.version_provider(),
+            "expires_at": time.time() + self.ttl,
+            "created_at": time.time(),
+            "response_time": response_time,
+        }
+
+        with self._lock:
+            matrix, entries = self._indices.get(namespace, (None, []))
+            if matrix is None or not entries:
+                matrix, entries = vector, [entry]
+            else:
+                matrix = np.vstack([matrix, vector])
+                entries = entries + [entry]
+            self._indices[namespace] = (matrix, entries)
+            self._evict()
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._indices = {}
+            self.stats = {"hits": 0, "misses": 0, "stale": 0, "saved_seconds": 0.0}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate, saved latency and index size of this process."""
+        with self._lock:
+            stats = dict(self.stats)
+            size = sum(len(entries) for _, entries in self._indices.values())
+        lookups = stats["hits"] + stats["misses"] + stats["stale"]
+        stats["lookups"] = lookups
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["entries"] = size
+        return stats
+
+    def _count(self, outcome: str, saved_seconds: float = 0.0) -> None:
+        self.stats[outcome] += 1
+        if CACHE_LOOKUPS is not None:
+            CACHE_LOOKUPS.labels(outcome=_OUTCOME_LABELS[outcome]).inc()
+        if saved_seconds:
+            self.stats["saved_seconds"] += saved_seconds
+            if SAVED_SECONDS is not None:
+                SAVED_SECONDS.inc(saved_seconds)
+
+    def _remove(self, namespace: str, position: int) -> None:
+        matrix, entries = self._indices[namespace]
+        entries = entries[:position] + entries[position + 1:]
+        if entries:
+            self._indices[namespace] = (np.delete(matrix, position, axis=0), entries)
+        else:
+            del self._indices[namespace]
+
+    def _evict(self) -> None:
+        """Drop the oldest entries until the index fits ``max_entries``."""
+        size = sum(len(entries) for _, entries in self._indices.values())
+        while size > self.max_entries:
+            # Entries are appended in creation order, so each namespace's
+            # oldest entry is its first one.
+            namespace = min(
+                self._indices, key=lambda name: self._indices[name][1][0]["created_at"]
+            )
+            self._remove(namespace, 0)
+            size -= 1
+
+
+def scope_for_user(user) -> str:
+    """Cache scope of answers generated for ``user`` in the current organization."""
+    from common.services.chat_query_cache import scope_for_current_organization
+
+    return f"user:{user.pk}|{scope_for_current_organization()}"
+
+
+def namespace_for(*parts: Any) -> str:
+    """Namespace key for answers generated under the given prompt settings."""
+    key_string = "|".join(str(part) for part in parts)
+    return hashlib.sha256(key_string.encode()).hexdigest()[:16]
+
+
+# Global singleton instance
+_cache_instance = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """
+    Get or create the global semantic cache instance.
+
+    Returns:
+        Singleton SemanticCache instance
+    """
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = SemanticCache()
+    return _cache_instance
@@ -0,0 +1,109 @@
+"""
+Tests for append-only AI conversation message storage.
+"""
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from ai_assistant.ai_engine import GeminiAIEngine
+from ai_assistant.models import AIConversation, AIConversationMessage
+
+User = get_user_model()
+
+
+class TestConversationMessages(TestCase):
+    """Test cases for AIConversation turns and rolling summary."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="chat-user", password="x")
+        self.conversation = AIConversation.objects.create(user=self.user)
+
+    def _add_turns(self, count):
+        for index in range(1, count + 1):
+            role = "user" if index % 2 else "assistant"
+            self.conversation.add_message(role, f"message {index}")
+
+    def test_messages_are_appended_in_order(self):
+        self.conversation.add_message("user", "Hello", metadata={"page": "policies"})
+        self.conversation.add_message("assistant", "Hi there")
+
+        self.conversation.refresh_from_db()
+        assert self.conversation.message_count == 2
+        assert [m["content"] for m in self.conversation.messages] == ["Hello", "Hi there"]
+        assert self.conversation.messages[0]["metadata"] == {"page": "policies"}
+        assert self.conversation.last_message_time is not None
+
+    def test_adding_a_message_costs_constant_queries(self):
+        self._add_turns(15)
+
+        with self.assertNumQueries(5):  # savepoint, lock, insert, update, release
+            self.conversation.add_message("user", "one more")
+
+    def test_recent_messages_returns_last_turns_oldest_first(self):
+        self._add_turns(14)
+
+        recent = self.conversation.recent_messages(3)
+
+        assert [m["content"] for m in recent] == ["message 12", "message 13", "message 14"]
+
+    def _assert_every_turn_reaches_the_prompt(self, count):
+        self._add_turns(count)
+        engine = GeminiAIEngine.__new__(GeminiAIEngine)
+        engine.system_prompts = {"policy_chat": "SYSTEM"}
+
+        prompt = engine._build_conversation_prompt(
+            "Next question",
+            "policy_chat",
+            conversation_history=self.conversation.recent_messages(),
+            conversation_summary=self.conversation.summary,
+        )
+
+        missing = [
+            index for index in range(1, count + 1) if f": message {index}\n" not in prompt
+        ]
+        assert missing == []
+
+    def test_no_turn_is_lost_at_15_turns(self):
+        self._assert_every_turn_reaches_the_prompt(15)
+
+    def test_no_turn_is_lost_at_20_turns(self):
+        self._assert_every_turn_reaches_the_prompt(20)
+
+    def test_no_turn_is_lost_at_30_turns(self):
+        self._assert_every_turn_reaches_the_prompt(30)
+
+    def test_old_turns_are_folded_into_summary(self):
+        turns = 2 * AIConversation.CONTEXT_TURNS + 1
+        self._add_turns(turns)
+
+        self.conversation.refresh_from_db()
+        folded = turns - AIConversation.CONTEXT_TURNS
+        assert self.conversation.summary_through == folded
+        assert self.conversation.summary.splitlines()[0] == "User: message 1"
+        assert len(self.conversation.summary.splitlines()) == folded
+        # Turns stay stored; only the prompt context is compacted
+        assert AIConversationMessage.objects.filter(
+            conversation=self.conversation
+        ).count() == turns
+
+    def test_summary_is_bounded(self):
+        for index in range(60):
+            self.conversation.add_message("user", f"{index} " + "x" * 500)
+
+        self.conversation.refresh_from_db()
+        assert len(self.conversation.summary) <= AIConversation.SUMMARY_MAX_CHARS
+        assert self.conversation.summary.endswith("...")
+
+    def test_summary_is_included_in_prompt(self):
+        engine = GeminiAIEngine.__new__(GeminiAIEngine)
+        engine.system_prompts = {"policy_chat": "SYSTEM"}
+
+        prompt = engine._build_conversation_prompt(
+            "Next question",
+            "policy_chat",
+            conversation_history=[{"role": "user", "content": "recent"}],
+            conversation_summary="User: earlier question",
+        )
+
+        assert "Earlier in this conversation:\nUser: earlier question" in prompt
+        assert prompt.index("earlier question") < prompt.index("recent")
@@ -2,11 +2,14 @@
 Tests for Gemini AI Service.
 """
 
+import threading
+import time
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from django.conf import settings
+from django.core.cache import cache
 from django.test import TestCase
 
 from ai_assistant.services.gemini_service import GeminiService
@@ -176,6 +179,149 @@ class TestGeminiService(TestCase):
         assert result2["cached"] is True
 
 
+class TestGeminiBatch(TestCase):
+    """Test cases for concurrent batch generation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        cache.clear()
+        with patch('ai_assistant.services.gemini_service.genai'):
+            with patch('django.conf.settings.GOOGLE_API_KEY', 'test-api-key'):
+                self.service = GeminiService(model_name="gemini-flash-latest", temperature=0.7)
+
+    def tearDown(self):
+        cache.clear()
+
+    @staticmethod
+    def _echo(full_prompt):
+        response = MagicMock()
+        response.text = f"answer to {full_prompt.rsplit(chr(10), 1)[-1]}"
+        return response
+
+    def test_results_keep_input_order_and_duplicates_are_sent_once(self):
+        """Each distinct prompt is generated once and results align with input."""
+        with patch.object(self.service.model, 'generate_content', side_effect=self._echo) as mock_generate:
+            results = self.service.generate_batch(
+                ["A", "B", "A", {"prompt": "C"}], include_cultural_context=False
+            )
+
+        assert [r["text"] for r in results] == [
+            "answer to A", "answer to B", "answer to A", "answer to C"
+        ]
+        assert mock_generate.call_count == 3
+        assert results[0] is not results[2]
+
+    def test_batch_shares_prompt_cache_with_generate_text(self):
+        """Batch results are cached under the generate_text prompt hash."""
+        with patch.object(self.service.model, 'generate_content', side_effect=self._echo):
+            single = self.service.generate_text("A", include_cultural_context=False)
+
+        with patch.object(self.service.model, 'generate_content', side_effect=self._echo) as mock_generate:
+            results = self.service.generate_batch(["A", "B"], include_cultural_context=False)
+            again = self.service.generate_text("B", include_cultural_context=False)
+
+        assert mock_generate.call_count == 1
+        assert results[0]["cached"] is True
+        assert results[0]["prompt_hash"] == single["prompt_hash"]
+        assert results[1]["cached"] is False
+        assert again["cached"] is True
+
+    def test_concurrency_is_bounded(self):
+        """No more than max_concurrency API calls run at once."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow(full_prompt):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            return self._echo(full_prompt)
+
+        with patch.object(self.service.model, 'generate_content', side_effect=slow):
+            results = self.service.generate_batch(
+                [str(i) for i in range(8)],
+                use_cache=False,
+                include_cultural_context=False,
+                max_concurrency=2,
+            )
+
+        assert all(r["success"] for r in results)
+        assert state["peak"] == 2
+
+    def test_retries_back_off_without_blocking_sleep(self):
+        """Failed attempts are retried with asyncio.sleep, not time.sleep."""
+        mock_response = MagicMock()
+        mock_response.text = "Success after retry"
+
+        with patch.object(
+            self.service.model, 'generate_content',
+            side_effect=[Exception("API Error"), mock_response],
+        ), patch(
+            'ai_assistant.services.gemini_service.asyncio.sleep', new_callable=AsyncMock
+        ) as mock_async_sleep, patch(
+            'ai_assistant.services.gemini_service.time.sleep'
+        ) as mock_sleep:
+            results = self.service.generate_batch(
+                ["A"], use_cache=False, include_cultural_context=False
+            )
+
+        assert results[0]["text"] == "Success after retry"
+        mock_async_sleep.assert_awaited_once_with(1)
+        mock_sleep.assert_not_called()
+
+    def test_failures_are_reported_and_not_cached(self):
+        """Exhausted retries produce a failure result that is not cached."""
+        with patch.object(
+            self.service.model, 'generate_content', side_effect=Exception("API Error")
+        ), patch(
+            'ai_assistant.services.gemini_service.asyncio.sleep', new_callable=AsyncMock
+        ):
+            results = self.service.generate_batch(["A"], include_cultural_context=False)
+
+        assert results[0]["success"] is False
+        assert results[0]["error"] == "API Error"
+        assert cache.get(self.service._get_cache_key(
+            self.service._build_prompt("A", None, False)
+        )) is None
+
+    def test_identical_in_flight_requests_share_one_call(self):
+        """A prompt already being generated is awaited instead of re-sent."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking(full_prompt):
+            started.set()
+            release.wait(5)
+            return self._echo(full_prompt)
+
+        results = {}
+        with patch.object(self.service.model, 'generate_content', side_effect=blocking) as mock_generate:
+            leader = threading.Thread(
+                target=lambda: results.update(leader=self.service.generate_text(
+                    "A", use_cache=False, include_cultural_context=False
+                ))
+            )
+            leader.start()
+            started.wait(5)
+
+            follower = threading.Thread(
+                target=lambda: results.update(follower=self.service.generate_batch(
+                    ["A"], use_cache=False, include_cultural_context=False
+                )[0])
+            )
+            follower.start()
+            time.sleep(0.05)
+            release.set()
+            leader.join(5)
+            follower.join(5)
+
+        assert mock_generate.call_count == 1
+        assert results["follower"]["text"] == results["leader"]["text"] == "answer to A"
+
+
 @pytest.mark.django_db
 class TestGeminiServiceIntegration:
     """Integration tests (require actual API key)."""
@@ -0,0 +1,203 @@
+"""
+Tests for the semantic answer cache.
+"""
+
+import zlib
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from ai_assistant.ai_engine import GeminiAIEngine
+from ai_assistant.services import semantic_cache
+from ai_assistant.services.gemini_service import GeminiService
+from ai_assistant.services.semantic_cache import SemanticCache, normalize_question
+from common.services.cache_generations import bump_model_generation
+
+
+def bag_of_words(text):
+    """Deterministic stand-in for the sentence embedding model."""
+    vector = np.zeros(64, dtype="float32")
+    for word in text.split():
+        vector[zlib.crc32(word.encode()) % 64] += 1
+    return vector / np.linalg.norm(vector)
+
+
+class TestSemanticCache(TestCase):
+    """Test cases for SemanticCache."""
+
+    def setUp(self):
+        cache.clear()
+        self.cache = SemanticCache(embedder=bag_of_words, threshold=0.9, ttl=3600)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_normalize_question(self):
+        assert normalize_question("  How many   communities, in Region IX? ") == (
+            "how many communities in region ix"
+        )
+
+    def test_rephrased_question_hits(self):
+        self.cache.store(
+            "How many communities are in Region IX?",
+            {"message": "47 communities", "suggestions": []},
+            response_time=2.5,
+        )
+
+        hit = self.cache.lookup("in region IX, how many communities are")
+
+        assert hit is not None
+        assert hit["answer"]["message"] == "47 communities"
+        assert hit["similarity"] >= 0.9
+        stats = self.cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["saved_seconds"] == 2.5
+        assert stats["hit_rate"] == 1.0
+
+    def test_dissimilar_question_misses(self):
+        self.cache.store("How many communities are in Region IX?", {"message": "47"})
+
+        assert self.cache.lookup("List all active partnerships") is None
+        assert self.cache.get_stats()["misses"] == 1
+
+    def test_changed_source_data_invalidates_entry(self):
+        self.cache.store("How many communities are in Region IX?", {"message": "47"})
+
+        bump_model_generation("communities.OBCCommunity")
+
+        assert self.cache.lookup("How many communities are in Region IX?") is None
+        stats = self.cache.get_stats()
+        assert stats["stale"] == 1
+        assert stats["entries"] == 0
+
+    def test_namespaces_are_separate(self):
+        self.cache.store("How many communities?", {"message": "47"}, namespace="a")
+
+        assert self.cache.lookup("How many communities?", namespace="b") is None
+        assert self.cache.lookup("How many communities?", namespace="a") is not None
+
+    def test_oldest_entries_are_evicted(self):
+        small = SemanticCache(embedder=bag_of_words, threshold=0.9, max_entries=2)
+        small.store("first question", {"message": "1"})
+        small.store("second question", {"message": "2"}, namespace="other")
+        small.store("third question", {"message": "3"})
+
+        assert small.get_stats()["entries"] == 2
+        assert small.lookup("first question") is None
+        assert small.lookup("third question")["answer"]["message"] == "3"
+
+
+@override_settings(AI_SEMANTIC_CACHE_ENABLED=True)
+class TestChatSemanticCache(TestCase):
+    """chat_with_ai() reuses answers to rephrased questions."""
+
+    def setUp(self):
+        cache.clear()
+        with patch('ai_assistant.services.gemini_service.genai'):
+            with patch('django.conf.settings.GOOGLE_API_KEY', 'test-api-key'):
+                self.service = GeminiService(temperature=0.8)
+        self.service.generate_text = MagicMock(return_value={
+            "success": True,
+            "text": "There are 47 communities.\n\nSUGGESTIONS:\n- Show provinces",
+            "tokens_used": 150,
+            "cost": 0.0001,
+            "response_time": 1.5,
+            "cached": False,
+        })
+        patcher = patch.object(
+            semantic_cache,
+            "_cache_instance",
+            SemanticCache(embedder=bag_of_words, threshold=0.9),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_rephrased_question_skips_llm(self):
+        first = self.service.chat_with_ai(
+            "How many communities are in Region IX?", cache_scope="user:1|org:1"
+        )
+        second = self.service.chat_with_ai(
+            "how many communities are in region IX", cache_scope="user:1|org:1"
+        )
+
+        assert self.service.generate_text.call_count == 1
+        assert first["cached"] is False
+        assert second["cached"] is True
+        assert second["message"] == first["message"]
+        assert second["suggestions"] == first["suggestions"]
+        assert second["tokens_used"] == 0
+
+    def test_page_context_and_history_bypass_cached_answer(self):
+        question = "How many communities are in Region IX?"
+        self.service.chat_with_ai(question, cache_scope="user:1|org:1")
+
+        self.service.chat_with_ai(
+            question, context="Viewing MANA dashboard", cache_scope="user:1|org:1"
+        )
+        self.service.chat_with_ai(
+            question,
+            conversation_history=[{"role": "user", "content": "Hello"}],
+            cache_scope="user:1|org:1",
+        )
+
+        assert self.service.generate_text.call_count == 3
+
+    def test_answers_are_not_shared_across_scopes(self):
+        question = "How many communities are in Region IX?"
+        self.service.chat_with_ai(question, cache_scope="user:1|org:1")
+
+        other_org = self.service.chat_with_ai(question, cache_scope="user:1|org:2")
+        unscoped = self.service.chat_with_ai(question)
+
+        assert self.service.generate_text.call_count == 3
+        assert other_org["cached"] is False
+        assert unscoped["cached"] is False
+
+
+@override_settings(AI_SEMANTIC_CACHE_ENABLED=True, GEMINI_MODEL="gemini-test")
+class TestAssistantSemanticCache(TestCase):
+    """GeminiAIEngine.generate_response() reuses answers within a scope."""
+
+    def setUp(self):
+        cache.clear()
+        self.engine = GeminiAIEngine.__new__(GeminiAIEngine)
+        self.engine.system_prompts = {"policy_chat": "SYSTEM"}
+        self.engine.model = MagicMock()
+        self.engine.model.generate_content.return_value = MagicMock(text="47 communities.")
+        patcher = patch.object(
+            semantic_cache,
+            "_cache_instance",
+            SemanticCache(embedder=bag_of_words, threshold=0.9),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_rephrased_question_in_same_scope_skips_llm(self):
+        self.engine.generate_response(
+            "How many communities are in Region IX?", cache_scope="user:1|org:1"
+        )
+        second = self.engine.generate_response(
+            "how many communities are in region IX", cache_scope="user:1|org:1"
+        )
+
+        assert self.engine.model.generate_content.call_count == 1
+        assert second["response"] == "47 communities."
+        assert second["metadata"]["cached"] is True
+
+    def test_other_users_and_organizations_do_not_share_answers(self):
+        question = "How many communities are in Region IX?"
+        self.engine.generate_response(question, cache_scope="user:1|org:1")
+
+        self.engine.generate_response(question, cache_scope="user:2|org:1")
+        self.engine.generate_response(question, cache_scope="user:1|org:2")
+        self.engine.generate_response(question)
+
+        assert self.engine.model.generate_content.call_count == 4
@@ -18,6 +18,7 @@ from recommendations.policy_tracking.serializers import PolicyRecommendationSeri
 
 from .ai_engine import GeminiAIEngine
 from .models import AIConversation, AIGeneratedDocument, AIInsight, AIUsageMetrics
+from .services import semantic_cache
 from .serializers import (
     AIConversationCreateSerializer,
     AIConversationSerializer,
@@ -105,7 +106,14 @@ class ChatAPIView(APIView):
             prompt=message,
             conversation_type=conversation_type,
             context_data=context_data,
-            conversation_history=conversation.messages[-10:],  # Last 10 messages
+            conversation_history=conversation.recent_messages(),
+            conversation_summary=conversation.summary,
+            # Opening questions do not depend on earlier turns
+            cache_scope=(
+                semantic_cache.scope_for_user(request.user)
+                if conversation.message_total == 1
+                else None
+            ),
         )
 
         if ai_response["success"]:
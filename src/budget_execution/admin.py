@@ -70,6 +70,10 @@ class AllotmentAdmin(admin.ModelAdmin):
     )
     inlines = [ObligationInline]
 
+    def get_queryset(self, request):
+        # Balance columns read the ledger annotations instead of summing per row.
+        return super().get_queryset(request).with_balances()
+
     def quarter_display(self, obj):
         return obj.get_quarter_display()
 
@@ -0,0 +1,46 @@
+"""
+Verify the budget execution ledger against allotments, obligations and disbursements.
+
+Usage:
+    python manage.py reconcile_budget_ledger
+    python manage.py reconcile_budget_ledger --fix
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from budget_execution.services import ledger
+
+
+class Command(BaseCommand):
+    help = "Compare ledger balances with the source rows and optionally rebuild drifted rows"
+
+    def add_arguments(self, parser):  # type: ignore[override]
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rewrite drifted or missing ledger rows from the source rows",
+        )
+
+    def handle(self, *args, **options):  # type: ignore[override]
+        differences = ledger.reconcile(fix=options["fix"])
+
+        if not differences:
+            self.stdout.write(self.style.SUCCESS("Budget ledger matches the source rows."))
+            return
+
+        for difference in differences:
+            recorded = difference["recorded"]
+            self.stdout.write(
+                f"{difference['ledger']} {difference['key']}: "
+                f"recorded {recorded if recorded is not None else 'missing'}, "
+                f"expected {difference['expected']}"
+            )
+
+        if options["fix"]:
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(differences)} ledger row(s)."))
+        else:
+            raise CommandError(
+                f"{len(differences)} ledger row(s) differ from the source rows; rerun with --fix."
+            )
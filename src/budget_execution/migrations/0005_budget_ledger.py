@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:32
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def build_ledgers(apps, schema_editor):
+    """Record the balances of existing allotments and program budgets."""
+    Allotment = apps.get_model("budget_execution", "Allotment")
+    Obligation = apps.get_model("budget_execution", "Obligation")
+    Disbursement = apps.get_model("budget_execution", "Disbursement")
+    AllotmentLedger = apps.get_model("budget_execution", "AllotmentLedger")
+    ProgramBudgetLedger = apps.get_model("budget_execution", "ProgramBudgetLedger")
+
+    def totals(queryset, key):
+        rows = queryset.order_by().values(key).annotate(total=Sum("amount"))
+        return {row[key]: row["total"] for row in rows}
+
+    obligated = totals(Obligation.objects.all(), "allotment_id")
+    disbursed = totals(Disbursement.objects.all(), "obligation__allotment_id")
+
+    allotment_ledgers = []
+    program_budgets = {}
+    for allotment_id, program_budget_id, amount in Allotment.objects.values_list(
+        "pk", "program_budget_id", "amount"
+    ):
+        ledger = AllotmentLedger(
+            allotment_id=allotment_id,
+            allotted_amount=amount,
+            obligated_amount=obligated.get(allotment_id) or Decimal("0.00"),
+            disbursed_amount=disbursed.get(allotment_id) or Decimal("0.00"),
+        )
+        ledger.available_amount = amount - ledger.obligated_amount
+        allotment_ledgers.append(ledger)
+
+        totals_row = program_budgets.setdefault(
+            program_budget_id, ProgramBudgetLedger(program_budget_id=program_budget_id)
+        )
+        for field in ("allotted_amount", "obligated_amount", "disbursed_amount", "available_amount"):
+            setattr(totals_row, field, getattr(totals_row, field) + getattr(ledger, field))
+
+    AllotmentLedger.objects.bulk_create(allotment_ledgers, batch_size=500)
+    ProgramBudgetLedger.objects.bulk_create(program_budgets.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budget_execution', '0004_alter_workitem_estimated_cost'),
+        ('budget_preparation', '0007_alter_programbudget_options_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AllotmentLedger',
+            fields=[
+                ('allotted_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Total allotments released (₱)', max_digits=15)),
+                ('obligated_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Total obligations charged (₱)', max_digits=15)),
+                ('disbursed_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Total disbursements paid (₱)', max_digits=15)),
+                ('available_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Allotted amount not yet obligated (₱)', max_digits=15)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('allotment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='ledger', serialize=False, to='budget_execution.allotment')),
+            ],
+            options={
+                'verbose_name': 'Allotment Ledger',
+                'verbose_name_plural': 'Allotment Ledgers',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProgramBudgetLedger',
+            fields=[
+                ('allotted_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Total allotments released (₱)', max_digits=15)),
+                ('obligated_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Total obligations charged (₱)', max_digits=15)),
+                ('disbursed_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Total disbursements paid (₱)', max_digits=15)),
+                ('available_amount', models.DecimalField(decimal_places=2, default=Decimal('0.00'), help_text='Allotted amount not yet obligated (₱)', max_digits=15)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('program_budget', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='execution_ledger', serialize=False, to='budget_preparation.programbudget')),
+            ],
+            options={
+                'verbose_name': 'Program Budget Ledger',
+                'verbose_name_plural': 'Program Budget Ledgers',
+            },
+        ),
+        migrations.RunPython(build_ledgers, migrations.RunPython.noop),
+    ]
@@ -2,5 +2,14 @@ from .allotment import Allotment
 from .obligation import Obligation
 from .disbursement import Disbursement
 from .work_item import WorkItem, DisbursementLineItem
+from .ledger import AllotmentLedger, ProgramBudgetLedger
 
-__all__ = ['Allotment', 'Obligation', 'Disbursement', 'WorkItem', 'DisbursementLineItem']
+__all__ = [
+    'Allotment',
+    'Obligation',
+    'Disbursement',
+    'WorkItem',
+    'DisbursementLineItem',
+    'AllotmentLedger',
+    'ProgramBudgetLedger',
+]
@@ -4,15 +4,30 @@ import uuid
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.db import models
-from django.db.models import Sum
+from django.db.models import F, Sum
 from django.utils import timezone
 
+from .ledger import AllotmentLedger, BalanceLedger, LedgerTrackedMixin, ProgramBudgetLedger
 
-class Allotment(models.Model):
+
+class AllotmentQuerySet(models.QuerySet):
+    def with_balances(self):
+        """
+        Annotate ledger balances as ``ledger_<balance>`` (e.g.
+        ``ledger_obligated_amount``) so listings need no per-row sums.
+        """
+        return self.annotate(
+            **{f"ledger_{field}": F(f"ledger__{field}") for field in BalanceLedger.BALANCE_FIELDS}
+        )
+
+
+class Allotment(LedgerTrackedMixin, models.Model):
     """
     Quarterly budget allotments released from an approved ProgramBudget.
     """
 
+    tracked_fields = ("amount", "status", "program_budget_id")
+
     QUARTER_CHOICES = [
         ("Q1", "Q1 (Jan–Mar)"),
         ("Q2", "Q2 (Apr–Jun)"),
@@ -77,6 +92,8 @@ class Allotment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = AllotmentQuerySet.as_manager()
+
     class Meta:
         ordering = ["program_budget", "quarter"]
         verbose_name = "Allotment"
@@ -99,9 +116,11 @@ class Allotment(models.Model):
             # Allow allotments even if approval not yet recorded to support draft flows.
             return
 
-        total_other = (
-            self.program_budget.allotments.exclude(pk=self.pk).aggregate(total=Sum("amount"))["total"]
-            or Decimal("0.00")
+        total_other = self.ledger_total_of_others(
+            ProgramBudgetLedger,
+            "program_budget_id",
+            "allotted_amount",
+            self.program_budget.allotments,
         )
         if total_other + self.amount > approved_amount:
             raise ValidationError(
@@ -116,14 +135,40 @@ class Allotment(models.Model):
     # ------------------------------------------------------------------
     # Aggregations
     # ------------------------------------------------------------------
+    def _ledger_balance(self, field: str) -> Decimal | None:
+        """Balance from ``with_balances()`` or the ledger row (None without one)."""
+        annotation = f"ledger_{field}"
+        if annotation in self.__dict__:
+            return self.__dict__[annotation]
+        return AllotmentLedger.objects.filter(pk=self.pk).values_list(field, flat=True).first()
+
     def get_obligated_amount(self) -> Decimal:
         """Return total obligations charged against this allotment."""
+        obligated = self._ledger_balance("obligated_amount")
+        if obligated is not None:
+            return obligated
         return self.obligations.aggregate(total=Sum("amount"))["total"] or Decimal("0.00")
 
+    def get_disbursed_amount(self) -> Decimal:
+        """Return total disbursements paid against this allotment."""
+        disbursed = self._ledger_balance("disbursed_amount")
+        if disbursed is not None:
+            return disbursed
+        return (
+            self.obligations.aggregate(total=Sum("disbursements__amount"))["total"]
+            or Decimal("0.00")
+        )
+
     def get_remaining_balance(self) -> Decimal:
         """Return remaining balance after obligations."""
         return self.amount - self.get_obligated_amount()
 
+    def get_utilization_rate(self) -> Decimal:
+        """Return obligated share of the allotment, in percent."""
+        if not self.amount:
+            return Decimal("0.00")
+        return (self.get_obligated_amount() / self.amount * 100).quantize(Decimal("0.01"))
+
     # ------------------------------------------------------------------
     # Legacy aliases for compatibility with integration fixtures
     # ------------------------------------------------------------------
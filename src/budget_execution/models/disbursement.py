@@ -7,12 +7,16 @@ from django.db import models
 from django.db.models import Sum
 from django.utils import timezone
 
+from .ledger import LedgerTrackedMixin
 
-class Disbursement(models.Model):
+
+class Disbursement(LedgerTrackedMixin, models.Model):
     """
     Payment disbursement linked to an obligation.
     """
 
+    tracked_fields = ("amount", "obligation_id")
+
     PAYMENT_METHOD_CHOICES = [
         ("check", "Check"),
         ("bank_transfer", "Bank Transfer"),
@@ -0,0 +1,118 @@
+from decimal import Decimal
+
+from django.db import models
+from django.db.models import Sum
+
+from common.running_totals import RunningTotalsMixin
+
+
+class LedgerTrackedMixin(RunningTotalsMixin):
+    """Source rows of the budget execution ledger."""
+
+    def ledger_total_of_others(self, ledger_model, parent_field, balance_field, siblings) -> Decimal:
+        """
+        Parent's ledger balance without this row's own recorded amount.
+
+        Falls back to summing ``siblings`` when the parent has no ledger row
+        or this row's recorded values are unknown.
+        """
+        parent_id = getattr(self, parent_field)
+        previous = self.__dict__.get("_tracked_values")
+        total = None
+        if self._state.adding or previous is not None:
+            total = (
+                ledger_model.objects.filter(pk=parent_id)
+                .values_list(balance_field, flat=True)
+                .first()
+            )
+        if total is None:
+            others = siblings.exclude(pk=self.pk).aggregate(total=Sum("amount"))["total"]
+            return others or Decimal("0.00")
+        if previous is not None and previous[parent_field] == parent_id:
+            total -= previous["amount"]
+        return total
+
+
+class BalanceLedger(models.Model):
+    """
+    Running execution balances, maintained by ``budget_execution.services.ledger``.
+
+    ``available_amount`` is the allotted amount not yet obligated.
+    """
+
+    allotted_amount = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        help_text="Total allotments released (₱)",
+    )
+    obligated_amount = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        help_text="Total obligations charged (₱)",
+    )
+    disbursed_amount = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        help_text="Total disbursements paid (₱)",
+    )
+    available_amount = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        help_text="Allotted amount not yet obligated (₱)",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    BALANCE_FIELDS = ("allotted_amount", "obligated_amount", "disbursed_amount", "available_amount")
+
+    class Meta:
+        abstract = True
+
+    @property
+    def utilization_rate(self) -> Decimal:
+        """Obligated share of the allotted amount, in percent."""
+        if not self.allotted_amount:
+            return Decimal("0.00")
+        return (self.obligated_amount / self.allotted_amount * 100).quantize(Decimal("0.01"))
+
+    def balances(self) -> dict:
+        return {field: getattr(self, field) for field in self.BALANCE_FIELDS}
+
+
+class AllotmentLedger(BalanceLedger):
+    """Running balances of a single allotment."""
+
+    allotment = models.OneToOneField(
+        "Allotment",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="ledger",
+    )
+
+    class Meta:
+        verbose_name = "Allotment Ledger"
+        verbose_name_plural = "Allotment Ledgers"
+
+    def __str__(self) -> str:
+        return f"Ledger for {self.allotment_id}"
+
+
+class ProgramBudgetLedger(BalanceLedger):
+    """Running balances of all allotments of a program budget."""
+
+    program_budget = models.OneToOneField(
+        "budget_preparation.ProgramBudget",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="execution_ledger",
+    )
+
+    class Meta:
+        verbose_name = "Program Budget Ledger"
+        verbose_name_plural = "Program Budget Ledgers"
+
+    def __str__(self) -> str:
+        return f"Ledger for {self.program_budget_id}"
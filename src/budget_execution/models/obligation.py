@@ -7,12 +7,16 @@ from django.db import models
 from django.db.models import Sum
 from django.utils import timezone
 
+from .ledger import AllotmentLedger, LedgerTrackedMixin
 
-class Obligation(models.Model):
+
+class Obligation(LedgerTrackedMixin, models.Model):
     """
     Obligation records (contracts, purchase orders) charged against an allotment.
     """
 
+    tracked_fields = ("amount", "status", "allotment_id")
+
     STATUS_CHOICES = [
         ("draft", "Draft"),
         ("obligated", "Obligated"),
@@ -88,9 +92,8 @@ class Obligation(models.Model):
 
     def clean(self) -> None:
         """Ensure obligations do not exceed the parent allotment."""
-        total_other = (
-            self.allotment.obligations.exclude(pk=self.pk).aggregate(total=Sum("amount"))["total"]
-            or Decimal("0.00")
+        total_other = self.ledger_total_of_others(
+            AllotmentLedger, "allotment_id", "obligated_amount", self.allotment.obligations
         )
         if total_other + self.amount > self.allotment.amount:
             raise ValidationError(
@@ -0,0 +1,277 @@
+"""
+Budget Execution Ledger
+
+Maintains running allotted, obligated, disbursed and available balances
+per allotment (``AllotmentLedger``) and per program budget
+(``ProgramBudgetLedger``), so balance checks and listings read one row
+instead of summing obligations and disbursements.
+
+Every save and delete of an allotment, obligation or disbursement posts
+its difference to both ledgers from the budget execution signals, using
+the running totals helpers in ``common.running_totals``. ``reconcile()``
+and the ``reconcile_budget_ledger`` management command compare the ledgers
+against the source rows and rebuild drifted balances.
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, List, Optional
+import logging
+
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from common.running_totals import ZERO, post_deltas, stored_differences
+
+from ..models import (
+    Allotment,
+    AllotmentLedger,
+    Disbursement,
+    Obligation,
+    ProgramBudgetLedger,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# POSTING
+# ============================================================================
+
+def _post(ledger_model, filters: dict, **deltas) -> int:
+    """Add ``deltas`` to the balances of the matching ledger rows."""
+    return post_deltas(
+        ledger_model.objects.filter(**filters),
+        {f"{field}_amount": delta for field, delta in deltas.items()},
+        updated_at=timezone.now(),
+    )
+
+
+def _post_via_allotment(allotment_id, **deltas) -> None:
+    _post(AllotmentLedger, {"allotment_id": allotment_id}, **deltas)
+    _post(ProgramBudgetLedger, {"program_budget__allotments": allotment_id}, **deltas)
+
+
+def _post_via_obligation(obligation_id, **deltas) -> None:
+    _post(AllotmentLedger, {"allotment__obligations": obligation_id}, **deltas)
+    _post(ProgramBudgetLedger, {"program_budget__allotments__obligations": obligation_id}, **deltas)
+
+
+def post_allotment(allotment: Allotment, previous: Optional[dict]) -> None:
+    """Post a saved allotment to its ledger and its program budget's ledger."""
+    if previous is None:
+        amount = allotment.amount
+        AllotmentLedger.objects.create(
+            allotment=allotment, allotted_amount=amount, available_amount=amount
+        )
+        if not _post(
+            ProgramBudgetLedger,
+            {"program_budget_id": allotment.program_budget_id},
+            allotted=amount,
+            available=amount,
+        ):
+            ProgramBudgetLedger.objects.create(
+                program_budget_id=allotment.program_budget_id,
+                allotted_amount=amount,
+                available_amount=amount,
+            )
+        return
+
+    delta = allotment.amount - previous["amount"]
+    _post(AllotmentLedger, {"allotment_id": allotment.pk}, allotted=delta, available=delta)
+
+    if previous["program_budget_id"] == allotment.program_budget_id:
+        _post(
+            ProgramBudgetLedger,
+            {"program_budget_id": allotment.program_budget_id},
+            allotted=delta,
+            available=delta,
+        )
+        return
+
+    # Moved to another program budget: carry its balances across.
+    obligated = allotment.obligations.aggregate(total=Sum("amount"))["total"] or ZERO
+    disbursed = (
+        Disbursement.objects.filter(obligation__allotment=allotment).aggregate(
+            total=Sum("amount")
+        )["total"]
+        or ZERO
+    )
+    _post(
+        ProgramBudgetLedger,
+        {"program_budget_id": previous["program_budget_id"]},
+        allotted=-previous["amount"],
+        obligated=-obligated,
+        disbursed=-disbursed,
+        available=obligated - previous["amount"],
+    )
+    moved = {
+        "allotted": allotment.amount,
+        "obligated": obligated,
+        "disbursed": disbursed,
+        "available": allotment.amount - obligated,
+    }
+    if not _post(ProgramBudgetLedger, {"program_budget_id": allotment.program_budget_id}, **moved):
+        ProgramBudgetLedger.objects.create(
+            program_budget_id=allotment.program_budget_id,
+            **{f"{field}_amount": value for field, value in moved.items()},
+        )
+
+
+def remove_allotment(deleted: dict) -> None:
+    """Take a deleted allotment out of its program budget's ledger."""
+    amount = deleted["amount"]
+    _post(
+        ProgramBudgetLedger,
+        {"program_budget_id": deleted["program_budget_id"]},
+        allotted=-amount,
+        available=-amount,
+    )
+
+
+def post_obligation(obligation: Obligation, previous: Optional[dict]) -> None:
+    """Post a saved obligation to the ledgers of its allotment."""
+    if previous is None or previous["allotment_id"] == obligation.allotment_id:
+        old_amount = previous["amount"] if previous else ZERO
+        delta = obligation.amount - old_amount
+        _post_via_allotment(obligation.allotment_id, obligated=delta, available=-delta)
+        return
+
+    disbursed = obligation.disbursements.aggregate(total=Sum("amount"))["total"] or ZERO
+    _post_via_allotment(
+        previous["allotment_id"],
+        obligated=-previous["amount"],
+        available=previous["amount"],
+        disbursed=-disbursed,
+    )
+    _post_via_allotment(
+        obligation.allotment_id,
+        obligated=obligation.amount,
+        available=-obligation.amount,
+        disbursed=disbursed,
+    )
+
+
+def remove_obligation(deleted: dict) -> None:
+    """Take a deleted obligation out of the ledgers of its allotment."""
+    amount = deleted["amount"]
+    _post_via_allotment(deleted["allotment_id"], obligated=-amount, available=amount)
+
+
+def post_disbursement(disbursement: Disbursement, previous: Optional[dict]) -> None:
+    """Post a saved disbursement to the ledgers of its obligation's allotment."""
+    if previous is None or previous["obligation_id"] == disbursement.obligation_id:
+        old_amount = previous["amount"] if previous else ZERO
+        _post_via_obligation(disbursement.obligation_id, disbursed=disbursement.amount - old_amount)
+        return
+
+    _post_via_obligation(previous["obligation_id"], disbursed=-previous["amount"])
+    _post_via_obligation(disbursement.obligation_id, disbursed=disbursement.amount)
+
+
+def remove_disbursement(deleted: dict) -> None:
+    """Take a deleted disbursement out of the ledgers of its allotment."""
+    _post_via_obligation(deleted["obligation_id"], disbursed=-deleted["amount"])
+
+
+# ============================================================================
+# READING
+# ============================================================================
+
+def allotment_balance(allotment_id, field: str) -> Optional[Decimal]:
+    """One balance of an allotment, or None when it has no ledger row."""
+    return (
+        AllotmentLedger.objects.filter(allotment_id=allotment_id)
+        .values_list(field, flat=True)
+        .first()
+    )
+
+
+def program_budget_balance(program_budget_id, field: str) -> Optional[Decimal]:
+    """One balance of a program budget, or None when it has no ledger row."""
+    return (
+        ProgramBudgetLedger.objects.filter(program_budget_id=program_budget_id)
+        .values_list(field, flat=True)
+        .first()
+    )
+
+
+# ============================================================================
+# RECONCILIATION
+# ============================================================================
+
+def _totals(queryset, key: str) -> Dict:
+    return dict(
+        queryset.order_by().values(key).annotate(total=Sum("amount")).values_list(key, "total")
+    )
+
+
+def expected_balances():
+    """
+    Balances recomputed from the source rows with three grouped queries.
+
+    Returns:
+        tuple: ``(allotments, program_budgets)``, each mapping a primary key
+        to its ``BalanceLedger.BALANCE_FIELDS`` values
+    """
+    obligated = _totals(Obligation.objects.all(), "allotment_id")
+    disbursed = _totals(Disbursement.objects.all(), "obligation__allotment_id")
+
+    allotments = {}
+    program_budgets = defaultdict(lambda: dict.fromkeys(AllotmentLedger.BALANCE_FIELDS, ZERO))
+    for allotment_id, program_budget_id, amount in Allotment.objects.values_list(
+        "pk", "program_budget_id", "amount"
+    ):
+        balances = {
+            "allotted_amount": amount,
+            "obligated_amount": obligated.get(allotment_id) or ZERO,
+            "disbursed_amount": disbursed.get(allotment_id) or ZERO,
+        }
+        balances["available_amount"] = amount - balances["obligated_amount"]
+        allotments[allotment_id] = balances
+        totals = program_budgets[program_budget_id]
+        for field, value in balances.items():
+            totals[field] += value
+    return allotments, dict(program_budgets)
+
+
+def _differences(ledger_model, key: str, expected: Dict) -> List[dict]:
+    rows = ledger_model.objects.values(key, *ledger_model.BALANCE_FIELDS)
+    return [
+        {"ledger": ledger_model.__name__, **difference}
+        for difference in stored_differences(rows, key, ledger_model.BALANCE_FIELDS, expected)
+    ]
+
+
+def reconcile(fix: bool = False) -> List[dict]:
+    """
+    Compare the ledgers against the source rows.
+
+    Args:
+        fix: Rewrite drifted, missing and orphaned ledger rows
+
+    Returns:
+        List of differences with ``ledger``, ``key``, ``recorded`` (None when
+        the row is missing) and ``expected`` balances
+    """
+    expected_allotments, expected_program_budgets = expected_balances()
+    differences = _differences(
+        AllotmentLedger, "allotment_id", expected_allotments
+    ) + _differences(ProgramBudgetLedger, "program_budget_id", expected_program_budgets)
+
+    if fix and differences:
+        with transaction.atomic():
+            for difference in differences:
+                ledger_model = (
+                    AllotmentLedger
+                    if difference["ledger"] == AllotmentLedger.__name__
+                    else ProgramBudgetLedger
+                )
+                key = "allotment_id" if ledger_model is AllotmentLedger else "program_budget_id"
+                ledger_model.objects.update_or_create(
+                    **{key: difference["key"]}, defaults=difference["expected"]
+                )
+        logger.warning("Budget execution ledger: rebuilt %d balance rows", len(differences))
+
+    return differences
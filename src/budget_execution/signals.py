@@ -9,14 +9,21 @@ Audit logging is handled by:
 
 All financial operations (allotments, obligations, disbursements) are automatically
 logged by the middleware. These signals provide additional event hooks if needed.
+
+They also post every write to the running balance ledger
+(budget_execution.services.ledger). Previous amounts are read from the
+locked row inside the write's transaction (common.running_totals).
 """
 
-from django.db.models.signals import post_save, post_delete, pre_save
+from django.db.models.signals import post_save, post_delete, pre_delete, pre_save
 from django.dispatch import receiver
 from decimal import Decimal
 import logging
 
+from common.running_totals import deleted_values, lock_previous_values
+
 from .models import Allotment, Obligation, Disbursement, DisbursementLineItem
+from .services import ledger
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +35,14 @@ def _user_display(user):
     return full_name or getattr(user, "username", str(user))
 
 
+@receiver(pre_delete, sender=Allotment)
+@receiver(pre_delete, sender=Obligation)
+@receiver(pre_delete, sender=Disbursement)
+def ledger_pre_delete(sender, instance, origin=None, **kwargs):
+    """Capture the amounts the ledger recorded for a row being deleted."""
+    instance._ledger_deleted = deleted_values(instance, origin)
+
+
 # ============================================================================
 # ALLOTMENT SIGNALS
 # ============================================================================
@@ -35,19 +50,19 @@ def _user_display(user):
 @receiver(pre_save, sender=Allotment)
 def allotment_pre_save(sender, instance, **kwargs):
     """Track allotment changes before save for audit context."""
-    if instance.pk:
-        # Updating existing allotment
-        try:
-            old_instance = Allotment.objects.get(pk=instance.pk)
-            instance._old_amount = old_instance.amount
-            instance._old_status = old_instance.status
-        except Allotment.DoesNotExist:
-            pass
+    previous = lock_previous_values(instance)
+    instance._ledger_previous = previous
+    if previous:
+        instance._old_amount = previous["amount"]
+        instance._old_status = previous["status"]
 
 
 @receiver(post_save, sender=Allotment)
 def allotment_post_save(sender, instance, created, **kwargs):
-    """Log allotment creation/updates."""
+    """Post allotment writes to the ledger and log creation/updates."""
+    ledger.post_allotment(instance, getattr(instance, "_ledger_previous", None))
+    instance.remember_tracked_values()
+
     if created:
         logger.info(
             f"Allotment created: {instance.id} | "
@@ -78,6 +93,7 @@ def allotment_post_save(sender, instance, created, **kwargs):
 @receiver(post_delete, sender=Allotment)
 def allotment_deleted(sender, instance, **kwargs):
     """Log allotment deletion (should be rare - cancelled instead)."""
+    ledger.remove_allotment(instance._ledger_deleted)
     logger.warning(
         f"Allotment deleted: {instance.id} | "
         f"Program: {instance.program_budget} | "
@@ -92,18 +108,19 @@ def allotment_deleted(sender, instance, **kwargs):
 @receiver(pre_save, sender=Obligation)
 def obligation_pre_save(sender, instance, **kwargs):
     """Track obligation changes before save."""
-    if instance.pk:
-        try:
-            old_instance = Obligation.objects.get(pk=instance.pk)
-            instance._old_amount = old_instance.amount
-            instance._old_status = old_instance.status
-        except Obligation.DoesNotExist:
-            pass
+    previous = lock_previous_values(instance)
+    instance._ledger_previous = previous
+    if previous:
+        instance._old_amount = previous["amount"]
+        instance._old_status = previous["status"]
 
 
 @receiver(post_save, sender=Obligation)
 def obligation_post_save(sender, instance, created, **kwargs):
-    """Log obligation creation/updates."""
+    """Post obligation writes to the ledger and log creation/updates."""
+    ledger.post_obligation(instance, getattr(instance, "_ledger_previous", None))
+    instance.remember_tracked_values()
+
     if created:
         logger.info(
             f"Obligation created: {instance.id} | "
@@ -134,6 +151,7 @@ def obligation_post_save(sender, instance, created, **kwargs):
 @receiver(post_delete, sender=Obligation)
 def obligation_deleted(sender, instance, **kwargs):
     """Log obligation deletion."""
+    ledger.remove_obligation(instance._ledger_deleted)
     logger.warning(
         f"Obligation deleted: {instance.id} | "
         f"Work Item: {getattr(instance.work_item, 'title', 'N/A')} | "
@@ -148,17 +166,18 @@ def obligation_deleted(sender, instance, **kwargs):
 @receiver(pre_save, sender=Disbursement)
 def disbursement_pre_save(sender, instance, **kwargs):
     """Track disbursement changes before save."""
-    if instance.pk:
-        try:
-            old_instance = Disbursement.objects.get(pk=instance.pk)
-            instance._old_amount = old_instance.amount
-        except Disbursement.DoesNotExist:
-            pass
+    previous = lock_previous_values(instance)
+    instance._ledger_previous = previous
+    if previous:
+        instance._old_amount = previous["amount"]
 
 
 @receiver(post_save, sender=Disbursement)
 def disbursement_post_save(sender, instance, created, **kwargs):
-    """Log disbursement creation/updates."""
+    """Post disbursement writes to the ledger and log creation/updates."""
+    ledger.post_disbursement(instance, getattr(instance, "_ledger_previous", None))
+    instance.remember_tracked_values()
+
     if created:
         logger.info(
             f"Disbursement created: {instance.id} | "
@@ -182,6 +201,7 @@ def disbursement_post_save(sender, instance, created, **kwargs):
 @receiver(post_delete, sender=Disbursement)
 def disbursement_deleted(sender, instance, **kwargs):
     """Log disbursement deletion."""
+    ledger.remove_disbursement(instance._ledger_deleted)
     logger.warning(
         f"Disbursement deleted: {instance.id} | "
         f"Reference: {instance.reference_number or 'N/A'} | "
@@ -0,0 +1,136 @@
+"""
+Ledger tests for budget execution
+
+Running balances must always equal the sums of the source rows.
+"""
+
+from decimal import Decimal
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from budget_execution.models import (
+    Allotment,
+    AllotmentLedger,
+    Disbursement,
+    Obligation,
+    ProgramBudgetLedger,
+)
+from budget_execution.services import ledger
+
+
+def assert_ledgers_reconciled():
+    assert ledger.reconcile() == []
+
+
+@pytest.mark.django_db
+class TestLedgerPosting:
+    """Writes post their differences to the allotment and program budget ledgers."""
+
+    def test_balances_follow_writes(self, disbursement, allotment_q1, approved_program_budget):
+        allotment_ledger = AllotmentLedger.objects.get(allotment=allotment_q1)
+        assert allotment_ledger.allotted_amount == Decimal("10000000.00")
+        assert allotment_ledger.obligated_amount == disbursement.obligation.amount
+        assert allotment_ledger.disbursed_amount == Decimal("2500000.00")
+        assert allotment_ledger.available_amount == (
+            Decimal("10000000.00") - disbursement.obligation.amount
+        )
+        assert ProgramBudgetLedger.objects.get(
+            program_budget=approved_program_budget
+        ).balances() == allotment_ledger.balances()
+        assert_ledgers_reconciled()
+
+    def test_updates_and_deletes_are_posted(self, disbursement, allotment_q1, allotment_q2):
+        obligation = Obligation.objects.get(pk=disbursement.obligation_id)
+        obligation.amount = Decimal("4000000.00")
+        obligation.save()
+
+        moved = Disbursement.objects.get(pk=disbursement.pk)
+        moved.amount = Decimal("1000000.00")
+        moved.save()
+        moved.amount = Decimal("1500000.00")  # second save on the same instance
+        moved.save()
+
+        obligation.allotment = allotment_q2
+        obligation.save()
+        assert AllotmentLedger.objects.get(allotment=allotment_q2).disbursed_amount == Decimal(
+            "1500000.00"
+        )
+        assert_ledgers_reconciled()
+
+        allotment_q2.amount = Decimal("11000000.00")
+        allotment_q2.save()
+        assert_ledgers_reconciled()
+
+        Allotment.objects.get(pk=allotment_q2.pk).delete()
+        assert_ledgers_reconciled()
+
+    def test_stale_instances_post_against_the_stored_row(self, disbursement, allotment_q1):
+        first = Disbursement.objects.get(pk=disbursement.pk)
+        second = Disbursement.objects.get(pk=disbursement.pk)
+
+        first.amount = Decimal("2000000.00")
+        first.save()
+        second.amount = Decimal("1000000.00")
+        second.save()
+
+        assert AllotmentLedger.objects.get(allotment=allotment_q1).disbursed_amount == Decimal(
+            "1000000.00"
+        )
+        assert_ledgers_reconciled()
+
+        # Deleting the stale instance removes the amount actually stored.
+        first.delete()
+        assert_ledgers_reconciled()
+
+    def test_refresh_from_db_re_records_tracked_values(self, disbursement):
+        loaded = Disbursement.objects.get(pk=disbursement.pk)
+        Disbursement.objects.filter(pk=disbursement.pk).update(amount=Decimal("1500000.00"))
+
+        loaded.refresh_from_db()
+
+        assert loaded._tracked_values["amount"] == Decimal("1500000.00")
+
+    def test_validation_reads_the_ledger(self, obligation, allotment_q1, work_item):
+        remaining = allotment_q1.get_remaining_balance()
+        assert remaining == allotment_q1.amount - obligation.amount
+
+        with pytest.raises(ValidationError):
+            Obligation.objects.create(
+                allotment=allotment_q1, work_item=work_item, amount=remaining + Decimal("0.01")
+            )
+        Obligation.objects.create(allotment=allotment_q1, work_item=work_item, amount=remaining)
+        assert Allotment.objects.get(pk=allotment_q1.pk).get_utilization_rate() == Decimal("100.00")
+
+    def test_bulk_listing_uses_annotations(self, obligation, allotment_q2):
+        with CaptureQueriesContext(connection) as queries:
+            allotments = list(Allotment.objects.with_balances())
+            balances = [allotment.get_remaining_balance() for allotment in allotments]
+
+        assert len(queries) == 1
+        assert sorted(balances) == sorted(
+            [allotment_q2.amount, obligation.allotment.amount - obligation.amount]
+        )
+
+
+@pytest.mark.django_db
+class TestLedgerReconciliation:
+    """The reconciliation command detects and repairs drift."""
+
+    def test_reconcile_command_repairs_drift(self, disbursement, allotment_q1):
+        Disbursement.objects.filter(pk=disbursement.pk).update(amount=Decimal("100.00"))
+        AllotmentLedger.objects.filter(allotment=allotment_q1).delete()
+
+        with pytest.raises(CommandError):
+            call_command("reconcile_budget_ledger")
+
+        call_command("reconcile_budget_ledger", "--fix")
+
+        assert_ledgers_reconciled()
+        assert AllotmentLedger.objects.get(allotment=allotment_q1).disbursed_amount == Decimal(
+            "100.00"
+        )
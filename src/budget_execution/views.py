@@ -107,11 +107,8 @@ def budget_dashboard(request):
     # Count pending approvals
     pending_approvals_count = Allotment.objects.filter(status='pending').count()
     alerts_count = Allotment.objects.filter(
-        status__in=['released', 'partially_utilized']
-    ).annotate(
-        utilization=Sum('obligations__amount')
-    ).filter(
-        utilization__gte=F('amount') * Decimal('0.85')  # 85% threshold
+        status__in=['released', 'partially_utilized'],
+        ledger__obligated_amount__gte=F('amount') * Decimal('0.85')  # 85% threshold
     ).count()
 
     context = {
@@ -606,11 +603,10 @@ def budget_alerts(request):
     alerts = []
 
     high_utilization = Allotment.objects.filter(
-        status__in=['released', 'partially_utilized']
+        status__in=['released', 'partially_utilized'],
+        ledger__obligated_amount__gte=F('amount') * Decimal('0.85')
     ).select_related('program_budget__program').annotate(
-        utilization=Sum('obligations__amount')
-    ).filter(
-        utilization__gte=F('amount') * Decimal('0.85')
+        utilization=F('ledger__obligated_amount')
     )[:5]
 
     for allotment in high_utilization:
@@ -638,7 +634,7 @@ def get_budget_details(request):
 
     program_budget = get_object_or_404(
         ProgramBudget.objects.annotate(
-            total_allotted=Sum('allotments__amount')
+            total_allotted=F('execution_ledger__allotted_amount')
         ),
         pk=program_budget_id
     )
@@ -9,3 +9,6 @@ class BudgetPreparationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "budget_preparation"
     verbose_name = "Budget Preparation (Phase 2A)"
+
+    def ready(self):
+        import budget_preparation.signals  # noqa
@@ -0,0 +1,44 @@
+"""
+Verify stored proposal and program budget totals against the source rows.
+
+Usage:
+    python manage.py verify_proposal_totals
+    python manage.py verify_proposal_totals --fix
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from budget_preparation.services import proposal_totals
+
+
+class Command(BaseCommand):
+    help = "Recompute proposal totals from line items and program budgets and optionally rebuild drifted rows"
+
+    def add_arguments(self, parser):  # type: ignore[override]
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rewrite drifted totals from the source rows",
+        )
+
+    def handle(self, *args, **options):  # type: ignore[override]
+        differences = proposal_totals.verify(fix=options["fix"])
+
+        if not differences:
+            self.stdout.write(self.style.SUCCESS("Proposal totals match the source rows."))
+            return
+
+        for difference in differences:
+            self.stdout.write(
+                f"{difference['model']} {difference['key']}: "
+                f"recorded {difference['recorded']}, expected {difference['expected']}"
+            )
+
+        if options["fix"]:
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(differences)} row(s)."))
+        else:
+            raise CommandError(
+                f"{len(differences)} row(s) differ from the source rows; rerun with --fix."
+            )
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:46
+
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def build_totals(apps, schema_editor):
+    """Record the totals of existing program budgets and proposals."""
+    BudgetProposal = apps.get_model("budget_preparation", "BudgetProposal")
+    ProgramBudget = apps.get_model("budget_preparation", "ProgramBudget")
+    BudgetLineItem = apps.get_model("budget_preparation", "BudgetLineItem")
+
+    def total(queryset, key, field):
+        rows = queryset.filter(**{key: OuterRef("pk")}).order_by().values(key)
+        return Coalesce(
+            Subquery(rows.annotate(total=Sum(field)).values("total")),
+            Value(Decimal("0.00")),
+            output_field=models.DecimalField(max_digits=15, decimal_places=2),
+        )
+
+    ProgramBudget.objects.update(
+        line_items_total_cost=total(BudgetLineItem.objects.all(), "program_budget", "total_cost")
+    )
+    BudgetProposal.objects.update(
+        program_requested_total=total(
+            ProgramBudget.objects.all(), "budget_proposal", "requested_amount"
+        ),
+        program_approved_total=total(
+            ProgramBudget.objects.all(), "budget_proposal", "approved_amount"
+        ),
+        line_items_total_cost=total(
+            BudgetLineItem.objects.all(), "program_budget__budget_proposal", "total_cost"
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budget_preparation', '0007_alter_programbudget_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='budgetproposal',
+            name='line_items_total_cost',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), editable=False, help_text='Running total cost of all program line items (₱)', max_digits=15),
+        ),
+        migrations.AddField(
+            model_name='budgetproposal',
+            name='program_approved_total',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), editable=False, help_text='Running total of program budget approved amounts (₱)', max_digits=15),
+        ),
+        migrations.AddField(
+            model_name='budgetproposal',
+            name='program_requested_total',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), editable=False, help_text='Running total of program budget requested amounts (₱)', max_digits=15),
+        ),
+        migrations.AddField(
+            model_name='programbudget',
+            name='line_items_total_cost',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), editable=False, help_text='Running total cost of line items (₱)', max_digits=15),
+        ),
+        migrations.RunPython(build_totals, migrations.RunPython.noop),
+    ]
@@ -9,8 +9,10 @@ from django.db import models
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 
+from common.running_totals import RunningTotalsMixin
 
-class BudgetLineItem(models.Model):
+
+class BudgetLineItem(RunningTotalsMixin, models.Model):
     """
     Individual line items representing detailed budget breakdown.
 
@@ -20,6 +22,8 @@ class BudgetLineItem(models.Model):
     - Capital Outlay (CO): Equipment, infrastructure
     """
 
+    tracked_fields = ("program_budget_id", "total_cost")
+
     CATEGORY_CHOICES = [
         ('personnel', 'Personnel Services (PS)'),
         ('operating', 'Maintenance & Other Operating Expenses (MOOE)'),
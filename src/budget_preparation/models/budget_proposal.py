@@ -12,10 +12,12 @@ from django.core.validators import MinValueValidator
 from django.db import models
 from django.utils import timezone
 
+from common.running_totals import RunningTotalsMixin
+
 User = get_user_model()
 
 
-class BudgetProposal(models.Model):
+class BudgetProposal(RunningTotalsMixin, models.Model):
     """
     Budget proposal submitted by a BMMS organization for a fiscal year.
 
@@ -24,6 +26,12 @@ class BudgetProposal(models.Model):
     tracks both requested and approved budget amounts.
     """
 
+    stored_total_fields = (
+        "program_requested_total",
+        "program_approved_total",
+        "line_items_total_cost",
+    )
+
     STATUS_CHOICES = [
         ("draft", "Draft"),
         ("submitted", "Submitted"),
@@ -65,6 +73,27 @@ class BudgetProposal(models.Model):
         validators=[MinValueValidator(Decimal("0.00"))],
         help_text="Total budget amount approved (₱)",
     )
+    program_requested_total = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        editable=False,
+        help_text="Running total of program budget requested amounts (₱)",
+    )
+    program_approved_total = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        editable=False,
+        help_text="Running total of program budget approved amounts (₱)",
+    )
+    line_items_total_cost = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        editable=False,
+        help_text="Running total cost of all program line items (₱)",
+    )
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
@@ -165,22 +194,12 @@ class BudgetProposal(models.Model):
     @property
     def total_program_requested(self) -> Decimal:
         """Sum of requested amounts across related program budgets."""
-        from django.db.models import Sum
-
-        return (
-            self.program_budgets.aggregate(total=Sum("requested_amount"))["total"]
-            or Decimal("0.00")
-        )
+        return self.program_requested_total
 
     @property
     def total_program_approved(self) -> Decimal:
         """Sum of approved amounts across related program budgets."""
-        from django.db.models import Sum
-
-        return (
-            self.program_budgets.aggregate(total=Sum("approved_amount"))["total"]
-            or Decimal("0.00")
-        )
+        return self.program_approved_total
 
     # ------------------------------------------------------------------
     # Backwards compatibility aliases
@@ -8,10 +8,11 @@ from decimal import Decimal
 
 from django.core.validators import MinValueValidator
 from django.db import models
-from django.db.models import Sum
 
+from common.running_totals import RunningTotalsMixin
 
-class ProgramBudget(models.Model):
+
+class ProgramBudget(RunningTotalsMixin, models.Model):
     """
     Budget allocation for a specific program within a budget proposal.
 
@@ -19,6 +20,9 @@ class ProgramBudget(models.Model):
     allows tracking of requested vs. approved amounts.
     """
 
+    tracked_fields = ("budget_proposal_id", "requested_amount", "approved_amount")
+    stored_total_fields = ("line_items_total_cost",)
+
     PRIORITY_CHOICES = [
         ("high", "High"),
         ("medium", "Medium"),
@@ -77,6 +81,13 @@ class ProgramBudget(models.Model):
         blank=True,
         help_text="Expected outcomes and beneficiaries",
     )
+    line_items_total_cost = models.DecimalField(
+        max_digits=15,
+        decimal_places=2,
+        default=Decimal("0.00"),
+        editable=False,
+        help_text="Running total cost of line items (₱)",
+    )
     priority_rank = models.PositiveIntegerField(
         default=1,
         help_text="Priority ranking within the proposal (1 = highest)",
@@ -123,10 +134,8 @@ class ProgramBudget(models.Model):
     # Financial helpers
     # ------------------------------------------------------------------
     def line_items_total(self) -> Decimal:
-        """Aggregate total cost of all line items."""
-        return self.line_items.aggregate(total=Sum("total_cost"))["total"] or Decimal(
-            "0.00"
-        )
+        """Total cost of all line items (stored running total)."""
+        return self.line_items_total_cost
 
     def get_variance(self) -> Decimal | None:
         """
@@ -9,6 +9,7 @@ from django.db import transaction
 from django.core.exceptions import ValidationError
 from decimal import Decimal
 from ..models import BudgetProposal, ProgramBudget, BudgetLineItem, BudgetJustification
+from . import proposal_totals
 
 
 class BudgetBuilderService:
@@ -201,6 +202,7 @@ class BudgetBuilderService:
             dict: Dictionary of validation errors (empty if valid)
         """
         errors = {}
+        proposal.refresh_from_db(fields=proposal_totals.PROPOSAL_TOTAL_FIELDS)
 
         # Check if proposal has program budgets
         program_budgets = proposal.program_budgets.all()
@@ -239,7 +241,8 @@ class BudgetBuilderService:
         return errors
 
     def _update_proposal_total(self, proposal):
-        """Update proposal total from program budgets."""
+        """Update proposal total from the stored program budget totals."""
+        proposal.refresh_from_db(fields=proposal_totals.PROPOSAL_TOTAL_FIELDS)
         requested_total = proposal.total_program_requested
         approved_total = proposal.total_program_approved
         proposal.total_proposed_budget = requested_total
@@ -0,0 +1,189 @@
+"""
+Proposal Totals
+
+Maintains stored rollups so proposal listings, validation and OCM reads do
+not re-aggregate program budgets and line items:
+
+- ``ProgramBudget.line_items_total_cost``: cost of the program's line items
+- ``BudgetProposal.line_items_total_cost``: cost of all its line items
+- ``BudgetProposal.program_requested_total`` / ``program_approved_total``:
+  requested and approved amounts of its program budgets
+
+Every save and delete of a line item or program budget posts its difference
+from the budget preparation signals, using the running totals helpers in
+``common.running_totals``. ``verify()`` and the ``verify_proposal_totals``
+management command recompute the totals from scratch and rebuild drifted
+rows.
+"""
+
+from decimal import Decimal
+from typing import Dict, List, Optional
+import logging
+
+from django.db import transaction
+from django.db.models import Sum
+
+from common.running_totals import ZERO, post_deltas, stored_differences
+
+from ..models import BudgetLineItem, BudgetProposal, ProgramBudget
+
+logger = logging.getLogger(__name__)
+
+PROGRAM_TOTAL_FIELDS = ProgramBudget.stored_total_fields
+PROPOSAL_TOTAL_FIELDS = BudgetProposal.stored_total_fields
+
+
+# ============================================================================
+# POSTING
+# ============================================================================
+
+def _post_line_items(program_budget_id, delta: Decimal) -> None:
+    """Post a line item cost change to its program budget and proposal."""
+    post_deltas(ProgramBudget.objects.filter(pk=program_budget_id), {"line_items_total_cost": delta})
+    post_deltas(
+        BudgetProposal.objects.filter(program_budgets=program_budget_id),
+        {"line_items_total_cost": delta},
+    )
+
+
+def _post_programs(proposal_id, requested: Decimal, approved: Decimal, line_items=ZERO) -> None:
+    """Post program budget amount changes to a proposal."""
+    post_deltas(
+        BudgetProposal.objects.filter(pk=proposal_id),
+        {
+            "program_requested_total": requested,
+            "program_approved_total": approved,
+            "line_items_total_cost": line_items,
+        },
+    )
+
+
+def post_line_item(line_item: BudgetLineItem, previous: Optional[dict]) -> None:
+    """Post a saved line item to its program budget and proposal totals."""
+    if previous is None or previous["program_budget_id"] == line_item.program_budget_id:
+        old_cost = previous["total_cost"] if previous else ZERO
+        _post_line_items(line_item.program_budget_id, line_item.total_cost - old_cost)
+        return
+
+    _post_line_items(previous["program_budget_id"], -previous["total_cost"])
+    _post_line_items(line_item.program_budget_id, line_item.total_cost)
+
+
+def remove_line_item(deleted: dict) -> None:
+    """Take a deleted line item out of its program budget and proposal totals."""
+    _post_line_items(deleted["program_budget_id"], -deleted["total_cost"])
+
+
+def post_program_budget(program_budget: ProgramBudget, previous: Optional[dict]) -> None:
+    """Post a saved program budget to its proposal totals."""
+    requested = program_budget.requested_amount
+    approved = program_budget.approved_amount or ZERO
+
+    if previous is None or previous["budget_proposal_id"] == program_budget.budget_proposal_id:
+        previous = previous or {}
+        _post_programs(
+            program_budget.budget_proposal_id,
+            requested - previous.get("requested_amount", ZERO),
+            approved - (previous.get("approved_amount") or ZERO),
+        )
+        return
+
+    # Moved to another proposal: carry its line item costs across. The
+    # stored cost was reloaded from the locked row before the save.
+    line_items = program_budget.line_items_total_cost
+    _post_programs(
+        previous["budget_proposal_id"],
+        -previous["requested_amount"],
+        -(previous["approved_amount"] or ZERO),
+        -line_items,
+    )
+    _post_programs(program_budget.budget_proposal_id, requested, approved, line_items)
+
+
+def remove_program_budget(deleted: dict) -> None:
+    """
+    Take a deleted program budget out of its proposal totals.
+
+    Its line items are deleted first (cascade) and remove their own costs.
+    """
+    _post_programs(
+        deleted["budget_proposal_id"],
+        -deleted["requested_amount"],
+        -(deleted["approved_amount"] or ZERO),
+    )
+
+
+# ============================================================================
+# VERIFICATION
+# ============================================================================
+
+def _totals(queryset, key: str, field: str) -> Dict:
+    return dict(
+        queryset.order_by().values(key).annotate(total=Sum(field)).values_list(key, "total")
+    )
+
+
+def expected_totals():
+    """
+    Totals recomputed from the source rows with grouped queries.
+
+    Returns:
+        tuple: ``(program_budgets, proposals)``, each mapping a primary key
+        to its stored total fields
+    """
+    program_costs = _totals(BudgetLineItem.objects.all(), "program_budget_id", "total_cost")
+    proposal_costs = _totals(
+        BudgetLineItem.objects.all(), "program_budget__budget_proposal_id", "total_cost"
+    )
+    requested = _totals(ProgramBudget.objects.all(), "budget_proposal_id", "requested_amount")
+    approved = _totals(ProgramBudget.objects.all(), "budget_proposal_id", "approved_amount")
+
+    program_budgets = {
+        pk: {"line_items_total_cost": program_costs.get(pk) or ZERO}
+        for pk in ProgramBudget.objects.values_list("pk", flat=True)
+    }
+    proposals = {
+        pk: {
+            "program_requested_total": requested.get(pk) or ZERO,
+            "program_approved_total": approved.get(pk) or ZERO,
+            "line_items_total_cost": proposal_costs.get(pk) or ZERO,
+        }
+        for pk in BudgetProposal.objects.values_list("pk", flat=True)
+    }
+    return program_budgets, proposals
+
+
+def _differences(model, fields, expected: Dict) -> List[dict]:
+    rows = model.objects.values("pk", *fields)
+    return [
+        {"model": model.__name__, **difference}
+        for difference in stored_differences(rows, "pk", fields, expected)
+    ]
+
+
+def verify(fix: bool = False) -> List[dict]:
+    """
+    Compare the stored totals against the source rows.
+
+    Args:
+        fix: Rewrite drifted totals
+
+    Returns:
+        List of differences with ``model``, ``key``, ``recorded`` and
+        ``expected`` totals
+    """
+    expected_programs, expected_proposals = expected_totals()
+    differences = _differences(
+        ProgramBudget, PROGRAM_TOTAL_FIELDS, expected_programs
+    ) + _differences(BudgetProposal, PROPOSAL_TOTAL_FIELDS, expected_proposals)
+
+    if fix and differences:
+        models = {model.__name__: model for model in (ProgramBudget, BudgetProposal)}
+        with transaction.atomic():
+            for difference in differences:
+                models[difference["model"]].objects.filter(pk=difference["key"]).update(
+                    **difference["expected"]
+                )
+        logger.warning("Proposal totals: rebuilt %d rows", len(differences))
+
+    return differences
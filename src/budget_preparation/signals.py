@@ -0,0 +1,53 @@
+"""
+Budget Preparation Signals
+
+Post every line item and program budget write to the stored proposal
+totals (budget_preparation.services.proposal_totals). Previous amounts are
+read from the locked row inside the write's transaction
+(common.running_totals).
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from common.running_totals import deleted_values, lock_previous_values
+
+from .models import BudgetLineItem, BudgetProposal, ProgramBudget
+from .services import proposal_totals
+
+
+@receiver(pre_save, sender=BudgetLineItem)
+@receiver(pre_save, sender=ProgramBudget)
+@receiver(pre_save, sender=BudgetProposal)
+def lock_totals_row(sender, instance, **kwargs):
+    """Read the stored values of the row being saved."""
+    instance._totals_previous = lock_previous_values(instance)
+
+
+@receiver(pre_delete, sender=BudgetLineItem)
+@receiver(pre_delete, sender=ProgramBudget)
+def capture_deleted_totals(sender, instance, origin=None, **kwargs):
+    """Capture the amounts the totals recorded for a row being deleted."""
+    instance._totals_deleted = deleted_values(instance, origin)
+
+
+@receiver(post_save, sender=BudgetLineItem)
+def line_item_saved(sender, instance, **kwargs):
+    proposal_totals.post_line_item(instance, instance._totals_previous)
+    instance.remember_tracked_values()
+
+
+@receiver(post_delete, sender=BudgetLineItem)
+def line_item_deleted(sender, instance, **kwargs):
+    proposal_totals.remove_line_item(instance._totals_deleted)
+
+
+@receiver(post_save, sender=ProgramBudget)
+def program_budget_saved(sender, instance, **kwargs):
+    proposal_totals.post_program_budget(instance, instance._totals_previous)
+    instance.remember_tracked_values()
+
+
+@receiver(post_delete, sender=ProgramBudget)
+def program_budget_deleted(sender, instance, **kwargs):
+    proposal_totals.remove_program_budget(instance._totals_deleted)
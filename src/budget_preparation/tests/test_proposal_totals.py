@@ -0,0 +1,139 @@
+"""
+Stored proposal totals
+
+Program and proposal rollups must always equal the sums of the source rows.
+"""
+
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from budget_preparation.models import BudgetLineItem, BudgetProposal, ProgramBudget
+from budget_preparation.services import proposal_totals
+from budget_preparation.services.budget_builder import BudgetBuilderService
+from budget_preparation.tests.fixtures.budget_data import create_program_budget
+
+
+def assert_totals_verified():
+    assert proposal_totals.verify() == []
+
+
+@pytest.mark.django_db
+class TestProposalTotalPosting:
+    """Line item and program budget writes post their differences."""
+
+    def test_line_item_writes_update_totals(self, multiple_line_items, program_budget):
+        program_budget.refresh_from_db()
+        proposal = BudgetProposal.objects.get(pk=program_budget.budget_proposal_id)
+        assert program_budget.line_items_total() == Decimal("1690000.00")
+        assert proposal.line_items_total_cost == Decimal("1690000.00")
+        assert proposal.total_program_requested == Decimal("50000000.00")
+
+        item = BudgetLineItem.objects.get(pk=multiple_line_items[0].pk)
+        item.quantity = 12
+        item.save()
+        BudgetLineItem.objects.get(pk=multiple_line_items[1].pk).delete()
+
+        program_budget.refresh_from_db()
+        assert program_budget.line_items_total() == Decimal("850000.00")
+        assert_totals_verified()
+
+    def test_moves_and_deletes_are_posted(
+        self, multiple_line_items, program_budget, approved_budget_proposal, monitoring_entry
+    ):
+        other = create_program_budget(
+            budget_proposal=approved_budget_proposal,
+            monitoring_entry=monitoring_entry,
+            approved_amount=Decimal("900000.00"),
+        )
+
+        item = BudgetLineItem.objects.get(pk=multiple_line_items[0].pk)
+        item.program_budget = other
+        item.save()
+        assert_totals_verified()
+
+        moved = ProgramBudget.objects.get(pk=program_budget.pk)
+        moved.budget_proposal = approved_budget_proposal
+        moved.monitoring_entry = None
+        moved.approved_amount = Decimal("40000000.00")
+        moved.save()
+        assert_totals_verified()
+
+        ProgramBudget.objects.get(pk=other.pk).delete()
+        assert_totals_verified()
+        assert BudgetProposal.objects.get(pk=approved_budget_proposal.pk).program_approved_total == (
+            Decimal("40000000.00")
+        )
+
+    def test_stale_instances_do_not_overwrite_totals(self, program_budget):
+        stale = ProgramBudget.objects.get(pk=program_budget.pk)
+        stale_proposal = BudgetProposal.objects.get(pk=program_budget.budget_proposal_id)
+        BudgetBuilderService().add_line_item(
+            program_budget, "operating", "Supplies", Decimal("1000.00"), 3
+        )
+
+        stale.justification = "Updated"
+        stale.save()
+        stale_proposal.title = "Renamed"
+        stale_proposal.save()
+
+        assert_totals_verified()
+
+    def test_program_writes_keep_entered_proposal_amounts(
+        self, budget_proposal, monitoring_entry
+    ):
+        entered = BudgetProposal.objects.get(pk=budget_proposal.pk).total_requested_budget
+        create_program_budget(
+            budget_proposal=budget_proposal,
+            monitoring_entry=monitoring_entry,
+            requested_amount=Decimal("3000.00"),
+            approved_amount=Decimal("2500.00"),
+        )
+
+        proposal = BudgetProposal.objects.get(pk=budget_proposal.pk)
+        assert proposal.total_requested_budget == entered
+        assert proposal.total_program_requested == Decimal("3000.00")
+        assert "total_variance" in BudgetBuilderService().validate_proposal(proposal)
+
+    def test_line_item_writes_do_not_aggregate(self, budget_line_item):
+        loaded = BudgetLineItem.objects.get(pk=budget_line_item.pk)
+        loaded.quantity = 6
+
+        with CaptureQueriesContext(connection) as queries:
+            loaded.save()
+
+        assert not [q["sql"] for q in queries if "SUM(" in q["sql"]]
+        assert_totals_verified()
+
+
+@pytest.mark.django_db
+class TestProposalTotalVerification:
+    """Verification recomputes totals from scratch and repairs drift."""
+
+    def test_builder_reads_stored_totals(self, budget_proposal, monitoring_entry):
+        service = BudgetBuilderService()
+        service.add_program_budget(
+            budget_proposal, monitoring_entry, Decimal("2000.00"), 1, "Needed"
+        )
+
+        budget_proposal.refresh_from_db()
+        assert budget_proposal.total_requested_budget == Decimal("2000.00")
+        assert "total_variance" not in service.validate_proposal(budget_proposal)
+
+    def test_verify_command_repairs_drift(self, budget_line_item, program_budget):
+        BudgetLineItem.objects.filter(pk=budget_line_item.pk).update(total_cost=Decimal("5.00"))
+        ProgramBudget.objects.filter(pk=program_budget.pk).update(requested_amount=Decimal("7.00"))
+
+        with pytest.raises(CommandError):
+            call_command("verify_proposal_totals")
+
+        call_command("verify_proposal_totals", "--fix")
+
+        assert_totals_verified()
+        proposal = BudgetProposal.objects.get(pk=program_budget.budget_proposal_id)
+        assert proposal.line_items_total_cost == Decimal("5.00")
+        assert proposal.total_program_requested == Decimal("7.00")
@@ -16,6 +16,18 @@ from .conversation_manager import get_conversation_manager
 from .entity_extractor import EntityExtractor
 from .fallback_handler import get_fallback_handler
 from .faq_handler import get_faq_handler
+from .instrumentation import (
+    STAGE_CLARIFICATION,
+    STAGE_ENTITIES,
+    STAGE_EXECUTION,
+    STAGE_FALLBACK,
+    STAGE_FAQ,
+    STAGE_HANDLER,
+    STAGE_HISTORY,
+    STAGE_INTENT,
+    STAGE_TEMPLATES,
+    ChatTrace,
+)
 from .intent_classifier import get_intent_classifier
 from .query_executor import get_query_executor
 from .query_templates import get_template_matcher
@@ -74,7 +86,9 @@ class ConversationalAssistant:
             self.has_gemini = False
             logger.info("Chat engine initialized with NO AI FALLBACK (production mode)")
 
-    def chat(self, user_id: int, message: str) -> Dict[str, any]:
+    def chat(
+        self, user_id: int, message: str, trace: Optional[ChatTrace] = None
+    ) -> Dict[str, any]:
         """
         Process user message and generate response using NEW UNIFIED PIPELINE.
 
@@ -89,6 +103,8 @@ class ConversationalAssistant:
         Args:
             user_id: User ID
             message: User's natural language message
+            trace: Optional ChatTrace collecting per-stage timings (a new
+                one is created per turn when omitted)
 
         Returns:
             Dictionary with:
@@ -99,6 +115,7 @@ class ConversationalAssistant:
                 - confidence: Intent confidence score
                 - visualization: Suggested visualization type
                 - source: Response source (faq, template, fallback, etc.)
+                - instrumentation: Per-stage breakdown (DEBUG only)
 
         Example:
             >>> assistant = ConversationalAssistant()
@@ -109,34 +126,35 @@ class ConversationalAssistant:
             >>> print(result['response'])
             'There are 47 communities in Region IX.'
         """
-        import time
-
-        pipeline_start = time.time()
+        trace = trace or ChatTrace()
 
         try:
             # =====================================================
             # STAGE 1: Try FAQ instant response (< 10ms target)
             # =====================================================
-            stage_start = time.time()
-            faq_result = self.faq_handler.try_faq(message)
-            stage_time = (time.time() - stage_start) * 1000
+            with trace.stage(STAGE_FAQ):
+                faq_result = self.faq_handler.try_faq(message)
+            stage_time = trace.stage_time(STAGE_FAQ)
 
             if faq_result:
-                total_time = (time.time() - pipeline_start) * 1000
+                total_time = trace.elapsed_ms()
                 logger.info(
                     f"User {user_id} query: '{message}' | "
                     f"Source: FAQ | "
                     f"Stage time: {stage_time:.2f}ms | "
                     f"Total time: {total_time:.2f}ms"
                 )
-                return self._format_faq_response(faq_result, user_id, message)
+                with trace.stage(STAGE_HISTORY):
+                    result = self._format_faq_response(faq_result, user_id, message)
+                return self._finish_trace(result, trace)
 
             # =====================================================
             # STAGE 2: Extract entities from query
             # =====================================================
-            stage_start = time.time()
-            entities = self.entity_extractor.extract_entities(message)
-            stage_time = (time.time() - stage_start) * 1000
+            with trace.stage(STAGE_ENTITIES):
+                entities = self.entity_extractor.extract_entities(message)
+            trace.set_candidates(STAGE_ENTITIES, len(entities))
+            stage_time = trace.stage_time(STAGE_ENTITIES)
 
             logger.info(
                 f"User {user_id} query: '{message}' | "
@@ -147,10 +165,14 @@ class ConversationalAssistant:
             # =====================================================
             # STAGE 3: Classify intent
             # =====================================================
-            stage_start = time.time()
-            context = self.conversation_manager.get_context(user_id)
-            intent_result = self.intent_classifier.classify(message, context)
-            stage_time = (time.time() - stage_start) * 1000
+            with trace.stage(STAGE_INTENT):
+                context = self.conversation_manager.get_context(user_id)
+                intent_result = self.intent_classifier.classify(message, context)
+            trace.set_candidates(
+                STAGE_INTENT,
+                sum(1 for score in intent_result.get("all_scores", {}).values() if score > 0),
+            )
+            stage_time = trace.stage_time(STAGE_INTENT)
 
             logger.info(
                 f"User {user_id} query: '{message}' | "
@@ -162,14 +184,14 @@ class ConversationalAssistant:
             # =====================================================
             # STAGE 4: Check if clarification needed
             # =====================================================
-            stage_start = time.time()
-            clarification_needed = self.clarification_handler.needs_clarification(
-                query=message, entities=entities, intent=intent_result["type"]
-            )
-            stage_time = (time.time() - stage_start) * 1000
+            with trace.stage(STAGE_CLARIFICATION):
+                clarification_needed = self.clarification_handler.needs_clarification(
+                    query=message, entities=entities, intent=intent_result["type"]
+                )
+            stage_time = trace.stage_time(STAGE_CLARIFICATION)
 
             if clarification_needed:
-                total_time = (time.time() - pipeline_start) * 1000
+                total_time = trace.elapsed_ms()
                 logger.info(
                     f"User {user_id} query: '{message}' | "
                     f"Source: Clarification | "
@@ -177,39 +199,44 @@ class ConversationalAssistant:
                     f"Stage time: {stage_time:.2f}ms | "
                     f"Total time: {total_time:.2f}ms"
                 )
-                return {
-                    "type": "clarification",
-                    "response": clarification_needed["message"],
-                    "clarification": clarification_needed,
-                    "data": {},
-                    "suggestions": [],
-                    "visualization": None,
-                    "intent": intent_result["type"],
-                    "confidence": intent_result["confidence"],
-                    "source": "clarification",
-                }
+                return self._finish_trace(
+                    {
+                        "type": "clarification",
+                        "response": clarification_needed["message"],
+                        "clarification": clarification_needed,
+                        "data": {},
+                        "suggestions": [],
+                        "visualization": None,
+                        "intent": intent_result["type"],
+                        "confidence": intent_result["confidence"],
+                        "source": "clarification",
+                    },
+                    trace,
+                )
 
             # =====================================================
             # STAGE 5: Route to appropriate handler
             # =====================================================
-            stage_start = time.time()
+            handler_start = trace.elapsed_ms()
             if intent_result["type"] == "data_query":
                 result = self._handle_data_query_new_pipeline(
-                    message, intent_result, entities, context
+                    message, intent_result, entities, context, trace=trace
                 )
-            elif intent_result["type"] == "analysis":
-                result = self._handle_analysis(message, intent_result, context)
-            elif intent_result["type"] == "navigation":
-                result = self._handle_navigation(message, intent_result)
-            elif intent_result["type"] == "help":
-                result = self._handle_help(message, intent_result)
-            elif intent_result["type"] == "general":
-                result = self._handle_general(message, context)
             else:
-                result = self._handle_unknown(message)
-
-            stage_time = (time.time() - stage_start) * 1000
-            total_time = (time.time() - pipeline_start) * 1000
+                with trace.stage(STAGE_HANDLER):
+                    if intent_result["type"] == "analysis":
+                        result = self._handle_analysis(message, intent_result, context)
+                    elif intent_result["type"] == "navigation":
+                        result = self._handle_navigation(message, intent_result)
+                    elif intent_result["type"] == "help":
+                        result = self._handle_help(message, intent_result)
+                    elif intent_result["type"] == "general":
+                        result = self._handle_general(message, context)
+                    else:
+                        result = self._handle_unknown(message)
+
+            total_time = trace.elapsed_ms()
+            stage_time = total_time - handler_start
 
             logger.info(
                 f"User {user_id} query: '{message}' | "
@@ -220,29 +247,43 @@ class ConversationalAssistant:
             # =====================================================
             # STAGE 6: Store conversation exchange
             # =====================================================
-            self.conversation_manager.add_exchange(
-                user_id=user_id,
-                user_message=message,
-                assistant_response=result["response"],
-                intent=intent_result["type"],
-                confidence=intent_result["confidence"],
-                entities=list(entities.keys()),
-            )
+            with trace.stage(STAGE_HISTORY):
+                self.conversation_manager.add_exchange(
+                    user_id=user_id,
+                    user_message=message,
+                    assistant_response=result["response"],
+                    intent=intent_result["type"],
+                    confidence=intent_result["confidence"],
+                    entities=list(entities.keys()),
+                )
 
             # Add metadata
             result["intent"] = intent_result["type"]
             result["confidence"] = intent_result["confidence"]
             result["response_time"] = total_time
 
-            return result
+            return self._finish_trace(result, trace)
 
         except Exception as e:
             logger.error(f"Chat error for user {user_id}: {str(e)}", exc_info=True)
-            return self.response_formatter.format_error(
-                error_message=f"An error occurred: {str(e)}",
-                query=message,
+            return self._finish_trace(
+                self.response_formatter.format_error(
+                    error_message=f"An error occurred: {str(e)}",
+                    query=message,
+                ),
+                trace,
+                source="error",
             )
 
+    def _finish_trace(
+        self, result: Dict, trace: ChatTrace, source: Optional[str] = None
+    ) -> Dict[str, any]:
+        """Export the turn's stage metrics and expose them in DEBUG mode."""
+        trace.finish(source or result.get("source") or result.get("intent"))
+        if settings.DEBUG:
+            result["instrumentation"] = trace.summary()
+        return result
+
     def _format_faq_response(
         self, faq_result: Dict, user_id: int, message: str
     ) -> Dict[str, any]:
@@ -285,6 +326,7 @@ class ConversationalAssistant:
         intent_result: Dict,
         entities: Dict,
         context: Dict,
+        trace: Optional[ChatTrace] = None,
     ) -> Dict[str, any]:
         """
         Handle data query using NEW TEMPLATE-BASED PIPELINE (NO AI).
@@ -301,16 +343,21 @@ class ConversationalAssistant:
             intent_result: Intent classification result
             entities: Extracted entities
             context: Conversation context
+            trace: Optional ChatTrace for per-stage timings
 
         Returns:
             Response dictionary
         """
+        trace = trace or ChatTrace()
+
         # =====================================================
         # STEP 1: Find matching query templates
         # =====================================================
-        matching_templates = self.template_matcher.find_matching_templates(
-            message, entities, intent_result["type"]
-        )
+        with trace.stage(STAGE_TEMPLATES):
+            matching_templates = self.template_matcher.find_matching_templates(
+                message, entities, intent_result["type"]
+            )
+        trace.set_candidates(STAGE_TEMPLATES, len(matching_templates))
 
         if not matching_templates:
             logger.info(
@@ -319,7 +366,7 @@ class ConversationalAssistant:
                 f"Entities: {list(entities.keys())}"
             )
             # Fallback to old rule-based approach or fallback handler
-            return self._handle_data_query_fallback(message, entities, context)
+            return self._handle_data_query_fallback(message, entities, context, trace=trace)
 
         # =====================================================
         # STEP 2: Try each matching template (priority order)
@@ -330,11 +377,13 @@ class ConversationalAssistant:
                     f"Trying template: {template.id} (priority: {template.priority})"
                 )
 
-                # Generate query from template
-                query_string = self.template_matcher.generate_query(template, entities)
+                with trace.stage(STAGE_EXECUTION):
+                    # Generate query from template
+                    query_string = self.template_matcher.generate_query(template, entities)
 
-                # Execute query
-                exec_result = self.query_executor.execute(query_string)
+                    # Execute query
+                    exec_result = self.query_executor.execute(query_string)
+                trace.set_candidates(STAGE_EXECUTION, 1)
 
                 if exec_result["success"]:
                     # Format response
@@ -375,13 +424,14 @@ class ConversationalAssistant:
             f"All templates failed for query: '{message}' | "
             f"Tried {len(matching_templates)} templates"
         )
-        return self._handle_data_query_fallback(message, entities, context)
+        return self._handle_data_query_fallback(message, entities, context, trace=trace)
 
     def _handle_data_query_fallback(
         self,
         message: str,
         entities: Dict,
         context: Dict,
+        trace: Optional[ChatTrace] = None,
     ) -> Dict[str, any]:
         """
         Fallback handler when template-based approach fails.
@@ -394,16 +444,21 @@ class ConversationalAssistant:
             message: User's query
             entities: Extracted entities
             context: Conversation context
+            trace: Optional ChatTrace for per-stage timings
 
         Returns:
             Response dictionary
         """
+        trace = trace or ChatTrace()
+
         # Try legacy rule-based approach
         legacy_query = self._generate_query_rule_based(message, list(entities.keys()))
 
         if legacy_query:
             try:
-                exec_result = self.query_executor.execute(legacy_query)
+                with trace.stage(STAGE_EXECUTION):
+                    exec_result = self.query_executor.execute(legacy_query)
+                trace.set_candidates(STAGE_EXECUTION, 1)
 
                 if exec_result["success"]:
                     formatted = self.response_formatter.format_query_result(
@@ -421,10 +476,16 @@ class ConversationalAssistant:
         # FINAL FALLBACK: Use fallback handler (NO AI)
         # =====================================================
         logger.info("Using rule-based fallback handler")
-        fallback_result = self.fallback_handler.handle_failed_query(
-            query=message,
-            intent='data_query',
-            entities=entities
+        with trace.stage(STAGE_FALLBACK):
+            fallback_result = self.fallback_handler.handle_failed_query(
+                query=message,
+                intent='data_query',
+                entities=entities
+            )
+        trace.set_candidates(
+            STAGE_FALLBACK,
+            sum(len(items) for items in fallback_result.get('suggestions', {}).values()
+                if isinstance(items, list)),
         )
 
         return self._format_fallback_response(fallback_result, message)
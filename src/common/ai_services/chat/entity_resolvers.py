@@ -18,7 +18,6 @@ from typing import Any, Dict, List, Optional
 
 try:
     from django.utils import timezone
-    from django.db.models import Q
     HAS_DJANGO = True
 except ImportError:
     # Fallback for testing without Django
@@ -30,16 +29,17 @@ except ImportError:
         @staticmethod
         def get_current_timezone():
             return pytz.UTC
-    Q = None
     HAS_DJANGO = False
 
 
 class LocationResolver:
     """
-    Resolve location entities with fuzzy matching and database validation.
+    Resolve location entities with fuzzy matching and gazetteer validation.
 
     Handles regions, provinces, municipalities, and barangays.
-    Supports common variations and misspellings.
+    Supports common variations and misspellings. Place names are looked up
+    in the in-memory gazetteer (``common.services.gazetteer``), so
+    resolution does not query the database per phrase.
     """
 
     # Region patterns with variations
@@ -121,11 +121,15 @@ class LocationResolver:
         if region:
             return region
 
-        # Try database lookup for municipalities
+        # Try gazetteer lookup for municipalities, then barangays
         municipality = self._match_municipality(normalized_query)
         if municipality:
             return municipality
 
+        barangay = self._match_barangay(normalized_query)
+        if barangay:
+            return barangay
+
         return None
 
     def _match_region(self, query: str) -> Optional[Dict[str, Any]]:
@@ -165,58 +169,100 @@ class LocationResolver:
         return None
 
     def _match_municipality(self, query: str) -> Optional[Dict[str, Any]]:
-        """Match municipality from query using database lookup."""
-        if not HAS_DJANGO:
+        """Match municipality from query using the in-memory gazetteer."""
+        gazetteer = self._get_gazetteer()
+        if gazetteer is None:
             return None
 
-        try:
-            from common.models import Municipality
-
-            # Extract potential municipality names (2-3 word phrases)
-            words = query.split()
-            for i in range(len(words)):
-                for length in [3, 2, 1]:  # Try 3-word, then 2-word, then 1-word
-                    if i + length <= len(words):
-                        phrase = ' '.join(words[i:i+length])
-
-                        # Case-insensitive lookup
-                        municipality = Municipality.objects.filter(
-                            Q(name__iexact=phrase) | Q(name__icontains=phrase)
-                        ).first()
-
-                        if municipality:
-                            confidence = 0.90 if municipality.name.lower() == phrase else 0.75
-                            return {
-                                'type': 'municipality',
-                                'value': municipality.name,
-                                'province': municipality.province.name,
-                                'region': municipality.province.region.name,
-                                'confidence': confidence,
-                            }
-        except Exception:
-            # Database not available or model import failed
-            pass
+        from common.services.gazetteer import LEVEL_MUNICIPALITY
+
+        levels = (LEVEL_MUNICIPALITY,)
+
+        # Extract potential municipality names (2-3 word phrases)
+        words = query.split()
+        for i in range(len(words)):
+            for length in [3, 2, 1]:  # Try 3-word, then 2-word, then 1-word
+                if i + length <= len(words):
+                    phrase = ' '.join(words[i:i+length])
+
+                    candidates = gazetteer.lookup(phrase, levels)
+                    confidence = 0.90
+                    if not candidates:
+                        candidates = gazetteer.lookup_partial(phrase, levels)
+                        confidence = 0.75
+
+                    if candidates:
+                        return self._location_result(candidates, confidence)
 
         return None
 
-    def _validate_province_db(self, province_name: str) -> Optional[str]:
-        """Validate and get official province name from database."""
+    def _match_barangay(self, query: str) -> Optional[Dict[str, Any]]:
+        """Match a barangay named exactly in the query."""
+        gazetteer = self._get_gazetteer()
+        if gazetteer is None:
+            return None
+
+        from common.services.gazetteer import LEVEL_BARANGAY
+
+        mentions = gazetteer.find_mentions(query, levels=(LEVEL_BARANGAY,))
+        if mentions:
+            return self._location_result(mentions[0].candidates, 0.85)
+        return None
+
+    def resolve_all(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Resolve every location named in the query.
+
+        Each mention lists all matching locations (with their hierarchy)
+        under ``candidates`` so callers can disambiguate.
+
+        Example:
+            >>> resolve_all("farmers in pagadian city and dipolog")
+            [{'type': 'municipality', 'value': 'Pagadian City', ...}, ...]
+        """
+        gazetteer = self._get_gazetteer()
+        if gazetteer is None or not query:
+            return []
+
+        return [
+            self._location_result(mention.candidates, 0.90 if mention.exact else 0.75)
+            for mention in gazetteer.find_mentions(query, allow_partial=False)
+        ]
+
+    def _location_result(self, candidates, confidence: float) -> Dict[str, Any]:
+        """Build a location entity from gazetteer candidates (best first)."""
+        result = {**candidates[0].as_dict(), 'confidence': confidence}
+        result.pop('id', None)
+        if len(candidates) > 1:
+            result['candidates'] = [candidate.as_dict() for candidate in candidates]
+        return result
+
+    def _get_gazetteer(self):
+        """Return the process-wide gazetteer, or None without a database."""
         if not HAS_DJANGO:
             return None
 
         try:
-            from common.models import Province
-
-            province = Province.objects.filter(
-                Q(name__iexact=province_name) | Q(name__icontains=province_name)
-            ).first()
+            from common.services.gazetteer import get_gazetteer
 
-            if province:
-                return province.name
+            return get_gazetteer()
         except Exception:
-            pass
+            # Database not available or model import failed
+            return None
 
-        return None
+    def _validate_province_db(self, province_name: str) -> Optional[str]:
+        """Validate and get official province name from the gazetteer."""
+        gazetteer = self._get_gazetteer()
+        if gazetteer is None:
+            return None
+
+        from common.services.gazetteer import LEVEL_PROVINCE
+
+        levels = (LEVEL_PROVINCE,)
+        candidates = gazetteer.lookup(province_name, levels) or gazetteer.lookup_partial(
+            province_name, levels
+        )
+        return candidates[0].name if candidates else None
 
 
 class EthnicGroupResolver:
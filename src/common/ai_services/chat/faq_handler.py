@@ -29,6 +29,7 @@ from .faq_data import (
     PATTERN_TO_FAQ_MAP,
     EnhancedFAQ,
 )
+from .faq_index import FuzzyPatternIndex
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,10 @@ class FAQHandler:
     # Fuzzy matching threshold (0.0 to 1.0)
     FUZZY_THRESHOLD = 0.75
 
+    # Patterns whose length differs from the query by more than this are
+    # never fuzzy-matched
+    FUZZY_LENGTH_DELTA = 6
+
     def __init__(self):
         """Initialize FAQ handler with base responses."""
         self.base_faqs = self._get_base_faqs()
@@ -64,6 +69,14 @@ class FAQHandler:
             self.enhanced_faqs, key=lambda faq: faq.priority, reverse=True
         )
         self._enhanced_pattern_cache = self._build_enhanced_pattern_cache()
+        # Candidate indexes over normalized patterns, rebuilt when FAQs change
+        self._base_index: Optional[FuzzyPatternIndex] = None
+        self._enhanced_index: Optional[FuzzyPatternIndex] = None
+        self._enhanced_flat_patterns: List[Tuple[EnhancedFAQ, Dict]] = [
+            (entry["faq"], pattern_entry)
+            for entry in self._enhanced_pattern_cache
+            for pattern_entry in entry["patterns"]
+        ]
         self._base_pattern_lookup = {
             self._normalize_for_cache(pattern): (pattern, data)
             for pattern, data in self.base_faqs.items()
@@ -392,21 +405,40 @@ class FAQHandler:
 
     def _build_base_pattern_cache(self) -> List[Dict]:
         """Prepare normalized base FAQ patterns for fast matching."""
-        cache_entries = []
-        for pattern, faq_data in self.base_faqs.items():
-            normalized = self._normalize_for_cache(pattern)
-            cache_entries.append(
-                {
-                    "pattern": pattern,
-                    "normalized": normalized,
-                    "faq_data": faq_data,
-                    "matcher": SequenceMatcher(None, "", normalized),
-                    "tokens": set(normalized.split()),
-                    "first_token": normalized.split(" ", 1)[0] if normalized else "",
-                    "length": len(normalized),
-                }
+        return [
+            self._build_base_pattern_entry(pattern, faq_data)
+            for pattern, faq_data in self.base_faqs.items()
+        ]
+
+    def _build_base_pattern_entry(self, pattern: str, faq_data: Dict) -> Dict:
+        normalized = self._normalize_for_cache(pattern)
+        return {
+            "pattern": pattern,
+            "normalized": normalized,
+            "faq_data": faq_data,
+            "matcher": SequenceMatcher(None, "", normalized),
+            "tokens": set(normalized.split()),
+            "first_token": normalized.split(" ", 1)[0] if normalized else "",
+            "length": len(normalized),
+        }
+
+    def _get_base_index(self) -> FuzzyPatternIndex:
+        """Candidate index over legacy FAQ patterns (built on first use)."""
+        if self._base_index is None:
+            self._base_index = FuzzyPatternIndex(
+                (entry["normalized"] for entry in self._base_pattern_cache),
+                max_length_delta=self.FUZZY_LENGTH_DELTA,
+            )
+        return self._base_index
+
+    def _get_enhanced_index(self) -> FuzzyPatternIndex:
+        """Candidate index over enhanced FAQ patterns (built on first use)."""
+        if self._enhanced_index is None:
+            self._enhanced_index = FuzzyPatternIndex(
+                (pattern_entry["normalized"] for _, pattern_entry in self._enhanced_flat_patterns),
+                max_length_delta=self.FUZZY_LENGTH_DELTA,
             )
-        return cache_entries
+        return self._enhanced_index
 
     def _build_enhanced_pattern_cache(self) -> List[Dict]:
         """Prepare normalized enhanced FAQ patterns for fast matching."""
@@ -471,7 +503,8 @@ class FAQHandler:
             if payload.get("answer") is not None or payload.get("cache_key"):
                 return payload
 
-        for entry in self._base_pattern_cache:
+        for position in self._get_base_index().containment_candidates(normalized_query):
+            entry = self._base_pattern_cache[position]
             pattern = entry["pattern"]
             normalized_pattern = entry["normalized"]
             faq_data = entry["faq_data"]
@@ -503,31 +536,11 @@ class FAQHandler:
         """
         best_match = None
         best_confidence = 0.0
-        query_tokens = set(normalized_query.split())
-        query_first_token = (
-            normalized_query.split(" ", 1)[0] if normalized_query else ""
-        )
-        query_length = len(normalized_query)
-        for entry in self._base_pattern_cache:
-            normalized_pattern = entry["normalized"]
+        # The index applies the length and shared-token pre-filters.
+        for position in self._get_base_index().fuzzy_candidates(normalized_query):
+            entry = self._base_pattern_cache[position]
             faq_data = entry["faq_data"]
             pattern = entry["pattern"]
-            pattern_length = entry.get("length", len(normalized_pattern))
-            pattern_first_token = entry.get("first_token", "")
-
-            if abs(pattern_length - query_length) > 6:
-                continue
-
-            pattern_tokens = entry.get("tokens")
-            if (
-                pattern_first_token
-                and query_first_token
-                and pattern_first_token != query_first_token
-                and pattern_tokens
-                and query_tokens
-                and not (pattern_tokens & query_tokens)
-            ):
-                continue
 
             matcher = entry["matcher"]
             matcher.set_seq1(normalized_query)
@@ -661,16 +674,10 @@ class FAQHandler:
         pattern_key = pattern.lower()
         self.base_faqs[pattern_key] = response
 
-        normalized = self._normalize_for_cache(pattern_key)
-        self._base_pattern_cache.append(
-            {
-                "pattern": pattern_key,
-                "normalized": normalized,
-                "faq_data": response,
-                "matcher": SequenceMatcher(None, "", normalized),
-            }
-        )
-        self._base_pattern_lookup[normalized] = (pattern_key, response)
+        entry = self._build_base_pattern_entry(pattern_key, response)
+        self._base_pattern_cache.append(entry)
+        self._base_pattern_lookup[entry["normalized"]] = (pattern_key, response)
+        self._base_index = None
 
         logger.info(f"Added FAQ: {pattern}")
 
@@ -912,76 +919,54 @@ class FAQHandler:
         best_match = None
         best_confidence = 0.0
         best_priority = -1
-        query_tokens = set(normalized_query.split())
-        query_first_token = (
-            normalized_query.split(" ", 1)[0] if normalized_query else ""
-        )
-        query_length = len(normalized_query)
-
-        for entry in self._enhanced_pattern_cache:
-            faq = entry["faq"]
-            # Try exact match against all patterns
-            for pattern_entry in entry["patterns"]:
-                pattern = pattern_entry["pattern"]
-                normalized_pattern = pattern_entry["normalized"]
-                if (
-                    normalized_query == normalized_pattern
-                    or normalized_query == pattern
-                    or normalized_query in normalized_pattern
-                    or normalized_pattern in normalized_query
+        index = self._get_enhanced_index()
+
+        # Exact/containment matches win outright, in FAQ priority order
+        for position in index.containment_candidates(normalized_query):
+            faq, pattern_entry = self._enhanced_flat_patterns[position]
+            pattern = pattern_entry["pattern"]
+            normalized_pattern = pattern_entry["normalized"]
+            if (
+                normalized_query == normalized_pattern
+                or normalized_query == pattern
+                or normalized_query in normalized_pattern
+                or normalized_pattern in normalized_query
+            ):
+                return {
+                    "faq": faq,
+                    "confidence": 1.0,
+                    "pattern": pattern,
+                }
+
+        # Fuzzy match (the index applies the length and shared-token pre-filters)
+        for position in index.fuzzy_candidates(normalized_query):
+            faq, pattern_entry = self._enhanced_flat_patterns[position]
+            pattern = pattern_entry["pattern"]
+
+            matcher = pattern_entry["matcher"]
+            matcher.set_seq1(normalized_query)
+            if matcher.quick_ratio() < self.FUZZY_THRESHOLD * 0.9:
+                continue
+            confidence = matcher.ratio()
+
+            # Consider both confidence and priority
+            # Higher priority FAQs can match with slightly lower confidence
+            adjusted_threshold = self.FUZZY_THRESHOLD
+            if faq.priority >= 18:
+                adjusted_threshold -= 0.05  # More lenient for critical FAQs
+
+            if confidence >= adjusted_threshold:
+                # Prefer higher priority, then higher confidence
+                if faq.priority > best_priority or (
+                    faq.priority == best_priority and confidence > best_confidence
                 ):
-                    # Exact match - return immediately
-                    return {
+                    best_match = {
                         "faq": faq,
-                        "confidence": 1.0,
+                        "confidence": confidence,
                         "pattern": pattern,
                     }
-
-            # Try fuzzy match
-            for pattern_entry in entry["patterns"]:
-                normalized_pattern = pattern_entry["normalized"]
-                pattern = pattern_entry["pattern"]
-                pattern_first_token = pattern_entry.get("first_token", "")
-                pattern_length = pattern_entry.get("length", len(normalized_pattern))
-                pattern_tokens = pattern_entry.get("tokens", set())
-
-                if abs(pattern_length - query_length) > 6:
-                    continue
-
-                if (
-                    pattern_first_token
-                    and query_first_token
-                    and pattern_first_token != query_first_token
-                    and pattern_tokens
-                    and query_tokens
-                    and not (pattern_tokens & query_tokens)
-                ):
-                    continue
-
-                matcher = pattern_entry["matcher"]
-                matcher.set_seq1(normalized_query)
-                if matcher.quick_ratio() < self.FUZZY_THRESHOLD * 0.9:
-                    continue
-                confidence = matcher.ratio()
-
-                # Consider both confidence and priority
-                # Higher priority FAQs can match with slightly lower confidence
-                adjusted_threshold = self.FUZZY_THRESHOLD
-                if faq.priority >= 18:
-                    adjusted_threshold -= 0.05  # More lenient for critical FAQs
-
-                if confidence >= adjusted_threshold:
-                    # Prefer higher priority, then higher confidence
-                    if faq.priority > best_priority or (
-                        faq.priority == best_priority and confidence > best_confidence
-                    ):
-                        best_match = {
-                            "faq": faq,
-                            "confidence": confidence,
-                            "pattern": pattern,
-                        }
-                        best_confidence = confidence
-                        best_priority = faq.priority
+                    best_confidence = confidence
+                    best_priority = faq.priority
 
         return best_match
 
@@ -0,0 +1,131 @@
+"""
+Fuzzy FAQ Pattern Index for OBCMS Chat System
+
+Prebuilt candidate index over normalized FAQ patterns so a chat message is
+compared (by substring containment or ``SequenceMatcher``) only against the
+few patterns that could possibly match, instead of every FAQ pattern.
+
+Candidate pruning reproduces the FAQ handler's existing filters exactly:
+
+- Containment: a pattern can only contain the query (or be contained by
+  it) if every character trigram of the shorter string occurs in the
+  longer one. Trigram postings give a superset of such patterns.
+- Fuzzy: patterns more than ``max_length_delta`` characters longer or
+  shorter than the query, or sharing neither the first token nor any
+  token with it, are skipped by the handler and are never returned here.
+
+Candidates are returned in pattern order, so first-match and tie-breaking
+behavior is unchanged. The index is built once per FAQ set.
+"""
+
+from typing import Dict, Iterable, List, Set
+
+NGRAM_SIZE = 3
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class FuzzyPatternIndex:
+    """
+    Candidate index over normalized FAQ patterns.
+
+    Example:
+        >>> index = FuzzyPatternIndex(["what is obcms", "how do i log in"])
+        >>> index.containment_candidates("what is obcms")
+        [0]
+    """
+
+    def __init__(self, normalized_patterns: Iterable[str], max_length_delta: int = 6):
+        self.patterns: List[str] = list(normalized_patterns)
+        self.max_length_delta = max_length_delta
+
+        self._lengths: List[int] = []
+        self._ngram_postings: Dict[str, Set[int]] = {}
+        self._anchor_postings: Dict[str, List[int]] = {}
+        self._short_patterns: List[int] = []
+        self._token_postings: Dict[str, Set[int]] = {}
+        self._first_token_postings: Dict[str, Set[int]] = {}
+        self._untokenized: Set[int] = set()
+
+        for position, pattern in enumerate(self.patterns):
+            self._lengths.append(len(pattern))
+
+            # Containment postings
+            for gram in _ngrams(pattern):
+                self._ngram_postings.setdefault(gram, set()).add(position)
+            if len(pattern) < NGRAM_SIZE:
+                self._short_patterns.append(position)
+            else:
+                self._anchor_postings.setdefault(pattern[:NGRAM_SIZE], []).append(position)
+
+            # Token postings for the fuzzy pre-filter
+            tokens = set(pattern.split())
+            first_token = pattern.split(" ", 1)[0] if pattern else ""
+            if not tokens or not first_token:
+                self._untokenized.add(position)
+                continue
+            self._first_token_postings.setdefault(first_token, set()).add(position)
+            for token in tokens:
+                self._token_postings.setdefault(token, set()).add(position)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def containment_candidates(self, query: str) -> List[int]:
+        """
+        Positions of patterns that may equal, contain or be contained in
+        ``query`` (a superset; callers still verify).
+        """
+        query_length = len(query)
+        candidates: Set[int] = set(self._short_patterns)
+
+        # Patterns contained in the query: their leading trigram occurs in it.
+        query_grams = _ngrams(query)
+        for gram in query_grams:
+            candidates.update(self._anchor_postings.get(gram, ()))
+
+        # Patterns containing the query: every query trigram occurs in them.
+        if query_length < NGRAM_SIZE:
+            candidates.update(
+                position
+                for position, length in enumerate(self._lengths)
+                if length >= query_length
+            )
+        else:
+            postings = sorted(
+                (self._ngram_postings.get(gram, set()) for gram in query_grams), key=len
+            )
+            containing = set(postings[0])
+            for posting in postings[1:]:
+                if not containing:
+                    break
+                containing &= posting
+            candidates |= containing
+
+        return sorted(candidates)
+
+    def fuzzy_candidates(self, query: str) -> List[int]:
+        """
+        Positions of patterns that pass the length and token pre-filters for
+        ``query``, i.e. the only patterns worth scoring with SequenceMatcher.
+        """
+        query_length = len(query)
+        query_tokens = set(query.split())
+        query_first_token = query.split(" ", 1)[0] if query else ""
+
+        if not query_tokens or not query_first_token:
+            eligible: Iterable[int] = range(len(self.patterns))
+        else:
+            eligible_set = set(self._untokenized)
+            eligible_set.update(self._first_token_postings.get(query_first_token, ()))
+            for token in query_tokens:
+                eligible_set.update(self._token_postings.get(token, ()))
+            eligible = eligible_set
+
+        return sorted(
+            position
+            for position in eligible
+            if abs(self._lengths[position] - query_length) <= self.max_length_delta
+        )
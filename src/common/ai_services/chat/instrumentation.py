@@ -0,0 +1,168 @@
+"""
+Per-stage instrumentation for the chat pipeline.
+
+Each chat turn gets a ``ChatTrace`` that records, for every pipeline stage
+(FAQ, entity extraction, intent classification, template matching, query
+execution, fallback, ...), the wall time, the number of candidates the stage
+considered and the number of database queries it issued.
+
+Finished traces are exported as Prometheus histograms next to the
+django-prometheus metrics served at ``/metrics/``; ``ConversationalAssistant``
+also attaches the breakdown to the response when ``DEBUG`` is on, and
+``benchmark_query_system`` aggregates it per stage.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from django.db import connection
+
+try:
+    from prometheus_client import Histogram
+except ImportError:  # pragma: no cover - prometheus_client ships with django-prometheus
+    Histogram = None
+
+logger = logging.getLogger(__name__)
+
+STAGE_FAQ = "faq"
+STAGE_ENTITIES = "entity_extraction"
+STAGE_INTENT = "intent_classification"
+STAGE_CLARIFICATION = "clarification"
+STAGE_TEMPLATES = "template_matching"
+STAGE_EXECUTION = "query_execution"
+STAGE_FALLBACK = "fallback"
+STAGE_HANDLER = "handler"
+STAGE_HISTORY = "history"
+
+if Histogram is not None:
+    STAGE_SECONDS = Histogram(
+        "obcms_chat_stage_seconds",
+        "Wall time spent in each chat pipeline stage.",
+        ["stage"],
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    )
+    STAGE_DB_QUERIES = Histogram(
+        "obcms_chat_stage_db_queries",
+        "Database queries issued by each chat pipeline stage.",
+        ["stage"],
+        buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+    )
+    STAGE_CANDIDATES = Histogram(
+        "obcms_chat_stage_candidates",
+        "Candidates (templates, entities, suggestions) considered by each chat stage.",
+        ["stage"],
+        buckets=(0, 1, 2, 5, 10, 25, 50, 100, 250),
+    )
+    TURN_SECONDS = Histogram(
+        "obcms_chat_turn_seconds",
+        "Wall time of a whole chat turn by response source.",
+        ["source"],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    )
+else:  # pragma: no cover
+    STAGE_SECONDS = STAGE_DB_QUERIES = STAGE_CANDIDATES = TURN_SECONDS = None
+
+
+class _QueryCounter:
+    """``connection.execute_wrapper`` hook counting executed statements."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class ChatTrace:
+    """
+    Timing, candidate and query counts for one chat turn.
+
+    Stages entered more than once (e.g. query execution for several
+    templates) accumulate into a single entry.
+
+    Example:
+        >>> trace = ChatTrace()
+        >>> with trace.stage(STAGE_FAQ):
+        ...     faq_result = faq_handler.try_faq(message)
+        >>> trace.summary()["stages"]["faq"]["time_ms"]
+        0.42
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._order: List[str] = []
+        self.total_ms: Optional[float] = None
+        self.source: Optional[str] = None
+
+    def _entry(self, name: str) -> Dict[str, float]:
+        entry = self.stages.get(name)
+        if entry is None:
+            entry = {"time_ms": 0.0, "queries": 0, "candidates": None}
+            self.stages[name] = entry
+            self._order.append(name)
+        return entry
+
+    @contextmanager
+    def stage(self, name: str):
+        """Measure the wrapped block as stage ``name``."""
+        entry = self._entry(name)
+        counter = _QueryCounter()
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(counter):
+                yield entry
+        finally:
+            entry["time_ms"] += (time.perf_counter() - start) * 1000
+            entry["queries"] += counter.count
+
+    def stage_time(self, name: str) -> float:
+        entry = self.stages.get(name)
+        return entry["time_ms"] if entry else 0.0
+
+    def set_candidates(self, name: str, count: int) -> None:
+        """Record how many candidates stage ``name`` considered."""
+        entry = self._entry(name)
+        entry["candidates"] = (entry["candidates"] or 0) + count
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def finish(self, source: Optional[str] = None) -> "ChatTrace":
+        """Close the trace and export it to Prometheus."""
+        if self.total_ms is None:
+            self.total_ms = self.elapsed_ms()
+            self.source = source or "unknown"
+            self._export()
+        return self
+
+    def summary(self) -> Dict:
+        """Per-stage breakdown in pipeline order."""
+        return {
+            "total_ms": round(self.total_ms if self.total_ms is not None else self.elapsed_ms(), 3),
+            "source": self.source,
+            "stages": {
+                name: {
+                    "time_ms": round(self.stages[name]["time_ms"], 3),
+                    "queries": self.stages[name]["queries"],
+                    "candidates": self.stages[name]["candidates"],
+                }
+                for name in self._order
+            },
+        }
+
+    def _export(self) -> None:
+        if STAGE_SECONDS is None:
+            return
+        try:
+            for name, entry in self.stages.items():
+                STAGE_SECONDS.labels(stage=name).observe(entry["time_ms"] / 1000)
+                STAGE_DB_QUERIES.labels(stage=name).observe(entry["queries"])
+                if entry["candidates"] is not None:
+                    STAGE_CANDIDATES.labels(stage=name).observe(entry["candidates"])
+            TURN_SECONDS.labels(source=self.source).observe(self.total_ms / 1000)
+        except Exception as e:  # Metrics must never break a chat turn
+            logger.warning(f"Could not export chat metrics: {e}")
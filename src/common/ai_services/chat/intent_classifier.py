@@ -3,15 +3,45 @@ Intent Classifier for Conversational AI
 
 Classifies user intent to route queries appropriately.
 Uses pattern matching and keyword analysis for fast classification.
+
+All keyword, entity and action terms are compiled into one lookup table
+scanned with a single trie-shaped regex, and intent patterns are only run
+when one of their required literals occurs, so every intent is scored in
+one pass over the message.
 """
 
 import logging
 import re
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .query_templates.literal_index import TemplateLiteralIndex
 
 logger = logging.getLogger(__name__)
 
 
+def _trie_pattern(terms: Iterable[str]) -> str:
+    """
+    Regex matching the longest of ``terms`` at a position, with shared
+    prefixes factored out so the engine tests each character once.
+    """
+    root: Dict[str, dict] = {}
+    for term in terms:
+        node = root
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:%s)" % "|".join(branches)
+        # Greedy optional suffix: prefer the longer term
+        return "(?:%s)?" % body if "" in node else body
+
+    return build(root)
+
+
 class IntentClassifier:
     """
     Classify user intent from natural language messages.
@@ -152,13 +182,101 @@ class IntentClassifier:
         self._compile_patterns()
 
     def _compile_patterns(self):
-        """Compile regex patterns for faster matching."""
+        """Compile regex patterns and the term lookup table for one-pass scoring."""
         self._compiled_patterns = {}
+        self._pattern_intents: List[Tuple[str, re.Pattern]] = []
         for intent, config in self.INTENT_PATTERNS.items():
             self._compiled_patterns[intent] = [
                 re.compile(pattern, re.IGNORECASE)
                 for pattern in config.get("patterns", [])
             ]
+            self._pattern_intents.extend(
+                (intent, compiled) for compiled in self._compiled_patterns[intent]
+            )
+
+        # Patterns are only run when one of their required literals occurs
+        self._pattern_index = TemplateLiteralIndex(
+            compiled.pattern for _, compiled in self._pattern_intents
+        )
+
+        # term -> [(intent, "keywords" | "entities"), ...]
+        self._term_table: Dict[str, List[Tuple[str, str]]] = {}
+        for intent, config in self.INTENT_PATTERNS.items():
+            for kind in ("keywords", "entities"):
+                for term in config.get(kind, []):
+                    self._term_table.setdefault(term, []).append((intent, kind))
+
+        terms = set(self._term_table)
+        for group in (self.DATA_ENTITIES, self.ACTION_VERBS):
+            for words in group.values():
+                terms.update(words)
+        terms.discard("")
+
+        # Terms are matched as substrings. At each position the scan reports
+        # only the longest term, so every shorter term it starts with is
+        # present there too.
+        self._term_prefixes: Dict[str, Tuple[str, ...]] = {
+            term: tuple(other for other in terms if term.startswith(other))
+            for term in terms
+        }
+        self._term_scanner = (
+            re.compile("(?=(%s))" % _trie_pattern(terms)) if terms else None
+        )
+
+    def _find_terms(self, message: str) -> Set[str]:
+        """All known keyword, entity and action terms occurring in message."""
+        found: Set[str] = set()
+        if self._term_scanner is None:
+            return found
+        for match in self._term_scanner.finditer(message):
+            found.update(self._term_prefixes[match.group(1)])
+        return found
+
+    def _matching_pattern_intents(self, message: str) -> List[str]:
+        """Intent of every pattern that matches message (one entry per pattern)."""
+        positions = self._pattern_index.candidates(message)
+        if positions is None:
+            positions = range(len(self._pattern_intents))
+        return [
+            self._pattern_intents[position][0]
+            for position in positions
+            if self._pattern_intents[position][1].search(message)
+        ]
+
+    def _score_intents(self, message: str, terms: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        Score every intent in one pass over the message.
+
+        Scoring:
+        - Keyword match: +0.3 per keyword (max 0.6)
+        - Pattern match: +0.5 per pattern (max 0.8)
+        - Entity match: +0.2 per entity (max 0.4)
+        - Max score: 1.0
+        """
+        if terms is None:
+            terms = self._find_terms(message)
+
+        counts = {
+            intent: {"keywords": 0, "patterns": 0, "entities": 0}
+            for intent in self.INTENT_PATTERNS
+        }
+        for term in terms:
+            for intent, kind in self._term_table.get(term, ()):
+                counts[intent][kind] += 1
+        for intent in self._matching_pattern_intents(message):
+            counts[intent]["patterns"] += 1
+
+        scores = {}
+        for intent, matched in counts.items():
+            score = 0.0
+            if matched["keywords"] > 0:
+                score += min(matched["keywords"] * 0.3, 0.6)
+            if matched["patterns"] > 0:
+                score += min(matched["patterns"] * 0.5, 0.8)
+            if matched["entities"] > 0:
+                score += min(matched["entities"] * 0.2, 0.4)
+            scores[intent] = min(score, 1.0)
+        return scores
 
     def classify(self, message: str, context: Optional[Dict] = None) -> Dict[str, any]:
         """
@@ -183,19 +301,18 @@ class IntentClassifier:
             'data_query'
         """
         message_lower = message.lower().strip()
+        terms = self._find_terms(message_lower)
 
         # Calculate scores for each intent
-        scores = {}
-        for intent in self.INTENT_PATTERNS.keys():
-            scores[intent] = self._score_intent(message_lower, intent)
+        scores = self._score_intents(message_lower, terms)
 
         # Get highest scoring intent
         best_intent = max(scores, key=scores.get)
         confidence = scores[best_intent]
 
         # Extract entities and actions
-        entities = self._extract_entities(message_lower)
-        action = self._extract_action(message_lower)
+        entities = self._extract_entities(message_lower, terms)
+        action = self._extract_action(message_lower, terms)
 
         # Build routing information
         routing = self._build_routing(best_intent, entities, action)
@@ -210,57 +327,28 @@ class IntentClassifier:
         }
 
     def _score_intent(self, message: str, intent: str) -> float:
-        """
-        Score how well message matches an intent.
+        """Score how well message matches an intent (see ``_score_intents``)."""
+        return self._score_intents(message)[intent]
 
-        Scoring:
-        - Keyword match: +0.3 per keyword
-        - Pattern match: +0.5 per pattern
-        - Entity match: +0.2 per entity
-        - Max score: 1.0
-        """
-        score = 0.0
-        config = self.INTENT_PATTERNS[intent]
-
-        # Check keyword matches
-        keywords = config.get("keywords", [])
-        keyword_matches = sum(1 for kw in keywords if kw in message)
-        if keyword_matches > 0:
-            score += min(keyword_matches * 0.3, 0.6)
-
-        # Check pattern matches
-        patterns = self._compiled_patterns.get(intent, [])
-        pattern_matches = sum(1 for pattern in patterns if pattern.search(message))
-        if pattern_matches > 0:
-            score += min(pattern_matches * 0.5, 0.8)
-
-        # Check entity matches
-        entities = config.get("entities", [])
-        entity_matches = sum(1 for entity in entities if entity in message)
-        if entity_matches > 0:
-            score += min(entity_matches * 0.2, 0.4)
-
-        # Normalize to 0-1
-        return min(score, 1.0)
-
-    def _extract_entities(self, message: str) -> List[str]:
+    def _extract_entities(self, message: str, terms: Optional[Set[str]] = None) -> List[str]:
         """Extract data entities from message."""
+        if terms is None:
+            terms = self._find_terms(message)
         entities = []
 
         for entity_type, keywords in self.DATA_ENTITIES.items():
-            for keyword in keywords:
-                if keyword in message:
-                    entities.append(entity_type)
-                    break  # Only add each entity type once
+            if any(keyword in terms for keyword in keywords):
+                entities.append(entity_type)  # Only add each entity type once
 
         return entities
 
-    def _extract_action(self, message: str) -> Optional[str]:
+    def _extract_action(self, message: str, terms: Optional[Set[str]] = None) -> Optional[str]:
         """Extract action verb from message."""
+        if terms is None:
+            terms = self._find_terms(message)
         for action, verbs in self.ACTION_VERBS.items():
-            for verb in verbs:
-                if verb in message:
-                    return action
+            if any(verb in terms for verb in verbs):
+                return action
 
         return None
 
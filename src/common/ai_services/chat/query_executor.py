@@ -3,14 +3,20 @@ Query Executor for Conversational AI
 
 Safely executes Django ORM queries generated from natural language.
 Implements comprehensive security validation to prevent dangerous operations.
+Results of string queries are cached per organization scope (see
+``common.services.chat_query_cache``).
 """
 
 import ast
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Avg, Count, Max, Min, Q, Sum
 
+from common.services import chat_query_cache as query_cache
+from common.services.cache_generations import model_label
+
 logger = logging.getLogger(__name__)
 
 
@@ -94,19 +100,25 @@ class QueryExecutor:
         """Initialize query executor with safety context."""
         self._context = self._build_safe_context()
 
-    def execute(self, query_input: Any) -> Dict[str, Any]:
+    def execute(
+        self, query_input: Any, scope: Optional[str] = None, use_cache: bool = True
+    ) -> Dict[str, Any]:
         """
         Execute a query with comprehensive safety checks.
 
         Args:
             query_input: Either a Django ORM query string OR a QuerySet object
+            scope: Cache scope of the caller ("global" or "org:<id>");
+                defaults to the current organization
+            use_cache: Serve/store string query results from the result cache
 
         Returns:
             Dictionary with:
                 - success: bool
                 - result: Query result or None
                 - error: Error message if failed
-                - query_info: Metadata about the query
+                - query_info: Metadata about the query (``cached`` is True
+                  when served from the result cache)
 
         Security:
             - If QuerySet is provided directly, no eval() or parsing is needed (most secure)
@@ -125,6 +137,8 @@ class QueryExecutor:
         """
         from django.db.models import QuerySet
 
+        cache_info = None
+        generations = None
         try:
             # SECURITY: If query_input is already a QuerySet, use it directly (most secure)
             if isinstance(query_input, QuerySet):
@@ -133,16 +147,30 @@ class QueryExecutor:
             else:
                 # String query - parse and validate
                 query_string = str(query_input)
+                caching = use_cache and query_cache.cache_timeout()
 
-                # Step 1: Parse and validate query
-                validation = self._validate_query(query_string)
-                if not validation["is_safe"]:
-                    return {
-                        "success": False,
-                        "result": None,
-                        "error": f"Unsafe query: {validation['reason']}",
-                        "query_info": validation,
-                    }
+                # Queries seen before were already validated and parsed
+                if caching:
+                    cache_info = query_cache.remembered(query_string)
+
+                if cache_info is None:
+                    # Step 1: Parse and validate query
+                    validation = self._validate_query(query_string)
+                    if not validation["is_safe"]:
+                        return {
+                            "success": False,
+                            "result": None,
+                            "error": f"Unsafe query: {validation['reason']}",
+                            "query_info": validation,
+                        }
+                    if caching:
+                        cache_info = self._describe_query(query_string)
+
+                if cache_info is not None:
+                    scope = scope or query_cache.scope_for_current_organization()
+                    cached, generations = query_cache.lookup(*cache_info, scope)
+                    if cached is not None:
+                        return {**cached, "query_info": {**cached["query_info"], "cached": True}}
 
                 # Step 2: Execute query in restricted context
                 result = self._execute_safe(query_string)
@@ -150,7 +178,7 @@ class QueryExecutor:
             # Step 3: Process and limit results
             processed_result = self._process_result(result)
 
-            return {
+            response = {
                 "success": True,
                 "result": processed_result,
                 "error": None,
@@ -158,8 +186,12 @@ class QueryExecutor:
                     "query": query_string if isinstance(query_input, str) else "QuerySet object",
                     "result_type": type(result).__name__,
                     "result_count": self._get_result_count(processed_result),
+                    "cached": False,
                 },
             }
+            if cache_info is not None:
+                query_cache.store(cache_info[0], scope, generations, response)
+            return response
 
         except Exception as e:
             query_repr = str(query_input)[:200] if query_input else "None"
@@ -171,6 +203,88 @@ class QueryExecutor:
                 "query_info": {"query": query_repr},
             }
 
+    def _describe_query(self, query_string: str) -> Optional[Tuple[str, FrozenSet[str]]]:
+        """
+        Cache digest and read models of a validated query string.
+
+        Returns None (do not cache) when the root model is unknown.
+        """
+        tree = ast.parse(query_string, mode="eval")
+        parsed = self._extract_from_ast(tree.body)
+        model_class = self._context.get(parsed["model"])
+        if model_class is None or not hasattr(model_class, "_meta"):
+            return None
+
+        labels = frozenset(self._query_models(model_class, parsed["operations"]))
+        digest = query_cache.query_digest(tree)
+        query_cache.remember(query_string, digest, labels)
+        return digest, labels
+
+    def _query_models(self, model_class, operations: List[Dict[str, Any]]) -> Set[str]:
+        """Labels of the root model and every model its lookups traverse."""
+        labels = {model_label(model_class)}
+        aliases: Set[str] = set()
+
+        for operation in operations:
+            paths: List[str] = []
+            args = operation.get("args", [])
+            kwargs = operation.get("kwargs", {})
+            if operation["method"] in ("annotate", "aggregate"):
+                aliases.update(kwargs)
+                self._collect_paths(list(args) + list(kwargs.values()), paths)
+            else:
+                paths.extend(key for key in kwargs if isinstance(key, str))
+                self._collect_paths(list(args) + list(kwargs.values()), paths)
+
+            for path in paths:
+                self._walk_lookup(model_class, path.lstrip("-"), labels, aliases)
+
+        return labels
+
+    def _collect_paths(self, values: List[Any], paths: List[str]) -> None:
+        """Lookup paths referenced by strings, Q objects and expressions."""
+        for value in values:
+            if isinstance(value, str):
+                paths.append(value)
+            elif isinstance(value, Q):
+                for child in value.children:
+                    if isinstance(child, tuple):
+                        paths.append(child[0])
+                    else:
+                        self._collect_paths([child], paths)
+            elif isinstance(value, (list, tuple)):
+                self._collect_paths(list(value), paths)
+            elif hasattr(value, "get_source_expressions"):
+                name = getattr(value, "name", None)
+                if isinstance(name, str):
+                    paths.append(name)
+                self._collect_paths(value.get_source_expressions(), paths)
+                if getattr(value, "filter", None) is not None:
+                    self._collect_paths([value.filter], paths)
+
+    def _walk_lookup(self, model_class, path: str, labels: Set[str], aliases: Set[str]) -> None:
+        parts = path.split("__")
+        if parts[0] in aliases:
+            return
+        current = model_class
+        for part in parts:
+            if part == "pk":
+                return
+            try:
+                field = current._meta.get_field(part)
+            except FieldDoesNotExist:
+                return  # Remaining parts are lookups/transforms
+            if not field.is_relation or field.related_model is None:
+                return
+            if field.many_to_many:
+                through = getattr(field, "through", None) or getattr(
+                    field.remote_field, "through", None
+                )
+                if through is not None and hasattr(through, "_meta"):
+                    labels.add(model_label(through))
+            current = field.related_model
+            labels.add(model_label(current))
+
     def _validate_query(self, query_string: str) -> Dict[str, Any]:
         """
         Validate query safety using multiple approaches.
@@ -13,7 +13,9 @@ Architecture:
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from common.ai_services.chat.query_templates.literal_index import TemplateLiteralIndex
 
 logger = logging.getLogger(__name__)
 
@@ -151,7 +153,12 @@ class QueryTemplate:
                 missing.append(required_entity)
         return missing
 
-    def score_match(self, query: str, entities: Dict[str, Any]) -> float:
+    def score_match(
+        self,
+        query: str,
+        entities: Dict[str, Any],
+        pattern_matched: Optional[bool] = None,
+    ) -> float:
         """
         Score how well this template matches the query.
 
@@ -163,6 +170,8 @@ class QueryTemplate:
         Args:
             query: User's query
             entities: Extracted entities
+            pattern_matched: Result of an earlier ``matches()`` call, if any,
+                so the regex is not evaluated a second time
 
         Returns:
             Score between 0.0 and 1.0
@@ -175,7 +184,9 @@ class QueryTemplate:
         score = 0.0
 
         # Pattern match (0.4)
-        if self.matches(query):
+        if pattern_matched is None:
+            pattern_matched = self.matches(query) is not None
+        if pattern_matched:
             score += 0.4
 
         # Priority (0.3, normalized from 1-10)
@@ -229,6 +240,10 @@ class TemplateRegistry:
         self._category_index: Dict[str, List[str]] = {}
         self._tag_index: Dict[str, List[str]] = {}
 
+        # Required-literal prefilter, rebuilt lazily after registration changes
+        self._literal_index: Optional[TemplateLiteralIndex] = None
+        self._indexed_templates: List[QueryTemplate] = []
+
     @classmethod
     def get_instance(cls) -> 'TemplateRegistry':
         """
@@ -282,6 +297,8 @@ class TemplateRegistry:
                 self._tag_index[tag] = []
             self._tag_index[tag].append(template.id)
 
+        self._literal_index = None
+
         logger.debug(f"Registered template: {template.id} (category: {template.category})")
 
     def register_many(self, templates: List[QueryTemplate]) -> None:
@@ -388,7 +405,7 @@ class TemplateRegistry:
             min_priority: Minimum priority threshold (1-10)
 
         Returns:
-            List of matching templates, sorted by match score
+            List of matching templates, in registration order
 
         Example:
             >>> matches = registry.search_templates(
@@ -396,23 +413,65 @@ class TemplateRegistry:
             ...     category='communities'
             ... )
         """
-        # Get candidate templates
-        if category:
-            candidates = self.get_templates_by_category(category)
-        else:
-            candidates = self.get_all_templates()
+        return [
+            template
+            for template, _ in self.search_template_matches(
+                query, category=category, min_priority=min_priority
+            )
+        ]
+
+    def search_template_matches(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        min_priority: int = 1,
+    ) -> List[Tuple[QueryTemplate, re.Match]]:
+        """
+        Search for templates matching a query, keeping each regex match.
 
-        # Filter by priority
-        candidates = [t for t in candidates if t.priority >= min_priority]
+        Only templates whose required literals occur in the query are
+        regex-evaluated (see ``literal_index``); results are identical to
+        testing every template.
+
+        Args:
+            query: User's natural language query
+            category: Optional category filter
+            min_priority: Minimum priority threshold (1-10)
+
+        Returns:
+            List of (template, match) tuples, in registration order
+        """
+        if not query:
+            return []
+
+        index = self._get_literal_index()
+        positions = index.candidates(query)
+        if positions is None:
+            candidates = self._indexed_templates
+        else:
+            candidates = [self._indexed_templates[pos] for pos in positions]
 
-        # Find matches
         matches = []
         for template in candidates:
-            if template.matches(query):
-                matches.append(template)
+            if category and template.category != category:
+                continue
+            if template.priority < min_priority:
+                continue
+            match = template.matches(query)
+            if match:
+                matches.append((template, match))
 
         return matches
 
+    def _get_literal_index(self) -> TemplateLiteralIndex:
+        """Build the literal prefilter index on first use after a change."""
+        if self._literal_index is None:
+            self._indexed_templates = list(self._templates.values())
+            self._literal_index = TemplateLiteralIndex(
+                template.pattern for template in self._indexed_templates
+            )
+        return self._literal_index
+
     def get_categories(self) -> List[str]:
         """
         Get list of all registered categories.
@@ -478,6 +537,8 @@ class TemplateRegistry:
         self._templates.clear()
         self._category_index.clear()
         self._tag_index.clear()
+        self._literal_index = None
+        self._indexed_templates = []
         logger.debug("Template registry cleared")
 
 
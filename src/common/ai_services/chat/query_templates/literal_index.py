@@ -0,0 +1,181 @@
+"""
+Required-Literal Index for Query Templates
+
+Pre-filters templates before regex evaluation. At registry load each
+template pattern is parsed once and reduced to a "guard": a small set of
+lowercase literal strings, at least one of which must occur in any text the
+pattern can match. A query is only regex-evaluated against templates whose
+guard is satisfied (or that have no usable guard), so the number of regex
+runs per message tracks how many templates could plausibly match rather
+than how many templates are registered.
+
+The guard is a necessary condition only, never a sufficient one, so search
+results are identical to scanning every template.
+"""
+
+import logging
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+try:  # Python 3.11+
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants
+    import sre_parse
+
+logger = logging.getLogger(__name__)
+
+# Guards whose shortest literal is below this length prune too little to be
+# worth indexing; such templates are evaluated for every query instead.
+MIN_LITERAL_LENGTH = 3
+
+_LITERAL = sre_constants.LITERAL
+_SUBPATTERN = sre_constants.SUBPATTERN
+_BRANCH = sre_constants.BRANCH
+_AT = sre_constants.AT
+_REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+_POSSESSIVE_REPEAT = getattr(sre_constants, "POSSESSIVE_REPEAT", None)
+_ATOMIC_GROUP = getattr(sre_constants, "ATOMIC_GROUP", None)
+
+Guard = FrozenSet[str]
+
+
+def _better(candidate: Optional[Guard], current: Optional[Guard]) -> bool:
+    """Prefer guards with longer shortest literals, then fewer alternatives."""
+    if not candidate:
+        return False
+    if not current:
+        return True
+    candidate_key = (min(map(len, candidate)), -len(candidate))
+    current_key = (min(map(len, current)), -len(current))
+    return candidate_key > current_key
+
+
+def _sequence_guard(items: Iterable[Tuple]) -> Optional[Guard]:
+    """Best guard for a sequence: a literal run or one item's guard."""
+    best: Optional[Guard] = None
+    run: List[str] = []
+
+    def flush():
+        nonlocal best
+        if run:
+            literal = frozenset(["".join(run)])
+            if _better(literal, best):
+                best = literal
+            run.clear()
+
+    for op, arg in items:
+        if op == _LITERAL and arg < 128:
+            run.append(chr(arg).lower())
+            continue
+        if op == _AT:
+            # Zero-width anchors (\b, ^, $) do not split the matched text.
+            continue
+
+        flush()
+        guard = _item_guard(op, arg)
+        if _better(guard, best):
+            best = guard
+
+    flush()
+    return best
+
+
+def _item_guard(op, arg) -> Optional[Guard]:
+    """Guard for a single parsed regex item, or None if none can be derived."""
+    if op == _SUBPATTERN:
+        return _sequence_guard(arg[-1])
+    if _ATOMIC_GROUP is not None and op == _ATOMIC_GROUP:
+        return _sequence_guard(arg)
+    if op in _REPEATS or (_POSSESSIVE_REPEAT is not None and op == _POSSESSIVE_REPEAT):
+        min_count, _max_count, body = arg
+        return _sequence_guard(body) if min_count >= 1 else None
+    if op == _BRANCH:
+        alternatives: Set[str] = set()
+        for branch in arg[1]:
+            guard = _sequence_guard(branch)
+            if not guard:
+                return None
+            alternatives.update(guard)
+        return frozenset(alternatives)
+    return None
+
+
+def required_literals(pattern: str, flags: int = re.IGNORECASE) -> Optional[Guard]:
+    """
+    Derive a guard for ``pattern``.
+
+    Returns a set of lowercase literals such that every match of the
+    pattern contains at least one of them, or ``None`` when no guard with
+    literals of at least ``MIN_LITERAL_LENGTH`` characters exists.
+
+    Example:
+        >>> sorted(required_literals(r'(?:how many|count).*communit'))
+        ['communit']
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error:
+        return None
+
+    guard = _sequence_guard(list(parsed))
+    if not guard or min(map(len, guard)) < MIN_LITERAL_LENGTH:
+        return None
+    return guard
+
+
+class TemplateLiteralIndex:
+    """
+    Inverted index from guard literals to template positions.
+
+    Positions are registration order, so callers can return candidates in
+    the same order a full scan would.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self._postings: Dict[str, List[int]] = {}
+        self._unguarded: List[int] = []
+        size = 0
+
+        for position, pattern in enumerate(patterns):
+            size += 1
+            guard = required_literals(pattern)
+            if guard is None:
+                self._unguarded.append(position)
+                continue
+            for literal in guard:
+                self._postings.setdefault(literal, []).append(position)
+
+        # Longest literals first is arbitrary but deterministic.
+        self._literals = sorted(self._postings, key=lambda lit: (-len(lit), lit))
+        self.size = size
+
+        logger.debug(
+            "Template literal index built: %d templates, %d literals, %d unguarded",
+            size,
+            len(self._literals),
+            len(self._unguarded),
+        )
+
+    @property
+    def unguarded_count(self) -> int:
+        return len(self._unguarded)
+
+    def candidates(self, query: str) -> Optional[List[int]]:
+        """
+        Positions of templates that could match ``query``, in order.
+
+        Returns ``None`` when the query cannot be pre-filtered safely
+        (non-ASCII text, where case-insensitive regex matching is looser
+        than ``str.lower``); callers should then scan every template.
+        """
+        if not query.isascii():
+            return None
+
+        text = query.lower()
+        positions = set(self._unguarded)
+        for literal in self._literals:
+            if literal in text:
+                positions.update(self._postings[literal])
+        return sorted(positions)
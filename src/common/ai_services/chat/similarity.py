@@ -7,10 +7,19 @@ Provides efficient string similarity calculations using multiple algorithms:
 - Combined similarity score
 
 Used by fallback handler to find similar successful queries.
+
+``find_most_similar`` only runs the edit-distance DP for candidates that can
+still reach the threshold: the exact Jaccard score, the length difference and
+a character-bigram count bound the Levenshtein distance from below, and the
+remaining distance budget bounds a banded DP that exits early once every cell
+in a row exceeds it. Scores are identical to an unbounded computation.
 """
 
 import logging
-from typing import List, Set
+import math
+import re
+from collections import Counter, OrderedDict
+from typing import List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -20,13 +29,19 @@ class SimilarityCalculator:
     Calculate similarity between query strings using multiple algorithms.
 
     Combines Levenshtein distance and Jaccard similarity for robust matching.
-    Optimized for performance with caching and early termination.
+    Optimized for performance with an LRU cache keyed by normalized pairs,
+    candidate prefiltering and bounded edit distance with early exit.
     """
 
+    LEVENSHTEIN_WEIGHT = 0.6
+    JACCARD_WEIGHT = 0.4
+
     def __init__(self):
         """Initialize similarity calculator."""
-        self._cache = {}
+        self._cache = OrderedDict()
         self._cache_size = 1000  # Maximum cache entries
+        self._hits = 0
+        self._misses = 0
 
     def calculate_similarity(self, query1: str, query2: str) -> float:
         """
@@ -48,14 +63,9 @@ class SimilarityCalculator:
             >>> calc.calculate_similarity("communities in region 9", "communities in Region IX")
             0.89
         """
-        # Check cache
-        cache_key = (query1, query2)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
         # Normalize queries
-        q1 = query1.lower().strip()
-        q2 = query2.lower().strip()
+        q1 = self._normalize(query1)
+        q2 = self._normalize(query2)
 
         # Handle exact match
         if q1 == q2:
@@ -65,38 +75,65 @@ class SimilarityCalculator:
         if not q1 or not q2:
             return 0.0
 
-        # Calculate Levenshtein similarity (60% weight)
-        lev_distance = self.levenshtein_distance(q1, q2)
-        max_len = max(len(q1), len(q2))
-        lev_similarity = 1.0 - (lev_distance / max_len) if max_len > 0 else 0.0
-
-        # Calculate Jaccard similarity (40% weight)
-        jaccard_sim = self.jaccard_similarity(q1, q2)
-
-        # Combined score
-        combined = (lev_similarity * 0.6) + (jaccard_sim * 0.4)
-
-        # Cache result (with size limit)
-        if len(self._cache) >= self._cache_size:
-            # Remove oldest entry (simple FIFO)
-            self._cache.pop(next(iter(self._cache)))
-        self._cache[cache_key] = combined
+        cached = self._cache_get(q1, q2)
+        if cached is not None:
+            return cached
 
+        lev_distance = self.levenshtein_distance(q1, q2)
+        combined = self._combine(q1, q2, lev_distance, self.jaccard_similarity(q1, q2))
+        self._cache_set(q1, q2, combined)
         return combined
 
-    def levenshtein_distance(self, s1: str, s2: str) -> int:
+    def _normalize(self, query: str) -> str:
+        return query.lower().strip()
+
+    def _combine(self, q1: str, q2: str, distance: int, jaccard_sim: float) -> float:
+        """Weighted score: Levenshtein similarity 60%, Jaccard similarity 40%."""
+        max_len = max(len(q1), len(q2))
+        lev_similarity = 1.0 - (distance / max_len) if max_len > 0 else 0.0
+        return (lev_similarity * self.LEVENSHTEIN_WEIGHT) + (jaccard_sim * self.JACCARD_WEIGHT)
+
+    def _cache_key(self, q1: str, q2: str) -> tuple:
+        # Both measures are symmetric, so (a, b) and (b, a) share an entry
+        return (q1, q2) if q1 <= q2 else (q2, q1)
+
+    def _cache_get(self, q1: str, q2: str) -> Optional[float]:
+        key = self._cache_key(q1, q2)
+        score = self._cache.get(key)
+        if score is None:
+            self._misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return score
+
+    def _cache_set(self, q1: str, q2: str, score: float) -> None:
+        key = self._cache_key(q1, q2)
+        self._cache[key] = score
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            # Evict least recently used entry
+            self._cache.popitem(last=False)
+
+    def levenshtein_distance(
+        self, s1: str, s2: str, max_distance: Optional[int] = None
+    ) -> int:
         """
         Calculate Levenshtein distance (minimum edit operations).
 
         Args:
             s1: First string
             s2: Second string
+            max_distance: Optional bound; once the distance is known to
+                exceed it, ``max_distance + 1`` is returned early
 
         Returns:
             Number of insertions, deletions, or substitutions needed
 
         Algorithm:
-            Dynamic programming with space optimization (O(min(m,n)) space)
+            Dynamic programming with space optimization (O(min(m,n)) space).
+            With ``max_distance`` only a diagonal band of width
+            ``2 * max_distance + 1`` is computed (O(k * min(m,n)) time).
 
         Example:
             >>> calc = SimilarityCalculator()
@@ -107,14 +144,18 @@ class SimilarityCalculator:
         if s1 == s2:
             return 0
         if not s1:
-            return len(s2)
+            return self._cap(len(s2), max_distance)
         if not s2:
-            return len(s1)
+            return self._cap(len(s1), max_distance)
 
         # Ensure s1 is shorter for space optimization
         if len(s1) > len(s2):
             s1, s2 = s2, s1
 
+        # The distance is at least the length difference
+        if max_distance is not None and len(s2) - len(s1) > max_distance:
+            return max_distance + 1
+
         # Trim common prefix to reduce problem size
         start = 0
         len_s1 = len(s1)
@@ -133,13 +174,16 @@ class SimilarityCalculator:
             len_s2 -= 1
 
         if len_s1 == 0:
-            return len_s2
+            return self._cap(len_s2, max_distance)
         if len_s2 == 0:
-            return len_s1
+            return self._cap(len_s1, max_distance)
 
         s1 = s1[:len_s1]
         s2 = s2[:len_s2]
 
+        if max_distance is not None and max_distance < len_s2:
+            return self._banded_levenshtein(s1, s2, max_distance)
+
         # Initialize distance matrix (only need current and previous row)
         previous_row = list(range(len(s2) + 1))
         current_row = [0] * (len(s2) + 1)
@@ -161,6 +205,51 @@ class SimilarityCalculator:
 
         return previous_row[len(s2)]
 
+    @staticmethod
+    def _cap(distance: int, max_distance: Optional[int]) -> int:
+        if max_distance is not None and distance > max_distance:
+            return max_distance + 1
+        return distance
+
+    @staticmethod
+    def _banded_levenshtein(s1: str, s2: str, max_distance: int) -> int:
+        """
+        Levenshtein distance restricted to cells within ``max_distance`` of
+        the diagonal (``len(s1) <= len(s2)``). Returns ``max_distance + 1``
+        as soon as no cell in a row is within the bound.
+        """
+        len_s2 = len(s2)
+        limit = max_distance + 1
+        previous_row = [j if j <= max_distance else limit for j in range(len_s2 + 1)]
+
+        for i, c1 in enumerate(s1, 1):
+            low = max(1, i - max_distance)
+            high = min(len_s2, i + max_distance)
+            current_row = [limit] * (len_s2 + 1)
+            if low == 1 and i <= max_distance:
+                current_row[0] = i
+            row_min = current_row[low - 1]
+
+            for j in range(low, high + 1):
+                value = min(
+                    previous_row[j] + 1,  # deletion
+                    current_row[j - 1] + 1,  # insertion
+                    previous_row[j - 1] + (c1 != s2[j - 1]),  # substitution
+                )
+                current_row[j] = value
+                if value < row_min:
+                    row_min = value
+
+            if row_min > max_distance:
+                return limit
+            previous_row = current_row
+
+        return min(previous_row[len_s2], limit)
+
+    @staticmethod
+    def _bigrams(text: str) -> Counter:
+        return Counter(text[i : i + 2] for i in range(len(text) - 1))
+
     def jaccard_similarity(self, s1: str, s2: str) -> float:
         """
         Calculate Jaccard similarity (token overlap).
@@ -209,7 +298,6 @@ class SimilarityCalculator:
             Set of normalized tokens
         """
         # Split on whitespace and punctuation
-        import re
         tokens = re.findall(r'\w+', text.lower())
         return set(tokens)
 
@@ -246,10 +334,44 @@ class SimilarityCalculator:
         if not candidates:
             return []
 
-        # Calculate similarities
+        q1 = self._normalize(query)
+        q1_tokens = self._tokenize(q1)
+        q1_bigrams = None
+
+        # Calculate similarities for candidates that can reach the threshold
         similarities = []
         for candidate in candidates:
-            score = self.calculate_similarity(query, candidate)
+            q2 = self._normalize(candidate)
+            if q1 == q2:
+                score = 1.0
+            elif not q1 or not q2:
+                score = 0.0
+            else:
+                score = self._cache_get(q1, q2)
+
+            if score is None:
+                jaccard_sim = self._jaccard_tokens(q1_tokens, self._tokenize(q2))
+                max_distance = self._distance_budget(q1, q2, jaccard_sim, threshold)
+                if max_distance < abs(len(q1) - len(q2)):
+                    continue
+
+                if q1_bigrams is None:
+                    q1_bigrams = self._bigrams(q1)
+                q2_bigrams = self._bigrams(q2)
+                # Each edit changes at most two bigrams
+                missing = max(
+                    sum((q1_bigrams - q2_bigrams).values()),
+                    sum((q2_bigrams - q1_bigrams).values()),
+                )
+                if max_distance < (missing + 1) // 2:
+                    continue
+
+                distance = self.levenshtein_distance(q1, q2, max_distance=max_distance)
+                if distance > max_distance:
+                    continue
+                score = self._combine(q1, q2, distance, jaccard_sim)
+                self._cache_set(q1, q2, score)
+
             if score >= threshold:
                 similarities.append((candidate, score))
 
@@ -257,16 +379,36 @@ class SimilarityCalculator:
         similarities.sort(key=lambda x: x[1], reverse=True)
         return similarities[:limit]
 
+    def _distance_budget(self, q1: str, q2: str, jaccard_sim: float, threshold: float) -> int:
+        """
+        Largest edit distance at which the combined score can still reach
+        ``threshold``, plus one to absorb floating-point rounding (the final
+        comparison uses the exact score).
+        """
+        max_len = max(len(q1), len(q2))
+        required = (threshold - jaccard_sim * self.JACCARD_WEIGHT) / self.LEVENSHTEIN_WEIGHT
+        return int(math.floor(max_len * (1.0 - required))) + 1
+
+    @staticmethod
+    def _jaccard_tokens(tokens1: Set[str], tokens2: Set[str]) -> float:
+        if not tokens1 or not tokens2:
+            return 0.0
+        return len(tokens1 & tokens2) / len(tokens1 | tokens2)
+
     def clear_cache(self):
         """Clear the similarity calculation cache."""
         self._cache.clear()
+        self._hits = 0
+        self._misses = 0
 
     def get_cache_stats(self) -> dict:
         """Get cache statistics."""
         return {
             'size': len(self._cache),
             'max_size': self._cache_size,
-            'utilization': len(self._cache) / self._cache_size if self._cache_size > 0 else 0
+            'utilization': len(self._cache) / self._cache_size if self._cache_size > 0 else 0,
+            'hits': self._hits,
+            'misses': self._misses,
         }
 
 
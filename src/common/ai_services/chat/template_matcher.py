@@ -14,7 +14,7 @@ Performance target: <10ms per match
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from common.ai_services.chat.query_templates import QueryTemplate, get_template_registry
 
@@ -88,8 +88,9 @@ class TemplateMatcher:
             ... )
         """
         try:
-            # Step 1: Find matching templates
-            matches = self.find_matching_templates(query, entities, intent, category)
+            # Step 1: Find matching templates (keeping each regex match for ranking)
+            found = self._find_template_matches(query, category)
+            matches = [template for template, _ in found]
 
             if not matches:
                 return {
@@ -102,7 +103,12 @@ class TemplateMatcher:
                 }
 
             # Step 2: Rank templates and pick best match
-            ranked_matches = self.rank_templates(matches, query, entities)
+            ranked_matches = self.rank_templates(
+                matches,
+                query,
+                entities,
+                match_lookup={template.id: match for template, match in found},
+            )
             best_match = ranked_matches[0]
 
             # Merge regex capture groups into the entity set so templates can use them
@@ -188,31 +194,29 @@ class TemplateMatcher:
             ...     category='communities'
             ... )
         """
-        # Use registry's search method
-        matches = self.registry.search_templates(
+        matches = [template for template, _ in self._find_template_matches(query, category)]
+
+        logger.debug(f"Found {len(matches)} matching templates for query: {query[:50]}...")
+        return matches
+
+    def _find_template_matches(
+        self,
+        query: str,
+        category: Optional[str] = None,
+    ) -> List[Tuple[QueryTemplate, re.Match]]:
+        """Find matching templates together with their regex match objects."""
+        return self.registry.search_template_matches(
             query=query,
             category=category,
             min_priority=1,
         )
 
-        # Additional filtering if needed
-        filtered_matches = []
-        for template in matches:
-            # Check pattern match
-            if not template.matches(query):
-                continue
-
-            # Add to results
-            filtered_matches.append(template)
-
-        logger.debug(f"Found {len(filtered_matches)} matching templates for query: {query[:50]}...")
-        return filtered_matches
-
     def rank_templates(
         self,
         templates: List[QueryTemplate],
         query: str,
         entities: Dict[str, Any],
+        match_lookup: Optional[Dict[str, re.Match]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Rank templates by match quality.
@@ -227,6 +231,8 @@ class TemplateMatcher:
             templates: List of candidate templates
             query: User's query
             entities: Extracted entities
+            match_lookup: Regex matches already computed during search, keyed
+                by template ID; templates missing from it are matched here
 
         Returns:
             List of dicts with 'template' and 'score', sorted by score (desc)
@@ -240,10 +246,13 @@ class TemplateMatcher:
 
         for template in templates:
             # Capture regex match for later entity extraction
-            match = template.matches(query)
+            if match_lookup is not None and template.id in match_lookup:
+                match = match_lookup[template.id]
+            else:
+                match = template.matches(query)
 
             # Calculate match score
-            score = template.score_match(query, entities)
+            score = template.score_match(query, entities, pattern_matched=match is not None)
 
             ranked.append({
                 'template': template,
@@ -0,0 +1,33 @@
+"""
+Management command to backfill the dashboard activity stream.
+
+Records feed entries for needs, PPAs, scheduled activities and completed
+tasks that predate the activity stream signals. Safe to re-run: entries
+already recorded for a source row are skipped.
+
+Usage:
+    python manage.py backfill_activity_stream
+    python manage.py backfill_activity_stream --days 90
+"""
+
+from django.core.management.base import BaseCommand
+
+from common.services.activity_stream import FEED_WINDOW_DAYS, backfill
+
+
+class Command(BaseCommand):
+    help = 'Backfill the dashboard activity stream from existing records'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=FEED_WINDOW_DAYS,
+            help=f'How many days of history to backfill (default: {FEED_WINDOW_DAYS})',
+        )
+
+    def handle(self, *args, **options):
+        processed = backfill(days=options['days'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Processed {processed} activity stream entries')
+        )
@@ -7,6 +7,7 @@ Benchmarks:
 - Entity extraction speed
 - Memory usage
 - Cache effectiveness
+- Chat pipeline stage breakdown (time, DB queries, candidates per stage)
 """
 
 import json
@@ -15,7 +16,9 @@ import tracemalloc
 from datetime import datetime
 from typing import Dict, List
 
+from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from common.ai_services.chat.query_templates import get_template_registry
 
@@ -41,6 +44,11 @@ class Command(BaseCommand):
             default=50,
             help='Number of sample queries to test (default: 50)',
         )
+        parser.add_argument(
+            '--user-id',
+            type=int,
+            help='User to run chat pipeline turns as (default: first active user)',
+        )
 
     def handle(self, *args, **options):
         """Main benchmark execution."""
@@ -88,6 +96,18 @@ class Command(BaseCommand):
         results['category_search'] = category_result
         self._print_benchmark_result(category_result)
 
+        # Benchmark 6: Chat Pipeline Stages
+        self.stdout.write(self.style.WARNING('Benchmark 6: Chat Pipeline Stages'))
+        pipeline_result = self._benchmark_pipeline_stages(
+            num_queries, options.get('user_id')
+        )
+        if pipeline_result:
+            results['pipeline_stages'] = pipeline_result
+            self._print_pipeline_result(pipeline_result)
+        else:
+            self.stdout.write('  Skipped: no user available to run chat turns as')
+            self.stdout.write('')
+
         # Summary
         self.stdout.write('')
         self.stdout.write(self.style.SUCCESS('=' * 70))
@@ -263,6 +283,62 @@ class Command(BaseCommand):
             'categories': times_by_category,
         }
 
+    def _benchmark_pipeline_stages(self, num_queries: int, user_id=None) -> Dict:
+        """
+        Run sample queries through the full chat pipeline and aggregate the
+        per-stage breakdown. Conversation history writes are rolled back.
+        """
+        from common.ai_services.chat import get_conversational_assistant
+        from common.ai_services.chat.instrumentation import ChatTrace
+
+        if user_id is None:
+            user_id = (
+                get_user_model()
+                .objects.filter(is_active=True)
+                .order_by('pk')
+                .values_list('pk', flat=True)
+                .first()
+            )
+        if user_id is None:
+            return {}
+
+        assistant = get_conversational_assistant()
+        sample_queries = self._get_sample_queries()[:num_queries]
+        stages = {}
+        totals = []
+
+        with transaction.atomic():
+            for query in sample_queries:
+                trace = ChatTrace()
+                assistant.chat(user_id, query, trace=trace)
+                summary = trace.summary()
+                totals.append(summary['total_ms'])
+                for name, stage in summary['stages'].items():
+                    bucket = stages.setdefault(
+                        name, {'turns': 0, 'time_ms': [], 'queries': 0, 'candidates': 0}
+                    )
+                    bucket['turns'] += 1
+                    bucket['time_ms'].append(stage['time_ms'])
+                    bucket['queries'] += stage['queries']
+                    bucket['candidates'] += stage['candidates'] or 0
+            transaction.set_rollback(True)
+
+        return {
+            'operation': 'Chat Pipeline Stages',
+            'queries_tested': len(sample_queries),
+            'avg_total_ms': sum(totals) / len(totals) if totals else 0,
+            'stages': {
+                name: {
+                    'turns': bucket['turns'],
+                    'avg_time_ms': sum(bucket['time_ms']) / bucket['turns'],
+                    'max_time_ms': max(bucket['time_ms']),
+                    'avg_queries': bucket['queries'] / bucket['turns'],
+                    'avg_candidates': bucket['candidates'] / bucket['turns'],
+                }
+                for name, bucket in stages.items()
+            },
+        }
+
     def _get_sample_queries(self) -> List[str]:
         """Get sample queries for benchmarking."""
         return [
@@ -368,6 +444,23 @@ class Command(BaseCommand):
         )
         self.stdout.write('')
 
+    def _print_pipeline_result(self, result: Dict):
+        """Print per-stage chat pipeline breakdown."""
+        self.stdout.write(f"  Operation: {result['operation']}")
+        self.stdout.write(f"  Queries tested: {result['queries_tested']}")
+        self.stdout.write(f"  Average turn time: {result['avg_total_ms']:.2f} ms")
+        self.stdout.write(
+            f"  {'Stage':<24}{'Turns':>7}{'Avg ms':>10}{'Max ms':>10}"
+            f"{'Avg DB q':>10}{'Avg cand':>10}"
+        )
+        for name, stage in result['stages'].items():
+            self.stdout.write(
+                f"  {name:<24}{stage['turns']:>7}{stage['avg_time_ms']:>10.2f}"
+                f"{stage['max_time_ms']:>10.2f}{stage['avg_queries']:>10.2f}"
+                f"{stage['avg_candidates']:>10.2f}"
+            )
+        self.stdout.write('')
+
     def _generate_summary(self, results: Dict) -> List[str]:
         """Generate summary of benchmark results."""
         summary = []
@@ -380,6 +473,13 @@ class Command(BaseCommand):
         summary.append(f"Template Loading: {loading_time:.2f} ms")
         summary.append(f"Pattern Matching (per query): {matching_time:.2f} ms")
         summary.append(f"Memory Usage: {memory_mb:.2f} MB")
+        if results.get('pipeline_stages'):
+            stages = results['pipeline_stages']['stages']
+            slowest = max(stages, key=lambda name: stages[name]['avg_time_ms'])
+            summary.append(
+                f"Chat Turn: {results['pipeline_stages']['avg_total_ms']:.2f} ms "
+                f"(slowest stage: {slowest}, {stages[slowest]['avg_time_ms']:.2f} ms)"
+            )
         summary.append('')
 
         # Performance assessment
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0046_grant_monitoring_to_oobc_staff'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardMetricSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(default='global', help_text="'global' or an organization scope such as 'org:<uuid>'", max_length=64)),
+                ('section', models.CharField(help_text='Dashboard section these counters belong to', max_length=50)),
+                ('metrics', models.JSONField(blank=True, default=dict, help_text='Computed counters for the section')),
+                ('is_stale', models.BooleanField(default=False, help_text='Set by model signals when source data changed')),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Dashboard Metric Snapshot',
+                'verbose_name_plural': 'Dashboard Metric Snapshots',
+                'db_table': 'common_dashboard_metric_snapshot',
+                'ordering': ['scope', 'section'],
+                'indexes': [models.Index(fields=['section', 'is_stale'], name='common_dash_section_eddac8_idx')],
+                'constraints': [models.UniqueConstraint(fields=('scope', 'section'), name='dashboard_metric_scope_section_uniq')],
+            },
+        ),
+    ]
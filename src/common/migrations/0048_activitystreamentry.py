@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 08:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0047_dashboardmetricsnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityStreamEntry',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('occurred_at', models.DateTimeField(help_text='When the underlying activity happened')),
+                ('kind', models.CharField(choices=[('need_created', 'Need Created'), ('ppa_created', 'PPA Created'), ('task_completed', 'Task Completed'), ('event_scheduled', 'Event Scheduled')], max_length=30)),
+                ('source_type', models.CharField(help_text='Model label of the source record (app_label.ModelName)', max_length=100)),
+                ('source_id', models.CharField(help_text='Primary key of the source record', max_length=64)),
+                ('title', models.CharField(max_length=255)),
+                ('subtitle', models.CharField(blank=True, max_length=255)),
+                ('icon', models.CharField(max_length=50)),
+                ('color', models.CharField(max_length=20)),
+                ('url', models.CharField(blank=True, default='#', max_length=255)),
+            ],
+            options={
+                'verbose_name': 'Activity Stream Entry',
+                'verbose_name_plural': 'Activity Stream Entries',
+                'db_table': 'common_activity_stream',
+                'ordering': ['-occurred_at', '-id'],
+                'indexes': [models.Index(fields=['-occurred_at', '-id'], include=('kind', 'title', 'subtitle', 'icon', 'color', 'url'), name='activity_stream_keyset_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'source_type', 'source_id'), name='activity_stream_source_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0048_activitystreamentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dashboardmetricsnapshot',
+            name='version',
+            field=models.PositiveIntegerField(default=0, help_text='Incremented each time the section is marked stale'),
+        ),
+    ]
@@ -1865,3 +1865,134 @@ class ChatMessage(models.Model):
 
     def __str__(self):
         return f"{self.user.get_full_name()}: {self.user_message[:50]}..."
+
+
+# ========== DASHBOARD METRICS ==========
+
+
+class DashboardMetricSnapshot(models.Model):
+    """
+    Materialized dashboard counters for one section within one scope.
+
+    Rows are maintained by ``common.services.dashboard_metrics``: model
+    signals flag affected sections as stale and the next read recomputes
+    them with a single conditional-aggregation query per source model.
+    """
+
+    SCOPE_GLOBAL = "global"
+
+    scope = models.CharField(
+        max_length=64,
+        default=SCOPE_GLOBAL,
+        help_text="'global' or an organization scope such as 'org:<uuid>'",
+    )
+
+    section = models.CharField(
+        max_length=50,
+        help_text="Dashboard section these counters belong to",
+    )
+
+    metrics = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Computed counters for the section",
+    )
+
+    is_stale = models.BooleanField(
+        default=False,
+        help_text="Set by model signals when source data changed",
+    )
+
+    version = models.PositiveIntegerField(
+        default=0,
+        help_text="Incremented each time the section is marked stale",
+    )
+
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'common_dashboard_metric_snapshot'
+        ordering = ['scope', 'section']
+        verbose_name = 'Dashboard Metric Snapshot'
+        verbose_name_plural = 'Dashboard Metric Snapshots'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['scope', 'section'],
+                name='dashboard_metric_scope_section_uniq',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['section', 'is_stale']),
+        ]
+
+    def __str__(self):
+        return f"{self.scope}:{self.section}"
+
+
+class ActivityStreamEntry(models.Model):
+    """
+    Append-only dashboard activity feed row.
+
+    Populated by model signals (see ``common.services.activity_stream``) so
+    the dashboard feed is a keyset range scan over ``(occurred_at, id)``
+    instead of a per-request merge of several querysets.
+    """
+
+    KIND_NEED_CREATED = "need_created"
+    KIND_PPA_CREATED = "ppa_created"
+    KIND_TASK_COMPLETED = "task_completed"
+    KIND_EVENT_SCHEDULED = "event_scheduled"
+
+    KIND_CHOICES = [
+        (KIND_NEED_CREATED, "Need Created"),
+        (KIND_PPA_CREATED, "PPA Created"),
+        (KIND_TASK_COMPLETED, "Task Completed"),
+        (KIND_EVENT_SCHEDULED, "Event Scheduled"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+
+    occurred_at = models.DateTimeField(
+        help_text="When the underlying activity happened"
+    )
+
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES)
+
+    source_type = models.CharField(
+        max_length=100,
+        help_text="Model label of the source record (app_label.ModelName)",
+    )
+    source_id = models.CharField(
+        max_length=64,
+        help_text="Primary key of the source record",
+    )
+
+    title = models.CharField(max_length=255)
+    subtitle = models.CharField(max_length=255, blank=True)
+    icon = models.CharField(max_length=50)
+    color = models.CharField(max_length=20)
+    url = models.CharField(max_length=255, blank=True, default="#")
+
+    class Meta:
+        db_table = 'common_activity_stream'
+        ordering = ['-occurred_at', '-id']
+        verbose_name = 'Activity Stream Entry'
+        verbose_name_plural = 'Activity Stream Entries'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind', 'source_type', 'source_id'],
+                name='activity_stream_source_uniq',
+            ),
+        ]
+        indexes = [
+            # Covering index for keyset pagination (INCLUDE is PostgreSQL-only
+            # and ignored on other backends).
+            models.Index(
+                fields=['-occurred_at', '-id'],
+                name='activity_stream_keyset_idx',
+                include=['kind', 'title', 'subtitle', 'icon', 'color', 'url'],
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.title}"
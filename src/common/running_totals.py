@@ -0,0 +1,143 @@
+"""
+Running totals
+
+Shared machinery for stored totals that are adjusted on every write of
+their source rows instead of being re-aggregated on read: the budget
+execution ledger (``budget_execution.services.ledger``) and the budget
+preparation proposal totals (``budget_preparation.services.proposal_totals``).
+
+A source model mixes in ``RunningTotalsMixin``; its ``pre_save`` and
+``pre_delete`` receivers read the values the totals last recorded with
+``lock_previous_values()`` / ``deleted_values()``, and its ``post_save`` and
+``post_delete`` receivers post the difference with ``post_deltas()``.
+
+The previous values are read under ``select_for_update()`` inside the save
+transaction, and postings are ``F()`` updates, so concurrent or stale
+writers of the same row serialize and cannot lose each other's amounts.
+Writes that bypass model signals (``QuerySet.update``, ``bulk_create``, raw
+SQL) are not posted; each user of this module provides a reconciliation
+built on ``stored_differences()``.
+"""
+
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models import F
+
+ZERO = Decimal("0.00")
+
+
+class RunningTotalsMixin:
+    """
+    Model mixin for rows that post to, or hold, running totals.
+
+    ``tracked_fields`` are the source values whose changes are posted.
+    ``stored_total_fields`` are totals kept on the row itself; they are
+    only ever changed with ``F()`` updates, and are reloaded from the locked
+    row before a save so a stale instance writes back the current totals.
+    """
+
+    tracked_fields: tuple = ()
+    stored_total_fields: tuple = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_tracked_values()
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self.remember_tracked_values()
+
+    def remember_tracked_values(self) -> None:
+        """Record the current tracked values (skipped when any is deferred)."""
+        if all(field in self.__dict__ for field in self.tracked_fields):
+            self._tracked_values = {field: self.__dict__[field] for field in self.tracked_fields}
+        else:
+            self.__dict__.pop("_tracked_values", None)
+
+    def save(self, *args, **kwargs):
+        # Receivers lock the row and post the totals inside this transaction.
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
+
+
+def lock_previous_values(instance) -> Optional[dict]:
+    """
+    Lock ``instance``'s row and return its tracked values as stored.
+
+    Also reloads ``stored_total_fields`` onto the instance. Must run inside
+    the write's transaction (``pre_save`` / ``pre_delete``).
+
+    Returns:
+        Field -> value, or None for rows being inserted (or already gone)
+    """
+    if instance._state.adding or instance.pk is None:
+        return None
+    stored = (
+        type(instance)
+        ._base_manager.select_for_update()
+        .filter(pk=instance.pk)
+        .values(*instance.tracked_fields, *instance.stored_total_fields)
+        .first()
+    )
+    if stored is None:
+        return None
+    for field in instance.stored_total_fields:
+        setattr(instance, field, stored.pop(field))
+    return stored
+
+
+def deleted_values(instance, origin) -> dict:
+    """
+    Tracked values to take out of the totals for a deleted row.
+
+    The row being deleted is re-read under lock; rows reached through a
+    cascade were just loaded by the deletion collector and are used as is.
+    """
+    if origin is instance:
+        stored = lock_previous_values(instance)
+        if stored is not None:
+            return stored
+    return {field: getattr(instance, field) for field in instance.tracked_fields}
+
+
+def post_deltas(queryset, deltas: Dict, **values) -> int:
+    """
+    Add the non-zero ``deltas`` (field -> amount) to the matching rows.
+
+    ``values`` are set as given in the same ``UPDATE`` (e.g. ``updated_at``).
+
+    Returns:
+        Number of rows updated
+    """
+    changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if not changes:
+        return 0
+    return queryset.update(**changes, **values)
+
+
+def stored_differences(recorded_rows: Iterable[dict], key: str, fields, expected: Dict) -> List[dict]:
+    """
+    Compare stored totals with totals recomputed from the source rows.
+
+    Args:
+        recorded_rows: ``values(key, *fields)`` rows of the stored totals
+        key: Row key field
+        fields: Total fields to compare
+        expected: Key -> recomputed totals
+
+    Returns:
+        Differences with ``key``, ``recorded`` (None when the row is
+        missing) and ``expected`` totals (zero for orphaned rows)
+    """
+    recorded = {row.pop(key): row for row in recorded_rows}
+    differences = []
+    for pk in expected.keys() | recorded.keys():
+        actual = recorded.get(pk)
+        wanted = expected.get(pk, dict.fromkeys(fields, ZERO))
+        if actual != wanted:
+            differences.append({"key": pk, "recorded": actual, "expected": wanted})
+    return differences
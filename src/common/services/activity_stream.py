@@ -0,0 +1,228 @@
+"""Activity stream backing the dashboard feed.
+
+Rows are written by model signals (``common.signals``) when a need or PPA
+is created, an activity is scheduled or a task is completed. A task that is
+completed again replaces its entry, and deleting a source removes its
+entries. The dashboard reads the stream newest-first with a
+``(occurred_at, id)`` keyset cursor so every scroll page is one indexed
+range scan, however deep it is.
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from common.models import ActivityStreamEntry
+
+FEED_WINDOW_DAYS = 30
+PAGE_SIZE = 20
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+# ---------------------------------------------------------------------------
+# Entry builders
+# ---------------------------------------------------------------------------
+
+
+def _source_type(source) -> str:
+    # Proxies (StaffTaskProxy, EventProxy) share their concrete model's rows.
+    return source._meta.concrete_model._meta.label
+
+
+def _entry(kind, source, occurred_at, title, subtitle, icon, color, url="#"):
+    return ActivityStreamEntry(
+        occurred_at=occurred_at or timezone.now(),
+        kind=kind,
+        source_type=_source_type(source),
+        source_id=str(source.pk),
+        title=title[:255],
+        subtitle=subtitle[:255],
+        icon=icon,
+        color=color,
+        url=url,
+    )
+
+
+def entry_for_need(need) -> ActivityStreamEntry:
+    return _entry(
+        ActivityStreamEntry.KIND_NEED_CREATED,
+        need,
+        need.created_at,
+        f"New need: {need.title}",
+        f"in {need.community}",
+        "fa-lightbulb",
+        "blue",
+    )
+
+
+def entry_for_ppa(ppa) -> ActivityStreamEntry:
+    lead_org = ppa.lead_organization.name if ppa.lead_organization_id else "OOBC"
+    return _entry(
+        ActivityStreamEntry.KIND_PPA_CREATED,
+        ppa,
+        ppa.created_at,
+        f"New PPA: {ppa.title}",
+        f"Lead: {lead_org}",
+        "fa-project-diagram",
+        "emerald",
+        f"/monitoring/entry/{ppa.id}/",
+    )
+
+
+def _completed_by(task) -> str:
+    assignee = next(iter(task.assignees.all()), None)
+    return f"by {assignee.get_full_name() if assignee else 'Unassigned'}"
+
+
+def entry_for_completed_task(task) -> ActivityStreamEntry:
+    return _entry(
+        ActivityStreamEntry.KIND_TASK_COMPLETED,
+        task,
+        task.updated_at,
+        f"Task completed: {task.title}",
+        _completed_by(task),
+        "fa-check-circle",
+        "green",
+    )
+
+
+def entry_for_event(event) -> ActivityStreamEntry:
+    start = event.start_date.strftime("%b %d, %Y") if event.start_date else "Date TBD"
+    return _entry(
+        ActivityStreamEntry.KIND_EVENT_SCHEDULED,
+        event,
+        event.created_at,
+        f"Event scheduled: {event.title}",
+        start,
+        "fa-calendar",
+        "purple",
+    )
+
+
+def record(*entries: ActivityStreamEntry) -> None:
+    """Append entries, ignoring ones already recorded for the same source."""
+
+    ActivityStreamEntry.objects.bulk_create(entries, ignore_conflicts=True)
+
+
+def _entries_for(source, kind=None):
+    entries = ActivityStreamEntry.objects.filter(
+        source_type=_source_type(source), source_id=str(source.pk)
+    )
+    return entries.filter(kind=kind) if kind else entries
+
+
+@transaction.atomic
+def record_completed_task(task) -> None:
+    """Record a task completion, replacing the entry of an earlier one."""
+
+    _entries_for(task, ActivityStreamEntry.KIND_TASK_COMPLETED).delete()
+    record(entry_for_completed_task(task))
+
+
+def refresh_completed_task(task) -> None:
+    """Update a completed task's entry after its assignees change."""
+
+    _entries_for(task, ActivityStreamEntry.KIND_TASK_COMPLETED).update(
+        subtitle=_completed_by(task)[:255]
+    )
+
+
+def remove(source) -> None:
+    """Remove every entry recorded for a deleted source."""
+
+    _entries_for(source).delete()
+
+
+# ---------------------------------------------------------------------------
+# Keyset pagination
+# ---------------------------------------------------------------------------
+
+
+def encode_cursor(entry: ActivityStreamEntry) -> str:
+    """Encode an entry position as ``<epoch microseconds>.<id>``."""
+
+    micros = (entry.occurred_at - _EPOCH) // timedelta(microseconds=1)
+    return f"{micros}.{entry.pk}"
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """Decode a cursor, returning ``None`` for missing or malformed values."""
+
+    if not cursor:
+        return None
+    try:
+        micros, pk = cursor.split(".", 1)
+        return _EPOCH + timedelta(microseconds=int(micros)), int(pk)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def fetch_page(
+    cursor: Optional[str] = None,
+    limit: int = PAGE_SIZE,
+    window_days: int = FEED_WINDOW_DAYS,
+) -> Tuple[List[ActivityStreamEntry], Optional[str]]:
+    """
+    Return one feed page and the cursor for the next page (or ``None``).
+
+    Fetches ``limit + 1`` rows to detect whether another page exists.
+    """
+
+    queryset = ActivityStreamEntry.objects.filter(
+        occurred_at__gte=timezone.now() - timedelta(days=window_days)
+    )
+
+    position = decode_cursor(cursor)
+    if position:
+        occurred_at, pk = position
+        queryset = queryset.filter(
+            Q(occurred_at__lt=occurred_at) | Q(occurred_at=occurred_at, id__lt=pk)
+        )
+
+    rows = list(queryset.order_by("-occurred_at", "-id")[: limit + 1])
+    page, has_next = rows[:limit], len(rows) > limit
+    return page, encode_cursor(page[-1]) if has_next else None
+
+
+# ---------------------------------------------------------------------------
+# Backfill
+# ---------------------------------------------------------------------------
+
+
+def backfill(days: int = FEED_WINDOW_DAYS) -> int:
+    """Record activity for source rows from the last ``days`` days."""
+
+    from common.work_item_model import WorkItem
+    from mana.models import Need
+    from monitoring.models import MonitoringEntry
+
+    since = timezone.now() - timedelta(days=days)
+    entries = []
+
+    for need in Need.objects.filter(created_at__gte=since).select_related("community"):
+        entries.append(entry_for_need(need))
+
+    for ppa in MonitoringEntry.objects.filter(created_at__gte=since).select_related(
+        "lead_organization"
+    ):
+        entries.append(entry_for_ppa(ppa))
+
+    for task in WorkItem.objects.filter(
+        work_type=WorkItem.WORK_TYPE_TASK,
+        status=WorkItem.STATUS_COMPLETED,
+        updated_at__gte=since,
+    ).prefetch_related("assignees"):
+        entries.append(entry_for_completed_task(task))
+
+    for event in WorkItem.objects.filter(
+        work_type=WorkItem.WORK_TYPE_ACTIVITY, created_at__gte=since
+    ):
+        entries.append(entry_for_event(event))
+
+    record(*entries)
+    return len(entries)
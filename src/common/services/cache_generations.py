@@ -0,0 +1,64 @@
+"""
+Per-model cache generation counters.
+
+Caches of database-derived results record the generation of every model
+they read and treat an entry as stale once any of those generations moved.
+``common.signals`` bumps a model's generation on saves, deletes and
+many-to-many changes of every model except ``UNWATCHED_MODELS``, and
+``invalidate_caches_for`` bumps it after bulk writes that send no signals.
+
+Used by the chat query result cache, the assistant's semantic cache, the
+monitoring budget rollup and the OCM summaries.
+"""
+
+import time
+from typing import Dict, Iterable
+
+from django.core.cache import cache
+
+GENERATION_KEY_PREFIX = "cache:model_gen"
+
+# Tables no cached result reads: they have no relations a query can
+# traverse, and sessions and derived rows are written far more often than
+# anything else.
+UNWATCHED_MODELS = frozenset(
+    {
+        "sessions.Session",
+        "common.DashboardMetricSnapshot",
+        "common.ActivityStreamEntry",
+    }
+)
+
+
+def _generation_key(label: str) -> str:
+    return f"{GENERATION_KEY_PREFIX}:{label}"
+
+
+def model_label(model) -> str:
+    """Generation label of ``model``; proxies share their concrete model's."""
+    return model._meta.concrete_model._meta.label
+
+
+def model_generations(labels: Iterable[str]) -> Dict[str, int]:
+    """Current generation of each model label, as bumped on saves and deletes."""
+    keys = {_generation_key(label): label for label in set(labels)}
+    found = cache.get_many(list(keys))
+    generations = {}
+    for key, label in keys.items():
+        generation = found.get(key)
+        if generation is None:
+            # Time-based seed: a key that was evicted and recreated never
+            # matches generations recorded before the eviction.
+            cache.add(key, time.time_ns(), None)
+            generation = cache.get(key)
+        generations[label] = generation
+    return generations
+
+
+def bump_model_generation(label: str) -> None:
+    """Invalidate cached results that read model ``label``."""
+    try:
+        cache.incr(_generation_key(label))
+    except ValueError:
+        # No generation yet: nothing cached depends on this model.
+        pass
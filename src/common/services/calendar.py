@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time as time_module
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta
@@ -36,12 +37,38 @@ from recommendations.policy_tracking.models import PolicyRecommendation
 
 CALENDAR_CACHE_INDEX_KEY = "calendar:payload:index"
 CALENDAR_CACHE_TTL = 300  # seconds
+CALENDAR_GENERATION_KEY = "calendar:generation"
+
+
+def get_calendar_generation() -> int:
+    """Return the calendar data generation.
+
+    The generation is the epoch time in milliseconds of the last calendar
+    data change. It only moves forward, so it stays unique even when the
+    cache is cleared, and feeds use it to answer conditional requests.
+    """
+
+    generation = cache.get(CALENDAR_GENERATION_KEY)
+    if generation is None:
+        cache.add(CALENDAR_GENERATION_KEY, int(time_module.time() * 1000), None)
+        generation = cache.get(CALENDAR_GENERATION_KEY)
+    return generation
+
+
+def bump_calendar_generation() -> int:
+    """Advance the calendar generation after a data change."""
+
+    previous = cache.get(CALENDAR_GENERATION_KEY) or 0
+    generation = max(int(time_module.time() * 1000), previous + 1)
+    cache.set(CALENDAR_GENERATION_KEY, generation, None)
+    return generation
 
 
 def invalidate_calendar_cache() -> None:
     """Clear cached calendar payloads and per-view responses."""
 
     cache.clear()
+    bump_calendar_generation()
 
 
 @dataclass
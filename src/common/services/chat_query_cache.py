@@ -0,0 +1,171 @@
+"""
+Result cache for executed chat ORM queries.
+
+Repeated analytic questions ("how many communities in X") generate the
+same ORM query string for many users. ``QueryExecutor`` caches the processed
+result of successful string queries keyed by:
+
+- a digest of the canonicalized query AST (formatting, quoting and the order
+  of filter keyword arguments do not matter), and
+- the caller's organization scope, since organization-scoped managers filter
+  by the current organization.
+
+Each entry records the models the query reads (root model plus every model
+traversed by lookups, ``Q`` objects and aggregates) with their current
+generation (``common.services.cache_generations``). Saves and deletes of a
+model bump its generation, so entries reading it miss on the next lookup.
+Writes that bypass signals (``QuerySet.update``) are bounded by the short
+TTL unless the writer calls ``invalidate_caches_for``.
+
+The per-process memo maps raw query strings to their digest and model
+dependencies, so a repeated query is answered without re-parsing.
+"""
+
+import ast
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+from common.services.cache_generations import model_generations
+
+try:
+    from prometheus_client import Counter
+except ImportError:  # pragma: no cover - prometheus_client ships with django-prometheus
+    Counter = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TIMEOUT = 300
+RESULT_KEY_PREFIX = "chat:query_result"
+MEMO_SIZE = 512
+
+# Keyword order does not change the rows these calls select
+_ORDER_INSENSITIVE_CALLS = {"filter", "exclude", "get", "Q"}
+
+if Counter is not None:
+    CACHE_LOOKUPS = Counter(
+        "obcms_chat_query_cache_lookups_total",
+        "Chat ORM query result cache lookups by outcome.",
+        ["outcome"],
+    )
+else:  # pragma: no cover
+    CACHE_LOOKUPS = None
+
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(hit: bool) -> None:
+    with _stats_lock:
+        _stats["hits" if hit else "misses"] += 1
+    if CACHE_LOOKUPS is not None:
+        CACHE_LOOKUPS.labels(outcome="hit" if hit else "miss").inc()
+
+
+def get_stats() -> Dict[str, float]:
+    """Hit/miss counters of this process."""
+    with _stats_lock:
+        hits, misses = _stats["hits"], _stats["misses"]
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+        "memo_size": len(_memo),
+    }
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats["hits"] = 0
+        _stats["misses"] = 0
+
+
+class _CanonicalizeCalls(ast.NodeTransformer):
+    def visit_Call(self, node: ast.Call) -> ast.Call:
+        self.generic_visit(node)
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        if name in _ORDER_INSENSITIVE_CALLS:
+            node.keywords = sorted(node.keywords, key=lambda keyword: keyword.arg or "")
+        return node
+
+
+def query_digest(tree: ast.AST) -> str:
+    """Digest of a parsed query that ignores formatting and filter kwarg order."""
+    canonical = _CanonicalizeCalls().visit(tree)
+    dump = ast.dump(canonical, annotate_fields=False, include_attributes=False)
+    return hashlib.sha256(dump.encode("utf-8")).hexdigest()
+
+
+def scope_for_current_organization() -> str:
+    """Scope key for the organization the scoped managers currently filter by."""
+    from common.services.dashboard_metrics import scope_for
+    from organizations.models.scoped import get_current_organization
+
+    return scope_for(get_current_organization())
+
+
+_memo: "OrderedDict[str, Tuple[str, FrozenSet[str]]]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def remembered(query_string: str) -> Optional[Tuple[str, FrozenSet[str]]]:
+    """Digest and model dependencies of an already validated query string."""
+    with _memo_lock:
+        entry = _memo.get(query_string)
+        if entry is not None:
+            _memo.move_to_end(query_string)
+        return entry
+
+
+def remember(query_string: str, digest: str, labels: FrozenSet[str]) -> None:
+    with _memo_lock:
+        _memo[query_string] = (digest, labels)
+        _memo.move_to_end(query_string)
+        if len(_memo) > MEMO_SIZE:
+            _memo.popitem(last=False)
+
+
+def _result_key(digest: str, scope: str) -> str:
+    return f"{RESULT_KEY_PREFIX}:{scope}:{digest}"
+
+
+def cache_timeout() -> int:
+    """Result TTL in seconds (``CHAT_QUERY_CACHE_TIMEOUT``; 0 disables caching)."""
+    return getattr(settings, "CHAT_QUERY_CACHE_TIMEOUT", DEFAULT_CACHE_TIMEOUT)
+
+
+def lookup(
+    digest: str, labels: FrozenSet[str], scope: str
+) -> Tuple[Optional[Dict], Dict[str, int]]:
+    """
+    Return ``(response, generations)``.
+
+    ``response`` is the cached executor response, or ``None`` if absent or
+    invalidated; ``generations`` are the current generations of ``labels``,
+    to be stored with a freshly computed result.
+    """
+    entry = cache.get(_result_key(digest, scope))
+    generations = model_generations(labels)
+    if entry is not None and entry["generations"] == generations:
+        _count(True)
+        return entry["response"], generations
+    _count(False)
+    return None, generations
+
+
+def store(digest: str, scope: str, generations: Dict[str, int], response: Dict) -> None:
+    try:
+        cache.set(
+            _result_key(digest, scope),
+            {"generations": generations, "response": response},
+            cache_timeout(),
+        )
+    except Exception as e:  # Unpicklable result values are simply not cached
+        logger.warning(f"Could not cache chat query result: {e}")
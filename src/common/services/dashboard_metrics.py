@@ -0,0 +1,514 @@
+"""Materialized dashboard metrics.
+
+Dashboard counters are grouped into *sections*. Each section is computed
+with one conditional-aggregation statement per source model and persisted
+in :class:`common.models.DashboardMetricSnapshot`, keyed by scope
+(``"global"`` or ``"org:<uuid>"`` for MOA portfolios).
+
+Reads go through the cache first, then the snapshot table; only sections
+that are missing, flagged stale by model signals, or computed on a previous
+day are recomputed. ``common.tasks.refresh_dashboard_metrics`` rebuilds all
+known snapshots periodically.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from django.core.cache import cache
+from django.db.models import Avg, Count, F, Q, Sum
+from django.utils import timezone
+
+from common.constants import STAFF_USER_TYPES
+from common.models import DashboardMetricSnapshot
+
+CACHE_GENERATION_KEY = "dashboard:metrics:generation"
+CACHE_TIMEOUT = 300  # seconds
+
+PENDING_REQUEST_STATUSES = ["submitted", "under_review", "clarification", "endorsed"]
+POLICY_CATEGORY_GROUPS = {
+    "policies": ["governance", "legal_framework", "administrative"],
+    "programs": [
+        "education",
+        "economic_development",
+        "social_development",
+        "cultural_development",
+    ],
+    "services": ["healthcare", "infrastructure", "environment", "human_rights"],
+}
+
+
+def _jsonable(values: Dict) -> Dict:
+    """Convert aggregate output into JSON-friendly primitives."""
+
+    cleaned = {}
+    for key, value in values.items():
+        if isinstance(value, Decimal):
+            value = float(value)
+        cleaned[key] = value if value is not None else 0
+    return cleaned
+
+
+# ---------------------------------------------------------------------------
+# Section builders (one conditional aggregate per source model)
+# ---------------------------------------------------------------------------
+
+
+def build_communities_metrics(organization=None) -> Dict:
+    from communities.models import MunicipalityCoverage, OBCCommunity, ProvinceCoverage
+
+    barangay = OBCCommunity.objects.aggregate(
+        barangay_total=Count("id"),
+        active=Count("id", filter=Q(is_active=True)),
+    )
+    metrics = _jsonable(barangay)
+    metrics["municipal_total"] = MunicipalityCoverage.objects.count()
+    metrics["provincial_total"] = ProvinceCoverage.objects.count()
+    metrics["total"] = metrics["barangay_total"]
+    metrics["combined_total"] = metrics["barangay_total"] + metrics["municipal_total"]
+    metrics["by_region"] = list(
+        OBCCommunity.objects.values("barangay__municipality__province__region__name")
+        .annotate(count=Count("id"))
+        .order_by("-count")[:5]
+    )
+    return metrics
+
+
+def build_mana_metrics(organization=None) -> Dict:
+    from mana.models import Assessment, Need
+
+    metrics = _jsonable(
+        Assessment.objects.aggregate(
+            total_assessments=Count("id"),
+            completed=Count("id", filter=Q(status="completed")),
+            in_progress=Count(
+                "id", filter=Q(status__in=["data_collection", "analysis"])
+            ),
+        )
+    )
+    metrics.update(
+        _jsonable(
+            Need.objects.aggregate(
+                high_priority=Count("id", filter=Q(impact_severity=5)),
+                unfunded_high_priority=Count(
+                    "id",
+                    filter=Q(linked_ppa__isnull=True, priority_score__gte=4.0),
+                ),
+            )
+        )
+    )
+    return metrics
+
+
+def build_monitoring_metrics(organization=None) -> Dict:
+    from monitoring.models import MonitoringEntry
+
+    return _jsonable(
+        MonitoringEntry.objects.aggregate(
+            total=Count("id"),
+            moa_ppa=Count("id", filter=Q(category="moa_ppa")),
+            oobc_ppa=Count("id", filter=Q(category="oobc_ppa")),
+            obc_requests=Count("id", filter=Q(category="obc_request")),
+            pending_requests=Count(
+                "id",
+                filter=Q(
+                    category="obc_request",
+                    request_status__in=PENDING_REQUEST_STATUSES,
+                ),
+            ),
+            active_projects=Count("id", filter=Q(status="ongoing")),
+            linked_assessments=Count(
+                "id", filter=Q(related_assessment__isnull=False)
+            ),
+            linked_policies=Count("id", filter=Q(related_policy__isnull=False)),
+            avg_progress=Avg("progress"),
+            total_budget=Sum("budget_allocation"),
+            total_beneficiaries=Sum("obc_slots"),
+        )
+    )
+
+
+def build_coordination_metrics(organization=None) -> Dict:
+    from coordination.models import (
+        CoordinationNote,
+        Event,
+        Partnership,
+        StakeholderEngagement,
+    )
+
+    today = timezone.now().date()
+
+    metrics = _jsonable(
+        Partnership.objects.filter(status="active").aggregate(
+            active_partnerships=Count("id"),
+            bmoas=Count("id", filter=Q(lead_organization__organization_type="bmoa")),
+            ngas=Count("id", filter=Q(lead_organization__organization_type="nga")),
+            lgus=Count("id", filter=Q(lead_organization__organization_type="lgu")),
+        )
+    )
+    metrics.update(
+        _jsonable(
+            Event.objects.aggregate(
+                total_events=Count("id"),
+                upcoming_events=Count(
+                    "id", filter=Q(start_date__gte=today, status="planned")
+                ),
+                upcoming_planned_30_days=Count(
+                    "id",
+                    filter=Q(
+                        start_date__gte=today,
+                        start_date__lte=today + timedelta(days=30),
+                        status="planned",
+                    ),
+                ),
+                events_next_7_days=Count(
+                    "id",
+                    filter=Q(
+                        start_date__gte=today,
+                        start_date__lte=today + timedelta(days=7),
+                    ),
+                ),
+            )
+        )
+    )
+    metrics.update(
+        _jsonable(
+            CoordinationNote.objects.aggregate(
+                total_coordination_notes=Count("id"),
+                recent_coordination_notes=Count(
+                    "id", filter=Q(note_date__gte=today - timedelta(days=30))
+                ),
+            )
+        )
+    )
+    metrics.update(
+        _jsonable(
+            StakeholderEngagement.objects.aggregate(
+                total_engagements=Count("id"),
+                active_engagements=Count(
+                    "id", filter=Q(status__in=["scheduled", "in_progress"])
+                ),
+            )
+        )
+    )
+    metrics["pending_actions"] = 0
+    return metrics
+
+
+def build_policy_tracking_metrics(organization=None) -> Dict:
+    from recommendations.policy_tracking.models import PolicyRecommendation
+
+    metrics = _jsonable(
+        PolicyRecommendation.objects.aggregate(
+            total_policies=Count("id"),
+            implemented=Count("id", filter=Q(status="implemented")),
+            under_review=Count("id", filter=Q(status="under_review")),
+            high_priority=Count(
+                "id", filter=Q(priority__in=["high", "urgent", "critical"])
+            ),
+            **{
+                name: Count("id", filter=Q(category__in=categories))
+                for name, categories in POLICY_CATEGORY_GROUPS.items()
+            },
+        )
+    )
+    metrics["total_recommendations"] = metrics["total_policies"]
+    return metrics
+
+
+def build_work_items_metrics(organization=None) -> Dict:
+    from common.work_item_model import WorkItem
+
+    today = timezone.now().date()
+    week_start = today - timedelta(days=today.weekday())
+
+    return _jsonable(
+        WorkItem.objects.filter(work_type=WorkItem.WORK_TYPE_TASK).aggregate(
+            overdue=Count(
+                "id",
+                filter=Q(
+                    due_date__lt=today,
+                    status__in=["not_started", "in_progress"],
+                ),
+            ),
+            due_this_week=Count(
+                "id",
+                filter=Q(
+                    due_date__gte=week_start,
+                    due_date__lte=week_start + timedelta(days=6),
+                    status__in=["not_started", "in_progress"],
+                ),
+            ),
+        )
+    )
+
+
+def build_staff_metrics(organization=None) -> Dict:
+    from common.models import User
+
+    return _jsonable(
+        User.objects.aggregate(
+            total_staff=Count("id", filter=Q(user_type__in=STAFF_USER_TYPES)),
+            active_staff=Count(
+                "id", filter=Q(user_type__in=STAFF_USER_TYPES, is_active=True)
+            ),
+            pending_approvals=Count("id", filter=Q(is_approved=False)),
+        )
+    )
+
+
+def build_moa_portfolio_metrics(organization=None) -> Dict:
+    from monitoring.models import MonitoringEntry
+
+    if organization is None:
+        return {
+            "total": 0,
+            "ongoing": 0,
+            "completed": 0,
+            "stalled": 0,
+            "avg_progress": 0,
+            "total_budget": 0,
+            "community_count": 0,
+            "status_breakdown": [],
+        }
+
+    ppa_qs = MonitoringEntry.objects.filter(
+        category="moa_ppa", implementing_moa=organization
+    )
+    metrics = _jsonable(
+        ppa_qs.aggregate(
+            total=Count("id"),
+            ongoing=Count("id", filter=Q(status__in=["planning", "ongoing"])),
+            completed=Count("id", filter=Q(status="completed")),
+            stalled=Count("id", filter=Q(status__in=["on_hold", "cancelled"])),
+            avg_progress=Avg("progress"),
+            total_budget=Sum("budget_allocation"),
+        )
+    )
+    # Counted separately: joining the M2M above would inflate the sums.
+    metrics["community_count"] = (
+        ppa_qs.exclude(communities=None).values("communities").distinct().count()
+    )
+    metrics["status_breakdown"] = list(
+        ppa_qs.values("status").annotate(count=Count("id")).order_by("-count")
+    )
+    return metrics
+
+
+SECTION_BUILDERS = {
+    "communities": build_communities_metrics,
+    "mana": build_mana_metrics,
+    "monitoring": build_monitoring_metrics,
+    "coordination": build_coordination_metrics,
+    "policy_tracking": build_policy_tracking_metrics,
+    "work_items": build_work_items_metrics,
+    "staff": build_staff_metrics,
+    "moa_portfolio": build_moa_portfolio_metrics,
+}
+
+GLOBAL_SECTIONS = (
+    "communities",
+    "mana",
+    "monitoring",
+    "coordination",
+    "policy_tracking",
+    "work_items",
+    "staff",
+)
+ORGANIZATION_SECTIONS = ("moa_portfolio",)
+
+# Source models whose writes invalidate each section.
+SECTION_SOURCES = {
+    "communities": (
+        "communities.OBCCommunity",
+        "communities.MunicipalityCoverage",
+        "communities.ProvinceCoverage",
+    ),
+    "mana": ("mana.Assessment", "mana.Need"),
+    "monitoring": ("monitoring.MonitoringEntry",),
+    "coordination": (
+        "coordination.Partnership",
+        "coordination.Organization",
+        "coordination.CoordinationNote",
+        "coordination.StakeholderEngagement",
+        "common.WorkItem",
+        "common.EventProxy",
+    ),
+    "policy_tracking": ("policy_tracking.PolicyRecommendation",),
+    "work_items": ("common.WorkItem", "common.StaffTaskProxy"),
+    "staff": ("common.User",),
+    "moa_portfolio": ("monitoring.MonitoringEntry",),
+}
+
+
+def sections_for_model(model_label: str) -> List[str]:
+    """Return the dashboard sections fed by ``app_label.ModelName``."""
+
+    return [
+        section
+        for section, sources in SECTION_SOURCES.items()
+        if model_label in sources
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Snapshot access
+# ---------------------------------------------------------------------------
+
+
+def scope_for(organization=None) -> str:
+    """Return the snapshot scope key for an optional organization."""
+
+    if organization is None:
+        return DashboardMetricSnapshot.SCOPE_GLOBAL
+    return f"org:{getattr(organization, 'pk', organization)}"
+
+
+def _cache_generation() -> int:
+    generation = cache.get(CACHE_GENERATION_KEY)
+    if generation is None:
+        cache.add(CACHE_GENERATION_KEY, 1, None)
+        generation = cache.get(CACHE_GENERATION_KEY, 1)
+    return generation
+
+
+def _cache_key(scope: str, sections: Sequence[str]) -> str:
+    return f"dashboard:metrics:{_cache_generation()}:{scope}:{','.join(sections)}"
+
+
+def _is_current(snapshot: DashboardMetricSnapshot, today) -> bool:
+    # Date-relative counters (overdue, upcoming) roll over at midnight.
+    return (
+        not snapshot.is_stale
+        and timezone.localtime(snapshot.computed_at).date() == today
+    )
+
+
+def refresh_section(section: str, organization=None) -> DashboardMetricSnapshot:
+    """
+    Recompute one section and persist it as the current snapshot.
+
+    The stale flag is only cleared if the snapshot ``version`` read before
+    computing is unchanged, so a write that marks the section stale while it
+    is being computed still triggers the next recompute.
+    """
+
+    scope = scope_for(organization)
+    snapshots = DashboardMetricSnapshot.objects.filter(scope=scope, section=section)
+    snapshot = snapshots.first()
+    metrics = SECTION_BUILDERS[section](organization=organization)
+
+    if snapshot is None:
+        snapshot, created = DashboardMetricSnapshot.objects.get_or_create(
+            scope=scope, section=section, defaults={"metrics": metrics}
+        )
+        if created:
+            return snapshot
+
+    computed_at = timezone.now()
+    cleared = snapshots.filter(version=snapshot.version).update(
+        metrics=metrics, is_stale=False, computed_at=computed_at
+    )
+    if not cleared:
+        snapshots.update(metrics=metrics, computed_at=computed_at)
+
+    snapshot.metrics = metrics
+    snapshot.is_stale = not cleared
+    snapshot.computed_at = computed_at
+    return snapshot
+
+
+def get_dashboard_metrics(
+    sections: Iterable[str] = GLOBAL_SECTIONS, organization=None
+) -> Dict[str, Dict]:
+    """
+    Return ``{section: metrics}`` for the requested sections.
+
+    A warm cache costs no queries; otherwise a single snapshot read is made
+    and only missing or stale sections are recomputed.
+    """
+
+    sections = tuple(sections)
+    scope = scope_for(organization)
+    cache_key = _cache_key(scope, sections)
+
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    snapshots = {
+        snapshot.section: snapshot
+        for snapshot in DashboardMetricSnapshot.objects.filter(
+            scope=scope, section__in=sections
+        )
+    }
+
+    today = timezone.localdate()
+    result = {}
+    for section in sections:
+        snapshot = snapshots.get(section)
+        if snapshot is None or not _is_current(snapshot, today):
+            snapshot = refresh_section(section, organization=organization)
+        result[section] = snapshot.metrics
+
+    cache.set(cache_key, result, CACHE_TIMEOUT)
+    return result
+
+
+def mark_sections_stale(sections: Iterable[str]) -> int:
+    """Flag sections stale in every scope and drop cached payloads."""
+
+    sections = list(sections)
+    if not sections:
+        return 0
+
+    # Bumping the version also stops an in-flight refresh_section() from
+    # clearing the flag with counters computed before this write.
+    updated = DashboardMetricSnapshot.objects.filter(section__in=sections).update(
+        is_stale=True, version=F("version") + 1
+    )
+
+    try:
+        cache.incr(CACHE_GENERATION_KEY)
+    except ValueError:
+        cache.set(CACHE_GENERATION_KEY, 1, None)
+
+    return updated
+
+
+def refresh_all_snapshots(organizations: Optional[Iterable] = None) -> int:
+    """
+    Rebuild global sections and every organization snapshot on record.
+
+    Returns the number of sections recomputed.
+    """
+
+    refreshed = 0
+    for section in GLOBAL_SECTIONS:
+        refresh_section(section)
+        refreshed += 1
+
+    if organizations is None:
+        from coordination.models import Organization
+
+        org_ids = [
+            scope.split(":", 1)[1]
+            for scope in DashboardMetricSnapshot.objects.filter(
+                scope__startswith="org:"
+            )
+            .values_list("scope", flat=True)
+            .distinct()
+        ]
+        organizations = Organization.objects.filter(pk__in=org_ids)
+
+    for organization in organizations:
+        for section in ORGANIZATION_SECTIONS:
+            refresh_section(section, organization=organization)
+            refreshed += 1
+
+    try:
+        cache.incr(CACHE_GENERATION_KEY)
+    except ValueError:
+        cache.set(CACHE_GENERATION_KEY, 1, None)
+
+    return refreshed
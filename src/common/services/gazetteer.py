@@ -0,0 +1,258 @@
+"""In-memory gazetteer of region, province, municipality and barangay names.
+
+Chat entity resolution looks location mentions up here instead of issuing
+``icontains`` queries per candidate phrase. Names and generated aliases are
+normalized (lowercase, accents and punctuation stripped) and indexed by
+exact name and by every contiguous token n-gram, so resolving a whole
+message needs no database round-trips.
+
+The gazetteer is loaded once per process and reloaded when the location
+generation (bumped by ``common.signals`` on location saves/deletes) moves,
+or after ``MAX_AGE_SECONDS`` to pick up bulk imports that bypass signals.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.core.cache import cache
+
+GAZETTEER_GENERATION_KEY = "gazetteer:generation"
+MAX_AGE_SECONDS = 60 * 60
+
+LEVEL_REGION = "region"
+LEVEL_PROVINCE = "province"
+LEVEL_MUNICIPALITY = "municipality"
+LEVEL_BARANGAY = "barangay"
+LEVELS = (LEVEL_REGION, LEVEL_PROVINCE, LEVEL_MUNICIPALITY, LEVEL_BARANGAY)
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_place_name(text: str) -> str:
+    """Lowercase, strip accents and punctuation, collapse whitespace."""
+
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    ascii_text = decomposed.encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join(_NON_ALNUM.sub(" ", ascii_text).split())
+
+
+def _aliases(level: str, name: str, code: str = "") -> List[str]:
+    """Normalized name plus common alternate spellings."""
+
+    normalized = normalize_place_name(name)
+    aliases = [normalized]
+    if level == LEVEL_REGION and code:
+        aliases.append(normalize_place_name(f"region {code}"))
+    if normalized.startswith("city of "):
+        base = normalized[len("city of ") :]
+        aliases.extend([base, f"{base} city"])
+    elif normalized.endswith(" city"):
+        base = normalized[: -len(" city")]
+        aliases.extend([base, f"city of {base}"])
+    return [alias for alias in dict.fromkeys(aliases) if alias]
+
+
+@dataclass(frozen=True)
+class GazetteerEntry:
+    """A location with its parent hierarchy."""
+
+    level: str
+    id: int
+    name: str
+    region: str = ""
+    province: str = ""
+    municipality: str = ""
+    code: str = ""
+
+    def as_dict(self) -> Dict[str, str]:
+        data = {"type": self.level, "id": self.id, "value": self.name}
+        for parent in ("municipality", "province", "region"):
+            value = getattr(self, parent)
+            if value:
+                data[parent] = value
+        return data
+
+
+@dataclass(frozen=True)
+class LocationMention:
+    """A span of the message matched to one or more gazetteer entries."""
+
+    phrase: str
+    start: int
+    end: int
+    exact: bool
+    candidates: Tuple[GazetteerEntry, ...]
+
+
+class Gazetteer:
+    """Exact-name and token n-gram index over location entries."""
+
+    def __init__(self, entries: Sequence[GazetteerEntry], generation=None):
+        self.generation = generation
+        self.loaded_at = time.monotonic()
+        self.entries: Tuple[GazetteerEntry, ...] = tuple(entries)
+        self._exact: Dict[str, List[int]] = {}
+        self._ngrams: Dict[str, List[int]] = {}
+        self.max_tokens = 1
+
+        for position, entry in enumerate(self.entries):
+            for alias in _aliases(entry.level, entry.name, entry.code):
+                self._add(self._exact, alias, position)
+                tokens = alias.split()
+                self.max_tokens = max(self.max_tokens, len(tokens))
+                for size in range(1, len(tokens) + 1):
+                    for start in range(len(tokens) - size + 1):
+                        self._add(self._ngrams, " ".join(tokens[start : start + size]), position)
+
+    @staticmethod
+    def _add(index: Dict[str, List[int]], key: str, position: int) -> None:
+        postings = index.setdefault(key, [])
+        if not postings or postings[-1] != position:
+            postings.append(position)
+
+    def _select(self, positions: List[int], levels: Optional[Sequence[str]]):
+        entries = (self.entries[pos] for pos in positions)
+        if levels:
+            return tuple(entry for entry in entries if entry.level in levels)
+        return tuple(entries)
+
+    def lookup(
+        self, phrase: str, levels: Optional[Sequence[str]] = None
+    ) -> Tuple[GazetteerEntry, ...]:
+        """Entries whose name or alias equals ``phrase`` (all, if ambiguous)."""
+
+        return self._select(self._exact.get(normalize_place_name(phrase), []), levels)
+
+    def lookup_partial(
+        self, phrase: str, levels: Optional[Sequence[str]] = None
+    ) -> Tuple[GazetteerEntry, ...]:
+        """Entries whose name contains ``phrase`` as whole tokens."""
+
+        return self._select(self._ngrams.get(normalize_place_name(phrase), []), levels)
+
+    def find_mentions(
+        self,
+        text: str,
+        levels: Optional[Sequence[str]] = None,
+        allow_partial: bool = False,
+    ) -> List[LocationMention]:
+        """
+        Find non-overlapping location mentions in ``text``, longest first.
+
+        Exact name/alias matches are preferred; with ``allow_partial`` a
+        phrase that is only part of a longer name is also reported.
+        """
+
+        tokens = normalize_place_name(text).split()
+        mentions: List[LocationMention] = []
+        index = 0
+        while index < len(tokens):
+            found = None
+            for size in range(min(self.max_tokens, len(tokens) - index), 0, -1):
+                phrase = " ".join(tokens[index : index + size])
+                candidates = self.lookup(phrase, levels)
+                exact = bool(candidates)
+                if not candidates and allow_partial:
+                    candidates = self.lookup_partial(phrase, levels)
+                if candidates:
+                    found = LocationMention(phrase, index, index + size, exact, candidates)
+                    break
+            if found:
+                mentions.append(found)
+                index = found.end
+            else:
+                index += 1
+        return mentions
+
+
+def _load_entries() -> List[GazetteerEntry]:
+    from common.models import Barangay, Municipality, Province, Region
+
+    entries = [
+        GazetteerEntry(LEVEL_REGION, pk, name, code=code)
+        for pk, name, code in Region.objects.order_by("code").values_list(
+            "pk", "name", "code"
+        )
+    ]
+    entries.extend(
+        GazetteerEntry(LEVEL_PROVINCE, pk, name, region=region)
+        for pk, name, region in Province.objects.order_by("region__code", "name").values_list(
+            "pk", "name", "region__name"
+        )
+    )
+    entries.extend(
+        GazetteerEntry(LEVEL_MUNICIPALITY, pk, name, region=region, province=province)
+        for pk, name, province, region in Municipality.objects.order_by(
+            "province__name", "name"
+        ).values_list("pk", "name", "province__name", "province__region__name")
+    )
+    entries.extend(
+        GazetteerEntry(
+            LEVEL_BARANGAY,
+            pk,
+            name,
+            region=region,
+            province=province,
+            municipality=municipality,
+        )
+        for pk, name, municipality, province, region in Barangay.objects.order_by(
+            "municipality__name", "name"
+        ).values_list(
+            "pk",
+            "name",
+            "municipality__name",
+            "municipality__province__name",
+            "municipality__province__region__name",
+        )
+    )
+    return entries
+
+
+def get_gazetteer_generation() -> int:
+    generation = cache.get(GAZETTEER_GENERATION_KEY)
+    if generation is None:
+        cache.add(GAZETTEER_GENERATION_KEY, 1, None)
+        generation = cache.get(GAZETTEER_GENERATION_KEY, 1)
+    return generation
+
+
+def bump_gazetteer_generation() -> None:
+    """Mark the loaded gazetteers stale after a location change."""
+
+    try:
+        cache.incr(GAZETTEER_GENERATION_KEY)
+    except ValueError:
+        cache.set(GAZETTEER_GENERATION_KEY, 2, None)
+
+
+_gazetteer: Optional[Gazetteer] = None
+_lock = threading.Lock()
+
+
+def get_gazetteer() -> Gazetteer:
+    """Return the process-wide gazetteer, reloading it if it is stale."""
+
+    global _gazetteer
+    generation = get_gazetteer_generation()
+    current = _gazetteer
+    if (
+        current is not None
+        and current.generation == generation
+        and time.monotonic() - current.loaded_at < MAX_AGE_SECONDS
+    ):
+        return current
+
+    with _lock:
+        current = _gazetteer
+        if (
+            current is None
+            or current.generation != generation
+            or time.monotonic() - current.loaded_at >= MAX_AGE_SECONDS
+        ):
+            current = Gazetteer(_load_entries(), generation=generation)
+            _gazetteer = current
+    return current
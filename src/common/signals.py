@@ -1,12 +1,15 @@
 """Common signals for the OBCMS application."""
 
 import logging
+from django.apps import apps
 from django.core.cache import cache
 from django.db import models
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from .models import (
+    Region,
+    Province,
     Municipality,
     Barangay,
     StaffLeave,
@@ -36,6 +39,22 @@ def _invalidate_calendar_cache():
 
     cache.delete(CALENDAR_CACHE_INDEX_KEY)
 
+    from .services.calendar import bump_calendar_generation
+
+    bump_calendar_generation()
+
+
+@receiver([post_save, post_delete], sender=Region)
+@receiver([post_save, post_delete], sender=Province)
+@receiver([post_save, post_delete], sender=Municipality)
+@receiver([post_save, post_delete], sender=Barangay)
+def gazetteer_invalidator(sender, **kwargs):
+    """Reload chat location gazetteers after a location change."""
+
+    from .services.gazetteer import bump_gazetteer_generation
+
+    bump_gazetteer_generation()
+
 
 @receiver(post_save, sender=Municipality)
 def municipality_post_save(sender, instance, created, **kwargs):
@@ -102,6 +121,9 @@ def barangay_post_save(sender, instance, created, **kwargs):
 # StaffTask and Event signals removed - models deleted
 # See: docs/refactor/WORKITEM_MIGRATION_COMPLETE.md
 
+CALENDAR_SOURCES = (MonitoringEntry, StaffLeave, CalendarResourceBooking, WorkItem)
+
+
 @receiver([post_save, post_delete], sender=MonitoringEntry)
 @receiver([post_save, post_delete], sender=StaffLeave)
 @receiver([post_save, post_delete], sender=CalendarResourceBooking)
@@ -110,3 +132,191 @@ def calendar_cache_invalidator(sender, **kwargs):
     """Clear cached calendar payloads when core calendar data changes."""
 
     _invalidate_calendar_cache()
+
+
+def invalidate_caches_for(model):
+    """Run this module's cache invalidation receivers for ``model``.
+
+    ``bulk_create``, ``bulk_update`` and ``QuerySet.update`` send no
+    signals; callers invoke this once after such a write.
+    """
+
+    from .services.cache_generations import bump_model_generation, model_label
+    from .services.dashboard_metrics import mark_sections_stale, sections_for_model
+
+    if issubclass(model, CALENDAR_SOURCES):
+        _invalidate_calendar_cache()
+    mark_sections_stale(sections_for_model(model._meta.label))
+    bump_model_generation(model_label(model))
+
+
+def _connect_dashboard_metric_invalidators():
+    """Flag materialized dashboard sections stale when their sources change."""
+
+    from .services.dashboard_metrics import (
+        SECTION_SOURCES,
+        mark_sections_stale,
+        sections_for_model,
+    )
+
+    def dashboard_metrics_invalidator(sender, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields and set(update_fields) <= {"last_login"}:
+            # Logins touch User rows without changing any counter.
+            return
+
+        mark_sections_stale(sections_for_model(sender._meta.label))
+
+    model_labels = {label for sources in SECTION_SOURCES.values() for label in sources}
+    for label in model_labels:
+        for signal in (post_save, post_delete):
+            signal.connect(
+                dashboard_metrics_invalidator,
+                sender=label,
+                weak=False,
+                dispatch_uid=f"dashboard_metrics_{signal is post_save}_{label}",
+            )
+
+
+_connect_dashboard_metric_invalidators()
+
+
+def _connect_cache_generation_invalidators():
+    """Bump the cache generation of every model on its writes."""
+
+    from .services.cache_generations import (
+        UNWATCHED_MODELS,
+        bump_model_generation,
+        model_label,
+    )
+
+    def cache_generation_invalidator(sender, **kwargs):
+        bump_model_generation(model_label(sender))
+
+    def cache_generation_m2m_invalidator(sender, instance, action, model, **kwargs):
+        if action.startswith("post_"):
+            for changed in {sender, type(instance), model}:
+                bump_model_generation(model_label(changed))
+
+    for model in apps.get_models(include_auto_created=True):
+        label = model._meta.label
+        if model_label(model) in UNWATCHED_MODELS:
+            continue
+        for signal in (post_save, post_delete):
+            signal.connect(
+                cache_generation_invalidator,
+                sender=model,
+                weak=False,
+                dispatch_uid=f"cache_generation_{signal is post_save}_{label}",
+            )
+        # m2m_changed is sent with the through model as sender.
+        m2m_changed.connect(
+            cache_generation_m2m_invalidator,
+            sender=model,
+            weak=False,
+            dispatch_uid=f"cache_generation_m2m_{label}",
+        )
+
+
+_connect_cache_generation_invalidators()
+
+
+def _update_activity(update, instance):
+    try:
+        update(instance)
+    except Exception:
+        logger.exception(
+            "Failed to update activity for %s %s", instance._meta.label, instance.pk
+        )
+
+
+def _record_activity(build_entry, instance):
+    from .services import activity_stream
+
+    _update_activity(lambda source: activity_stream.record(build_entry(source)), instance)
+
+
+@receiver(post_save, sender="mana.Need")
+def need_activity_recorder(sender, instance, created, **kwargs):
+    """Append a feed entry when a community need is created."""
+
+    if created:
+        from .services.activity_stream import entry_for_need
+
+        _record_activity(entry_for_need, instance)
+
+
+@receiver(post_save, sender=MonitoringEntry)
+def ppa_activity_recorder(sender, instance, created, **kwargs):
+    """Append a feed entry when a PPA is created."""
+
+    if created:
+        from .services.activity_stream import entry_for_ppa
+
+        _record_activity(entry_for_ppa, instance)
+
+
+@receiver(pre_save, sender=WorkItem)
+@receiver(pre_save, sender="common.StaffTaskProxy")
+@receiver(pre_save, sender="common.EventProxy")
+def track_work_item_status_change(sender, instance, **kwargs):
+    """
+    Store the previous task status in instance._old_status so the
+    post_save recorder only reacts to the transition into completed.
+    """
+
+    instance._old_status = None
+    if not instance._state.adding and instance.work_type == WorkItem.WORK_TYPE_TASK:
+        instance._old_status = (
+            WorkItem.objects.filter(pk=instance.pk).values_list("status", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=WorkItem)
+@receiver(post_save, sender="common.StaffTaskProxy")
+@receiver(post_save, sender="common.EventProxy")
+def work_item_activity_recorder(sender, instance, created, **kwargs):
+    """Append feed entries for scheduled activities and completed tasks."""
+
+    from .services import activity_stream
+
+    if created and instance.work_type == WorkItem.WORK_TYPE_ACTIVITY:
+        _record_activity(activity_stream.entry_for_event, instance)
+    elif (
+        instance.work_type == WorkItem.WORK_TYPE_TASK
+        and instance.status == WorkItem.STATUS_COMPLETED
+        and getattr(instance, "_old_status", None) != WorkItem.STATUS_COMPLETED
+    ):
+        # A task completed again after being reopened replaces its entry.
+        _update_activity(activity_stream.record_completed_task, instance)
+
+
+@receiver(m2m_changed, sender=WorkItem.assignees.through)
+def work_item_assignee_activity_updater(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep a completed task's entry in step with its assignees."""
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    from .services import activity_stream
+
+    tasks = WorkItem.objects.filter(pk__in=pk_set or ()) if reverse else [instance]
+    for task in tasks:
+        if (
+            task.work_type == WorkItem.WORK_TYPE_TASK
+            and task.status == WorkItem.STATUS_COMPLETED
+        ):
+            _update_activity(activity_stream.refresh_completed_task, task)
+
+
+@receiver(post_delete, sender="mana.Need")
+@receiver(post_delete, sender=MonitoringEntry)
+@receiver(post_delete, sender=WorkItem)
+@receiver(post_delete, sender="common.StaffTaskProxy")
+@receiver(post_delete, sender="common.EventProxy")
+def activity_source_remover(sender, instance, **kwargs):
+    """Drop feed entries of deleted needs, PPAs and work items."""
+
+    from .services import activity_stream
+
+    _update_activity(activity_stream.remove, instance)
@@ -488,3 +488,14 @@ def send_calendar_notifications_batch(batch_size=100):
     ).apply_async()
     logger.info("Queued %s calendar notifications for delivery", len(pending_ids))
     return {"queued": len(pending_ids)}
+
+
+@shared_task
+def refresh_dashboard_metrics():
+    """Rebuild materialized dashboard metric snapshots."""
+
+    from common.services.dashboard_metrics import refresh_all_snapshots
+
+    refreshed = refresh_all_snapshots()
+    logger.info("Refreshed %s dashboard metric sections", refreshed)
+    return {"refreshed": refreshed}
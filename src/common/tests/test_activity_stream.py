@@ -0,0 +1,156 @@
+"""Tests for the append-only dashboard activity stream."""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from common.models import ActivityStreamEntry
+from common.services import activity_stream
+from common.work_item_model import WorkItem
+from monitoring.models import MonitoringEntry
+
+
+class ActivityStreamTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="feed.staff",
+            password="pass1234",
+            user_type="oobc_staff",
+            is_approved=True,
+        )
+
+    def test_signals_record_ppa_and_completed_task_once(self):
+        MonitoringEntry.objects.create(
+            title="Feeding Program",
+            category="oobc_ppa",
+            status="planning",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        task = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_TASK,
+            title="Prepare report",
+            status=WorkItem.STATUS_IN_PROGRESS,
+        )
+        self.assertFalse(
+            ActivityStreamEntry.objects.filter(
+                kind=ActivityStreamEntry.KIND_TASK_COMPLETED
+            ).exists()
+        )
+
+        task.status = WorkItem.STATUS_COMPLETED
+        task.save()
+        task.save()
+
+        kinds = list(
+            ActivityStreamEntry.objects.values_list("kind", flat=True).order_by("kind")
+        )
+        self.assertEqual(
+            kinds,
+            [ActivityStreamEntry.KIND_PPA_CREATED, ActivityStreamEntry.KIND_TASK_COMPLETED],
+        )
+
+    def completed_entries(self):
+        return ActivityStreamEntry.objects.filter(
+            kind=ActivityStreamEntry.KIND_TASK_COMPLETED
+        )
+
+    def test_completed_task_entry_follows_assignees(self):
+        self.user.first_name, self.user.last_name = "Amina", "Datu"
+        self.user.save()
+        task = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_TASK,
+            title="File minutes",
+            status=WorkItem.STATUS_COMPLETED,
+        )
+        self.assertEqual(self.completed_entries().get().subtitle, "by Unassigned")
+
+        task.assignees.add(self.user)
+
+        self.assertEqual(self.completed_entries().get().subtitle, "by Amina Datu")
+
+    def test_task_completed_again_is_recorded_again(self):
+        task = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_TASK,
+            title="Review budget",
+            status=WorkItem.STATUS_COMPLETED,
+        )
+        first = self.completed_entries().get()
+
+        task.status = WorkItem.STATUS_IN_PROGRESS
+        task.save()
+        task.status = WorkItem.STATUS_COMPLETED
+        task.save()
+
+        second = self.completed_entries().get()
+        self.assertNotEqual(second.pk, first.pk)
+        self.assertGreater(second.occurred_at, first.occurred_at)
+
+    def test_deleted_sources_leave_the_feed(self):
+        task = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_TASK,
+            title="Close out",
+            status=WorkItem.STATUS_COMPLETED,
+        )
+        event = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_ACTIVITY, title="Barangay consultation"
+        )
+        self.assertEqual(ActivityStreamEntry.objects.count(), 2)
+
+        task.delete()
+        event.delete()
+
+        self.assertFalse(ActivityStreamEntry.objects.exists())
+
+    def test_keyset_pages_cover_feed_without_overlap(self):
+        now = timezone.now()
+        ActivityStreamEntry.objects.bulk_create(
+            ActivityStreamEntry(
+                occurred_at=now - timedelta(minutes=index // 2),
+                kind=ActivityStreamEntry.KIND_NEED_CREATED,
+                source_type="mana.Need",
+                source_id=str(index),
+                title=f"Need {index}",
+                icon="fa-lightbulb",
+                color="blue",
+            )
+            for index in range(7)
+        )
+
+        seen = []
+        cursor = None
+        while True:
+            with self.assertNumQueries(1):
+                page, cursor = activity_stream.fetch_page(cursor=cursor, limit=3)
+            seen.extend(entry.pk for entry in page)
+            if cursor is None:
+                break
+
+        expected = list(
+            ActivityStreamEntry.objects.order_by("-occurred_at", "-id").values_list(
+                "pk", flat=True
+            )
+        )
+        self.assertEqual(seen, expected)
+
+    def test_entries_outside_window_are_excluded(self):
+        ActivityStreamEntry.objects.create(
+            occurred_at=timezone.now() - timedelta(days=45),
+            kind=ActivityStreamEntry.KIND_NEED_CREATED,
+            source_type="mana.Need",
+            source_id="old",
+            title="Old need",
+            icon="fa-lightbulb",
+            color="blue",
+        )
+
+        page, cursor = activity_stream.fetch_page()
+
+        self.assertEqual(page, [])
+        self.assertIsNone(cursor)
+
+    def test_malformed_cursor_falls_back_to_first_page(self):
+        self.assertIsNone(activity_stream.decode_cursor("not-a-cursor"))
+        self.assertIsNone(activity_stream.decode_cursor(None))
@@ -0,0 +1,31 @@
+"""Tests for the per-model cache generation counters."""
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from common.services.cache_generations import model_generations
+from common.signals import invalidate_caches_for
+from monitoring.models import MonitoringEntry
+
+PPA_LABEL = "monitoring.MonitoringEntry"
+
+
+class CacheGenerationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_saves_bump_models_outside_the_chat_whitelist(self):
+        before = model_generations([PPA_LABEL])
+
+        MonitoringEntry.objects.create(
+            title="Feeding Program", category="oobc_ppa", status="planning"
+        )
+
+        self.assertNotEqual(model_generations([PPA_LABEL]), before)
+
+    def test_bulk_write_invalidation_bumps_the_source_model(self):
+        before = model_generations([PPA_LABEL])
+
+        invalidate_caches_for(MonitoringEntry)
+
+        self.assertNotEqual(model_generations([PPA_LABEL]), before)
@@ -6,6 +6,7 @@ conversation manager, and chat engine.
 """
 
 import json
+import re
 from django.contrib.auth import get_user_model
 from django.test import TestCase, Client
 from django.urls import reverse
@@ -17,6 +18,7 @@ from common.ai_services.chat import (
     get_query_executor,
     get_response_formatter,
 )
+from common.ai_services.chat.instrumentation import ChatTrace
 from common.models import ChatMessage
 
 User = get_user_model()
@@ -140,6 +142,43 @@ class IntentClassifierTestCase(TestCase):
 
         self.assertEqual(result['type'], 'general')
 
+    def test_single_pass_scores_match_per_intent_rules(self):
+        """Test one-pass scoring against a rule-by-rule scan of every intent."""
+
+        def reference_score(message, config):
+            score = 0.0
+            keywords = sum(1 for kw in config['keywords'] if kw in message)
+            if keywords:
+                score += min(keywords * 0.3, 0.6)
+            patterns = sum(
+                1 for pattern in config['patterns'] if re.search(pattern, message, re.IGNORECASE)
+            )
+            if patterns:
+                score += min(patterns * 0.5, 0.8)
+            entities = sum(1 for entity in config['entities'] if entity in message)
+            if entities:
+                score += min(entities * 0.2, 0.4)
+            return min(score, 1.0)
+
+        messages = [
+            "show me the accounting page",  # "count" inside another word
+            "thank you, how do i open the mana dashboard view?",
+            "which regions have the most workshops in total",
+            "hey",
+            "",
+        ]
+        for message in messages:
+            result = self.classifier.classify(message)
+            expected = {
+                intent: reference_score(message, config)
+                for intent, config in self.classifier.INTENT_PATTERNS.items()
+            }
+            self.assertEqual(result['all_scores'], expected, message)
+
+        result = self.classifier.classify("show me the accounting page")
+        self.assertEqual(result['action'], 'read')
+        self.assertEqual(result['all_scores']['data_query'], 0.6)
+
     def test_get_example_queries(self):
         """Test getting example queries."""
         examples = self.classifier.get_example_queries('data_query')
@@ -366,6 +405,41 @@ class ChatEngineTestCase(TestCase):
         self.assertIn('available_models', capabilities)
         self.assertTrue(len(capabilities['intents']) > 0)
 
+    def test_stage_breakdown_attached_in_debug(self):
+        """Test per-stage timings, queries and candidates in DEBUG responses."""
+        with self.settings(DEBUG=True):
+            result = self.assistant.chat(
+                user_id=self.user.id,
+                message="Count barangays with fishing livelihood in Lanao",
+            )
+
+        breakdown = result['instrumentation']
+        stages = breakdown['stages']
+        self.assertIn('entity_extraction', stages)
+        self.assertIn('intent_classification', stages)
+        self.assertEqual(stages['history']['queries'], 1)
+        self.assertGreaterEqual(breakdown['total_ms'], stages['faq']['time_ms'])
+
+        with self.settings(DEBUG=False):
+            result = self.assistant.chat(user_id=self.user.id, message="Hello")
+        self.assertNotIn('instrumentation', result)
+
+    def test_stage_metrics_exported(self):
+        """Test that finished turns are observed by the Prometheus histograms."""
+        from prometheus_client import REGISTRY
+
+        def faq_count():
+            return REGISTRY.get_sample_value(
+                'obcms_chat_stage_seconds_count', {'stage': 'faq'}
+            ) or 0
+
+        before = faq_count()
+        trace = ChatTrace()
+        self.assistant.chat(user_id=self.user.id, message="Hello", trace=trace)
+
+        self.assertEqual(faq_count(), before + 1)
+        self.assertIsNotNone(trace.total_ms)
+
 
 class ChatViewsTestCase(TestCase):
     """Test chat views."""
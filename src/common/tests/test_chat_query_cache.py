@@ -0,0 +1,100 @@
+"""Tests for the chat ORM query result cache."""
+
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django.test import TestCase, override_settings
+
+from common.ai_services.chat.query_executor import QueryExecutor
+from common.models import Event
+from common.services import cache_generations, chat_query_cache
+from common.tests.factories import create_municipality, create_province, create_region
+
+
+class ChatQueryCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        chat_query_cache.reset_stats()
+        self.region = create_region(code="IX", name="Zamboanga Peninsula")
+        self.province = create_province(
+            region=self.region, code="ZDS", name="Zamboanga del Sur"
+        )
+        create_municipality(province=self.province, code="PAG", name="Pagadian")
+        self.executor = QueryExecutor()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_equivalent_queries_share_one_cached_result(self):
+        first = self.executor.execute(
+            "Municipality.objects.filter(province__name='Zamboanga del Sur', name='Pagadian').count()"
+        )
+        self.assertEqual(first["result"], 1)
+        self.assertFalse(first["query_info"]["cached"])
+
+        with self.assertNumQueries(0):
+            second = self.executor.execute(
+                'Municipality.objects.filter(name="Pagadian",  province__name="Zamboanga del Sur").count()'
+            )
+
+        self.assertEqual(second["result"], 1)
+        self.assertTrue(second["query_info"]["cached"])
+        self.assertEqual(chat_query_cache.get_stats()["hits"], 1)
+
+    def test_write_to_traversed_model_invalidates(self):
+        query = "Municipality.objects.filter(province__region__name='Zamboanga Peninsula').count()"
+        self.assertEqual(self.executor.execute(query)["result"], 1)
+
+        self.region.name = "Region IX"
+        self.region.save()
+
+        result = self.executor.execute(query)
+        self.assertFalse(result["query_info"]["cached"])
+        self.assertEqual(result["result"], 0)
+
+    def test_unrelated_write_keeps_entry(self):
+        query = "Region.objects.filter(code='IX').count()"
+        self.executor.execute(query)
+
+        create_municipality(province=self.province, code="DIM", name="Dimataling")
+
+        self.assertTrue(self.executor.execute(query)["query_info"]["cached"])
+
+    def test_proxy_writes_bump_the_concrete_model(self):
+        before = cache_generations.model_generations(["common.WorkItem"])
+
+        Event.objects.create(title="Coordination meeting", work_type=Event.WORK_TYPE_ACTIVITY)
+
+        self.assertNotEqual(cache_generations.model_generations(["common.WorkItem"]), before)
+
+    def test_models_chat_queries_cannot_read_are_not_watched(self):
+        before = cache_generations.model_generations(["sessions.Session"])
+
+        post_save.send(sender=Session, instance=None, created=False)
+
+        self.assertEqual(cache_generations.model_generations(["sessions.Session"]), before)
+
+    def test_results_are_cached_per_scope(self):
+        query = "Region.objects.count()"
+        self.executor.execute(query, scope="org:1")
+
+        self.assertFalse(self.executor.execute(query, scope="org:2")["query_info"]["cached"])
+        self.assertTrue(self.executor.execute(query, scope="org:1")["query_info"]["cached"])
+
+    def test_failures_and_unsafe_queries_are_not_cached(self):
+        self.executor.execute("Region.objects.filter(missing_field='x').count()")
+        self.executor.execute("Region.objects.all().delete()")
+
+        failed = self.executor.execute("Region.objects.filter(missing_field='x').count()")
+        unsafe = self.executor.execute("Region.objects.all().delete()")
+
+        self.assertFalse(failed["success"])
+        self.assertFalse(unsafe["success"])
+        self.assertIn("Unsafe query", unsafe["error"])
+
+    @override_settings(CHAT_QUERY_CACHE_TIMEOUT=0)
+    def test_zero_timeout_disables_cache(self):
+        self.executor.execute("Region.objects.count()")
+
+        self.assertFalse(self.executor.execute("Region.objects.count()")["query_info"]["cached"])
+        self.assertEqual(chat_query_cache.get_stats()["misses"], 0)
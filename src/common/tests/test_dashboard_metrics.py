@@ -0,0 +1,141 @@
+"""Tests for materialized dashboard metric snapshots."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from common.models import DashboardMetricSnapshot
+from common.services import dashboard_metrics
+from common.services.dashboard_metrics import (
+    ORGANIZATION_SECTIONS,
+    get_dashboard_metrics,
+    mark_sections_stale,
+    refresh_all_snapshots,
+    scope_for,
+)
+from coordination.models import Organization
+from monitoring.models import MonitoringEntry
+
+
+class DashboardMetricSnapshotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="metrics.staff",
+            password="pass1234",
+            user_type="oobc_staff",
+            is_approved=True,
+        )
+        self.organization = Organization.objects.create(
+            name="Ministry of Metrics",
+            organization_type="bmoa",
+        )
+
+    def _create_entry(self, **kwargs):
+        defaults = {
+            "title": "Livelihood Support",
+            "category": "moa_ppa",
+            "implementing_moa": self.organization,
+            "status": "ongoing",
+            "progress": 40,
+            "budget_allocation": Decimal("1000000.00"),
+            "created_by": self.user,
+            "updated_by": self.user,
+        }
+        defaults.update(kwargs)
+        return MonitoringEntry.objects.create(**defaults)
+
+    def test_monitoring_section_uses_conditional_aggregates(self):
+        self._create_entry()
+        self._create_entry(title="Request", category="obc_request", implementing_moa=None,
+                           request_status="submitted", status="planning", progress=0,
+                           budget_allocation=None)
+
+        monitoring = get_dashboard_metrics(["monitoring"])["monitoring"]
+
+        self.assertEqual(monitoring["total"], 2)
+        self.assertEqual(monitoring["moa_ppa"], 1)
+        self.assertEqual(monitoring["pending_requests"], 1)
+        self.assertEqual(monitoring["active_projects"], 1)
+        self.assertEqual(monitoring["total_budget"], 1000000.0)
+        self.assertEqual(monitoring["avg_progress"], 20)
+
+    def test_warm_snapshot_is_served_with_a_single_read(self):
+        get_dashboard_metrics(["monitoring", "mana"])
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            get_dashboard_metrics(["monitoring", "mana"])
+
+        with self.assertNumQueries(0):
+            get_dashboard_metrics(["monitoring", "mana"])
+
+    def test_signal_marks_only_affected_sections_stale(self):
+        get_dashboard_metrics(["monitoring", "mana"])
+
+        self._create_entry()
+
+        stale = dict(
+            DashboardMetricSnapshot.objects.values_list("section", "is_stale")
+        )
+        self.assertTrue(stale["monitoring"])
+        self.assertFalse(stale["mana"])
+
+        monitoring = get_dashboard_metrics(["monitoring", "mana"])["monitoring"]
+        self.assertEqual(monitoring["total"], 1)
+
+    def test_mark_during_refresh_keeps_section_stale(self):
+        get_dashboard_metrics(["monitoring"])
+        self._create_entry()
+        build = dashboard_metrics.SECTION_BUILDERS["monitoring"]
+
+        def build_then_write(organization=None):
+            metrics = build(organization=organization)
+            mark_sections_stale(["monitoring"])
+            return metrics
+
+        with patch.dict(
+            dashboard_metrics.SECTION_BUILDERS, {"monitoring": build_then_write}
+        ):
+            snapshot = dashboard_metrics.refresh_section("monitoring")
+
+        self.assertTrue(snapshot.is_stale)
+        stored = DashboardMetricSnapshot.objects.get(section="monitoring")
+        self.assertTrue(stored.is_stale)
+        self.assertEqual(stored.metrics["total"], 1)
+
+        dashboard_metrics.refresh_section("monitoring")
+        self.assertFalse(DashboardMetricSnapshot.objects.get(section="monitoring").is_stale)
+
+    def test_organization_scope_is_isolated(self):
+        other = Organization.objects.create(name="Other Ministry", organization_type="bmoa")
+        self._create_entry()
+        self._create_entry(title="Other", implementing_moa=other, status="completed")
+
+        portfolio = get_dashboard_metrics(
+            ORGANIZATION_SECTIONS, organization=self.organization
+        )["moa_portfolio"]
+
+        self.assertEqual(portfolio["total"], 1)
+        self.assertEqual(portfolio["ongoing"], 1)
+        self.assertEqual(portfolio["completed"], 0)
+        self.assertTrue(
+            DashboardMetricSnapshot.objects.filter(
+                scope=scope_for(self.organization), section="moa_portfolio"
+            ).exists()
+        )
+
+    def test_refresh_all_snapshots_rebuilds_known_organizations(self):
+        get_dashboard_metrics(ORGANIZATION_SECTIONS, organization=self.organization)
+        self._create_entry()
+
+        refresh_all_snapshots()
+
+        snapshot = DashboardMetricSnapshot.objects.get(
+            scope=scope_for(self.organization), section="moa_portfolio"
+        )
+        self.assertFalse(snapshot.is_stale)
+        self.assertEqual(snapshot.metrics["total"], 1)
@@ -206,6 +206,58 @@ class TestSimilarityCalculator:
         stats = similarity_calc.get_cache_stats()
         assert stats['size'] > 0
 
+    def test_cache_is_lru_keyed_by_normalized_pair(self, similarity_calc):
+        """Test that case/whitespace variants and reversed pairs share entries."""
+        similarity_calc._cache_size = 2
+
+        similarity_calc.calculate_similarity("Hello World ", "hello there")
+        similarity_calc.calculate_similarity("hello there", "HELLO WORLD")
+        assert similarity_calc.get_cache_stats()['size'] == 1
+        assert similarity_calc.get_cache_stats()['hits'] == 1
+
+        similarity_calc.calculate_similarity("region ix", "region x")
+        similarity_calc.calculate_similarity("hello world", "hello there")  # refresh
+        similarity_calc.calculate_similarity("workshops", "workshop")  # evicts region pair
+
+        assert ("hello there", "hello world") in similarity_calc._cache
+        assert ("region ix", "region x") not in similarity_calc._cache
+
+    def test_bounded_levenshtein(self, similarity_calc):
+        """Test that bounded distance is exact within the bound and capped beyond it."""
+        assert similarity_calc.levenshtein_distance("kitten", "sitting", max_distance=3) == 3
+        assert similarity_calc.levenshtein_distance("kitten", "sitting", max_distance=2) == 3
+        assert similarity_calc.levenshtein_distance("kitten", "sitting", max_distance=0) == 1
+        assert similarity_calc.levenshtein_distance("abc", "abcdefgh", max_distance=2) == 3
+        assert similarity_calc.levenshtein_distance(
+            "communities in region ix", "communities in region x", max_distance=5
+        ) == 1
+
+    def test_find_most_similar_prefilter_matches_full_scan(self, similarity_calc):
+        """Test that pruned candidates could never have reached the threshold."""
+        candidates = [
+            "communities in Region IX",
+            "communities in Region X",
+            "workshops in Zamboanga",
+            "show me all policy recommendations for barangay development",
+            "",
+            "x",
+        ]
+        query = "communities in region 9"
+
+        for threshold in (0.0, 0.3, 0.5, 0.8):
+            expected = sorted(
+                (
+                    (candidate, SimilarityCalculator().calculate_similarity(query, candidate))
+                    for candidate in candidates
+                ),
+                key=lambda x: x[1],
+                reverse=True,
+            )
+            expected = [item for item in expected if item[1] >= threshold]
+            assert similarity_calc.find_most_similar(
+                query, candidates, threshold=threshold, limit=10
+            ) == expected
+
     def test_performance_levenshtein(self, similarity_calc):
         """Test Levenshtein distance performance."""
         import time
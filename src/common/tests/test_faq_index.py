@@ -0,0 +1,84 @@
+"""
+Tests for the fuzzy FAQ pattern index.
+
+Verifies that candidate pruning never drops a pattern the FAQ handler's
+containment or fuzzy checks would accept, and that the handler rebuilds the
+index when FAQs are added.
+"""
+
+from difflib import SequenceMatcher
+
+import pytest
+from django.core.cache import cache
+
+from common.ai_services.chat.faq_handler import FAQHandler
+from common.ai_services.chat.faq_index import FuzzyPatternIndex
+
+PATTERNS = [
+    "what is obcms",
+    "how many regions",
+    "help",
+    "how do i create a work item",
+    "ok",
+    "",
+]
+
+
+def _fuzzy_eligible(query, pattern):
+    if abs(len(pattern) - len(query)) > 6:
+        return False
+    query_tokens, pattern_tokens = set(query.split()), set(pattern.split())
+    query_first = query.split(" ", 1)[0]
+    pattern_first = pattern.split(" ", 1)[0]
+    return not (
+        pattern_first
+        and query_first
+        and pattern_first != query_first
+        and pattern_tokens
+        and query_tokens
+        and not (pattern_tokens & query_tokens)
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["what is obcms", "wat is obcms", "how many region", "i need help now", "ok", "x", "obc"],
+)
+def test_candidates_cover_every_possible_match(query):
+    index = FuzzyPatternIndex(PATTERNS)
+
+    contained = {
+        pos
+        for pos, pattern in enumerate(PATTERNS)
+        if query == pattern or query in pattern or pattern in query
+    }
+    assert contained <= set(index.containment_candidates(query))
+
+    eligible = [pos for pos, pattern in enumerate(PATTERNS) if _fuzzy_eligible(query, pattern)]
+    assert index.fuzzy_candidates(query) == eligible
+
+
+def test_candidates_prune_unrelated_patterns():
+    index = FuzzyPatternIndex(PATTERNS)
+
+    assert 1 not in index.containment_candidates("what is obcms")
+    assert 3 not in index.fuzzy_candidates("what is obcms")
+    assert SequenceMatcher(None, "wat is obcms", PATTERNS[0]).ratio() >= 0.75
+    assert 0 in index.fuzzy_candidates("wat is obcms")
+
+
+@pytest.mark.django_db
+def test_added_faq_is_matched_after_index_was_built():
+    cache.clear()
+    handler = FAQHandler()
+    assert handler._fuzzy_match("wher is the gazeteer page") is None
+
+    handler.add_faq(
+        "where is the gazetteer page",
+        {"answer": "Open Geography > Gazetteer.", "category": "navigation"},
+    )
+
+    result = handler._fuzzy_match("wher is the gazeteer page")
+    assert result is not None
+    assert result["pattern"] == "where is the gazetteer page"
+    cache.clear()
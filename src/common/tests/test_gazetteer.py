@@ -0,0 +1,70 @@
+"""Tests for the in-memory location gazetteer used by chat entity resolution."""
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from common.ai_services.chat.entity_resolvers import LocationResolver
+from common.services.gazetteer import get_gazetteer, normalize_place_name
+from common.tests.factories import (
+    create_barangay,
+    create_municipality,
+    create_province,
+    create_region,
+)
+
+
+class GazetteerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        region = create_region(code="IX", name="Zamboanga Peninsula")
+        self.zds = create_province(region=region, code="ZDS", name="Zamboanga del Sur")
+        self.zdn = create_province(region=region, code="ZDN", name="Zamboanga del Norte")
+        self.pagadian = create_municipality(
+            province=self.zds, code="PAG", name="City of Pagadian"
+        )
+        create_municipality(province=self.zds, code="SJ1", name="San Jose")
+        create_municipality(province=self.zdn, code="SJ2", name="San Jose")
+        create_barangay(municipality=self.pagadian, code="BR1", name="Tuburan")
+        self.resolver = LocationResolver()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_normalization_strips_accents_and_punctuation(self):
+        self.assertEqual(normalize_place_name("  Dumingag, Ñ-Town! "), "dumingag n town")
+
+    def test_warm_resolution_needs_no_queries(self):
+        self.resolver.resolve("farmers in pagadian city")
+
+        with self.assertNumQueries(0):
+            result = self.resolver.resolve("farmers in pagadian city")
+
+        self.assertEqual(result["type"], "municipality")
+        self.assertEqual(result["value"], "City of Pagadian")
+        self.assertEqual(result["province"], "Zamboanga del Sur")
+        self.assertEqual(result["region"], "Zamboanga Peninsula")
+        self.assertEqual(result["confidence"], 0.90)
+
+    def test_ambiguous_name_returns_all_candidates(self):
+        result = self.resolver.resolve("communities in san jose")
+
+        self.assertEqual(result["value"], "San Jose")
+        provinces = sorted(candidate["province"] for candidate in result["candidates"])
+        self.assertEqual(provinces, ["Zamboanga del Norte", "Zamboanga del Sur"])
+
+    def test_resolve_all_reports_every_mention(self):
+        mentions = self.resolver.resolve_all("tuburan and san jose")
+
+        self.assertEqual([mention["type"] for mention in mentions], ["barangay", "municipality"])
+        self.assertEqual(mentions[0]["municipality"], "City of Pagadian")
+        self.assertEqual(len(mentions[1]["candidates"]), 2)
+
+    def test_location_change_reloads_gazetteer(self):
+        before = get_gazetteer()
+        self.assertFalse(before.lookup("dimataling"))
+
+        create_municipality(province=self.zds, code="DIM", name="Dimataling")
+
+        after = get_gazetteer()
+        self.assertIsNot(before, after)
+        self.assertEqual([entry.name for entry in after.lookup("dimataling")], ["Dimataling"])
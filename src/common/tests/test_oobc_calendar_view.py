@@ -5,6 +5,8 @@ from datetime import timedelta
 from django.urls import reverse
 from django.utils import timezone
 from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from common.models import StaffTeam, User
 from common.work_item_model import WorkItem
@@ -333,7 +335,8 @@ def test_oobc_calendar_feed_json_requires_login(client):
 
     response = client.get(reverse("common:oobc_calendar_feed_json"))
     assert response.status_code == 200
-    payload = response.json()
+    assert response.streaming
+    payload = json.loads(b"".join(response.streaming_content))
     assert "events" in payload
     assert "module_stats" in payload
     assert "workflow_actions" in payload
@@ -353,7 +356,45 @@ def test_oobc_calendar_feed_ics_download(client):
     response = client.get(reverse("common:oobc_calendar_feed_ics"))
     assert response.status_code == 200
     assert response["Content-Type"] == "text/calendar"
-    assert "BEGIN:VCALENDAR" in response.content.decode()
+    content = b"".join(response.streaming_content).decode()
+    assert content.startswith("BEGIN:VCALENDAR")
+    assert content.endswith("END:VCALENDAR")
+
+
+@pytest.mark.django_db
+def test_oobc_calendar_feed_conditional_get(client):
+    user = User.objects.create_user(
+        username="ics_poller",
+        password="secret",
+        user_type="oobc_staff",
+        is_approved=True,
+    )
+    client.force_login(user)
+    url = reverse("common:oobc_calendar_feed_ics")
+
+    first = client.get(url)
+    etag = first["ETag"]
+    assert first.status_code == 200
+    assert first["Last-Modified"]
+
+    # Only session/auth lookups run; no calendar source table is queried.
+    with CaptureQueriesContext(connection) as captured:
+        unchanged = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert unchanged.status_code == 304
+    source_tables = (WorkItem._meta.db_table, MonitoringEntry._meta.db_table)
+    assert not any(
+        table in query["sql"] for query in captured for table in source_tables
+    )
+
+    WorkItem.objects.create(
+        work_type=WorkItem.WORK_TYPE_ACTIVITY,
+        title="New coordination meeting",
+        start_date=timezone.now().date(),
+    )
+
+    changed = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert changed["ETag"] != etag
 
 
 @pytest.mark.django_db
@@ -0,0 +1,99 @@
+"""
+Tests for the required-literal template prefilter.
+
+Verifies guard extraction from regex patterns and that prefiltered registry
+searches return exactly what a full regex scan returns.
+"""
+
+from unittest import mock
+
+import pytest
+
+from common.ai_services.chat.query_templates import get_template_registry
+from common.ai_services.chat.query_templates.base import QueryTemplate, TemplateRegistry
+from common.ai_services.chat.query_templates.literal_index import (
+    TemplateLiteralIndex,
+    required_literals,
+)
+from common.ai_services.chat.template_matcher import TemplateMatcher
+
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        (r"(?:how many|count).*communit.*(?:in|at)\s+(.+)", {"communit"}),
+        (r"\b(high priority|urgent)\s+tasks?\b", {"high priority", "urgent"}),
+        (r"\bshow\s+(obc\s+)?communities?\b", {"communitie"}),
+        (r"(?:list|show)\s+(.+)", {"list", "show"}),
+        (r"(?:a|b)\s+\w+", None),
+        (r"(?:workshops?)?\s*(.+)", None),
+        (r"[", None),
+    ],
+)
+def test_required_literals(pattern, expected):
+    guard = required_literals(pattern)
+    assert (set(guard) if guard else None) == expected
+
+
+def test_index_candidates_include_unguarded_templates():
+    index = TemplateLiteralIndex(
+        [r"how many\s+communities", r"\bworkshops?\b", r"(?:a|b)\s+(.+)"]
+    )
+
+    assert index.candidates("How many COMMUNITIES are there") == [0, 2]
+    assert index.candidates("list workshop venues") == [1, 2]
+    assert index.candidates("ñandú communities") is None
+
+
+def test_prefiltered_search_matches_full_scan():
+    registry = get_template_registry()
+    templates = registry.get_all_templates()
+    queries = [example for template in templates for example in template.examples]
+    queries += ["hello there", "SHOW ME PENDING POLICIES", "¿cuántas comunidades?"]
+
+    for query in queries:
+        expected = [template for template in templates if template.matches(query)]
+        assert registry.search_templates(query) == expected, query
+
+
+def test_registering_template_rebuilds_index():
+    TemplateRegistry.reset_instance()
+    registry = TemplateRegistry.get_instance()
+    registry.register(
+        QueryTemplate(id="count_workshops", category="mana", pattern=r"how many workshops")
+    )
+    assert [t.id for t in registry.search_templates("how many workshops")] == [
+        "count_workshops"
+    ]
+
+    registry.register(
+        QueryTemplate(id="count_barangays", category="geographic", pattern=r"how many barangays")
+    )
+    assert [t.id for t in registry.search_templates("how many barangays")] == [
+        "count_barangays"
+    ]
+    TemplateRegistry.reset_instance()
+
+
+def test_match_and_generate_runs_each_candidate_regex_once():
+    TemplateRegistry.reset_instance()
+    matcher = TemplateMatcher()
+    matcher.registry.register(
+        QueryTemplate(
+            id="count_test_communities",
+            category="literal_index_test",
+            pattern=r"how many test communities",
+            query_template="OBCCommunity.objects.count()",
+            result_type="count",
+        )
+    )
+    template = matcher.registry.get_template("count_test_communities")
+
+    with mock.patch.object(template, "matches", wraps=template.matches) as spy:
+        result = matcher.match_and_generate(
+            "how many test communities", {}, category="literal_index_test"
+        )
+
+    assert result["success"] is True
+    assert spy.call_count == 1
+    TemplateRegistry.reset_instance()
@@ -6,14 +6,16 @@ from django.contrib.auth.decorators import login_required
 from django.shortcuts import redirect, render
 from django.utils import timezone
 
-from common.constants import STAFF_USER_TYPES
-
 
 def _render_moa_dashboard(request):
     """Render the dedicated dashboard for MOA focal persons and staff."""
 
-    from django.db.models import Avg, Count, Sum
+    from django.db.models import Count, Q
 
+    from common.services.dashboard_metrics import (
+        ORGANIZATION_SECTIONS,
+        get_dashboard_metrics,
+    )
     from common.work_item_model import WorkItem
     from monitoring.models import MonitoringEntry
     from recommendations.policy_tracking.models import PolicyRecommendation
@@ -27,18 +29,9 @@ def _render_moa_dashboard(request):
     else:
         ppa_qs = ppa_qs.none()
 
-    total_ppas = ppa_qs.count()
-    ongoing_ppas = ppa_qs.filter(status__in=["planning", "ongoing"]).count()
-    completed_ppas = ppa_qs.filter(status="completed").count()
-    stalled_ppas = ppa_qs.filter(status__in=["on_hold", "cancelled"]).count()
-    avg_progress = ppa_qs.aggregate(avg=Avg("progress"))["avg"] or 0
-    total_budget = ppa_qs.aggregate(total=Sum("budget_allocation"))["total"] or 0
-    community_count = (
-        ppa_qs.values("communities")
-        .exclude(communities=None)
-        .distinct()
-        .count()
-    )
+    ppa_stats = get_dashboard_metrics(
+        ORGANIZATION_SECTIONS, organization=organization
+    )["moa_portfolio"]
 
     recent_ppas = list(
         ppa_qs.select_related("implementing_moa", "lead_organization")
@@ -68,62 +61,89 @@ def _render_moa_dashboard(request):
         open_items_qs.order_by("due_date", "title")[:5]
     )
 
-    overdue_count = open_items_qs.filter(due_date__lt=today).count()
-    due_soon_count = open_items_qs.filter(
-        due_date__gte=today,
-        due_date__lte=upcoming_threshold,
-    ).count()
-    completed_work_items = work_item_qs.filter(status=WorkItem.STATUS_COMPLETED).count()
+    open_filter = Q(status__in=open_statuses)
+    work_item_summary = work_item_qs.aggregate(
+        open=Count("id", filter=open_filter),
+        overdue=Count("id", filter=open_filter & Q(due_date__lt=today)),
+        due_soon=Count(
+            "id",
+            filter=open_filter
+            & Q(due_date__gte=today, due_date__lte=upcoming_threshold),
+        ),
+        completed=Count("id", filter=Q(status=WorkItem.STATUS_COMPLETED)),
+    )
 
     policy_qs = PolicyRecommendation.objects.filter(proposed_by=user)
-    policy_stats = {
-        "total": policy_qs.count(),
-        "under_review": policy_qs.filter(status__in=["under_review", "needs_revision"]).count(),
-        "approved": policy_qs.filter(status__in=["approved", "in_implementation"]).count(),
-        "implemented": policy_qs.filter(status="implemented").count(),
-    }
+    policy_stats = policy_qs.aggregate(
+        total=Count("id"),
+        under_review=Count(
+            "id", filter=Q(status__in=["under_review", "needs_revision"])
+        ),
+        approved=Count(
+            "id", filter=Q(status__in=["approved", "in_implementation"])
+        ),
+        implemented=Count("id", filter=Q(status="implemented")),
+    )
     recent_policies = list(
         policy_qs.order_by("-updated_at", "-created_at")[:4]
     )
 
-    status_breakdown = list(
-        ppa_qs.values("status").annotate(count=Count("id")).order_by("-count")
-    ) if organization else []
-
     context = {
         "organization": organization,
-        "ppa_stats": {
-            "total": total_ppas,
-            "ongoing": ongoing_ppas,
-            "completed": completed_ppas,
-            "stalled": stalled_ppas,
-            "avg_progress": avg_progress,
-            "total_budget": total_budget,
-            "community_count": community_count,
-            "status_breakdown": status_breakdown,
-        },
+        "ppa_stats": ppa_stats,
         "recent_ppas": recent_ppas,
         "open_work_items": open_work_items,
-        "work_item_summary": {
-            "open": open_items_qs.count(),
-            "overdue": overdue_count,
-            "due_soon": due_soon_count,
-            "completed": completed_work_items,
-        },
+        "work_item_summary": work_item_summary,
         "policy_stats": policy_stats,
         "recent_policies": recent_policies,
     }
     return render(request, "common/dashboard_moa.html", context)
 
 
+def _user_task_summary(user):
+    """Open/overdue/due-soon/completed counts for a user's work items in one query."""
+    from django.db.models import Count, Q
+
+    from common.work_item_model import WorkItem
+
+    today = timezone.now().date()
+    upcoming_threshold = today + timedelta(days=14)
+
+    open_filter = Q(
+        status__in=[
+            WorkItem.STATUS_NOT_STARTED,
+            WorkItem.STATUS_IN_PROGRESS,
+            WorkItem.STATUS_AT_RISK,
+            WorkItem.STATUS_BLOCKED,
+        ]
+    )
+    return WorkItem.objects.filter(
+        Q(assignees=user) | Q(created_by=user)
+    ).aggregate(
+        open=Count("id", distinct=True, filter=open_filter),
+        overdue=Count(
+            "id", distinct=True, filter=open_filter & Q(due_date__lt=today)
+        ),
+        due_soon=Count(
+            "id",
+            distinct=True,
+            filter=open_filter
+            & Q(due_date__gte=today, due_date__lte=upcoming_threshold),
+        ),
+        completed=Count(
+            "id", distinct=True, filter=Q(status=WorkItem.STATUS_COMPLETED)
+        ),
+    )
+
+
 def _render_staff_dashboard(request):
     """Render the dedicated dashboard for OOBC staff members."""
     from datetime import timedelta
-    from django.db.models import Count, Q
+    from django.db.models import Q
 
     from common.rbac_models import UserRole
-    from communities.models import OBCCommunity, MunicipalityCoverage, ProvinceCoverage
-    from coordination.models import Event, Partnership
+    from common.services.dashboard_metrics import get_dashboard_metrics
+    from coordination.models import Event
     from common.work_item_model import WorkItem
 
     user = request.user
@@ -135,52 +155,16 @@ def _render_staff_dashboard(request):
         is_active=True
     ).exists()
 
-    # Communities stats
-    communities_qs = OBCCommunity.objects.all()
-    barangay_total = communities_qs.count()
-    municipal_total = MunicipalityCoverage.objects.count()
-    provincial_total = ProvinceCoverage.objects.count()
-    combined_total = barangay_total + municipal_total
-
-    # Partnerships stats
-    partnerships_qs = Partnership.objects.filter(status='active')
-    total_partnerships = partnerships_qs.count()
-
-    # Partnership breakdown
-    bmoa_partnerships = partnerships_qs.filter(
-        lead_organization__organization_type='bmoa'
-    ).count()
-    nga_partnerships = partnerships_qs.filter(
-        lead_organization__organization_type='nga'
-    ).count()
-    lgu_partnerships = partnerships_qs.filter(
-        lead_organization__organization_type='lgu'
-    ).count()
+    metrics = get_dashboard_metrics(["communities", "coordination"])
+    communities = metrics["communities"]
+    coordination = metrics["coordination"]
 
-    # Work items (tasks) for this user
     today = timezone.now().date()
-    upcoming_threshold = today + timedelta(days=14)
 
     user_tasks_qs = WorkItem.objects.filter(
         Q(assignees=user) | Q(created_by=user)
     ).distinct()
 
-    # Task status counts
-    open_statuses = [
-        WorkItem.STATUS_NOT_STARTED,
-        WorkItem.STATUS_IN_PROGRESS,
-        WorkItem.STATUS_AT_RISK,
-        WorkItem.STATUS_BLOCKED,
-    ]
-
-    open_tasks = user_tasks_qs.filter(status__in=open_statuses)
-    overdue_tasks = open_tasks.filter(due_date__lt=today).count()
-    due_soon_tasks = open_tasks.filter(
-        due_date__gte=today,
-        due_date__lte=upcoming_threshold
-    ).count()
-    completed_tasks = user_tasks_qs.filter(status=WorkItem.STATUS_COMPLETED).count()
-
     # Upcoming events (next 30 days)
     events_qs = Event.objects.filter(
         start_date__gte=today,
@@ -199,23 +183,18 @@ def _render_staff_dashboard(request):
         'user': user,
         'has_oobc_staff_role': has_oobc_staff_role,
         'communities_stats': {
-            'total': combined_total,
-            'barangay': barangay_total,
-            'municipal': municipal_total,
-            'provincial': provincial_total,
+            'total': communities['combined_total'],
+            'barangay': communities['barangay_total'],
+            'municipal': communities['municipal_total'],
+            'provincial': communities['provincial_total'],
         },
         'partnerships_stats': {
-            'total': total_partnerships,
-            'bmoa': bmoa_partnerships,
-            'nga': nga_partnerships,
-            'lgu': lgu_partnerships,
-        },
-        'tasks_stats': {
-            'open': open_tasks.count(),
-            'overdue': overdue_tasks,
-            'due_soon': due_soon_tasks,
-            'completed': completed_tasks,
+            'total': coordination['active_partnerships'],
+            'bmoa': coordination['bmoas'],
+            'nga': coordination['ngas'],
+            'lgu': coordination['lgus'],
         },
+        'tasks_stats': _user_task_summary(user),
         'upcoming_events': upcoming_events,
         'recent_tasks': recent_tasks,
     }
@@ -266,127 +245,21 @@ def dashboard(request):
     if request.user.is_moa_staff:
         return _render_moa_dashboard(request)
 
-    from django.db.models import Avg, Count
+    from common.services.dashboard_metrics import get_dashboard_metrics
+    from communities.models import OBCCommunity
 
-    from communities.models import (
-        MunicipalityCoverage,
-        OBCCommunity,
-        Stakeholder,
-    )
-    from coordination.models import Event, Partnership
-    from mana.models import Assessment, Need
-    from monitoring.models import MonitoringEntry
-    from recommendations.policy_tracking.models import PolicyRecommendation
-    from common.models import User
+    metrics = get_dashboard_metrics()
 
-    communities_qs = OBCCommunity.objects.all()
-    barangay_total = communities_qs.count()
-    municipal_total = MunicipalityCoverage.objects.count()
-    combined_total = barangay_total + municipal_total
-
-    oobc_staff_qs = User.objects.filter(user_type__in=STAFF_USER_TYPES)
+    communities = dict(metrics["communities"])
+    communities["recent"] = OBCCommunity.objects.order_by("-created_at")[:5]
 
     stats = {
-        "communities": {
-            "total": barangay_total,
-            "combined_total": combined_total,
-            "barangay_total": barangay_total,
-            "municipal_total": municipal_total,
-            "active": communities_qs.filter(is_active=True).count(),
-            "by_region": communities_qs.values(
-                "barangay__municipality__province__region__name"
-            ).annotate(count=Count("id"))[:5],
-            "recent": communities_qs.order_by("-created_at")[:5],
-        },
-        "mana": {
-            "total_assessments": Assessment.objects.count(),
-            "completed": Assessment.objects.filter(status="completed").count(),
-            "in_progress": Assessment.objects.filter(
-                status__in=["data_collection", "analysis"]
-            ).count(),
-            "high_priority": Need.objects.filter(impact_severity=5).count(),
-        },
-        "monitoring": {
-            "total": MonitoringEntry.objects.count(),
-            "moa_ppa": MonitoringEntry.objects.filter(category="moa_ppa").count(),
-            "oobc_ppa": MonitoringEntry.objects.filter(category="oobc_ppa").count(),
-            "obc_requests": MonitoringEntry.objects.filter(
-                category="obc_request"
-            ).count(),
-            "pending_requests": MonitoringEntry.objects.filter(
-                category="obc_request",
-                request_status__in=[
-                    "submitted",
-                    "under_review",
-                    "clarification",
-                    "endorsed",
-                ],
-            ).count(),
-            "avg_progress": MonitoringEntry.objects.aggregate(avg=Avg("progress"))[
-                "avg"
-            ]
-            or 0,
-            "linked_assessments": MonitoringEntry.objects.filter(
-                related_assessment__isnull=False
-            ).count(),
-            "linked_policies": MonitoringEntry.objects.filter(
-                related_policy__isnull=False
-            ).count(),
-        },
-        "coordination": {
-            "total_events": Event.objects.count(),
-            "active_partnerships": Partnership.objects.filter(status="active").count(),
-            "upcoming_events": Event.objects.filter(
-                start_date__gte=timezone.now().date(), status="planned"
-            ).count(),
-            "pending_actions": 0,
-            "bmoas": Partnership.objects.filter(
-                status="active", lead_organization__organization_type="bmoa"
-            ).count(),
-            "ngas": Partnership.objects.filter(
-                status="active", lead_organization__organization_type="nga"
-            ).count(),
-            "lgus": Partnership.objects.filter(
-                status="active", lead_organization__organization_type="lgu"
-            ).count(),
-        },
-        "policy_tracking": {
-            "total_policies": PolicyRecommendation.objects.count(),
-            "implemented": PolicyRecommendation.objects.filter(
-                status="implemented"
-            ).count(),
-            "under_review": PolicyRecommendation.objects.filter(
-                status="under_review"
-            ).count(),
-            "high_priority": PolicyRecommendation.objects.filter(
-                priority__in=["high", "urgent", "critical"]
-            ).count(),
-            "total_recommendations": PolicyRecommendation.objects.count(),
-            "policies": PolicyRecommendation.objects.filter(
-                category__in=["governance", "legal_framework", "administrative"]
-            ).count(),
-            "programs": PolicyRecommendation.objects.filter(
-                category__in=[
-                    "education",
-                    "economic_development",
-                    "social_development",
-                    "cultural_development",
-                ]
-            ).count(),
-            "services": PolicyRecommendation.objects.filter(
-                category__in=[
-                    "healthcare",
-                    "infrastructure",
-                    "environment",
-                    "human_rights",
-                ]
-            ).count(),
-        },
-        "oobc_management": {
-            "total_staff": oobc_staff_qs.count(),
-            "active_staff": oobc_staff_qs.filter(is_active=True).count(),
-            "pending_approvals": User.objects.filter(is_approved=False).count(),
-        },
+        "communities": communities,
+        "mana": metrics["mana"],
+        "monitoring": metrics["monitoring"],
+        "coordination": metrics["coordination"],
+        "policy_tracking": metrics["policy_tracking"],
+        "oobc_management": metrics["staff"],
     }
 
     context = {
@@ -402,41 +275,19 @@ def dashboard(request):
 def dashboard_metrics(request):
     """Live metrics HTML (updates every 60s)."""
     from django.http import HttpResponse
-    from django.db.models import Sum
-    from datetime import timedelta
-
-    try:
-        # Import models safely
-        from monitoring.models import MonitoringEntry
-        from mana.models import Need
-        from coordination.models import Event
-        from common.models.staff import StaffTask
-
-        # Aggregate from all modules
-        total_budget = (
-            MonitoringEntry.objects.aggregate(total=Sum("budget_allocation"))["total"]
-            or 0
-        )
-
-        active_projects = MonitoringEntry.objects.filter(status="ongoing").count()
 
-        unfunded_needs = Need.objects.filter(
-            linked_ppa__isnull=True, priority_score__gte=4.0
-        ).count()
+    from common.services.dashboard_metrics import get_dashboard_metrics
 
-        total_beneficiaries = (
-            MonitoringEntry.objects.aggregate(total=Sum("obc_slots"))["total"] or 0
+    try:
+        metrics = get_dashboard_metrics(
+            ["monitoring", "mana", "coordination", "work_items"]
         )
-
-        upcoming_events = Event.objects.filter(
-            start_date__gte=timezone.now().date(),
-            start_date__lte=timezone.now().date() + timedelta(days=7),
-        ).count()
-
-        current_week = timezone.now().isocalendar()[1]
-        tasks_due = StaffTask.objects.filter(
-            due_date__week=current_week, status__in=["not_started", "in_progress"]
-        ).count()
+        total_budget = metrics["monitoring"]["total_budget"]
+        active_projects = metrics["monitoring"]["active_projects"]
+        unfunded_needs = metrics["mana"]["unfunded_high_priority"]
+        total_beneficiaries = metrics["monitoring"]["total_beneficiaries"]
+        upcoming_events = metrics["coordination"]["events_next_7_days"]
+        tasks_due = metrics["work_items"]["due_this_week"]
 
     except Exception as e:
         # Fallback values if models don't exist
@@ -533,93 +384,22 @@ def dashboard_metrics(request):
 def dashboard_activity(request):
     """Recent activity feed (infinite scroll)."""
     from django.http import HttpResponse
-    from datetime import timedelta
-
-    page = int(request.GET.get("page", 1))
-    per_page = 20
-
-    # Aggregate recent items from all modules
-    activities = []
-
-    try:
-        from mana.models import Need
-        from monitoring.models import MonitoringEntry
-        from common.models.staff import StaffTask
-        from coordination.models import Event
-
-        # Recent needs
-        for need in Need.objects.filter(
-            created_at__gte=timezone.now() - timedelta(days=30)
-        ).select_related("community")[:10]:
-            activities.append(
-                {
-                    "icon": "fa-lightbulb",
-                    "color": "blue",
-                    "title": f"New need: {need.title}",
-                    "subtitle": f"in {need.community}",
-                    "timestamp": need.created_at,
-                    "url": "#",
-                }
-            )
-
-        # Recent PPAs
-        for ppa in MonitoringEntry.objects.filter(
-            created_at__gte=timezone.now() - timedelta(days=30)
-        )[:10]:
-            lead_org = ppa.lead_organization.name if ppa.lead_organization else "OOBC"
-            activities.append(
-                {
-                    "icon": "fa-project-diagram",
-                    "color": "emerald",
-                    "title": f"New PPA: {ppa.title}",
-                    "subtitle": f"Lead: {lead_org}",
-                    "timestamp": ppa.created_at,
-                    "url": f"/monitoring/entry/{ppa.id}/",
-                }
-            )
-
-        # Recent tasks completed
-        for task in StaffTask.objects.filter(
-            status="completed", updated_at__gte=timezone.now() - timedelta(days=30)
-        ).select_related("assigned_to")[:10]:
-            activities.append(
-                {
-                    "icon": "fa-check-circle",
-                    "color": "green",
-                    "title": f"Task completed: {task.title}",
-                    "subtitle": f'by {task.assigned_to.get_full_name() if task.assigned_to else "Unassigned"}',
-                    "timestamp": task.updated_at,
-                    "url": "#",
-                }
-            )
-
-        # Recent events
-        for event in Event.objects.filter(
-            created_at__gte=timezone.now() - timedelta(days=30)
-        )[:10]:
-            activities.append(
-                {
-                    "icon": "fa-calendar",
-                    "color": "purple",
-                    "title": f"Event scheduled: {event.title}",
-                    "subtitle": f'{event.start_date.strftime("%b %d, %Y")}',
-                    "timestamp": event.created_at,
-                    "url": "#",
-                }
-            )
-
-    except Exception:
-        # Fallback empty activities
-        pass
-
-    # Sort by timestamp
-    activities = sorted(activities, key=lambda x: x["timestamp"], reverse=True)
-
-    # Paginate
-    start = (page - 1) * per_page
-    end = start + per_page
-    activities_page = activities[start:end]
-    has_next = len(activities) > end
+    from django.utils.http import urlencode
+
+    from common.services.activity_stream import fetch_page
+
+    entries, next_cursor = fetch_page(cursor=request.GET.get("cursor"))
+    activities_page = [
+        {
+            "icon": entry.icon,
+            "color": entry.color,
+            "title": entry.title,
+            "subtitle": entry.subtitle,
+            "timestamp": timezone.localtime(entry.occurred_at),
+            "url": entry.url,
+        }
+        for entry in entries
+    ]
 
     # Render HTML
     html = '<div class="space-y-3">'
@@ -649,9 +429,9 @@ def dashboard_activity(request):
     html += "</div>"
 
     # Infinite scroll trigger
-    if has_next:
+    if next_cursor:
         html += f"""
-        <div hx-get="/dashboard/activity/?page={page + 1}" hx-trigger="revealed" hx-swap="afterend" class="text-center py-4">
+        <div hx-get="/dashboard/activity/?{urlencode({'cursor': next_cursor})}" hx-trigger="revealed" hx-swap="afterend" class="text-center py-4">
             <i class="fas fa-spinner fa-spin text-gray-400"></i>
         </div>
         """
@@ -667,13 +447,12 @@ def dashboard_alerts(request):
     alerts = []
 
     try:
-        from mana.models import Need
-        from common.models.staff import StaffTask
+        from common.services.dashboard_metrics import get_dashboard_metrics
+
+        metrics = get_dashboard_metrics(["mana", "work_items"])
 
         # Unfunded needs
-        unfunded = Need.objects.filter(
-            linked_ppa__isnull=True, priority_score__gte=4.0
-        ).count()
+        unfunded = metrics["mana"]["unfunded_high_priority"]
 
         if unfunded > 0:
             alerts.append(
@@ -687,10 +466,7 @@ def dashboard_alerts(request):
             )
 
         # Overdue tasks
-        overdue = StaffTask.objects.filter(
-            due_date__lt=timezone.now().date(),
-            status__in=["not_started", "in_progress"],
-        ).count()
+        overdue = metrics["work_items"]["overdue"]
 
         if overdue > 0:
             alerts.append(
@@ -742,55 +518,35 @@ def dashboard_alerts(request):
 def dashboard_stats_cards(request):
     """Render dashboard stats cards (HTMX endpoint)."""
     from django.http import HttpResponse
-    from django.db.models import Avg, Count
-    from communities.models import MunicipalityCoverage, OBCCommunity
-    from coordination.models import Partnership
-    from mana.models import Assessment
-    from monitoring.models import MonitoringEntry
-    from recommendations.policy_tracking.models import PolicyRecommendation
 
-    # Calculate stats
-    communities_qs = OBCCommunity.objects.all()
-    barangay_total = communities_qs.count()
-    municipal_total = MunicipalityCoverage.objects.count()
-    total_communities = barangay_total + municipal_total
-
-    total_assessments = Assessment.objects.count()
-    active_partnerships = Partnership.objects.filter(status="active").count()
-    bmoas = Partnership.objects.filter(
-        status="active", lead_organization__organization_type="bmoa"
-    ).count()
-    ngas = Partnership.objects.filter(
-        status="active", lead_organization__organization_type="nga"
-    ).count()
-    lgus = Partnership.objects.filter(
-        status="active", lead_organization__organization_type="lgu"
-    ).count()
-
-    total_recommendations = PolicyRecommendation.objects.count()
-    policies = PolicyRecommendation.objects.filter(
-        category__in=["governance", "legal_framework", "administrative"]
-    ).count()
-    programs = PolicyRecommendation.objects.filter(
-        category__in=[
-            "education",
-            "economic_development",
-            "social_development",
-            "cultural_development",
-        ]
-    ).count()
-    services = PolicyRecommendation.objects.filter(
-        category__in=["healthcare", "infrastructure", "environment", "human_rights"]
-    ).count()
-
-    monitoring_total = MonitoringEntry.objects.count()
-    pending_requests = MonitoringEntry.objects.filter(
-        category="obc_request",
-        request_status__in=["submitted", "under_review", "clarification", "endorsed"],
-    ).count()
-    avg_progress = (
-        MonitoringEntry.objects.aggregate(avg=Avg("progress"))["avg"] or 0
+    from common.services.dashboard_metrics import get_dashboard_metrics
+
+    metrics = get_dashboard_metrics(
+        ["communities", "mana", "coordination", "policy_tracking", "monitoring"]
     )
+    communities = metrics["communities"]
+    coordination = metrics["coordination"]
+    policy_tracking = metrics["policy_tracking"]
+    monitoring = metrics["monitoring"]
+
+    barangay_total = communities["barangay_total"]
+    municipal_total = communities["municipal_total"]
+    total_communities = communities["combined_total"]
+
+    total_assessments = metrics["mana"]["total_assessments"]
+    active_partnerships = coordination["active_partnerships"]
+    bmoas = coordination["bmoas"]
+    ngas = coordination["ngas"]
+    lgus = coordination["lgus"]
+
+    total_recommendations = policy_tracking["total_recommendations"]
+    policies = policy_tracking["policies"]
+    programs = policy_tracking["programs"]
+    services = policy_tracking["services"]
+
+    monitoring_total = monitoring["total"]
+    pending_requests = monitoring["pending_requests"]
+    avg_progress = monitoring["avg_progress"]
 
     # Render HTML
     html = f"""
@@ -942,13 +698,9 @@ def dashboard_stats_cards(request):
 def staff_dashboard_stats(request):
     """Render staff dashboard stats cards (HTMX endpoint)."""
     from django.http import HttpResponse
-    from django.db.models import Q
-    from datetime import timedelta
 
     from common.rbac_models import UserRole
-    from communities.models import OBCCommunity, MunicipalityCoverage, ProvinceCoverage
-    from coordination.models import Partnership, CoordinationNote, StakeholderEngagement
-    from common.work_item_model import WorkItem
+    from common.services.dashboard_metrics import get_dashboard_metrics
 
     user = request.user
 
@@ -959,65 +711,33 @@ def staff_dashboard_stats(request):
         is_active=True
     ).exists()
 
+    metrics = get_dashboard_metrics(["communities", "coordination"])
+    communities = metrics["communities"]
+    coordination = metrics["coordination"]
+
     # Communities stats
-    communities_qs = OBCCommunity.objects.all()
-    barangay_total = communities_qs.count()
-    municipal_total = MunicipalityCoverage.objects.count()
-    provincial_total = ProvinceCoverage.objects.count()
-    combined_total = barangay_total + municipal_total
+    barangay_total = communities["barangay_total"]
+    municipal_total = communities["municipal_total"]
+    provincial_total = communities["provincial_total"]
+    combined_total = communities["combined_total"]
 
     # Partnerships stats
-    partnerships_qs = Partnership.objects.filter(status='active')
-    total_partnerships = partnerships_qs.count()
-
-    # Partnership breakdown
-    bmoa_partnerships = partnerships_qs.filter(
-        lead_organization__organization_type='bmoa'
-    ).count()
-    nga_partnerships = partnerships_qs.filter(
-        lead_organization__organization_type='nga'
-    ).count()
-    lgu_partnerships = partnerships_qs.filter(
-        lead_organization__organization_type='lgu'
-    ).count()
+    total_partnerships = coordination["active_partnerships"]
+    bmoa_partnerships = coordination["bmoas"]
+    nga_partnerships = coordination["ngas"]
+    lgu_partnerships = coordination["lgus"]
 
     # Coordination activities stats
-    today = timezone.now().date()
-    thirty_days_ago = today - timedelta(days=30)
-
-    total_coordination_notes = CoordinationNote.objects.count()
-    recent_coordination_notes = CoordinationNote.objects.filter(
-        note_date__gte=thirty_days_ago
-    ).count()
-
-    total_engagements = StakeholderEngagement.objects.count()
-    active_engagements = StakeholderEngagement.objects.filter(
-        status__in=['scheduled', 'in_progress']
-    ).count()
+    total_coordination_notes = coordination["total_coordination_notes"]
+    recent_coordination_notes = coordination["recent_coordination_notes"]
+    total_engagements = coordination["total_engagements"]
+    active_engagements = coordination["active_engagements"]
 
     # Work items (tasks) for this user
-    today = timezone.now().date()
-    upcoming_threshold = today + timedelta(days=14)
-
-    user_tasks_qs = WorkItem.objects.filter(
-        Q(assignees=user) | Q(created_by=user)
-    ).distinct()
-
-    # Task status counts
-    open_statuses = [
-        WorkItem.STATUS_NOT_STARTED,
-        WorkItem.STATUS_IN_PROGRESS,
-        WorkItem.STATUS_AT_RISK,
-        WorkItem.STATUS_BLOCKED,
-    ]
-
-    open_tasks = user_tasks_qs.filter(status__in=open_statuses)
-    overdue_tasks = open_tasks.filter(due_date__lt=today).count()
-    due_soon_tasks = open_tasks.filter(
-        due_date__gte=today,
-        due_date__lte=upcoming_threshold
-    ).count()
-    completed_tasks = user_tasks_qs.filter(status=WorkItem.STATUS_COMPLETED).count()
+    task_summary = _user_task_summary(user)
+    overdue_tasks = task_summary["overdue"]
+    due_soon_tasks = task_summary["due_soon"]
+    completed_tasks = task_summary["completed"]
 
     # Render HTML stat cards
     html = f"""
@@ -1125,7 +845,7 @@ def staff_dashboard_stats(request):
             <div class="flex items-center justify-between mb-3">
                 <div>
                     <p class="text-gray-600 text-sm font-semibold uppercase tracking-wide">My Tasks</p>
-                    <p class="text-4xl font-extrabold text-gray-800 mt-1">{open_tasks.count()}</p>
+                    <p class="text-4xl font-extrabold text-gray-800 mt-1">{task_summary["open"]}</p>
                     <p class="text-xs text-gray-500 mt-1">Open</p>
                 </div>
                 <div class="w-16 h-16 rounded-2xl flex items-center justify-center"
@@ -2,6 +2,7 @@
 
 import json
 import re
+import time as time_module
 import warnings
 from collections import defaultdict
 from datetime import date, datetime, time, timedelta, timezone as datetime_timezone
@@ -11,6 +12,7 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import OperationalError, transaction
 from common.decorators.rbac import require_feature_access
 from django.db.models import (
@@ -26,13 +28,12 @@ from django.db.models import (
     When,
 )
 from django.db.models.functions import Coalesce
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils import formats, timezone
 from django.utils.http import url_has_allowed_host_and_scheme
-from django.views.decorators.cache import cache_page
-from django.views.decorators.http import require_POST
+from django.views.decorators.http import condition, require_POST
 
 from common.constants import (
     CALENDAR_MODULE_COLORS,
@@ -76,7 +77,11 @@ from common.services.staff import (
     ensure_membership,
     ensure_staff_profiles_for_users,
 )
-from common.services.calendar import CALENDAR_CACHE_TTL, build_calendar_payload
+from common.services.calendar import (
+    CALENDAR_CACHE_TTL,
+    build_calendar_payload,
+    get_calendar_generation,
+)
 from common.security_logging import log_unauthorized_access
 from monitoring.models import (
     MonitoringEntry,
@@ -846,21 +851,37 @@ def oobc_calendar_advanced_modern(request):
     return render(request, "common/calendar_advanced_modern.html", context)
 
 
-@login_required
-@cache_page(CALENDAR_CACHE_TTL)
-def oobc_calendar_feed_json(request):
-    """Return calendar events as JSON for integrations."""
+def _calendar_feed_version(request):
+    """Return ``(generation, ttl_bucket, modules_key)`` for feed validators.
 
-    modules_filter = _parse_module_filters(request)
-    payload = build_calendar_payload(filter_modules=modules_filter)
+    The TTL bucket forces revalidation once the cached payload may have
+    been rebuilt from sources that do not bump the generation counter.
+    """
 
-    follow_up_export = [
-        {
-            **item,
-            "due": item["due"].isoformat() if item.get("due") else None,
-        }
-        for item in payload.get("follow_up_items", [])
-    ]
+    modules_filter = _parse_module_filters(request) or ["all"]
+    bucket = int(time_module.time()) // CALENDAR_CACHE_TTL
+    return get_calendar_generation(), bucket, ",".join(sorted(modules_filter))
+
+
+def _calendar_feed_etag(request):
+    generation, bucket, modules_key = _calendar_feed_version(request)
+    return f"calendar-{generation}-{bucket}-{modules_key}"
+
+
+def _calendar_feed_last_modified(request):
+    generation, bucket, _ = _calendar_feed_version(request)
+    changed_at = max(generation / 1000, bucket * CALENDAR_CACHE_TTL)
+    return datetime.fromtimestamp(changed_at, tz=datetime_timezone.utc)
+
+
+calendar_feed_condition = condition(
+    etag_func=_calendar_feed_etag,
+    last_modified_func=_calendar_feed_last_modified,
+)
+
+
+def _iter_calendar_feed_json(modules_filter, payload):
+    """Yield the JSON calendar feed in chunks, one event at a time."""
 
     analytics = payload.get("analytics", {})
     heatmap = analytics.get("heatmap", {})
@@ -875,6 +896,14 @@ def oobc_calendar_feed_json(request):
         "compliance": analytics.get("compliance", {}),
     }
 
+    follow_up_export = [
+        {
+            **item,
+            "due": item["due"].isoformat() if item.get("due") else None,
+        }
+        for item in payload.get("follow_up_items", [])
+    ]
+
     workflow_actions_export = []
     for action in payload.get("workflow_actions", []):
         action_copy = dict(action)
@@ -882,45 +911,62 @@ def oobc_calendar_feed_json(request):
             action_copy["due"] = action_copy["due"].isoformat()
         workflow_actions_export.append(action_copy)
 
-    data = {
-        "generated_at": timezone.now().isoformat(),
-        "modules": modules_filter or CALENDAR_MODULE_ORDER,
-        "events": payload["entries"],
-        "module_stats": payload["module_stats"],
-        "follow_up_items": follow_up_export,
-        "workflow_actions": workflow_actions_export,
-        "workflow_summary": analytics.get("workflow_summary", {}),
-        "analytics": analytics_payload,
-    }
-    return JsonResponse(data)
+    encoder = DjangoJSONEncoder()
+    yield '{"generated_at": %s, "modules": %s, "events": [' % (
+        encoder.encode(timezone.now().isoformat()),
+        encoder.encode(modules_filter or CALENDAR_MODULE_ORDER),
+    )
+    for index, entry in enumerate(payload["entries"]):
+        yield ("," if index else "") + encoder.encode(entry)
+    yield '], "module_stats": %s, "follow_up_items": %s, "workflow_actions": %s, ' % (
+        encoder.encode(payload["module_stats"]),
+        encoder.encode(follow_up_export),
+        encoder.encode(workflow_actions_export),
+    )
+    yield '"workflow_summary": %s, "analytics": %s}' % (
+        encoder.encode(analytics.get("workflow_summary", {})),
+        encoder.encode(analytics_payload),
+    )
 
 
 @login_required
-@cache_page(CALENDAR_CACHE_TTL)
-def oobc_calendar_feed_ics(request):
-    """Provide an ICS feed of calendar events."""
+@calendar_feed_condition
+def oobc_calendar_feed_json(request):
+    """Return calendar events as JSON for integrations."""
 
     modules_filter = _parse_module_filters(request)
     payload = build_calendar_payload(filter_modules=modules_filter)
 
-    def ics_escape(value: str) -> str:
-        return (
-            value.replace("\\", "\\\\")
-            .replace(";", "\\;")
-            .replace(",", "\\,")
-            .replace("\n", "\\n")
-        )
+    return StreamingHttpResponse(
+        _iter_calendar_feed_json(modules_filter, payload),
+        content_type="application/json",
+    )
 
-    lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//OOBC Management//Calendar//EN",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-        "X-WR-CALNAME:OOBC Integrated Calendar",
-    ]
 
-    for entry in payload["entries"]:
+def _ics_escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _iter_calendar_feed_ics(entries):
+    """Yield an ICS calendar as CRLF-terminated chunks, one VEVENT at a time."""
+
+    yield "\r\n".join(
+        [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//OOBC Management//Calendar//EN",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            "X-WR-CALNAME:OOBC Integrated Calendar",
+        ]
+    )
+
+    for entry in entries:
         start_iso = entry.get("start")
         if not start_iso:
             continue
@@ -939,12 +985,14 @@ def oobc_calendar_feed_ics(request):
                 description_lines.append(f"{key.title()}: {value}")
 
         workflow_actions = extended.get("workflowActions", [])
+        action_displays = []
         for action in workflow_actions:
             due_value = action.get("due")
             if isinstance(due_value, datetime):
                 due_display = due_value.strftime("%Y-%m-%d")
             else:
                 due_display = str(due_value)
+            action_displays.append((action.get("label", "Workflow"), due_display))
             description_lines.append(
                 f"Action - {action.get('label', 'Workflow')}: {due_display}"
             )
@@ -952,13 +1000,11 @@ def oobc_calendar_feed_ics(request):
 
         sanitized_title = entry.get("title", "").replace("\n", " ")
 
-        lines.extend(
-            [
-                "BEGIN:VEVENT",
-                f"UID:{ics_escape(entry.get('id', ''))}@oobcms",
-                f"SUMMARY:{ics_escape(sanitized_title)}",
-            ]
-        )
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{_ics_escape(entry.get('id', ''))}@oobcms",
+            f"SUMMARY:{_ics_escape(sanitized_title)}",
+        ]
 
         lines.append(
             "DTSTART;VALUE=DATE:" + _format_ics_datetime(start_dt, all_day=True)
@@ -975,26 +1021,31 @@ def oobc_calendar_feed_ics(request):
 
         location_value = extended.get("location") or entry.get("location")
         if location_value:
-            lines.append(f"LOCATION:{ics_escape(str(location_value))}")
+            lines.append(f"LOCATION:{_ics_escape(str(location_value))}")
 
         if description:
-            lines.append(f"DESCRIPTION:{ics_escape(description)}")
+            lines.append(f"DESCRIPTION:{_ics_escape(description)}")
 
-        for action in workflow_actions:
-            due_value = action.get("due")
-            if isinstance(due_value, datetime):
-                due_display = due_value.strftime("%Y-%m-%d")
-            else:
-                due_display = str(due_value)
-            action_text = f"{action.get('label', 'Workflow')} ({due_display})"
-            lines.append(f"X-OOBC-ACTION:{ics_escape(action_text)}")
+        for label, due_display in action_displays:
+            lines.append(f"X-OOBC-ACTION:{_ics_escape(f'{label} ({due_display})')}")
 
         lines.append("END:VEVENT")
+        yield "\r\n" + "\r\n".join(lines)
+
+    yield "\r\nEND:VCALENDAR"
 
-    lines.append("END:VCALENDAR")
 
-    content = "\r\n".join(lines)
-    response = HttpResponse(content, content_type="text/calendar")
+@login_required
+@calendar_feed_condition
+def oobc_calendar_feed_ics(request):
+    """Provide an ICS feed of calendar events."""
+
+    modules_filter = _parse_module_filters(request)
+    payload = build_calendar_payload(filter_modules=modules_filter)
+
+    response = StreamingHttpResponse(
+        _iter_calendar_feed_ics(payload["entries"]), content_type="text/calendar"
+    )
     response["Content-Disposition"] = "attachment; filename=OOBC-calendar.ics"
     return response
 
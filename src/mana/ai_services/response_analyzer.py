@@ -11,6 +11,7 @@ from django.core.cache import cache
 
 from ai_assistant.ai_engine import GeminiAIEngine
 from ai_assistant.cultural_context import BangsomoroCulturalContext
+from ai_assistant.services.gemini_service import GeminiService
 
 logger = logging.getLogger(__name__)
 
@@ -53,17 +54,88 @@ class ResponseAnalyzer:
             }
 
         # Check cache first
-        cache_key = f"mana_response_analysis_{hash(question + str(responses))}"
+        cache_key = self._analysis_cache_key(question, responses)
         cached_result = cache.get(cache_key)
         if cached_result:
             logger.info(f"Using cached analysis for question: {question[:50]}...")
             return cached_result
 
+        try:
+            # Generate analysis using Gemini
+            response = self.ai_engine.model.generate_content(
+                self._analysis_prompt(question, responses)
+            )
+            return self._parse_analysis(response.text, cache_key, len(responses))
+
+        except Exception as e:
+            logger.error(f"Error analyzing responses: {e}")
+            return self._error_analysis(e)
+
+    def analyze_questions(self, questions: Dict) -> Dict:
+        """
+        Analyze the responses to several workshop questions at once
+
+        Questions without a cached analysis are sent to Gemini as one
+        concurrent batch instead of one request after another.
+
+        Args:
+            questions: {key: (question text, list of response texts)}
+
+        Returns:
+            dict: {key: analysis}, each shaped like analyze_question_responses()
+        """
+        analyses = {}
+        pending = []
+        for key, (question, responses) in questions.items():
+            if not responses:
+                analyses[key] = self.analyze_question_responses(question, responses)
+                continue
+
+            cache_key = self._analysis_cache_key(question, responses)
+            cached_result = cache.get(cache_key)
+            if cached_result:
+                analyses[key] = cached_result
+            else:
+                pending.append((key, question, responses, cache_key))
+
+        if not pending:
+            return analyses
+
+        prompts = [
+            self._analysis_prompt(question, responses)
+            for _, question, responses, _ in pending
+        ]
+
+        try:
+            # The cultural guidelines are already part of each prompt
+            results = GeminiService().generate_batch(
+                prompts, use_cache=False, include_cultural_context=False
+            )
+        except Exception as e:
+            logger.error(f"Error analyzing responses: {e}")
+            results = [{"success": False, "error": str(e)}] * len(pending)
+
+        for (key, _, responses, cache_key), result in zip(pending, results):
+            if result["success"]:
+                analyses[key] = self._parse_analysis(
+                    result["text"], cache_key, len(responses)
+                )
+            else:
+                logger.error(f"Error analyzing responses: {result['error']}")
+                analyses[key] = self._error_analysis(result["error"])
+
+        return analyses
+
+    def _analysis_cache_key(self, question: str, responses: List[str]) -> str:
+        """Cache key for the analysis of one question's responses"""
+        return f"mana_response_analysis_{hash(question + str(responses))}"
+
+    def _analysis_prompt(self, question: str, responses: List[str]) -> str:
+        """Build the analysis prompt for one question's responses"""
         # Prepare cultural context
         cultural_guidelines = self.cultural_context.get_base_context()
 
-        # Build analysis prompt
-        prompt = f"""
+        return f"""
 {cultural_guidelines}
 
 TASK: Analyze community workshop responses with cultural sensitivity
@@ -96,35 +168,22 @@ OUTPUT FORMAT (JSON):
 }}
 """
 
-        try:
-            # Generate analysis using Gemini
-            response = self.ai_engine.model.generate_content(prompt)
-            result_text = response.text.strip()
+    def _parse_analysis(
+        self, result_text: str, cache_key: str, response_count: int
+    ) -> Dict:
+        """Parse and cache the JSON analysis returned by Gemini"""
+        result_text = result_text.strip()
 
-            # Clean JSON from markdown code blocks if present
-            if result_text.startswith("```json"):
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif result_text.startswith("```"):
-                result_text = result_text.split("```")[1].split("```")[0].strip()
+        # Clean JSON from markdown code blocks if present
+        if result_text.startswith("```json"):
+            result_text = result_text.split("```json")[1].split("```")[0].strip()
+        elif result_text.startswith("```"):
+            result_text = result_text.split("```")[1].split("```")[0].strip()
 
+        try:
             # Parse JSON response
             analysis = json.loads(result_text)
 
-            # Validate structure
-            analysis.setdefault("summary", "Analysis completed")
-            analysis.setdefault("key_points", [])
-            analysis.setdefault("sentiment", "neutral")
-            analysis.setdefault("action_items", [])
-            analysis.setdefault("confidence", 0.7)
-
-            # Cache result for 24 hours
-            cache.set(cache_key, analysis, timeout=86400)
-
-            logger.info(
-                f"Successfully analyzed {len(responses)} responses for question"
-            )
-            return analysis
-
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse AI response as JSON: {e}")
             logger.error(f"Raw response: {result_text}")
@@ -136,15 +195,28 @@ OUTPUT FORMAT (JSON):
                 "confidence": 0.3,
             }
 
-        except Exception as e:
-            logger.error(f"Error analyzing responses: {e}")
-            return {
-                "summary": f"Error during analysis: {str(e)}",
-                "key_points": [],
-                "sentiment": "neutral",
-                "action_items": ["Review system logs", "Retry analysis"],
-                "confidence": 0.0,
-            }
+        # Validate structure
+        analysis.setdefault("summary", "Analysis completed")
+        analysis.setdefault("key_points", [])
+        analysis.setdefault("sentiment", "neutral")
+        analysis.setdefault("action_items", [])
+        analysis.setdefault("confidence", 0.7)
+
+        # Cache result for 24 hours
+        cache.set(cache_key, analysis, timeout=86400)
+
+        logger.info(f"Successfully analyzed {response_count} responses for question")
+        return analysis
+
+    def _error_analysis(self, error) -> Dict:
+        """Analysis returned when Gemini could not be reached"""
+        return {
+            "summary": f"Error during analysis: {str(error)}",
+            "key_points": [],
+            "sentiment": "neutral",
+            "action_items": ["Review system logs", "Retry analysis"],
+            "confidence": 0.0,
+        }
 
     def aggregate_workshop_insights(self, workshop_id: int) -> Dict:
         """
@@ -184,19 +256,19 @@ OUTPUT FORMAT (JSON):
                 if response_text:
                     question_groups[question_id].append(response_text)
 
-            # Analyze each question group
-            question_analyses = {}
-            for question_id, response_texts in question_groups.items():
-                # Try to get question text
-                question_text = f"Question {question_id}"
+            # Analyze all question groups in one batch
+            questions = {
+                question_id: (f"Question {question_id}", response_texts)
+                for question_id, response_texts in question_groups.items()
+            }
+            analyses = self.analyze_questions(questions)
 
-                analysis = self.analyze_question_responses(
-                    question_text, response_texts
-                )
+            question_analyses = {}
+            for question_id, (question_text, response_texts) in questions.items():
                 question_analyses[question_id] = {
                     "question": question_text,
                     "response_count": len(response_texts),
-                    "analysis": analysis,
+                    "analysis": analyses[question_id],
                 }
 
             # Generate overall workshop summary
@@ -13,28 +13,21 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import Group, Permission
 from django.db import transaction
-from django.http import Http404, HttpResponse, HttpResponseBadRequest
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.crypto import get_random_string
+from django.utils.html import format_html
 from django.conf import settings
 from django.views.decorators.http import require_http_methods
 
-try:
-    from openpyxl import Workbook
-except ImportError:  # pragma: no cover - handled gracefully at runtime
-    Workbook = None
-
-try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.pdfgen import canvas
-except ImportError:  # pragma: no cover
-    canvas = None
-    letter = None
-
-from common.models import Province
-
 from .decorators import facilitator_required
 from .forms import (
     FacilitatorBulkImportForm,
@@ -51,8 +44,11 @@ from .models import (
     WorkshopSynthesis,
 )
 from .schema import get_questions_for_workshop
+from .services import response_export
+from .services.participant_import import ParticipantBulkImporter
 from .services.workshop_access import WorkshopAccessManager
 from .services.workshop_synthesis import AIWorkshopSynthesizer
+from .tasks import export_workshop_responses as task_export_workshop_responses
 from .tasks import generate_workshop_synthesis as task_generate_workshop_synthesis
 
 User = get_user_model()
@@ -309,52 +305,10 @@ def manage_participants(request, assessment_id):
                 csv_file = request.FILES["csv_file"]
                 decoded = csv_file.read().decode("utf-8")
                 reader = csv.DictReader(io.StringIO(decoded))
-                created = 0
-                for row in reader:
-                    email = row.get("email")
-                    if not email or User.objects.filter(username=email).exists():
-                        continue
-
-                    with transaction.atomic():
-                        user = User.objects.create_user(
-                            username=email,
-                            email=email,
-                            first_name=row.get("first_name", ""),
-                            last_name=row.get("last_name", ""),
-                            password=row.get(
-                                "password", get_random_string(length=12)
-                            ),
-                        )
-                        _ensure_participant_permissions(user)
-
-                        province_id = row.get("province_id") or None
-                        region_id = row.get("region_id") or None
-                        if not region_id and province_id:
-                            region_id = (
-                                Province.objects.filter(pk=province_id)
-                                .values_list("region_id", flat=True)
-                                .first()
-                            )
-
-                        participant = WorkshopParticipantAccount.objects.create(
-                            assessment=assessment,
-                            user=user,
-                            stakeholder_type=row.get("stakeholder_type", "other"),
-                            region_id=region_id,
-                            province_id=province_id,
-                            municipality_id=row.get("municipality_id") or None,
-                            barangay_id=row.get("barangay_id") or None,
-                            office_business_name=(
-                                row.get("office_business_name")
-                                or row.get("organization", "")
-                            ),
-                            created_by=request.user,
-                            current_workshop="workshop_1",
-                            completed_workshops=[],
-                            consent_given=False,
-                            profile_completed=False,
-                        )
-                        created += 1
+                result = ParticipantBulkImporter(
+                    assessment, request.user
+                ).import_rows(reader)
+                created = result.created
 
                 messages.success(
                     request,
@@ -489,15 +443,22 @@ def advance_workshop(request, assessment_id, workshop_type):
     )
 
     # Create notifications for all participants in this assessment
-    participants = WorkshopParticipantAccount.objects.filter(assessment=assessment)
-    for participant in participants:
-        WorkshopNotification.objects.create(
-            participant=participant,
-            notification_type="workshop_advanced",
-            title=f"🎉 New Workshop Available: {workshop_name}",
-            message=f"The facilitator has unlocked {workshop_name}. You can now proceed to complete this workshop.",
-            workshop=workshop_obj,
-        )
+    participant_ids = WorkshopParticipantAccount.objects.filter(
+        assessment=assessment
+    ).values_list("pk", flat=True)
+    WorkshopNotification.objects.bulk_create(
+        [
+            WorkshopNotification(
+                participant_id=participant_id,
+                notification_type="workshop_advanced",
+                title=f"🎉 New Workshop Available: {workshop_name}",
+                message=f"The facilitator has unlocked {workshop_name}. You can now proceed to complete this workshop.",
+                workshop=workshop_obj,
+            )
+            for participant_id in participant_ids
+        ],
+        batch_size=500,
+    )
 
     messages.success(request, f"Advanced {moved} participants to {workshop_name}.")
 
@@ -684,129 +645,22 @@ def approve_synthesis(request, assessment_id, synthesis_id):
     )
 
 
-def _export_as_csv(responses: List[WorkshopResponse]) -> HttpResponse:
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(
-        [
-            "Participant",
-            "Organization",
-            "Province",
-            "Stakeholder",
-            "Status",
-            "Submitted",
-            "Question",
-            "Response",
-        ]
-    )
+def _export_response(responses, format_type: str):
+    content_type = response_export.EXPORT_FORMATS[format_type]
+    filename = response_export.export_filename(format_type)
 
-    for response in responses:
-        participant = response.participant
-        writer.writerow(
-            [
-                participant.user.get_full_name() or participant.user.email,
-                participant.office_business_name,
-                participant.province.name if participant.province else "",
-                participant.get_stakeholder_type_display(),
-                response.status,
-                response.submitted_at.isoformat() if response.submitted_at else "",
-                response.question_id,
-                json.dumps(response.response_data, ensure_ascii=False),
-            ]
+    if format_type == "csv":
+        result = StreamingHttpResponse(
+            response_export.iter_csv(responses), content_type=content_type
         )
+        result["Content-Disposition"] = f"attachment; filename={filename}"
+        return result
 
-    result = HttpResponse(output.getvalue(), content_type="text/csv")
-    result["Content-Disposition"] = "attachment; filename=workshop_responses.csv"
-    return result
-
-
-def _export_as_xlsx(responses: List[WorkshopResponse]) -> HttpResponse:
-    if Workbook is None:
-        raise RuntimeError("openpyxl is not installed")
-
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Responses"
-    ws.append(
-        [
-            "Participant",
-            "Organization",
-            "Province",
-            "Stakeholder",
-            "Status",
-            "Submitted",
-            "Question",
-            "Response",
-        ]
+    spooled = response_export.spool_export(responses, format_type)
+    return FileResponse(
+        spooled, as_attachment=True, filename=filename, content_type=content_type
     )
 
-    for response in responses:
-        participant = response.participant
-        ws.append(
-            [
-                participant.user.get_full_name() or participant.user.email,
-                participant.office_business_name,
-                participant.province.name if participant.province else "",
-                participant.get_stakeholder_type_display(),
-                response.status,
-                response.submitted_at.isoformat() if response.submitted_at else "",
-                response.question_id,
-                json.dumps(response.response_data, ensure_ascii=False),
-            ]
-        )
-
-    output = io.BytesIO()
-    wb.save(output)
-    output.seek(0)
-
-    response = HttpResponse(
-        output.read(),
-        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    )
-    response["Content-Disposition"] = "attachment; filename=workshop_responses.xlsx"
-    return response
-
-
-def _export_as_pdf(responses: List[WorkshopResponse]) -> HttpResponse:
-    if canvas is None or letter is None:
-        raise RuntimeError("reportlab is not installed")
-
-    buffer = io.BytesIO()
-    pdf = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
-    y = height - 50
-
-    pdf.setFont("Helvetica-Bold", 12)
-    pdf.drawString(40, y, "Workshop Responses")
-    y -= 30
-
-    pdf.setFont("Helvetica", 10)
-    for response in responses:
-        participant = response.participant
-        text = (
-            f"Participant: {participant.user.get_full_name() or participant.user.email}\n"
-            f"Organization: {participant.office_business_name}\n"
-            f"Province: {participant.province.name if participant.province else ''}\n"
-            f"Stakeholder: {participant.get_stakeholder_type_display()}\n"
-            f"Question: {response.question_id}\n"
-            f"Response: {json.dumps(response.response_data, ensure_ascii=False)}\n"
-        )
-        for line in text.split("\n"):
-            pdf.drawString(40, y, line[:95])
-            y -= 14
-            if y < 60:
-                pdf.showPage()
-                y = height - 50
-                pdf.setFont("Helvetica", 10)
-        y -= 10
-
-    pdf.save()
-    buffer.seek(0)
-
-    response = HttpResponse(buffer.getvalue(), content_type="application/pdf")
-    response["Content-Disposition"] = "attachment; filename=workshop_responses.pdf"
-    return response
-
 
 @login_required
 @facilitator_required
@@ -816,18 +670,39 @@ def export_workshop_responses(request, assessment_id, workshop_type, format_type
         WorkshopActivity, assessment=assessment, workshop_type=workshop_type
     )
 
+    if format_type not in response_export.EXPORT_FORMATS:
+        return HttpResponseBadRequest("Unsupported export format")
+
     province_id = request.GET.get("province")
     stakeholder_type = request.GET.get("stakeholder")
 
-    responses = _get_filtered_responses(workshop, province_id, stakeholder_type)
+    responses = response_export.response_export_queryset(
+        workshop, province_id, stakeholder_type
+    )
+
+    if responses.count() > response_export.ASYNC_EXPORT_THRESHOLD:
+        token = response_export.start_export_job(workshop, format_type)
+        task_export_workshop_responses.delay(
+            token, workshop.id, format_type, province_id, stakeholder_type
+        )
+        download_url = reverse(
+            "mana:facilitator_export_download",
+            kwargs={"assessment_id": assessment.id, "token": token},
+        )
+        messages.info(
+            request,
+            format_html(
+                'Large export queued. <a href="{}" class="underline">Download it here</a> once it is ready.',
+                download_url,
+            ),
+        )
+        return redirect(
+            "mana:facilitator_dashboard",
+            assessment_id=str(assessment.id),
+        )
 
     try:
-        if format_type == "csv":
-            return _export_as_csv(responses)
-        if format_type == "xlsx":
-            return _export_as_xlsx(responses)
-        if format_type == "pdf":
-            return _export_as_pdf(responses)
+        return _export_response(responses, format_type)
     except RuntimeError as exc:
         messages.error(request, str(exc))
         return redirect(
@@ -835,7 +710,32 @@ def export_workshop_responses(request, assessment_id, workshop_type, format_type
             assessment_id=str(assessment.id),
         )
 
-    return HttpResponseBadRequest("Unsupported export format")
+
+@login_required
+@facilitator_required
+def download_workshop_export(request, assessment_id, token):
+    assessment = get_object_or_404(Assessment, pk=assessment_id)
+    job = response_export.get_export_job(token)
+    if not job or job.get("assessment_id") != str(assessment.id):
+        raise Http404("Export not found")
+
+    storage = response_export.export_storage()
+    if job["status"] == "ready" and storage.exists(job["path"]):
+        return FileResponse(
+            storage.open(job["path"], "rb"),
+            as_attachment=True,
+            filename=response_export.export_filename(job["format"]),
+            content_type=response_export.EXPORT_FORMATS[job["format"]],
+        )
+
+    if job["status"] == "failed":
+        messages.error(request, job.get("error") or "Export failed.")
+    else:
+        messages.info(request, "Your export is still being prepared. Try again shortly.")
+    return redirect(
+        "mana:facilitator_dashboard",
+        assessment_id=str(assessment.id),
+    )
 
 
 @login_required
@@ -1,6 +1,12 @@
 """Services for MANA module."""
 
+from .participant_import import ParticipantBulkImporter, ParticipantImportResult
 from .workshop_access import WorkshopAccessManager
 from .workshop_synthesis import AIWorkshopSynthesizer
 
-__all__ = ["WorkshopAccessManager", "AIWorkshopSynthesizer"]
+__all__ = [
+    "ParticipantBulkImporter",
+    "ParticipantImportResult",
+    "WorkshopAccessManager",
+    "AIWorkshopSynthesizer",
+]
@@ -0,0 +1,184 @@
+"""Bulk participant import for regional MANA workshops."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission
+from django.db import transaction
+from django.utils.crypto import get_random_string
+
+from common.models import Province
+from common.services.dashboard_metrics import mark_sections_stale, sections_for_model
+
+from ..models import Assessment, WorkshopParticipantAccount
+
+User = get_user_model()
+
+PARTICIPANT_GROUP_NAME = "mana_regional_participant"
+PARTICIPANT_PERMISSION_CODENAMES = ["can_access_regional_mana", "can_view_provincial_obc"]
+
+
+@dataclass
+class ParticipantImportResult:
+    """Outcome of a bulk participant import."""
+
+    created: int = 0
+    skipped_existing: List[str] = field(default_factory=list)
+    skipped_invalid: int = 0
+
+
+def _hash_workers() -> int:
+    configured = getattr(settings, "MANA_IMPORT_HASH_WORKERS", None)
+    return configured or min(8, os.cpu_count() or 1)
+
+
+def hash_passwords(raw_passwords: List[str]) -> List[str]:
+    """Hash passwords in a thread pool.
+
+    The default PBKDF2 hasher runs in ``hashlib``, which releases the GIL,
+    so a thread pool gives real parallelism for large imports.
+    """
+
+    if len(raw_passwords) <= 1:
+        return [make_password(password) for password in raw_passwords]
+
+    with ThreadPoolExecutor(max_workers=_hash_workers()) as executor:
+        return list(executor.map(make_password, raw_passwords))
+
+
+class ParticipantBulkImporter:
+    """Create participant users and workshop accounts in a handful of queries."""
+
+    def __init__(self, assessment: Assessment, created_by):
+        self.assessment = assessment
+        self.created_by = created_by
+
+    def _clean_rows(self, rows: Iterable[Dict], result: ParticipantImportResult) -> List[Dict]:
+        cleaned = []
+        seen = set()
+        for row in rows:
+            email = (row.get("email") or "").strip()
+            if not email or email in seen:
+                result.skipped_invalid += 1
+                continue
+            seen.add(email)
+            cleaned.append({**row, "email": email})
+        return cleaned
+
+    @transaction.atomic
+    def import_rows(self, rows: Iterable[Dict]) -> ParticipantImportResult:
+        """Import CSV ``DictReader`` rows, skipping emails that already exist."""
+
+        result = ParticipantImportResult()
+        rows = self._clean_rows(rows, result)
+
+        existing = set(
+            User.objects.filter(username__in=[row["email"] for row in rows]).values_list(
+                "username", flat=True
+            )
+        )
+        result.skipped_existing = sorted(existing)
+        rows = [row for row in rows if row["email"] not in existing]
+        if not rows:
+            return result
+
+        hashed = hash_passwords(
+            [row.get("password") or get_random_string(length=12) for row in rows]
+        )
+
+        users = User.objects.bulk_create(
+            [
+                User(
+                    username=row["email"],
+                    email=row["email"],
+                    first_name=row.get("first_name", ""),
+                    last_name=row.get("last_name", ""),
+                    password=password,
+                )
+                for row, password in zip(rows, hashed)
+            ]
+        )
+        if any(user.pk is None for user in users):
+            # Backends that cannot return primary keys from bulk inserts.
+            by_username = User.objects.in_bulk(
+                [user.username for user in users], field_name="username"
+            )
+            users = [by_username[user.username] for user in users]
+
+        self._grant_participant_access(users)
+
+        province_ids = {row.get("province_id") for row in rows if row.get("province_id")}
+        province_regions = {
+            str(pk): region_id
+            for pk, region_id in Province.objects.filter(
+                pk__in=province_ids
+            ).values_list("pk", "region_id")
+        }
+
+        WorkshopParticipantAccount.objects.bulk_create(
+            [
+                self._build_account(row, user, province_regions)
+                for row, user in zip(rows, users)
+            ]
+        )
+
+        # bulk_create bypasses post_save, so refresh dependent dashboard counters.
+        mark_sections_stale(sections_for_model(User._meta.label))
+
+        result.created = len(users)
+        return result
+
+    def _build_account(
+        self, row: Dict, user, province_regions: Dict
+    ) -> WorkshopParticipantAccount:
+        province_id = row.get("province_id") or None
+        region_id = row.get("region_id") or None
+        if not region_id and province_id:
+            region_id = province_regions.get(str(province_id))
+
+        return WorkshopParticipantAccount(
+            assessment=self.assessment,
+            user=user,
+            stakeholder_type=row.get("stakeholder_type", "other"),
+            region_id=region_id,
+            province_id=province_id,
+            municipality_id=row.get("municipality_id") or None,
+            barangay_id=row.get("barangay_id") or None,
+            office_business_name=(
+                row.get("office_business_name") or row.get("organization", "")
+            ),
+            created_by=self.created_by,
+            current_workshop="workshop_1",
+            completed_workshops=[],
+            consent_given=False,
+            profile_completed=False,
+        )
+
+    def _grant_participant_access(self, users: List) -> None:
+        group, _ = Group.objects.get_or_create(name=PARTICIPANT_GROUP_NAME)
+        permission_ids = list(
+            Permission.objects.filter(
+                codename__in=PARTICIPANT_PERMISSION_CODENAMES
+            ).values_list("pk", flat=True)
+        )
+
+        GroupLink = User.groups.through
+        PermissionLink = User.user_permissions.through
+        GroupLink.objects.bulk_create(
+            [GroupLink(user_id=user.pk, group_id=group.pk) for user in users],
+            ignore_conflicts=True,
+        )
+        PermissionLink.objects.bulk_create(
+            [
+                PermissionLink(user_id=user.pk, permission_id=permission_id)
+                for user in users
+                for permission_id in permission_ids
+            ],
+            ignore_conflicts=True,
+        )
+
@@ -0,0 +1,274 @@
+"""Constant-memory workshop response exports (CSV, XLSX and PDF).
+
+Rows are read with ``select_related`` and ``.iterator()`` so only one chunk
+of responses is held in memory at a time. CSV is streamed to the client as
+it is produced; XLSX (openpyxl write-only mode) and PDF are spooled to a
+temporary file. Exports above ``ASYNC_EXPORT_THRESHOLD`` rows are written to
+default storage by a background task and fetched through a download link.
+"""
+
+import csv
+import json
+import logging
+import os
+import tempfile
+import uuid
+from datetime import timedelta
+from typing import IO, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.utils import timezone
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # pragma: no cover - handled gracefully at runtime
+    Workbook = None
+
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+except ImportError:  # pragma: no cover
+    canvas = None
+    letter = None
+
+from ..models import WorkshopActivity, WorkshopResponse
+
+logger = logging.getLogger(__name__)
+
+EXPORT_HEADERS = [
+    "Participant",
+    "Organization",
+    "Province",
+    "Stakeholder",
+    "Status",
+    "Submitted",
+    "Question",
+    "Response",
+]
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "pdf": "application/pdf",
+}
+
+ASYNC_EXPORT_THRESHOLD = getattr(settings, "MANA_EXPORT_ASYNC_THRESHOLD", 5000)
+ITERATOR_CHUNK_SIZE = 2000
+EXPORT_JOB_TTL = 60 * 60 * 24
+EXPORT_STORAGE_DIR = "mana_exports"
+
+
+def export_filename(format_type: str) -> str:
+    return f"workshop_responses.{format_type}"
+
+
+def response_export_queryset(
+    workshop: WorkshopActivity,
+    province_id: Optional[str] = None,
+    stakeholder_type: Optional[str] = None,
+):
+    """Responses to export, with every column reachable without extra queries."""
+
+    responses = WorkshopResponse.objects.filter(workshop=workshop).select_related(
+        "participant__user",
+        "participant__province",
+    )
+    if province_id:
+        responses = responses.filter(participant__province_id=province_id)
+    if stakeholder_type:
+        responses = responses.filter(participant__stakeholder_type=stakeholder_type)
+    return responses.order_by("pk")
+
+
+def _iter_rows(responses) -> Iterator[List[str]]:
+    for response in responses.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        participant = response.participant
+        yield [
+            participant.user.get_full_name() or participant.user.email,
+            participant.office_business_name,
+            participant.province.name if participant.province else "",
+            participant.get_stakeholder_type_display(),
+            response.status,
+            response.submitted_at.isoformat() if response.submitted_at else "",
+            response.question_id,
+            json.dumps(response.response_data, ensure_ascii=False),
+        ]
+
+
+class _Echo:
+    """File-like object whose ``write`` hands the encoded line back."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(responses) -> Iterator[str]:
+    """Yield CSV lines for ``responses`` one row at a time."""
+
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_HEADERS)
+    for row in _iter_rows(responses):
+        yield writer.writerow(row)
+
+
+def write_csv(responses, fileobj: IO[bytes]) -> None:
+    for line in iter_csv(responses):
+        fileobj.write(line.encode("utf-8"))
+
+
+def write_xlsx(responses, fileobj: IO[bytes]) -> None:
+    if Workbook is None:
+        raise RuntimeError("openpyxl is not installed")
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title="Responses")
+    ws.append(EXPORT_HEADERS)
+    for row in _iter_rows(responses):
+        ws.append(row)
+    wb.save(fileobj)
+
+
+def write_pdf(responses, fileobj: IO[bytes]) -> None:
+    if canvas is None or letter is None:
+        raise RuntimeError("reportlab is not installed")
+
+    pdf = canvas.Canvas(fileobj, pagesize=letter)
+    width, height = letter
+    y = height - 50
+
+    pdf.setFont("Helvetica-Bold", 12)
+    pdf.drawString(40, y, "Workshop Responses")
+    y -= 30
+
+    pdf.setFont("Helvetica", 10)
+    for participant, organization, province, stakeholder, _, _, question, answer in _iter_rows(
+        responses
+    ):
+        lines = [
+            f"Participant: {participant}",
+            f"Organization: {organization}",
+            f"Province: {province}",
+            f"Stakeholder: {stakeholder}",
+            f"Question: {question}",
+            f"Response: {answer}",
+        ]
+        for line in lines:
+            pdf.drawString(40, y, line[:95])
+            y -= 14
+            if y < 60:
+                pdf.showPage()
+                y = height - 50
+                pdf.setFont("Helvetica", 10)
+        y -= 24
+
+    pdf.save()
+
+
+WRITERS = {
+    "csv": write_csv,
+    "xlsx": write_xlsx,
+    "pdf": write_pdf,
+}
+
+
+def spool_export(responses, format_type: str) -> IO[bytes]:
+    """Write an export to a temporary file and return it rewound."""
+
+    spooled = tempfile.TemporaryFile()
+    try:
+        WRITERS[format_type](responses, spooled)
+    except Exception:
+        spooled.close()
+        raise
+    spooled.seek(0)
+    return spooled
+
+
+# ---------------------------------------------------------------------------
+# Background exports
+# ---------------------------------------------------------------------------
+
+
+def export_storage() -> FileSystemStorage:
+    """
+    Private storage for background exports.
+
+    Exports contain participant details, so they live under
+    ``PRIVATE_MEDIA_ROOT`` (not MEDIA) and are only served through the
+    facilitator download view.
+    """
+
+    return FileSystemStorage(
+        location=os.path.join(settings.PRIVATE_MEDIA_ROOT, EXPORT_STORAGE_DIR),
+        base_url=None,
+    )
+
+
+def _job_cache_key(token: str) -> str:
+    return f"mana:export_job:{token}"
+
+
+def start_export_job(workshop: WorkshopActivity, format_type: str) -> str:
+    """Register a background export and return its download token."""
+
+    token = uuid.uuid4().hex
+    cache.set(
+        _job_cache_key(token),
+        {
+            "status": "pending",
+            "assessment_id": str(workshop.assessment_id),
+            "format": format_type,
+        },
+        EXPORT_JOB_TTL,
+    )
+    return token
+
+
+def get_export_job(token: str) -> Optional[dict]:
+    return cache.get(_job_cache_key(token))
+
+
+def run_export_job(
+    token: str,
+    workshop_id: int,
+    format_type: str,
+    province_id: Optional[str] = None,
+    stakeholder_type: Optional[str] = None,
+) -> Optional[str]:
+    """Write the export to default storage and mark the job ready (or failed)."""
+
+    job = get_export_job(token) or {}
+
+    try:
+        workshop = WorkshopActivity.objects.get(pk=workshop_id)
+        responses = response_export_queryset(workshop, province_id, stakeholder_type)
+        with spool_export(responses, format_type) as spooled:
+            path = export_storage().save(f"{token}.{format_type}", File(spooled))
+    except Exception as exc:
+        logger.exception("Workshop response export %s failed", token)
+        job.update(status="failed", error=str(exc))
+        cache.set(_job_cache_key(token), job, EXPORT_JOB_TTL)
+        return None
+
+    job.update(status="ready", path=path)
+    cache.set(_job_cache_key(token), job, EXPORT_JOB_TTL)
+    return path
+
+
+def delete_expired_exports() -> int:
+    """Delete exports older than their download link; return the count."""
+
+    storage = export_storage()
+    if not os.path.isdir(storage.location):
+        return 0
+
+    cutoff = timezone.now() - timedelta(seconds=EXPORT_JOB_TTL)
+    deleted = 0
+    for name in storage.listdir("")[1]:
+        if storage.get_modified_time(name) < cutoff:
+            storage.delete(name)
+            deleted += 1
+    return deleted
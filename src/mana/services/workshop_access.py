@@ -192,63 +192,78 @@ class WorkshopAccessManager:
         2. If participant completed previous workshop, update current_workshop
         3. Log the advancement action
 
+        Runs as two set-based ``update()`` calls plus one ``bulk_create`` for
+        the access logs, so query count does not grow with cohort size.
+
         Returns count of participants advanced.
         """
-        participants = WorkshopParticipantAccount.objects.filter(
-            assessment=self.assessment
-        )
-
         try:
             target_index = self.WORKSHOP_SEQUENCE.index(workshop_type)
         except ValueError:
             return 0
 
-        count = 0
+        participants = WorkshopParticipantAccount.objects.filter(
+            assessment=self.assessment
+        )
+        rows = list(participants.values_list("pk", "completed_workshops"))
+        if not rows:
+            return 0
+
+        participant_ids = [pk for pk, _ in rows]
+
+        # Participants who finished the previous workshop move onto this one
+        # (everyone does for the first workshop).
+        if target_index > 0:
+            prev_workshop = self.WORKSHOP_SEQUENCE[target_index - 1]
+            moving_ids = [
+                pk for pk, completed in rows if prev_workshop in (completed or [])
+            ]
+        else:
+            moving_ids = participant_ids
+
+        now = timezone.now()
+        moving = set(moving_ids)
+        staying_ids = [pk for pk in participant_ids if pk not in moving]
+        if moving_ids:
+            participants.filter(pk__in=moving_ids).update(
+                facilitator_advanced_to=workshop_type,
+                current_workshop=workshop_type,
+                updated_at=now,
+            )
+        if staying_ids:
+            participants.filter(pk__in=staying_ids).update(
+                facilitator_advanced_to=workshop_type,
+                updated_at=now,
+            )
+
+        # Log advancement
         workshop = WorkshopActivity.objects.filter(
             assessment=self.assessment, workshop_type=workshop_type
         ).first()
-
-        for participant in participants:
-            # Update facilitator_advanced_to (max accessible)
-            participant.facilitator_advanced_to = workshop_type
-
-            # If participant completed previous workshop, move them to this one
-            if target_index > 0:
-                prev_workshop = self.WORKSHOP_SEQUENCE[target_index - 1]
-                if prev_workshop in (participant.completed_workshops or []):
-                    participant.current_workshop = workshop_type
-            else:
-                # First workshop, always set as current
-                participant.current_workshop = workshop_type
-
-            participant.save(
-                update_fields=[
-                    "facilitator_advanced_to",
-                    "current_workshop",
-                    "updated_at",
-                ]
+        if workshop:
+            metadata = {
+                "advanced_by": (
+                    by_user.get_full_name()
+                    if hasattr(by_user, "get_full_name")
+                    else str(by_user)
+                ),
+                "to_workshop": workshop_type,
+                "bulk_advancement": True,
+            }
+            WorkshopAccessLog.objects.bulk_create(
+                [
+                    WorkshopAccessLog(
+                        participant_id=participant_id,
+                        workshop=workshop,
+                        action_type="unlock",
+                        metadata=metadata,
+                    )
+                    for participant_id in participant_ids
+                ],
+                batch_size=500,
             )
 
-            # Log advancement
-            if workshop:
-                WorkshopAccessLog.objects.create(
-                    participant=participant,
-                    workshop=workshop,
-                    action_type="unlock",
-                    metadata={
-                        "advanced_by": (
-                            by_user.get_full_name()
-                            if hasattr(by_user, "get_full_name")
-                            else str(by_user)
-                        ),
-                        "to_workshop": workshop_type,
-                        "bulk_advancement": True,
-                    },
-                )
-
-            count += 1
-
-        return count
+        return len(participant_ids)
 
     @transaction.atomic
     def reset_participant_progress(
@@ -22,6 +22,7 @@ from django.contrib.auth import get_user_model
 from django.core.cache import cache
 
 from .models import Assessment, WorkshopActivity
+from .services import response_export
 from .services.workshop_access import WorkshopAccessManager
 from .services.workshop_synthesis import AIWorkshopSynthesizer
 
@@ -62,6 +63,26 @@ def generate_workshop_synthesis(
     }
 
 
+@shared_task
+def export_workshop_responses(
+    token: str,
+    workshop_id: int,
+    format_type: str,
+    province_id: str | None = None,
+    stakeholder_type: str | None = None,
+) -> str | None:
+    """Write a large workshop response export to storage for later download."""
+    return response_export.run_export_job(
+        token, workshop_id, format_type, province_id, stakeholder_type
+    )
+
+
+@shared_task(name="mana.cleanup_workshop_exports")
+def cleanup_workshop_exports() -> int:
+    """Delete background workshop exports whose download link has expired."""
+    return response_export.delete_expired_exports()
+
+
 @shared_task
 def analyze_workshop_responses(workshop_id: int) -> dict:
     """
@@ -122,6 +122,30 @@ class TestResponseAnalyzer(TestCase):
         self.assertEqual(len(result["action_items"]), 2)
         self.assertGreaterEqual(result["confidence"], 0.8)
 
+    @patch("mana.ai_services.response_analyzer.GeminiService")
+    def test_analyze_questions_in_one_batch(self, mock_service):
+        """Test that uncached questions are analyzed in a single batch"""
+        mock_service.return_value.generate_batch.side_effect = lambda prompts, **kwargs: [
+            {"success": True, "text": json.dumps({"summary": "Analyzed"})}
+            for _ in prompts
+        ]
+
+        result = self.analyzer.analyze_questions(
+            {
+                1: ("What are the health concerns?", ["No clinic nearby"]),
+                2: ("What are the education concerns?", ["No school nearby"]),
+                3: ("Any other concerns?", []),
+            }
+        )
+
+        self.assertEqual(mock_service.return_value.generate_batch.call_count, 1)
+        self.assertEqual(
+            len(mock_service.return_value.generate_batch.call_args[0][0]), 2
+        )
+        self.assertEqual(result[1]["summary"], "Analyzed")
+        self.assertEqual(result[2]["summary"], "Analyzed")
+        self.assertEqual(result[3]["summary"], "No responses available")
+
     def test_analyze_empty_responses(self):
         """Test handling of empty responses"""
         result = self.analyzer.analyze_question_responses("Test question?", [])
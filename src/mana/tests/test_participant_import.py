@@ -0,0 +1,100 @@
+"""Tests for bulk facilitator participant imports."""
+
+import csv
+import io
+from datetime import date
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+
+from common.models import Province, Region
+from mana.models import Assessment, AssessmentCategory, WorkshopParticipantAccount
+from mana.services.participant_import import (
+    PARTICIPANT_GROUP_NAME,
+    ParticipantBulkImporter,
+)
+
+User = get_user_model()
+
+
+@pytest.fixture
+def assessment(db):
+    facilitator = User.objects.create_user(
+        username="facilitator@test.com",
+        email="facilitator@test.com",
+        password="testpass",
+        is_staff=True,
+    )
+    category = AssessmentCategory.objects.create(
+        name="Regional MANA", category_type="needs_assessment"
+    )
+    region = Region.objects.create(code="IX", name="Zamboanga Peninsula")
+    province = Province.objects.create(code="ZAM", name="Zamboanga del Sur", region=region)
+    return Assessment.objects.create(
+        title="Regional Assessment 2025",
+        category=category,
+        description="Test assessment",
+        objectives="Test objectives",
+        assessment_level="regional",
+        primary_methodology="workshop",
+        status="data_collection",
+        priority="high",
+        planned_start_date=date(2025, 1, 1),
+        planned_end_date=date(2025, 1, 10),
+        created_by=facilitator,
+        lead_assessor=facilitator,
+        province=province,
+    )
+
+
+def _rows(text):
+    return csv.DictReader(io.StringIO(text))
+
+
+@pytest.mark.django_db
+def test_import_creates_users_accounts_and_group_links(assessment, settings):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    User.objects.create_user(username="existing@test.com", password="x")
+    province = assessment.province
+    lines = ["email,first_name,last_name,province_id,password"]
+    lines += [f"p{i}@test.com,P{i},Participant,{province.pk},secret{i}" for i in range(5)]
+    lines += [
+        f"existing@test.com,Ex,Isting,{province.pk},",
+        f",No,Email,{province.pk},",
+        f"p0@test.com,Dup,Row,{province.pk},",
+    ]
+
+    result = ParticipantBulkImporter(assessment, assessment.created_by).import_rows(
+        _rows("\n".join(lines))
+    )
+
+    assert result.created == 5
+    assert result.skipped_existing == ["existing@test.com"]
+    assert result.skipped_invalid == 2
+
+    accounts = WorkshopParticipantAccount.objects.filter(assessment=assessment)
+    assert accounts.count() == 5
+    assert set(accounts.values_list("region_id", flat=True)) == {province.region_id}
+
+    user = User.objects.get(username="p3@test.com")
+    assert user.check_password("secret3")
+    assert user.groups.filter(name=PARTICIPANT_GROUP_NAME).exists()
+    assert Group.objects.get(name=PARTICIPANT_GROUP_NAME).user_set.count() == 5
+
+
+@pytest.mark.django_db
+def test_import_query_count_does_not_grow_with_rows(
+    assessment, settings, django_assert_max_num_queries
+):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    province_id = assessment.province_id
+    lines = ["email,first_name,last_name,province_id"]
+    lines += [f"bulk{i}@test.com,B{i},Participant,{province_id}" for i in range(40)]
+
+    with django_assert_max_num_queries(16):
+        result = ParticipantBulkImporter(assessment, assessment.created_by).import_rows(
+            _rows("\n".join(lines))
+        )
+
+    assert result.created == 40
@@ -1,10 +1,12 @@
 import json
+import os
 from datetime import date, time
 
 import pytest
 
 try:
     from django.contrib.auth import get_user_model
+    from django.core.files.base import ContentFile
     from django.urls import reverse
 except ImportError:  # pragma: no cover - handled via skip
     pytest.skip(
@@ -250,3 +252,107 @@ def test_export_workshop_responses_csv(client, assessment_setup, participant_acc
     response = client.get(url)
     assert response.status_code == 200
     assert response["Content-Type"] == "text/csv"
+    body = b"".join(response.streaming_content).decode("utf-8")
+    assert body.splitlines()[0].startswith("Participant,Organization")
+    assert "w1_q1" in body
+
+
+@pytest.mark.django_db
+def test_export_workshop_responses_xlsx_uses_constant_queries(
+    client, assessment_setup, participant_account, django_assert_max_num_queries
+):
+    from io import BytesIO
+
+    from openpyxl import load_workbook
+
+    facilitator = assessment_setup["facilitator"]
+    client.force_login(facilitator)
+    for index in range(5):
+        WorkshopResponse.objects.create(
+            participant=participant_account,
+            workshop=assessment_setup["workshop"],
+            question_id=f"w1_q{index}",
+            response_data="Sample",
+            status="submitted",
+        )
+
+    url = reverse(
+        "mana:facilitator_export_workshop",
+        args=[assessment_setup["assessment"].id, "workshop_1", "xlsx"],
+    )
+    with django_assert_max_num_queries(12):
+        response = client.get(url)
+        content = b"".join(response.streaming_content)
+
+    assert response.status_code == 200
+    rows = list(load_workbook(BytesIO(content)).active.values)
+    assert len(rows) == 6
+
+
+@pytest.mark.django_db
+def test_large_export_is_offloaded_to_download_link(
+    client, assessment_setup, participant_account, monkeypatch, settings, tmp_path
+):
+    from mana.services import response_export
+
+    settings.MEDIA_ROOT = tmp_path / "media"
+    settings.PRIVATE_MEDIA_ROOT = tmp_path / "private"
+    monkeypatch.setattr(response_export, "ASYNC_EXPORT_THRESHOLD", 0)
+    client.force_login(assessment_setup["facilitator"])
+    WorkshopResponse.objects.create(
+        participant=participant_account,
+        workshop=assessment_setup["workshop"],
+        question_id="w1_q1",
+        response_data="Sample",
+        status="submitted",
+    )
+
+    url = reverse(
+        "mana:facilitator_export_workshop",
+        args=[assessment_setup["assessment"].id, "workshop_1", "csv"],
+    )
+    response = client.get(url)
+    assert response.status_code == 302
+
+    message = next(iter(response.wsgi_request._messages))
+    download_url = str(message).split('href="')[1].split('"')[0]
+    download = client.get(download_url)
+    assert download.status_code == 200
+    assert b"w1_q1" in b"".join(download.streaming_content)
+    assert not (tmp_path / "media").exists()
+
+    client.logout()
+    assert client.get(download_url).status_code == 302
+
+
+@pytest.mark.django_db
+def test_failed_export_job_is_marked_failed(assessment_setup, monkeypatch):
+    from mana.services import response_export
+
+    def fail(*args, **kwargs):
+        raise OSError("storage unavailable")
+
+    monkeypatch.setattr(response_export.FileSystemStorage, "save", fail)
+    token = response_export.start_export_job(assessment_setup["workshop"], "csv")
+
+    path = response_export.run_export_job(token, assessment_setup["workshop"].id, "csv")
+
+    assert path is None
+    job = response_export.get_export_job(token)
+    assert job["status"] == "failed"
+    assert job["error"] == "storage unavailable"
+
+
+def test_expired_exports_are_deleted(settings, tmp_path):
+    from mana.services import response_export
+
+    settings.PRIVATE_MEDIA_ROOT = tmp_path
+    storage = response_export.export_storage()
+    old = storage.save("old.csv", ContentFile(b"old"))
+    fresh = storage.save("fresh.csv", ContentFile(b"fresh"))
+    expired = storage.get_modified_time(old).timestamp() - response_export.EXPORT_JOB_TTL - 60
+    os.utime(storage.path(old), (expired, expired))
+
+    assert response_export.delete_expired_exports() == 1
+    assert not storage.exists(old)
+    assert storage.exists(fresh)
@@ -399,3 +399,56 @@ class TestWorkshopAccessControl:
             workshop__workshop_type="workshop_4",
         )
         assert logs.exists()
+
+
+@pytest.mark.django_db
+class TestBulkAdvancement:
+    """Bulk advancement runs set-based regardless of cohort size."""
+
+    def _add_participants(self, env, count, completed):
+        for index in range(count):
+            user = User.objects.create_user(
+                username=f"bulk{index}@test.com",
+                email=f"bulk{index}@test.com",
+                password="testpass",
+            )
+            WorkshopParticipantAccount.objects.create(
+                user=user,
+                assessment=env["assessment"],
+                stakeholder_type="youth_leader",
+                region=env["province"].region,
+                office_business_name="Youth Org",
+                province=env["province"],
+                created_by=env["facilitator"],
+                current_workshop="workshop_1",
+                completed_workshops=completed,
+                consent_given=True,
+                profile_completed=True,
+            )
+
+    def test_only_participants_who_finished_previous_move(
+        self, setup_workshop_environment, django_assert_max_num_queries
+    ):
+        env = setup_workshop_environment
+        self._add_participants(env, 10, ["workshop_1"])
+        manager = WorkshopAccessManager(env["assessment"])
+
+        with django_assert_max_num_queries(8):
+            count = manager.advance_all_participants("workshop_2", env["facilitator"])
+
+        assert count == 11
+        accounts = WorkshopParticipantAccount.objects.filter(
+            assessment=env["assessment"]
+        )
+        assert set(accounts.values_list("facilitator_advanced_to", flat=True)) == {
+            "workshop_2"
+        }
+        assert accounts.filter(current_workshop="workshop_2").count() == 10
+        env["participant"].refresh_from_db()
+        assert env["participant"].current_workshop == "workshop_1"
+        assert (
+            WorkshopAccessLog.objects.filter(
+                action_type="unlock", metadata__bulk_advancement=True
+            ).count()
+            == 11
+        )
@@ -96,6 +96,11 @@ urlpatterns = [
         facilitator_views.approve_synthesis,
         name="facilitator_approve_synthesis",
     ),
+    path(
+        "assessments/<uuid:assessment_id>/facilitator/exports/download/<str:token>/",
+        facilitator_views.download_workshop_export,
+        name="facilitator_export_download",
+    ),
     path(
         "assessments/<uuid:assessment_id>/facilitator/exports/<str:workshop_type>/<str:format_type>/",
         facilitator_views.export_workshop_responses,
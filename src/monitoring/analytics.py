@@ -6,9 +6,111 @@ Part of Phase 7: Analytics & Forecasting.
 
 from decimal import Decimal
 from datetime import datetime, timedelta
-from django.db.models import Sum, Avg, Count, Q, F
+from django.core.cache import cache
+from django.db.models import Sum, Count, Q, F
+from django.db.models.functions import ExtractYear
 from django.utils import timezone
 
+BUDGET_ROLLUP_CACHE_KEY = "monitoring:budget_rollup"
+BUDGET_ROLLUP_CACHE_TIMEOUT = 300  # seconds
+BUDGET_ROLLUP_SOURCE = "monitoring.MonitoringEntry"
+
+ROLLUP_MEASURES = (
+    "total_budget",
+    "ppas_count",
+    "budgeted_count",
+    "completed",
+    "ongoing",
+    "planned",
+    "total_slots",
+)
+
+
+def fiscal_data_version():
+    """Generation of the PPA data, bumped by ``common.signals`` on every write."""
+    from common.services.cache_generations import model_generations
+
+    return model_generations([BUDGET_ROLLUP_SOURCE])[BUDGET_ROLLUP_SOURCE]
+
+
+def budget_rollup():
+    """
+    Return PPA budget totals grouped by start year, sector and funding source.
+
+    Computed with a single ``GROUP BY`` query and cached per fiscal-data
+    version, so every analytics function below shares one database hit
+    until a MonitoringEntry changes. Rows are shared with the cache and
+    must not be mutated.
+
+    Returns:
+        list: Dicts with ``year``, ``sector``, ``funding_source`` and the
+        ``ROLLUP_MEASURES`` totals
+    """
+    from monitoring.models import MonitoringEntry
+
+    key = f"{BUDGET_ROLLUP_CACHE_KEY}:{fiscal_data_version()}"
+    rows = cache.get(key)
+    if rows is not None:
+        return rows
+
+    rows = list(
+        MonitoringEntry.objects.annotate(year=ExtractYear("start_date"))
+        .values("year", "sector", "funding_source")
+        .annotate(
+            total_budget=Sum("budget_allocation"),
+            ppas_count=Count("id"),
+            budgeted_count=Count("budget_allocation"),
+            completed=Count("id", filter=Q(status="completed")),
+            ongoing=Count("id", filter=Q(status="ongoing")),
+            planned=Count("id", filter=Q(status="planned")),
+            total_slots=Sum("total_slots"),
+        )
+        .order_by()
+    )
+    for row in rows:
+        row["total_budget"] = row["total_budget"] or Decimal("0")
+        row["total_slots"] = row["total_slots"] or 0
+
+    cache.set(key, rows, BUDGET_ROLLUP_CACHE_TIMEOUT)
+    return rows
+
+
+def rollup_by(*dimensions, rows=None):
+    """
+    Re-aggregate budget rollup rows over a subset of their dimensions.
+
+    Args:
+        *dimensions: Any of ``"year"``, ``"sector"``, ``"funding_source"``
+        rows: Rollup rows to combine (default: ``budget_rollup()``)
+
+    Returns:
+        dict: Dimension value (tuple when several) -> measure totals, with
+        ``avg_budget`` averaged over PPAs that have a budget
+    """
+    groups = {}
+    for row in budget_rollup() if rows is None else rows:
+        values = tuple(row[dimension] for dimension in dimensions)
+        group_key = values[0] if len(values) == 1 else values
+        group = groups.setdefault(group_key, dict.fromkeys(ROLLUP_MEASURES, 0))
+        for measure in ROLLUP_MEASURES:
+            group[measure] += row[measure]
+
+    for group in groups.values():
+        group["total_budget"] = Decimal(group["total_budget"])
+        group["avg_budget"] = (
+            group["total_budget"] / group["budgeted_count"]
+            if group["budgeted_count"]
+            else Decimal("0")
+        )
+    return groups
+
+
+def _yearly_totals(start_year, end_year):
+    by_year = rollup_by("year")
+    empty = dict.fromkeys(ROLLUP_MEASURES, 0)
+    empty["avg_budget"] = 0
+    return [(year, by_year.get(year, empty)) for year in range(start_year, end_year + 1)]
+
 
 def calculate_budget_trends(years=5):
     """
@@ -17,8 +119,6 @@ def calculate_budget_trends(years=5):
     Returns:
         dict: Trend data including totals, growth rates, sector breakdowns
     """
-    from monitoring.models import MonitoringEntry
-
     current_year = timezone.now().year
     start_year = current_year - years
 
@@ -30,17 +130,19 @@ def calculate_budget_trends(years=5):
         "sectors": {},
     }
 
-    for year in range(start_year, current_year + 1):
-        year_data = MonitoringEntry.objects.filter(start_date__year=year).aggregate(
-            total=Sum("budget_allocation"),
-            count=Count("id"),
-            avg=Avg("budget_allocation"),
-        )
-
+    for year, year_data in _yearly_totals(start_year, current_year):
         trends["years"].append(year)
-        trends["total_budget"].append(float(year_data["total"] or 0))
-        trends["ppas_count"].append(year_data["count"] or 0)
-        trends["avg_budget_per_ppa"].append(float(year_data["avg"] or 0))
+        trends["total_budget"].append(float(year_data["total_budget"]))
+        trends["ppas_count"].append(year_data["ppas_count"])
+        trends["avg_budget_per_ppa"].append(float(year_data["avg_budget"]))
+
+    # Per-sector budget series over the same years
+    by_year_sector = rollup_by("year", "sector")
+    for year, sector in sorted(by_year_sector, key=lambda k: (k[1], k[0] or 0)):
+        if not sector or year is None or not start_year <= year <= current_year:
+            continue
+        series = trends["sectors"].setdefault(sector, [0.0] * len(trends["years"]))
+        series[year - start_year] = float(by_year_sector[(year, sector)]["total_budget"])
 
     # Calculate year-over-year growth
     trends["growth_rates"] = []
@@ -68,7 +170,6 @@ def forecast_budget_needs(horizon_years=3):
     Returns:
         dict: Forecast data with projected budgets
     """
-    from monitoring.models import MonitoringEntry
     import statistics
 
     current_year = timezone.now().year
@@ -77,16 +178,10 @@ def forecast_budget_needs(horizon_years=3):
     historical_years = 5
     start_year = current_year - historical_years
 
-    historical_budgets = []
-    for year in range(start_year, current_year + 1):
-        total = (
-            MonitoringEntry.objects.filter(start_date__year=year).aggregate(
-                Sum("budget_allocation")
-            )["budget_allocation__sum"]
-            or 0
-        )
-
-        historical_budgets.append(float(total))
+    historical_budgets = [
+        float(totals["total_budget"])
+        for _, totals in _yearly_totals(start_year, current_year)
+    ]
 
     # Simple linear regression
     if len(historical_budgets) >= 3:
@@ -139,26 +234,15 @@ def analyze_sector_performance():
     Returns:
         list: Sector performance metrics
     """
-    from monitoring.models import MonitoringEntry
-
-    sectors = (
-        MonitoringEntry.objects.values("sector")
-        .annotate(
-            total_budget=Sum("budget_allocation"),
-            ppas_count=Count("id"),
-            avg_budget=Avg("budget_allocation"),
-            completed=Count("id", filter=Q(status="completed")),
-            ongoing=Count("id", filter=Q(status="ongoing")),
-            planned=Count("id", filter=Q(status="planned")),
-        )
-        .order_by("-total_budget")
-    )
+    sectors = rollup_by("sector")
 
     sector_performance = []
-    total_budget_all = sum(s["total_budget"] or 0 for s in sectors)
+    total_budget_all = sum(s["total_budget"] for s in sectors.values())
 
-    for sector in sectors:
-        if sector["sector"]:
+    for sector_name, sector in sorted(
+        sectors.items(), key=lambda item: item[1]["total_budget"], reverse=True
+    ):
+        if sector_name:
             completion_rate = 0
             if sector["ppas_count"] > 0:
                 completion_rate = (sector["completed"] / sector["ppas_count"]) * 100
@@ -169,11 +253,11 @@ def analyze_sector_performance():
 
             sector_performance.append(
                 {
-                    "sector": sector["sector"],
-                    "total_budget": float(sector["total_budget"] or 0),
+                    "sector": sector_name,
+                    "total_budget": float(sector["total_budget"]),
                     "budget_share": round(budget_share, 2),
                     "ppas_count": sector["ppas_count"],
-                    "avg_budget": float(sector["avg_budget"] or 0),
+                    "avg_budget": float(sector["avg_budget"]),
                     "completed": sector["completed"],
                     "ongoing": sector["ongoing"],
                     "planned": sector["planned"],
@@ -194,19 +278,11 @@ def calculate_impact_metrics():
     from monitoring.models import MonitoringEntry
     from mana.models import Need
 
-    total_ppas = MonitoringEntry.objects.count()
-    active_ppas = MonitoringEntry.objects.filter(status="ongoing").count()
-
-    total_beneficiaries = (
-        MonitoringEntry.objects.aggregate(Sum("total_slots"))["total_slots__sum"] or 0
-    )
-
-    total_budget = (
-        MonitoringEntry.objects.aggregate(Sum("budget_allocation"))[
-            "budget_allocation__sum"
-        ]
-        or 0
-    )
+    overall = rollup_by().get((), dict.fromkeys(ROLLUP_MEASURES, 0))
+    total_ppas = overall["ppas_count"]
+    active_ppas = overall["ongoing"]
+    total_beneficiaries = overall["total_slots"]
+    total_budget = overall["total_budget"]
 
     # Needs addressed
     total_needs = Need.objects.count()
@@ -41,7 +41,7 @@ def export_aip_summary_excel(request):
         "submitted_by_community",
         "coverage_region",
         "coverage_province",
-    ).prefetch_related("funding_flows")
+    ).with_funding_totals()
 
     if plan_year:
         entries = entries.filter(plan_year=plan_year)
@@ -7,12 +7,38 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction
-from django.db.models import F, Q, Sum
+from django.db.models import DecimalField, F, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 
 from common.validators import validate_document_file
 
 ZERO_DECIMAL = Decimal("0.00")
 
+# Tranche type -> attribute set by MonitoringEntryQuerySet.with_funding_totals()
+FUNDING_TOTAL_ANNOTATIONS = {
+    "allocation": "total_allocations_sum",
+    "obligation": "total_obligations_sum",
+    "disbursement": "total_disbursements_sum",
+}
+
+
+def _funding_total_subquery(tranche_type):
+    """Correlated sum of an entry's tranches of ``tranche_type``."""
+    totals = (
+        MonitoringEntryFunding.objects.filter(
+            entry=OuterRef("pk"), tranche_type=tranche_type
+        )
+        .order_by()
+        .values("entry")
+        .annotate(total=Sum("amount"))
+        .values("total")
+    )
+    return Coalesce(
+        Subquery(totals[:1]),
+        Value(ZERO_DECIMAL),
+        output_field=DecimalField(max_digits=16, decimal_places=2),
+    )
+
 
 class MonitoringEntryQuerySet(models.QuerySet):
     """Custom queryset for MonitoringEntry with common filters and optimizations."""
@@ -49,20 +75,20 @@ class MonitoringEntryQuerySet(models.QuerySet):
         )
 
     def with_funding_totals(self):
-        """Annotate with funding total calculations."""
+        """
+        Annotate with funding total calculations.
+
+        Entries loaded from the annotated queryset answer
+        ``total_allocations``/``total_obligations``/``total_disbursements``
+        (and the rates derived from them) without further queries. The sums
+        are correlated subqueries rather than joins, so they compose with
+        other annotations, ``values()`` grouping and ``aggregate()``.
+        """
         return self.annotate(
-            total_allocations_sum=Sum(
-                "funding_flows__amount",
-                filter=Q(funding_flows__tranche_type="allocation"),
-            ),
-            total_obligations_sum=Sum(
-                "funding_flows__amount",
-                filter=Q(funding_flows__tranche_type="obligation"),
-            ),
-            total_disbursements_sum=Sum(
-                "funding_flows__amount",
-                filter=Q(funding_flows__tranche_type="disbursement"),
-            ),
+            **{
+                attribute: _funding_total_subquery(tranche_type)
+                for tranche_type, attribute in FUNDING_TOTAL_ANNOTATIONS.items()
+            }
         )
 
     def active(self):
@@ -921,7 +947,23 @@ class MonitoringEntry(models.Model):
             raise ValidationError(errors)
 
     def funding_total(self, tranche_type: str) -> float:
-        """Return total amount recorded for a funding tranche type."""
+        """
+        Return total amount recorded for a funding tranche type.
+
+        Served from the ``with_funding_totals()`` annotation or prefetched
+        ``funding_flows`` when available; otherwise runs an aggregate query.
+        """
+
+        attribute = FUNDING_TOTAL_ANNOTATIONS.get(tranche_type)
+        if attribute and attribute in self.__dict__:
+            return self.__dict__[attribute] or 0
+
+        prefetched = getattr(self, "_prefetched_objects_cache", {}).get("funding_flows")
+        if prefetched is not None:
+            return sum(
+                (flow.amount for flow in prefetched if flow.tranche_type == tranche_type),
+                0,
+            )
 
         return (
             self.funding_flows.filter(tranche_type=tranche_type)
@@ -942,6 +984,11 @@ class MonitoringEntry(models.Model):
 
         return self.funding_source == self.FUNDING_SOURCE_GAAB_2025
 
+    @property
+    def target_completion(self):
+        """Target completion date (alias of ``target_end_date``)."""
+        return self.target_end_date
+
     @property
     def total_allocations(self) -> Decimal:
         """Total allocation tranches recorded."""
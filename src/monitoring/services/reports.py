@@ -57,9 +57,7 @@ class MFBMBudgetExecutionReportGenerator:
         ).select_related(
             'implementing_moa',
             'execution_project'
-        ).prefetch_related(
-            'funding_flows'
-        )
+        ).with_funding_totals()
 
         if self.moa_filter:
             queryset = queryset.filter(implementing_moa__id=self.moa_filter)
@@ -293,6 +291,7 @@ class BPDADevelopmentReportGenerator:
             'lead_organization'
         ).prefetch_related(
             'standard_outcome_indicators',
+            'implementing_policies',
             'communities'
         )
 
@@ -544,9 +543,8 @@ class COAVarianceReportGenerator:
             'implementing_moa',
             'execution_project'
         ).prefetch_related(
-            'funding_flows',
             'execution_project__children'
-        )
+        ).with_funding_totals()
 
         if self.moa_filter:
             queryset = queryset.filter(implementing_moa__id=self.moa_filter)
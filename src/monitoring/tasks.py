@@ -1,16 +1,26 @@
 """Celery tasks for Monitoring & Evaluation background jobs."""
 
+from collections import defaultdict
 from datetime import timedelta
 
 from celery import shared_task
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection
 from django.utils import timezone
 
-from common.models import WorkItem
+from common.models import StaffTeamMembership, WorkItem
 
 from .models import MonitoringEntryWorkflowStage
 
+# Reminder digests list the most urgent items first.
+URGENCY_ORDER = ("critical", "high", "medium")
+
+REMINDER_FOOTER = """
+---
+Office for Other Bangsamoro Communities
+Planning & Budgeting System
+"""
+
 
 @shared_task(name="monitoring.send_workflow_deadline_reminders")
 def send_workflow_deadline_reminders():
@@ -21,73 +31,74 @@ def send_workflow_deadline_reminders():
     - Deadlines in 3 days
     - Deadlines in 7 days
     - Overdue stages
+
+    Each recipient gets one digest listing all of their stages, and all
+    digests are sent over a single SMTP connection.
     """
     today = timezone.now().date()
     three_days = today + timedelta(days=3)
     seven_days = today + timedelta(days=7)
 
-    # Find stages approaching deadline
-    upcoming_3_days = MonitoringEntryWorkflowStage.objects.filter(
-        due_date=three_days,
+    open_stages = MonitoringEntryWorkflowStage.objects.filter(
         status__in=[
             MonitoringEntryWorkflowStage.STATUS_NOT_STARTED,
             MonitoringEntryWorkflowStage.STATUS_IN_PROGRESS,
         ],
     ).select_related("entry", "owner_team", "owner_organization")
 
-    upcoming_7_days = MonitoringEntryWorkflowStage.objects.filter(
-        due_date=seven_days,
-        status__in=[
-            MonitoringEntryWorkflowStage.STATUS_NOT_STARTED,
-            MonitoringEntryWorkflowStage.STATUS_IN_PROGRESS,
-        ],
-    ).select_related("entry", "owner_team", "owner_organization")
+    # Find stages approaching deadline
+    upcoming_3_days = list(open_stages.filter(due_date=three_days))
+    upcoming_7_days = list(open_stages.filter(due_date=seven_days))
 
     # Find overdue stages
-    overdue_stages = MonitoringEntryWorkflowStage.objects.filter(
-        due_date__lt=today,
-        status__in=[
-            MonitoringEntryWorkflowStage.STATUS_NOT_STARTED,
-            MonitoringEntryWorkflowStage.STATUS_IN_PROGRESS,
-        ],
-    ).select_related("entry", "owner_team", "owner_organization")
+    overdue_stages = list(open_stages.filter(due_date__lt=today))
 
-    reminder_count = 0
-
-    # Process 3-day reminders
-    for stage in upcoming_3_days:
-        _send_workflow_reminder(
+    reminders = [
+        (
             stage,
-            urgency="high",
-            message=f"Deadline in 3 days: {stage.get_stage_display()} for {stage.entry.title}",
+            "high",
+            f"Deadline in 3 days: {stage.get_stage_display()} for {stage.entry.title}",
         )
-        reminder_count += 1
-
-    # Process 7-day reminders
-    for stage in upcoming_7_days:
-        _send_workflow_reminder(
+        for stage in upcoming_3_days
+    ] + [
+        (
             stage,
-            urgency="medium",
-            message=f"Deadline in 7 days: {stage.get_stage_display()} for {stage.entry.title}",
+            "medium",
+            f"Deadline in 7 days: {stage.get_stage_display()} for {stage.entry.title}",
         )
-        reminder_count += 1
-
-    # Process overdue reminders
-    for stage in overdue_stages:
-        days_overdue = (today - stage.due_date).days
-        _send_workflow_reminder(
+        for stage in upcoming_7_days
+    ] + [
+        (
             stage,
-            urgency="critical",
-            message=f"OVERDUE ({days_overdue} days): {stage.get_stage_display()} for {stage.entry.title}",
+            "critical",
+            f"OVERDUE ({(today - stage.due_date).days} days): "
+            f"{stage.get_stage_display()} for {stage.entry.title}",
         )
-        reminder_count += 1
+        for stage in overdue_stages
+    ]
+
+    recipients = _workflow_stage_recipients([stage for stage, _, _ in reminders])
+    digests = defaultdict(list)
+    for stage, urgency, message in reminders:
+        if not recipients[stage.pk]:
+            # Log if no recipients found
+            print(f"[WORKFLOW REMINDER] No recipients for stage {stage.id}: {message}")
+            continue
+        section = _workflow_reminder_section(stage, message)
+        for email in recipients[stage.pk]:
+            digests[email].append((urgency, section))
+
+    emails_sent = _send_reminder_digests(
+        digests, "Workflow Deadline Reminder", log_prefix="[WORKFLOW REMINDER]"
+    )
 
     return {
         "status": "completed",
-        "reminders_sent": reminder_count,
-        "three_day_count": upcoming_3_days.count(),
-        "seven_day_count": upcoming_7_days.count(),
-        "overdue_count": overdue_stages.count(),
+        "reminders_sent": len(reminders),
+        "emails_sent": emails_sent,
+        "three_day_count": len(upcoming_3_days),
+        "seven_day_count": len(upcoming_7_days),
+        "overdue_count": len(overdue_stages),
     }
 
 
@@ -100,8 +111,13 @@ def send_task_assignment_reminders():
     - Tasks due in 2 days
     - Tasks due in 5 days
     - Overdue tasks
+
+    Assignees and linked PPAs are prefetched for all tasks at once. Each
+    recipient gets one digest listing all of their tasks, and all digests
+    are sent over a single SMTP connection.
     """
     from django.contrib.contenttypes.models import ContentType
+    from django.db.models import Q
     from .models import MonitoringEntry
 
     today = timezone.now().date()
@@ -117,180 +133,120 @@ def send_task_assignment_reminders():
     # Get ContentType for MonitoringEntry
     monitoring_ct = ContentType.objects.get_for_model(MonitoringEntry)
 
-    # Get WorkItems (tasks) linked to MonitoringEntry with monitoring domain
-    base_queryset = (
+    # Monitoring domain tasks (domain stored in task_data JSON) linked to a
+    # MonitoringEntry that are due in 2 or 5 days or overdue
+    monitoring_tasks = list(
         WorkItem.objects.filter(
+            Q(due_date__in=[two_days, five_days]) | Q(due_date__lt=today),
             work_type__in=[WorkItem.WORK_TYPE_TASK, WorkItem.WORK_TYPE_SUBTASK],
             content_type=monitoring_ct,
-            due_date__isnull=False,
+            status__in=monitoring_statuses,
+            task_data__domain="monitoring",
         )
         .select_related("created_by")
-        .prefetch_related("assignees")
+        .prefetch_related("assignees", "related_object")
     )
 
-    # Further filter to monitoring domain tasks (stored in task_data JSON)
-    monitoring_tasks = [
-        task for task in base_queryset
-        if task.task_data and task.task_data.get("domain") == "monitoring"
-    ]
-
-    # Filter by due date and status
-    upcoming_2_days = [
-        task for task in monitoring_tasks
-        if task.due_date == two_days and task.status in monitoring_statuses
-    ]
-
-    upcoming_5_days = [
-        task for task in monitoring_tasks
-        if task.due_date == five_days and task.status in monitoring_statuses
-    ]
-
-    overdue_tasks = [
-        task for task in monitoring_tasks
-        if task.due_date < today and task.status in monitoring_statuses
-    ]
-
-    reminder_count = 0
-
-    # Process 2-day reminders
-    for task in upcoming_2_days:
-        # Get related PPA via GenericForeignKey
-        related_ppa = task.content_object if task.content_type == monitoring_ct else None
-        ppa_title = getattr(related_ppa, 'title', 'Unlinked PPA') if related_ppa else 'Unlinked PPA'
-
-        _send_task_reminder(
+    # Filter by due date
+    upcoming_2_days = [task for task in monitoring_tasks if task.due_date == two_days]
+    upcoming_5_days = [task for task in monitoring_tasks if task.due_date == five_days]
+    overdue_tasks = [task for task in monitoring_tasks if task.due_date < today]
+
+    def ppa_title(task):
+        return getattr(task.related_object, "title", None) or "Unlinked PPA"
+
+    reminders = [
+        (task, "high", f"Deadline in 2 days: {task.title} for {ppa_title(task)}")
+        for task in upcoming_2_days
+    ] + [
+        (task, "medium", f"Deadline in 5 days: {task.title} for {ppa_title(task)}")
+        for task in upcoming_5_days
+    ] + [
+        (
             task,
-            urgency="high",
-            message=f"Deadline in 2 days: {task.title} for {ppa_title}",
+            "critical",
+            f"OVERDUE ({(today - task.due_date).days} days): "
+            f"{task.title} for {ppa_title(task)}",
         )
-        reminder_count += 1
+        for task in overdue_tasks
+    ]
 
-    # Process 5-day reminders
-    for task in upcoming_5_days:
-        # Get related PPA via GenericForeignKey
-        related_ppa = task.content_object if task.content_type == monitoring_ct else None
-        ppa_title = getattr(related_ppa, 'title', 'Unlinked PPA') if related_ppa else 'Unlinked PPA'
+    digests = defaultdict(list)
+    for task, urgency, message in reminders:
+        recipients = {user.email for user in task.assignees.all() if user.email}
+        if not recipients and task.created_by and task.created_by.email:
+            recipients.add(task.created_by.email)
 
-        _send_task_reminder(
-            task,
-            urgency="medium",
-            message=f"Deadline in 5 days: {task.title} for {ppa_title}",
-        )
-        reminder_count += 1
+        if not recipients:
+            print(f"[TASK REMINDER] No recipients for task {task.pk}: {message}")
+            continue
 
-    # Process overdue reminders
-    for task in overdue_tasks:
-        days_overdue = (today - task.due_date).days
-        # Get related PPA via GenericForeignKey
-        related_ppa = task.content_object if task.content_type == monitoring_ct else None
-        ppa_title = getattr(related_ppa, 'title', 'Unlinked PPA') if related_ppa else 'Unlinked PPA'
+        section = _task_reminder_section(task, message, ppa_title(task))
+        for email in recipients:
+            digests[email].append((urgency, section))
 
-        _send_task_reminder(
-            task,
-            urgency="critical",
-            message=f"OVERDUE ({days_overdue} days): {task.title} for {ppa_title}",
-        )
-        reminder_count += 1
+    emails_sent = _send_reminder_digests(
+        digests, "Task Deadline Reminder", log_prefix="[TASK REMINDER]"
+    )
 
     return {
         "status": "completed",
-        "reminders_sent": reminder_count,
+        "reminders_sent": len(reminders),
+        "emails_sent": emails_sent,
         "two_day_count": len(upcoming_2_days),
         "five_day_count": len(upcoming_5_days),
         "overdue_count": len(overdue_tasks),
     }
 
 
-def _send_workflow_reminder(stage, urgency, message):
+def _workflow_stage_recipients(stages):
     """
-    Send email reminder for workflow stage deadline.
+    Resolve reminder recipients for workflow stages.
 
-    Args:
-        stage: MonitoringEntryWorkflowStage instance
-        urgency: str - "critical", "high", "medium"
-        message: str - notification message
-    """
-    # Determine recipients
-    recipients = []
-
-    # Add owner team members (if available)
-    if stage.owner_team:
-        team_emails = list(
-            stage.owner_team.members.values_list("user__email", flat=True)
-        )
-        recipients.extend(team_emails)
-
-    # Add organization contacts (if available)
-    if stage.owner_organization:
-        # Assuming organization has a contact_email field
-        if hasattr(stage.owner_organization, "contact_email"):
-            recipients.append(stage.owner_organization.contact_email)
-
-    # Filter out None and empty strings
-    recipients = [email for email in recipients if email]
+    Recipients are the active members of the owner team and the owner
+    organization's contact email. Team members are loaded for all stages
+    with one query.
 
-    if not recipients:
-        # Log if no recipients found
-        print(f"[WORKFLOW REMINDER] No recipients for stage {stage.id}: {message}")
-        return
-
-    # Construct email
-    subject = f"[{urgency.upper()}] Workflow Deadline Reminder"
-    email_message = f"""
-{message}
+    Returns:
+        dict: stage pk -> set of email addresses
+    """
+    team_emails = defaultdict(set)
+    for team_id, email in StaffTeamMembership.objects.filter(
+        team_id__in={stage.owner_team_id for stage in stages if stage.owner_team_id},
+        is_active=True,
+    ).values_list("team_id", "user__email"):
+        team_emails[team_id].add(email)
+
+    recipients = {}
+    for stage in stages:
+        emails = set(team_emails.get(stage.owner_team_id, ()))
+        if stage.owner_organization:
+            emails.add(stage.owner_organization.contact_email)
+        # Filter out None and empty strings
+        recipients[stage.pk] = {email for email in emails if email}
+    return recipients
+
+
+def _workflow_reminder_section(stage, message):
+    """Digest entry for a workflow stage deadline."""
+    return f"""{message}
 
 Entry: {stage.entry.title}
 Stage: {stage.get_stage_display()}
 Status: {stage.get_status_display()}
 Due Date: {stage.due_date}
 Notes: {stage.notes or "No notes"}
-
-Please review and take action as needed.
-
----
-Office for Other Bangsamoro Communities
-Planning & Budgeting System
 """
 
-    try:
-        send_mail(
-            subject=subject,
-            message=email_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=recipients,
-            fail_silently=False,
-        )
-        print(f"[WORKFLOW REMINDER] Sent to {', '.join(recipients)}: {message}")
-    except Exception as e:
-        print(f"[WORKFLOW REMINDER] Failed to send email: {e}")
-
 
-def _send_task_reminder(task, urgency, message):
-    """Send email reminder for monitoring WorkItem task deadlines."""
+def _task_reminder_section(task, message, entry_title):
+    """Digest entry for a monitoring WorkItem task deadline."""
 
-    recipients = [user.email for user in task.assignees.all() if user.email]
+    # Extract task_role and notes from task_data JSON field
+    task_data = task.task_data or {}
+    task_role = task_data.get("task_role", "Not specified")
 
-    if not recipients and task.created_by and task.created_by.email:
-        recipients.append(task.created_by.email)
-
-    if not recipients:
-        print(f"[TASK REMINDER] No recipients for task {task.pk}: {message}")
-        return
-
-    # Get related PPA via GenericForeignKey
-    from django.contrib.contenttypes.models import ContentType
-    from .models import MonitoringEntry
-
-    monitoring_ct = ContentType.objects.get_for_model(MonitoringEntry)
-    related_ppa = task.content_object if task.content_type == monitoring_ct else None
-    entry_title = getattr(related_ppa, "title", "Unlinked PPA") if related_ppa else "Unlinked PPA"
-
-    # Extract task_role from task_data JSON field
-    task_role = task.task_data.get("task_role", "Not specified") if task.task_data else "Not specified"
-
-    subject = f"[{urgency.upper()}] Task Deadline Reminder"
-    email_message = f"""
-{message}
+    return f"""{message}
 
 PPA: {entry_title}
 Task: {task.title}
@@ -303,26 +259,145 @@ Description:
 {task.description or "No description"}
 
 Notes:
-{task.notes or "No notes"}
+{task_data.get("notes") or "No notes"}
+"""
 
-Please complete this task as soon as possible.
 
----
-Office for Other Bangsamoro Communities
-Planning & Budgeting System
-"""
+def _send_reminder_digests(digests, title, log_prefix):
+    """
+    Send one digest email per recipient over a single SMTP connection.
 
-    try:
-        send_mail(
-            subject=subject,
-            message=email_message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=recipients,
-            fail_silently=False,
+    Args:
+        digests: dict of email address -> list of (urgency, section text)
+        title: str - subject line, e.g. "Task Deadline Reminder"
+        log_prefix: str - prefix for log output
+
+    Returns:
+        int: Number of digests sent
+    """
+    messages = []
+    for email, items in digests.items():
+        items = sorted(items, key=lambda item: URGENCY_ORDER.index(item[0]))
+        urgency = items[0][0]
+        count = len(items)
+        subject = f"[{urgency.upper()}] {title}" + (f"s ({count})" if count > 1 else "")
+        body = "\n\n".join(
+            f"[{item_urgency.upper()}] {section}" for item_urgency, section in items
         )
-        print(f"[TASK REMINDER] Sent to {', '.join(recipients)}: {message}")
+        messages.append(
+            EmailMessage(
+                subject=subject,
+                body=f"""
+{body}
+Please review and take action as needed.
+{REMINDER_FOOTER}""",
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[email],
+            )
+        )
+
+    if not messages:
+        return 0
+
+    sent = []
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+        for message in messages:
+            try:
+                if connection.send_messages([message]):
+                    sent.extend(message.to)
+            except Exception as e:
+                print(f"{log_prefix} Failed to send email to {', '.join(message.to)}: {e}")
     except Exception as e:
-        print(f"[TASK REMINDER] Failed to send email: {e}")
+        print(f"{log_prefix} Failed to open email connection: {e}")
+    finally:
+        connection.close()
+
+    if sent:
+        print(f"{log_prefix} Sent {len(sent)} digest(s) to {', '.join(sorted(sent))}")
+    return len(sent)
+
+
+# Portfolio jobs below walk PPAs in primary-key chunks. Each chunk is
+# committed on its own; a retry resumes after the last committed chunk
+# (``resume_after``) and carries the counts so far (``totals``).
+TASK_CHUNK_SIZE = 500
+
+
+def _pk_chunks(queryset, resume_after=None, chunk_size=None):
+    """
+    Yield rows of ``queryset`` in primary-key order, ``chunk_size`` (default
+    ``TASK_CHUNK_SIZE``) at a time.
+
+    Keyset pagination: every chunk starts after the last key of the previous
+    one, so rows are neither skipped nor repeated when a job resumes.
+    """
+    chunk_size = chunk_size or TASK_CHUNK_SIZE
+    queryset = queryset.order_by("pk")
+    while True:
+        page = queryset.filter(pk__gt=resume_after) if resume_after else queryset
+        chunk = list(page[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        resume_after = chunk[-1].pk
+
+
+def _is_retryable(error, keywords=("database", "connection")):
+    return any(keyword in str(error).lower() for keyword in keywords)
+
+
+def _calculate_workitem_progress(ppas):
+    """
+    Progress each PPA would get from ``sync_progress_from_workitem()``.
+
+    Uses two queries for the whole chunk: the root execution projects (the
+    latest one when a PPA has several) and per-tree descendant counts.
+
+    Returns:
+        dict: PPA id -> calculated progress, for PPAs with a project
+    """
+    from django.contrib.contenttypes.models import ContentType
+    from django.db.models import Count, Q
+
+    from .models import MonitoringEntry
+
+    projects = {}
+    for row in (
+        WorkItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(MonitoringEntry),
+            object_id__in=[ppa.pk for ppa in ppas],
+            work_type=WorkItem.WORK_TYPE_PROJECT,
+            parent__isnull=True,
+        )
+        .order_by("object_id", "created_at")
+        .values("object_id", "tree_id", "progress")
+    ):
+        projects[row["object_id"]] = row  # later rows are newer projects
+
+    descendants = {
+        row["tree_id"]: row
+        for row in WorkItem.objects.filter(
+            tree_id__in={project["tree_id"] for project in projects.values()},
+            parent__isnull=False,
+        )
+        .order_by()
+        .values("tree_id")
+        .annotate(
+            total=Count("pk"),
+            completed=Count("pk", filter=Q(status=WorkItem.STATUS_COMPLETED)),
+        )
+    }
+
+    progress = {}
+    for ppa_id, project in projects.items():
+        counts = descendants.get(project["tree_id"])
+        if counts:
+            progress[ppa_id] = int((counts["completed"] / counts["total"]) * 100)
+        else:
+            progress[ppa_id] = project["progress"]
+    return progress
 
 
 @shared_task(
@@ -331,7 +406,7 @@ Planning & Budgeting System
     max_retries=3,
     default_retry_delay=300  # 5 minutes
 )
-def auto_sync_ppa_progress(self):
+def auto_sync_ppa_progress(self, resume_after=None, totals=None):
     """
     Automatically sync PPA progress from WorkItem completion status.
 
@@ -341,6 +416,14 @@ def auto_sync_ppa_progress(self):
 
     The task calculates progress based on completed WorkItem descendants
     (activities/tasks) and updates the MonitoringEntry.progress field.
+    PPAs are processed in chunks of ``TASK_CHUNK_SIZE``: progress for a
+    chunk is computed with grouped queries and changed rows are written
+    with one ``bulk_update``.
+
+    Args:
+        resume_after: Primary key of the last PPA already processed (set
+            by retries so completed chunks are not repeated)
+        totals: Counts accumulated before the retry
 
     Returns:
         dict: Sync results summary
@@ -354,7 +437,8 @@ def auto_sync_ppa_progress(self):
     Retry Logic:
         - Max retries: 3
         - Retry delay: 5 minutes
-        - Retries on database errors, connection issues
+        - Retries on database errors, connection issues, resuming after
+          the last committed chunk
 
     Example Result:
         {
@@ -367,12 +451,19 @@ def auto_sync_ppa_progress(self):
         }
     """
     import logging
+    from django.db import transaction
+    from common.signals import invalidate_caches_for
     from .models import MonitoringEntry
     from .utils.email import send_progress_sync_notification
 
     logger = logging.getLogger(__name__)
     logger.info("[AUTO SYNC] Starting nightly PPA progress sync from WorkItems")
 
+    totals = dict(
+        {"total_processed": 0, "total_updated": 0, "total_unchanged": 0, "errors": []},
+        **(totals or {}),
+    )
+
     try:
         # Find PPAs with WorkItem tracking enabled and auto-sync enabled
         ppas_to_sync = MonitoringEntry.objects.filter(
@@ -381,53 +472,55 @@ def auto_sync_ppa_progress(self):
             status__in=['planning', 'ongoing']  # Only active PPAs
         ).select_related('implementing_moa', 'created_by')
 
-        total_processed = 0
-        total_updated = 0
-        total_unchanged = 0
-        total_errors = 0
-        errors = []
-
-        for ppa in ppas_to_sync:
-            total_processed += 1
-
-            try:
-                # Store old progress for comparison
-                old_progress = ppa.progress
-
-                # Sync progress from WorkItem
-                new_progress = ppa.sync_progress_from_workitem()
-
-                if new_progress != old_progress:
-                    total_updated += 1
-                    logger.info(
-                        f"[AUTO SYNC] Updated PPA {ppa.id}: "
-                        f"{old_progress}% → {new_progress}% ({ppa.title})"
-                    )
-
+        for chunk in _pk_chunks(ppas_to_sync, resume_after):
+            calculated = _calculate_workitem_progress(chunk)
+            now = timezone.now()
+
+            changed = []
+            for ppa in chunk:
+                new_progress = calculated.get(ppa.pk, ppa.progress)
+                if new_progress != ppa.progress:
+                    changed.append((ppa, ppa.progress))
+                    ppa.progress = new_progress
+                    ppa.updated_at = now
+
+            with transaction.atomic():
+                MonitoringEntry.objects.bulk_update(
+                    [ppa for ppa, _ in changed], ["progress", "updated_at"]
+                )
+            if changed:
+                invalidate_caches_for(MonitoringEntry)
+
+            totals["total_processed"] += len(chunk)
+            totals["total_updated"] += len(changed)
+            totals["total_unchanged"] += len(chunk) - len(changed)
+            resume_after = str(chunk[-1].pk)
+
+            for ppa, old_progress in changed:
+                logger.info(
+                    f"[AUTO SYNC] Updated PPA {ppa.id}: "
+                    f"{old_progress}% → {ppa.progress}% ({ppa.title})"
+                )
+                try:
                     # Send notification if significant change (handled by email utility)
-                    send_progress_sync_notification(ppa, old_progress, new_progress)
-                else:
-                    total_unchanged += 1
-
-            except Exception as e:
-                total_errors += 1
-                error_msg = f"PPA {ppa.id}: {str(e)}"
-                errors.append(error_msg)
-                logger.error(f"[AUTO SYNC] Error syncing {ppa.id}: {e}", exc_info=True)
+                    send_progress_sync_notification(ppa, old_progress, ppa.progress)
+                except Exception as e:
+                    totals["errors"].append(f"PPA {ppa.id}: {str(e)}")
+                    logger.error(f"[AUTO SYNC] Error notifying {ppa.id}: {e}", exc_info=True)
 
         # Final summary
         result = {
             "status": "completed",
-            "total_processed": total_processed,
-            "total_updated": total_updated,
-            "total_unchanged": total_unchanged,
-            "total_errors": total_errors,
-            "errors": errors[:10]  # Limit to first 10 errors
+            "total_processed": totals["total_processed"],
+            "total_updated": totals["total_updated"],
+            "total_unchanged": totals["total_unchanged"],
+            "total_errors": len(totals["errors"]),
+            "errors": totals["errors"][:10]  # Limit to first 10 errors
         }
 
         logger.info(
-            f"[AUTO SYNC] Completed: {total_processed} processed, "
-            f"{total_updated} updated, {total_errors} errors"
+            f"[AUTO SYNC] Completed: {result['total_processed']} processed, "
+            f"{result['total_updated']} updated, {result['total_errors']} errors"
         )
 
         return result
@@ -435,9 +528,9 @@ def auto_sync_ppa_progress(self):
     except Exception as e:
         logger.error(f"[AUTO SYNC] Fatal error in auto_sync_ppa_progress: {e}", exc_info=True)
 
-        # Retry on database errors
-        if "database" in str(e).lower() or "connection" in str(e).lower():
-            raise self.retry(exc=e)
+        # Retry on database errors, resuming after the last committed chunk
+        if _is_retryable(e):
+            raise self.retry(exc=e, kwargs={"resume_after": resume_after, "totals": totals})
 
         return {
             "status": "failed",
@@ -456,7 +549,7 @@ def auto_sync_ppa_progress(self):
     max_retries=3,
     default_retry_delay=300  # 5 minutes
 )
-def detect_budget_variances(self):
+def detect_budget_variances(self, resume_after=None, totals=None):
     """
     Detect budget variances and create alerts for overruns.
 
@@ -464,10 +557,19 @@ def detect_budget_variances(self):
     disbursements exceed allocated budget. Alerts are created for variances
     exceeding 10%, and email notifications are sent to MOA finance officers.
 
+    Actual disbursements are the PPA's disbursement funding tranches. The
+    overrun filter and the active-alert check run in the database, so each
+    chunk of ``TASK_CHUNK_SIZE`` PPAs costs one query plus one bulk insert
+    of the missing alerts.
+
     Variance Thresholds:
         - >10%: Create alert, send email (MEDIUM severity)
         - >20%: Create alert, send email (CRITICAL severity)
 
+    Args:
+        resume_after: Primary key of the last PPA already processed
+        totals: Counts accumulated before the retry
+
     Returns:
         dict: Detection results summary
             - status: "completed" or "failed"
@@ -480,7 +582,8 @@ def detect_budget_variances(self):
     Retry Logic:
         - Max retries: 3
         - Retry delay: 5 minutes
-        - Retries on database errors, email failures
+        - Retries on database errors, email failures, resuming after the
+          last committed chunk
 
     Example Result:
         {
@@ -494,6 +597,9 @@ def detect_budget_variances(self):
     """
     import logging
     from decimal import Decimal
+    from django.db import transaction
+    from django.db.models import Exists, F, OuterRef
+    from common.signals import invalidate_caches_for
     from .models import MonitoringEntry
     from .utils.email import send_budget_variance_alert
     from project_central.models import Alert
@@ -501,113 +607,109 @@ def detect_budget_variances(self):
     logger = logging.getLogger(__name__)
     logger.info("[BUDGET VARIANCE] Starting budget variance detection")
 
+    totals = dict(
+        {"total_variances": 0, "alerts_created": 0, "emails_sent": 0, "errors": []},
+        **(totals or {}),
+    )
+
     try:
         # Find active PPAs with budget allocations
         ppas = MonitoringEntry.objects.filter(
             status__in=['planning', 'ongoing', 'completed'],
             budget_allocation__gt=0
-        ).select_related('implementing_moa', 'lead_organization')
-
-        total_checked = 0
-        total_variances = 0
-        alerts_created = 0
-        emails_sent = 0
-        errors = []
+        )
+        total_checked = ppas.count()
+
+        # Only variances above 10% of the allocation are alerted
+        over_budget = (
+            ppas.with_funding_totals()
+            .filter(total_disbursements_sum__gt=F('budget_allocation') * Decimal('1.10'))
+            .annotate(
+                has_active_alert=Exists(
+                    Alert.objects.filter(
+                        alert_type="overspending",
+                        related_ppa=OuterRef("pk"),
+                        is_active=True,
+                    )
+                )
+            )
+            .select_related('implementing_moa', 'lead_organization')
+        )
 
-        for ppa in ppas:
-            total_checked += 1
+        for chunk in _pk_chunks(over_budget, resume_after):
+            expires_at = timezone.now() + timedelta(days=30)
+            alerts = []
+            variances = []
 
-            try:
-                # Calculate actual disbursement
-                actual_disbursed = ppa.total_actual_disbursed()
+            for ppa in chunk:
+                actual_disbursed = ppa.total_disbursements
+                variance_amount = actual_disbursed - ppa.budget_allocation
+                variance_pct = float((variance_amount / ppa.budget_allocation) * 100)
+                variances.append((ppa, variance_amount, variance_pct))
 
-                # Skip if no disbursements yet
-                if actual_disbursed == Decimal('0.00'):
+                if ppa.has_active_alert:
                     continue
 
-                # Calculate variance
-                if actual_disbursed > ppa.budget_allocation:
-                    variance_amount = actual_disbursed - ppa.budget_allocation
-                    variance_pct = float(
-                        (variance_amount / ppa.budget_allocation) * 100
+                alerts.append(
+                    Alert(
+                        alert_type="overspending",
+                        severity="critical" if variance_pct > 20 else "high",
+                        title=f"Budget Variance: {ppa.title}",
+                        description=(
+                            f"Actual disbursements exceed budget allocation by "
+                            f"PHP {variance_amount:,.2f} ({variance_pct:.1f}%). "
+                            f"Allocated: PHP {ppa.budget_allocation:,.2f}, "
+                            f"Actual: PHP {actual_disbursed:,.2f}"
+                        ),
+                        related_ppa=ppa,
+                        action_url=f"/monitoring/{ppa.id}/",
+                        alert_data={
+                            "ppa_id": str(ppa.id),
+                            "variance_amount": str(variance_amount),
+                            "variance_pct": variance_pct,
+                            "allocated": str(ppa.budget_allocation),
+                            "actual": str(actual_disbursed)
+                        },
+                        expires_at=expires_at,
                     )
-
-                    # Only alert if variance > 10%
-                    if variance_pct > 10:
-                        total_variances += 1
-
-                        # Determine severity
-                        if variance_pct > 20:
-                            severity = "critical"
-                        else:
-                            severity = "high"
-
-                        # Check if alert already exists
-                        existing_alert = Alert.objects.filter(
-                            alert_type="overspending",
-                            related_ppa=ppa,
-                            is_active=True
-                        ).first()
-
-                        if not existing_alert:
-                            # Create alert
-                            Alert.create_alert(
-                                alert_type="overspending",
-                                severity=severity,
-                                title=f"Budget Variance: {ppa.title}",
-                                description=(
-                                    f"Actual disbursements exceed budget allocation by "
-                                    f"PHP {variance_amount:,.2f} ({variance_pct:.1f}%). "
-                                    f"Allocated: PHP {ppa.budget_allocation:,.2f}, "
-                                    f"Actual: PHP {actual_disbursed:,.2f}"
-                                ),
-                                related_ppa=ppa,
-                                action_url=f"/monitoring/{ppa.id}/",
-                                alert_data={
-                                    "ppa_id": str(ppa.id),
-                                    "variance_amount": str(variance_amount),
-                                    "variance_pct": variance_pct,
-                                    "allocated": str(ppa.budget_allocation),
-                                    "actual": str(actual_disbursed)
-                                },
-                                expires_at=timezone.now() + timedelta(days=30)
-                            )
-                            alerts_created += 1
-
-                            logger.info(
-                                f"[BUDGET VARIANCE] Alert created for PPA {ppa.id}: "
-                                f"{variance_pct:.1f}% over budget"
-                            )
-
-                        # Send email notification
-                        email_sent = send_budget_variance_alert(
-                            ppa, variance_amount, variance_pct
-                        )
-                        if email_sent:
-                            emails_sent += 1
-
-            except Exception as e:
-                error_msg = f"PPA {ppa.id}: {str(e)}"
-                errors.append(error_msg)
-                logger.error(
-                    f"[BUDGET VARIANCE] Error processing PPA {ppa.id}: {e}",
-                    exc_info=True
                 )
 
+            with transaction.atomic():
+                Alert.objects.bulk_create(alerts)
+            if alerts:
+                invalidate_caches_for(Alert)
+
+            totals["total_variances"] += len(variances)
+            totals["alerts_created"] += len(alerts)
+            resume_after = str(chunk[-1].pk)
+
+            for ppa, variance_amount, variance_pct in variances:
+                try:
+                    # Send email notification
+                    if send_budget_variance_alert(ppa, variance_amount, variance_pct):
+                        totals["emails_sent"] += 1
+                except Exception as e:
+                    totals["errors"].append(f"PPA {ppa.id}: {str(e)}")
+                    logger.error(
+                        f"[BUDGET VARIANCE] Error notifying PPA {ppa.id}: {e}",
+                        exc_info=True
+                    )
+
         # Final summary
         result = {
             "status": "completed",
             "total_checked": total_checked,
-            "total_variances": total_variances,
-            "alerts_created": alerts_created,
-            "emails_sent": emails_sent,
-            "errors": errors[:10]  # Limit to first 10 errors
+            "total_variances": totals["total_variances"],
+            "alerts_created": totals["alerts_created"],
+            "emails_sent": totals["emails_sent"],
+            "errors": totals["errors"][:10]  # Limit to first 10 errors
         }
 
         logger.info(
             f"[BUDGET VARIANCE] Completed: {total_checked} checked, "
-            f"{total_variances} variances found, {alerts_created} alerts created, "
-            f"{emails_sent} emails sent"
+            f"{result['total_variances']} variances found, "
+            f"{result['alerts_created']} alerts created, "
+            f"{result['emails_sent']} emails sent"
         )
 
         return result
@@ -618,9 +720,9 @@ def detect_budget_variances(self):
             exc_info=True
         )
 
-        # Retry on database/email errors
-        if any(keyword in str(e).lower() for keyword in ['database', 'connection', 'smtp']):
-            raise self.retry(exc=e)
+        # Retry on database/email errors, resuming after the last committed chunk
+        if _is_retryable(e, ('database', 'connection', 'smtp')):
+            raise self.retry(exc=e, kwargs={"resume_after": resume_after, "totals": totals})
 
         return {
             "status": "failed",
@@ -639,7 +741,7 @@ def detect_budget_variances(self):
     max_retries=3,
     default_retry_delay=300  # 5 minutes
 )
-def send_approval_deadline_reminders(self):
+def send_approval_deadline_reminders(self, resume_after=None, totals=None):
     """
     Send reminders for PPAs pending approval beyond deadline.
 
@@ -647,10 +749,18 @@ def send_approval_deadline_reminders(self):
     approval for more than 7 days and sends email reminders to MFBM analysts.
     Alerts are also created for overdue approvals.
 
+    Overdue PPAs and their recent-alert flags are selected in the database
+    and processed in chunks of ``TASK_CHUNK_SIZE``, with the missing alerts
+    of each chunk inserted by one ``bulk_create``.
+
     Reminder Thresholds:
         - >7 days: Send reminder (HIGH severity)
         - >14 days: Send reminder (CRITICAL severity)
 
+    Args:
+        resume_after: Primary key of the last PPA already processed
+        totals: Counts accumulated before the retry
+
     Returns:
         dict: Reminder results summary
             - status: "completed" or "failed"
@@ -663,7 +773,8 @@ def send_approval_deadline_reminders(self):
     Retry Logic:
         - Max retries: 3
         - Retry delay: 5 minutes
-        - Retries on database errors, email failures
+        - Retries on database errors, email failures, resuming after the
+          last committed chunk
 
     Example Result:
         {
@@ -677,6 +788,9 @@ def send_approval_deadline_reminders(self):
     """
     import logging
     from datetime import timedelta
+    from django.db import transaction
+    from django.db.models import Exists, OuterRef
+    from common.signals import invalidate_caches_for
     from .models import MonitoringEntry
     from .utils.email import send_approval_deadline_reminder
     from project_central.models import Alert
@@ -684,8 +798,14 @@ def send_approval_deadline_reminders(self):
     logger = logging.getLogger(__name__)
     logger.info("[APPROVAL REMINDER] Starting approval deadline reminder task")
 
+    totals = dict(
+        {"total_overdue": 0, "reminders_sent": 0, "alerts_created": 0, "errors": []},
+        **(totals or {}),
+    )
+
     try:
-        today = timezone.now().date()
+        now = timezone.now()
+        seven_days_ago = now - timedelta(days=7)
 
         # Find PPAs pending approval
         pending_ppas = MonitoringEntry.objects.filter(
@@ -695,6 +815,21 @@ def send_approval_deadline_reminders(self):
                 MonitoringEntry.APPROVAL_STATUS_BUDGET_REVIEW
             ],
             status__in=['planning', 'ongoing']
+        )
+        total_checked = pending_ppas.count()
+
+        # More than 7 whole days pending; skip alerts created in the last 7 days
+        overdue_ppas = pending_ppas.filter(
+            updated_at__lte=now - timedelta(days=8)
+        ).annotate(
+            has_recent_alert=Exists(
+                Alert.objects.filter(
+                    alert_type="approval_bottleneck",
+                    related_ppa=OuterRef("pk"),
+                    is_active=True,
+                    created_at__gte=seven_days_ago
+                )
+            )
         ).select_related(
             'implementing_moa',
             'submitted_to_organization',
@@ -702,95 +837,76 @@ def send_approval_deadline_reminders(self):
             'created_by'
         )
 
-        total_checked = 0
-        total_overdue = 0
-        reminders_sent = 0
-        alerts_created = 0
-        errors = []
+        for chunk in _pk_chunks(overdue_ppas, resume_after):
+            expires_at = timezone.now() + timedelta(days=14)
+            alerts = []
+            overdue = []
 
-        for ppa in pending_ppas:
-            total_checked += 1
+            for ppa in chunk:
+                days_pending = (now - ppa.updated_at).days
+                overdue.append((ppa, days_pending))
 
-            try:
-                # Calculate days pending (from created_at or updated_at)
-                pending_since = ppa.updated_at or ppa.created_at
-                days_pending = (timezone.now() - pending_since).days
-
-                # Only process if pending > 7 days
-                if days_pending > 7:
-                    total_overdue += 1
-
-                    # Determine severity
-                    if days_pending > 14:
-                        severity = "critical"
-                    else:
-                        severity = "high"
-
-                    # Check if alert already exists (created in last 7 days)
-                    seven_days_ago = timezone.now() - timedelta(days=7)
-                    existing_alert = Alert.objects.filter(
+                if ppa.has_recent_alert:
+                    continue
+
+                alerts.append(
+                    Alert(
                         alert_type="approval_bottleneck",
+                        severity="critical" if days_pending > 14 else "high",
+                        title=f"Approval Overdue: {ppa.title}",
+                        description=(
+                            f"This PPA has been pending approval for {days_pending} days. "
+                            f"Current status: {ppa.get_approval_status_display()}. "
+                            f"Budget: PHP {ppa.budget_allocation or 0:,.2f}. "
+                            f"Priority: {ppa.get_priority_display()}."
+                        ),
                         related_ppa=ppa,
-                        is_active=True,
-                        created_at__gte=seven_days_ago
-                    ).first()
-
-                    if not existing_alert:
-                        # Create alert
-                        Alert.create_alert(
-                            alert_type="approval_bottleneck",
-                            severity=severity,
-                            title=f"Approval Overdue: {ppa.title}",
-                            description=(
-                                f"This PPA has been pending approval for {days_pending} days. "
-                                f"Current status: {ppa.get_approval_status_display()}. "
-                                f"Budget: PHP {ppa.budget_allocation:,.2f}. "
-                                f"Priority: {ppa.get_priority_display()}."
-                            ),
-                            related_ppa=ppa,
-                            action_url=f"/monitoring/{ppa.id}/",
-                            alert_data={
-                                "ppa_id": str(ppa.id),
-                                "days_pending": days_pending,
-                                "approval_status": ppa.approval_status,
-                                "fiscal_year": ppa.fiscal_year
-                            },
-                            expires_at=timezone.now() + timedelta(days=14)
-                        )
-                        alerts_created += 1
-
-                        logger.info(
-                            f"[APPROVAL REMINDER] Alert created for PPA {ppa.id}: "
-                            f"{days_pending} days pending"
-                        )
+                        action_url=f"/monitoring/{ppa.id}/",
+                        alert_data={
+                            "ppa_id": str(ppa.id),
+                            "days_pending": days_pending,
+                            "approval_status": ppa.approval_status,
+                            "fiscal_year": ppa.fiscal_year
+                        },
+                        expires_at=expires_at,
+                    )
+                )
 
-                    # Send email reminder
-                    email_sent = send_approval_deadline_reminder(ppa, days_pending)
-                    if email_sent:
-                        reminders_sent += 1
+            with transaction.atomic():
+                Alert.objects.bulk_create(alerts)
+            if alerts:
+                invalidate_caches_for(Alert)
 
-            except Exception as e:
-                error_msg = f"PPA {ppa.id}: {str(e)}"
-                errors.append(error_msg)
-                logger.error(
-                    f"[APPROVAL REMINDER] Error processing PPA {ppa.id}: {e}",
-                    exc_info=True
-                )
+            totals["total_overdue"] += len(overdue)
+            totals["alerts_created"] += len(alerts)
+            resume_after = str(chunk[-1].pk)
+
+            for ppa, days_pending in overdue:
+                try:
+                    # Send email reminder
+                    if send_approval_deadline_reminder(ppa, days_pending):
+                        totals["reminders_sent"] += 1
+                except Exception as e:
+                    totals["errors"].append(f"PPA {ppa.id}: {str(e)}")
+                    logger.error(
+                        f"[APPROVAL REMINDER] Error processing PPA {ppa.id}: {e}",
+                        exc_info=True
+                    )
 
         # Final summary
         result = {
             "status": "completed",
             "total_checked": total_checked,
-            "total_overdue": total_overdue,
-            "reminders_sent": reminders_sent,
-            "alerts_created": alerts_created,
-            "errors": errors[:10]  # Limit to first 10 errors
+            "total_overdue": totals["total_overdue"],
+            "reminders_sent": totals["reminders_sent"],
+            "alerts_created": totals["alerts_created"],
+            "errors": totals["errors"][:10]  # Limit to first 10 errors
         }
 
         logger.info(
             f"[APPROVAL REMINDER] Completed: {total_checked} checked, "
-            f"{total_overdue} overdue, {reminders_sent} reminders sent, "
-            f"{alerts_created} alerts created"
+            f"{result['total_overdue']} overdue, {result['reminders_sent']} reminders sent, "
+            f"{result['alerts_created']} alerts created"
         )
 
         return result
@@ -801,9 +917,9 @@ def send_approval_deadline_reminders(self):
             exc_info=True
         )
 
-        # Retry on database/email errors
-        if any(keyword in str(e).lower() for keyword in ['database', 'connection', 'smtp']):
-            raise self.retry(exc=e)
+        # Retry on database/email errors, resuming after the last committed chunk
+        if _is_retryable(e, ('database', 'connection', 'smtp')):
+            raise self.retry(exc=e, kwargs={"resume_after": resume_after, "totals": totals})
 
         return {
             "status": "failed",
@@ -0,0 +1,109 @@
+"""Tests for the grouped budget rollup behind monitoring analytics."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from monitoring import analytics
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def ppas(monitoring_entry_factory):
+    this_year = timezone.now().year
+    last_year = this_year - 1
+    return [
+        monitoring_entry_factory(
+            sector="social",
+            funding_source="gaab_2025",
+            status="completed",
+            budget_allocation=Decimal("100.00"),
+            total_slots=10,
+            start_date=date(last_year, 3, 1),
+        ),
+        monitoring_entry_factory(
+            sector="social",
+            funding_source="gaab_2025",
+            status="ongoing",
+            budget_allocation=Decimal("300.00"),
+            total_slots=5,
+            start_date=date(this_year, 2, 1),
+        ),
+        monitoring_entry_factory(
+            sector="economic",
+            funding_source="sdf",
+            status="ongoing",
+            budget_allocation=Decimal("500.00"),
+            start_date=date(this_year, 6, 1),
+        ),
+        monitoring_entry_factory(
+            sector="economic",
+            funding_source="sdf",
+            budget_allocation=None,
+            start_date=date(this_year, 7, 1),
+        ),
+    ]
+
+
+def test_rollup_groups_by_year_sector_and_funding_source(ppas):
+    this_year = timezone.now().year
+
+    rows = analytics.rollup_by("year", "sector", "funding_source")
+
+    social = rows[(this_year, "social", "gaab_2025")]
+    assert social["total_budget"] == Decimal("300.00")
+    assert social["ppas_count"] == 1
+    economic = rows[(this_year, "economic", "sdf")]
+    assert economic["ppas_count"] == 2
+    assert economic["avg_budget"] == Decimal("500.00")
+
+
+def test_dashboard_functions_share_one_query(ppas):
+    with CaptureQueriesContext(connection) as queries:
+        trends = analytics.calculate_budget_trends(years=2)
+        forecast = analytics.forecast_budget_needs(horizon_years=1)
+        sectors = analytics.analyze_sector_performance()
+
+    assert len(queries) == 1
+    assert trends["total_budget"][-2:] == [100.0, 800.0]
+    assert trends["ppas_count"][-2:] == [1, 3]
+    assert trends["avg_budget_per_ppa"][-1] == 400.0
+    assert trends["sectors"]["social"][-2:] == [100.0, 300.0]
+    assert forecast["forecast_years"] == [timezone.now().year + 1]
+    assert [s["sector"] for s in sectors] == ["economic", "social"]
+    assert sectors[1]["completion_rate"] == 50.0
+
+
+def test_impact_metrics_use_rollup_totals(ppas):
+    metrics = analytics.calculate_impact_metrics()
+
+    assert metrics["total_ppas"] == 4
+    assert metrics["active_ppas"] == 2
+    assert metrics["total_beneficiaries"] == 15
+    assert metrics["total_budget"] == 900.0
+
+
+def test_rollup_is_recomputed_after_ppa_changes(ppas):
+    analytics.budget_rollup()
+
+    with CaptureQueriesContext(connection) as queries:
+        analytics.budget_rollup()
+    assert len(queries) == 0
+
+    ppas[0].budget_allocation = Decimal("150.00")
+    ppas[0].save()
+
+    assert analytics.analyze_sector_performance()[1]["total_budget"] == 450.0
@@ -1,7 +1,8 @@
 """Regression tests for monitoring Celery tasks."""
 
+from datetime import timedelta
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -13,10 +14,28 @@ except ImportError:  # pragma: no cover - handled via skip
         allow_module_level=True,
     )
 
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import DatabaseError
+from django.utils import timezone
+
+from common.models import StaffTeam, StaffTeamMembership
 from common.work_item_model import WorkItem
 from coordination.models import Organization
-from monitoring.models import MonitoringEntry
-from monitoring.tasks import auto_sync_ppa_progress, detect_budget_variances
+from monitoring import tasks as monitoring_tasks
+from monitoring.models import (
+    MonitoringEntry,
+    MonitoringEntryFunding,
+    MonitoringEntryWorkflowStage,
+)
+from monitoring.tasks import (
+    auto_sync_ppa_progress,
+    detect_budget_variances,
+    send_approval_deadline_reminders,
+    send_task_assignment_reminders,
+    send_workflow_deadline_reminders,
+)
+from project_central.models import Alert
 
 User = get_user_model()
 
@@ -105,25 +124,206 @@ def test_detect_budget_variances_flags_overspending(monkeypatch, staff_user, org
         updated_by=staff_user,
     )
 
-    # Inject stub for total_actual_disbursed
-    monkeypatch.setattr(
-        MonitoringEntry,
-        "total_actual_disbursed",
-        lambda self: Decimal("1250000.00"),
-        raising=False,
+    MonitoringEntryFunding.objects.create(
+        entry=ppa,
+        tranche_type=MonitoringEntryFunding.TRANCHE_DISBURSEMENT,
+        amount=Decimal("1250000.00"),
     )
 
-    # Patch Alert model within task to avoid cross-app dependencies
-    with patch("project_central.models.Alert") as mock_alert, patch(
-        "monitoring.utils.email.send_budget_variance_alert"
-    ) as mock_email:
-        mock_alert.objects.filter.return_value.first.return_value = None
-        mock_alert.create_alert = MagicMock()
-
+    with patch("monitoring.utils.email.send_budget_variance_alert") as mock_email:
         result = detect_budget_variances.apply(args=[], kwargs={}).get()
+        rerun = detect_budget_variances.apply(args=[], kwargs={}).get()
 
     assert result["total_variances"] == 1
     assert result["alerts_created"] == 1
     assert result["emails_sent"] == 1
-    mock_alert.create_alert.assert_called_once()
-    mock_email.assert_called_once_with(ppa, Decimal("250000.00"), 25.0)
+    alert = Alert.objects.get(related_ppa=ppa, alert_type="overspending")
+    assert alert.severity == "critical"
+    mock_email.assert_any_call(ppa, Decimal("250000.00"), 25.0)
+
+    # The active alert is not duplicated on the next run.
+    assert rerun["total_variances"] == 1
+    assert rerun["alerts_created"] == 0
+
+
+@pytest.mark.django_db
+def test_send_approval_deadline_reminders_bulk_creates_alerts(staff_user, organization):
+    ppas = [
+        MonitoringEntry.objects.create(
+            title=f"Pending PPA {idx}",
+            category="moa_ppa",
+            implementing_moa=organization,
+            status="planning",
+            approval_status=MonitoringEntry.APPROVAL_STATUS_TECHNICAL_REVIEW,
+            budget_allocation=Decimal("500000.00"),
+            fiscal_year=2025,
+            created_by=staff_user,
+            updated_by=staff_user,
+        )
+        for idx in range(3)
+    ]
+    now = timezone.now()
+    MonitoringEntry.objects.filter(pk=ppas[0].pk).update(updated_at=now - timedelta(days=20))
+    MonitoringEntry.objects.filter(pk=ppas[1].pk).update(updated_at=now - timedelta(days=9))
+
+    with patch(
+        "monitoring.utils.email.send_approval_deadline_reminder", return_value=True
+    ) as mock_email:
+        result = send_approval_deadline_reminders.apply(args=[], kwargs={}).get()
+
+    assert result["total_checked"] == 3
+    assert result["total_overdue"] == 2
+    assert result["reminders_sent"] == 2
+    assert result["alerts_created"] == 2
+    assert mock_email.call_count == 2
+    severities = dict(
+        Alert.objects.filter(alert_type="approval_bottleneck").values_list(
+            "related_ppa_id", "severity"
+        )
+    )
+    assert severities == {ppas[0].pk: "critical", ppas[1].pk: "high"}
+
+
+@pytest.mark.django_db
+def test_auto_sync_ppa_progress_resumes_after_committed_chunks(
+    monkeypatch, staff_user, organization
+):
+    ppas = sorted(
+        (
+            MonitoringEntry.objects.create(
+                title=f"Chunked PPA {idx}",
+                category="moa_ppa",
+                implementing_moa=organization,
+                status="ongoing",
+                fiscal_year=2025,
+                auto_sync_progress=True,
+                enable_workitem_tracking=True,
+                created_by=staff_user,
+                updated_by=staff_user,
+            )
+            for idx in range(3)
+        ),
+        key=lambda ppa: ppa.pk,
+    )
+    for ppa in ppas:
+        create_execution_project(ppa, created_by=staff_user, complete_children=1, total_children=4)
+
+    monkeypatch.setattr(monitoring_tasks, "TASK_CHUNK_SIZE", 1)
+    chunk_calls = []
+    calculate = monitoring_tasks._calculate_workitem_progress
+
+    def fail_on_second_chunk(chunk):
+        chunk_calls.append([ppa.pk for ppa in chunk])
+        if len(chunk_calls) == 2:
+            raise DatabaseError("database connection lost")
+        return calculate(chunk)
+
+    monkeypatch.setattr(
+        monitoring_tasks, "_calculate_workitem_progress", fail_on_second_chunk
+    )
+
+    with patch("monitoring.utils.email.send_progress_sync_notification"):
+        result = auto_sync_ppa_progress.apply(args=[], kwargs={}).get()
+
+    # The retry resumed at the failed chunk instead of the first PPA.
+    assert chunk_calls == [[ppas[0].pk], [ppas[1].pk], [ppas[1].pk], [ppas[2].pk]]
+    assert result["total_processed"] == 3
+    assert result["total_updated"] == 3
+    assert set(MonitoringEntry.objects.values_list("progress", flat=True)) == {25}
+
+
+@pytest.fixture
+def ppa(staff_user, organization):
+    return MonitoringEntry.objects.create(
+        title="Reminder PPA",
+        category="moa_ppa",
+        implementing_moa=organization,
+        status="ongoing",
+        fiscal_year=2025,
+        created_by=staff_user,
+        updated_by=staff_user,
+    )
+
+
+@pytest.mark.django_db
+def test_task_reminders_send_one_digest_per_recipient(settings, staff_user, ppa):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    staff_user.email = "assignee@example.com"
+    staff_user.save(update_fields=["email"])
+    today = timezone.now().date()
+
+    for title, due_date in [
+        ("Due soon", today + timedelta(days=2)),
+        ("Due later", today + timedelta(days=5)),
+        ("Overdue", today - timedelta(days=3)),
+        ("Not due", today + timedelta(days=10)),
+    ]:
+        task = WorkItem.objects.create(
+            work_type=WorkItem.WORK_TYPE_TASK,
+            title=title,
+            related_object=ppa,
+            due_date=due_date,
+            status=WorkItem.STATUS_IN_PROGRESS,
+            task_data={"domain": "monitoring"},
+        )
+        task.assignees.add(staff_user)
+
+    result = send_task_assignment_reminders.apply().get()
+
+    assert result["reminders_sent"] == 3
+    assert result["emails_sent"] == 1
+    assert (result["two_day_count"], result["five_day_count"], result["overdue_count"]) == (1, 1, 1)
+    assert len(mail.outbox) == 1
+    digest = mail.outbox[0]
+    assert digest.to == ["assignee@example.com"]
+    assert digest.subject == "[CRITICAL] Task Deadline Reminders (3)"
+    # Most urgent first, every item listed with its PPA.
+    assert digest.body.index("Overdue for Reminder PPA") < digest.body.index("Due soon")
+    assert "Due later for Reminder PPA" in digest.body
+    assert "Not due" not in digest.body
+
+
+@pytest.mark.django_db
+def test_workflow_reminders_digest_team_members(settings, staff_user, ppa):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    staff_user.email = "member@example.com"
+    staff_user.save(update_fields=["email"])
+    team = StaffTeam.objects.create(name="Budget Team")
+    StaffTeamMembership.objects.create(team=team, user=staff_user)
+    today = timezone.now().date()
+
+    for stage, due_date in [
+        (MonitoringEntryWorkflowStage.STAGE_BUDGET_CALL, today + timedelta(days=3)),
+        (MonitoringEntryWorkflowStage.STAGE_FORMULATION, today - timedelta(days=1)),
+    ]:
+        MonitoringEntryWorkflowStage.objects.create(
+            entry=ppa, stage=stage, owner_team=team, due_date=due_date
+        )
+
+    result = send_workflow_deadline_reminders.apply().get()
+
+    assert result["reminders_sent"] == 2
+    assert result["emails_sent"] == 1
+    assert [message.to for message in mail.outbox] == [["member@example.com"]]
+    assert mail.outbox[0].subject == "[CRITICAL] Workflow Deadline Reminders (2)"
+
+
+def test_reminder_digest_failures_do_not_stop_other_recipients(settings):
+    settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+    send_messages = EmailBackend.send_messages
+
+    def fail_for_bounced(self, messages):
+        if messages[0].to == ["bounced@example.com"]:
+            raise OSError("mailbox unavailable")
+        return send_messages(self, messages)
+
+    digests = {
+        "first@example.com": [("high", "Due soon")],
+        "bounced@example.com": [("high", "Due soon")],
+        "last@example.com": [("critical", "Overdue")],
+    }
+    with patch.object(EmailBackend, "send_messages", fail_for_bounced):
+        sent = monitoring_tasks._send_reminder_digests(digests, "Task Deadline Reminder", "[TEST]")
+
+    assert sent == 2
+    assert [message.to for message in mail.outbox] == [["first@example.com"], ["last@example.com"]]
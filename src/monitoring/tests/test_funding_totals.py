@@ -0,0 +1,94 @@
+"""Tests for annotated MonitoringEntry funding totals."""
+
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.db.models import Count, Sum
+from django.test.utils import CaptureQueriesContext
+
+from monitoring.models import MonitoringEntry, MonitoringEntryFunding
+from project_central.services.analytics_service import AnalyticsService
+
+pytestmark = pytest.mark.django_db
+
+
+def add_tranche(entry, tranche_type, amount):
+    return MonitoringEntryFunding.objects.create(
+        entry=entry, tranche_type=tranche_type, amount=Decimal(amount)
+    )
+
+
+@pytest.fixture
+def funded_entries(monitoring_entry_factory):
+    entries = []
+    for index in range(3):
+        entry = monitoring_entry_factory(title=f"Funded PPA {index}")
+        add_tranche(entry, "allocation", "1000.00")
+        add_tranche(entry, "allocation", "500.00")
+        add_tranche(entry, "obligation", "800.00")
+        add_tranche(entry, "disbursement", "200.00")
+        entries.append(entry)
+    monitoring_entry_factory(title="Unfunded PPA", status="completed")
+    return entries
+
+
+def test_annotated_entries_serve_totals_without_queries(funded_entries):
+    entries = list(MonitoringEntry.objects.with_funding_totals().order_by("title"))
+
+    with CaptureQueriesContext(connection) as queries:
+        funded = entries[0]
+        unfunded = entries[-1]
+        assert funded.total_allocations == Decimal("1500.00")
+        assert funded.total_obligations == Decimal("800.00")
+        assert funded.total_disbursements == Decimal("200.00")
+        assert unfunded.total_allocations == Decimal("0.00")
+        assert unfunded.total_disbursements == Decimal("0.00")
+
+    assert len(queries) == 0
+
+
+def test_prefetched_flows_are_used(funded_entries):
+    entry = MonitoringEntry.objects.prefetch_related("funding_flows").get(
+        pk=funded_entries[0].pk
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        assert entry.total_allocations == Decimal("1500.00")
+
+    assert len(queries) == 0
+
+
+def test_plain_entry_falls_back_to_query(funded_entries):
+    entry = MonitoringEntry.objects.get(pk=funded_entries[0].pk)
+
+    assert entry.total_obligations == Decimal("800.00")
+
+
+def test_annotations_compose_with_grouping_and_aggregates(funded_entries):
+    entries = MonitoringEntry.objects.with_funding_totals()
+
+    by_status = dict(
+        entries.values("status").annotate(count=Count("id")).values_list("status", "count")
+    )
+    totals = entries.aggregate(disbursed=Sum("total_disbursements_sum"))
+
+    assert by_status == {"planning": 3, "completed": 1}
+    assert totals["disbursed"] == Decimal("600.00")
+
+
+def test_analytics_query_count_does_not_grow_with_entries(
+    funded_entries, monitoring_entry_factory
+):
+    with CaptureQueriesContext(connection) as baseline:
+        AnalyticsService.get_utilization_rates()
+
+    for index in range(5):
+        entry = monitoring_entry_factory(title=f"Extra PPA {index}")
+        add_tranche(entry, "obligation", "100.00")
+
+    with CaptureQueriesContext(connection) as queries:
+        rates = AnalyticsService.get_utilization_rates()
+
+    assert len(queries) == len(baseline)
+    assert rates["ppa_utilization"]["total_obligations"] == 2900.0
@@ -301,6 +301,10 @@ WHITENOISE_MANIFEST_STRICT = False  # Graceful degradation if hashed file missin
 MEDIA_URL = "media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Private files: outside MEDIA_ROOT, never served by the web server, only
+# downloaded through authenticated views
+PRIVATE_MEDIA_ROOT = env("PRIVATE_MEDIA_ROOT", default=str(BASE_DIR / "private_media"))
+
 # File upload size limits
 DATA_UPLOAD_MAX_MEMORY_SIZE = 52428800  # 50MB for POST data
 FILE_UPLOAD_MAX_MEMORY_SIZE = 52428800  # 50MB for file uploads
@@ -489,6 +493,22 @@ CELERY_BEAT_SCHEDULE = {
         "schedule": crontab(hour=10, minute=0, day_of_month=1),
     },
     # ========================================================================
+    # MANA TASKS
+    # ========================================================================
+    # Delete background workshop exports older than their download link
+    "cleanup-workshop-exports": {
+        "task": "mana.cleanup_workshop_exports",
+        "schedule": crontab(minute=30),
+    },
+    # ========================================================================
+    # DASHBOARD TASKS
+    # ========================================================================
+    # Rebuild materialized dashboard metric snapshots every 15 minutes
+    "refresh-dashboard-metrics": {
+        "task": "common.tasks.refresh_dashboard_metrics",
+        "schedule": crontab(minute="*/15"),
+    },
+    # ========================================================================
     # CLEANUP TASKS
     # ========================================================================
     # Weekly cleanup of expired alerts every Sunday at 2:00 AM
@@ -655,6 +675,16 @@ GOOGLE_API_KEY = env.str("GOOGLE_API_KEY", default="")
 ENABLE_GEMINI_INTEGRATION_TESTS = env.bool(
     "ENABLE_GEMINI_INTEGRATION_TESTS", default=False
 )
+# GeminiService.generate_batch(): simultaneous API calls and optional
+# estimated-token budget per minute (unset = unlimited)
+GEMINI_BATCH_MAX_CONCURRENCY = env.int("GEMINI_BATCH_MAX_CONCURRENCY", default=4)
+GEMINI_BATCH_TOKENS_PER_MINUTE = env.int("GEMINI_BATCH_TOKENS_PER_MINUTE", default=None)
+# Semantic answer cache for the chat assistant: reuse answers to questions
+# whose embeddings are at least AI_SEMANTIC_CACHE_THRESHOLD cosine-similar
+AI_SEMANTIC_CACHE_ENABLED = env.bool("AI_SEMANTIC_CACHE_ENABLED", default=False)
+AI_SEMANTIC_CACHE_THRESHOLD = env.float("AI_SEMANTIC_CACHE_THRESHOLD", default=0.92)
+AI_SEMANTIC_CACHE_MAX_ENTRIES = env.int("AI_SEMANTIC_CACHE_MAX_ENTRIES", default=1000)
+AI_SEMANTIC_CACHE_TTL = env.int("AI_SEMANTIC_CACHE_TTL", default=3600)
 
 # ========== WORK HIERARCHY CONFIGURATION ==========
 # WorkItem Migration Completed: October 5, 2025
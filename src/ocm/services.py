@@ -0,0 +1,150 @@
+"""
+Cross-organization summaries for the OCM dashboards.
+
+The OCM views report budget and planning figures for every MOA. Instead of
+aggregating per organization, each measure is computed for all organizations
+with one grouped query and the result is cached per data version: saves and
+deletes of the source models bump their generation (``common.signals``), so
+the next request after a budget write recomputes the totals.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db.models import Prefetch, Sum
+
+from budget_execution.models.allotment import Allotment
+from budget_execution.models.disbursement import Disbursement
+from budget_preparation.models.budget_proposal import BudgetProposal
+from budget_preparation.models.program_budget import ProgramBudget
+from planning.models import AnnualWorkPlan, WorkPlanObjective
+
+SUMMARY_CACHE_PREFIX = "ocm:summary"
+SUMMARY_CACHE_TIMEOUT = 300  # seconds
+
+BUDGET_SOURCES = (
+    "budget_preparation.BudgetProposal",
+    "budget_preparation.ProgramBudget",
+    "budget_execution.Allotment",
+    "budget_execution.Obligation",
+    "budget_execution.Disbursement",
+)
+PLANNING_SOURCES = (
+    "budget_preparation.BudgetProposal",
+    "budget_preparation.ProgramBudget",
+    "planning.AnnualWorkPlan",
+    "planning.WorkPlanObjective",
+)
+
+BUDGET_MEASURES = ("proposed", "approved", "allocated", "disbursed")
+
+
+def _cached(name: str, sources, compute):
+    """Return ``compute()`` cached under the current generation of ``sources``."""
+    from common.services.cache_generations import model_generations
+
+    generations = model_generations(sources)
+    version = ".".join(str(generations[label]) for label in sources)
+    key = f"{SUMMARY_CACHE_PREFIX}:{name}:{version}"
+
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        cache.set(key, result, SUMMARY_CACHE_TIMEOUT)
+    return result
+
+
+def _totals_by_organization(queryset, organization_path: str, **sums) -> dict:
+    rows = (
+        queryset.order_by()
+        .values(organization_path)
+        .annotate(**{name: Sum(field) for name, field in sums.items()})
+    )
+    return {row[organization_path]: row for row in rows}
+
+
+def _compute_budget_totals() -> dict[int, dict[str, Decimal]]:
+    proposals = _totals_by_organization(
+        BudgetProposal.objects.all(),
+        "organization_id",
+        proposed="total_requested_budget",
+        approved="total_approved_budget",
+    )
+    allotments = _totals_by_organization(
+        Allotment.objects.all(),
+        "program_budget__budget_proposal__organization_id",
+        allocated="amount",
+    )
+    disbursements = _totals_by_organization(
+        Disbursement.objects.all(),
+        "obligation__allotment__program_budget__budget_proposal__organization_id",
+        disbursed="amount",
+    )
+
+    totals: dict[int, dict[str, Decimal]] = defaultdict(
+        lambda: dict.fromkeys(BUDGET_MEASURES, Decimal("0"))
+    )
+    for grouped in (proposals, allotments, disbursements):
+        for org_id, row in grouped.items():
+            for measure in BUDGET_MEASURES:
+                if row.get(measure):
+                    totals[org_id][measure] = row[measure]
+    return dict(totals)
+
+
+def budget_totals_by_organization() -> dict[int, dict[str, Decimal]]:
+    """
+    Proposed, approved, allocated and disbursed totals of every organization.
+
+    Returns:
+        dict: Organization id -> ``BUDGET_MEASURES`` totals; organizations
+        without budget records are omitted
+    """
+    return _cached("budget", BUDGET_SOURCES, _compute_budget_totals)
+
+
+def _compute_planning_metrics() -> dict[int, dict]:
+    plan_orgs = (
+        ProgramBudget.objects.filter(annual_work_plan__isnull=False)
+        .order_by()
+        .values_list("budget_proposal__organization_id", "annual_work_plan_id")
+        .distinct()
+    )
+    plans_by_org: dict[int, set[int]] = defaultdict(set)
+    for org_id, plan_id in plan_orgs:
+        plans_by_org[org_id].add(plan_id)
+
+    plan_ids = set().union(*plans_by_org.values()) if plans_by_org else set()
+    plans = {
+        plan.pk: plan
+        for plan in AnnualWorkPlan.objects.filter(pk__in=plan_ids).prefetch_related(
+            Prefetch("objectives", queryset=WorkPlanObjective.objects.order_by())
+        )
+    }
+
+    metrics = {}
+    for org_id, org_plan_ids in plans_by_org.items():
+        org_plans = [plans[plan_id] for plan_id in org_plan_ids]
+        metrics[org_id] = {
+            "active": sum(1 for plan in org_plans if plan.status in ("active", "approved")),
+            "completed": sum(1 for plan in org_plans if plan.status == "completed"),
+            "progress": [plan.overall_progress for plan in org_plans],
+        }
+    return metrics
+
+
+def planning_metrics_by_organization() -> dict[int, dict]:
+    """
+    Annual work plan counts and progress values per organization.
+
+    Plans are attributed to an organization through the program budgets of
+    its proposals, as BMMS tenant fields are not yet on the planning models.
+
+    Returns:
+        dict: Organization id -> ``active``/``completed`` plan counts and the
+        ``progress`` of each plan; organizations without plans are omitted
+    """
+    return _cached("planning", PLANNING_SOURCES, _compute_planning_metrics)
@@ -0,0 +1,18 @@
+"""
+Pytest configuration for OCM tests
+
+Reuses the budget preparation and execution fixtures.
+"""
+
+import pytest
+from django.core.cache import cache
+
+from budget_preparation.tests.fixtures.budget_data import *  # noqa: F401, F403
+from budget_execution.tests.fixtures.execution_data import *  # noqa: F401, F403
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
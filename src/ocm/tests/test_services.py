@@ -0,0 +1,84 @@
+"""Tests for the cross-organization OCM summaries."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from budget_execution.models.disbursement import Disbursement
+from budget_preparation.tests.fixtures.budget_data import create_budget_proposal
+from ocm import services
+from organizations.models import Organization
+
+pytestmark = pytest.mark.django_db
+
+
+def create_organization(code):
+    # Codes must not collide with the ministries seeded by organizations 0002.
+    return Organization.objects.create(code=code, name=f"Test Ministry {code}", org_type="ministry")
+
+
+def test_budget_totals_per_organization(disbursement, test_organization):
+    other = create_organization("TST1")
+    create_budget_proposal(organization=other, total_requested_budget=Decimal("5000.00"))
+
+    totals = services.budget_totals_by_organization()
+
+    assert totals[test_organization.pk] == {
+        "proposed": Decimal("100000000.00"),
+        "approved": Decimal("95000000.00"),
+        "allocated": Decimal("10000000.00"),
+        "disbursed": Decimal("2500000.00"),
+    }
+    assert totals[other.pk] == {
+        "proposed": Decimal("5000.00"),
+        "approved": Decimal("0"),
+        "allocated": Decimal("0"),
+        "disbursed": Decimal("0"),
+    }
+
+
+def test_budget_totals_query_count_does_not_grow_with_organizations(disbursement):
+    with CaptureQueriesContext(connection) as baseline:
+        before = services.budget_totals_by_organization()
+
+    for code in ("TST1", "TST2", "TST3"):
+        create_budget_proposal(organization=create_organization(code))
+
+    with CaptureQueriesContext(connection) as queries:
+        totals = services.budget_totals_by_organization()
+
+    assert len(totals) == len(before) + 3
+    assert len(queries) == len(baseline) == 3
+
+
+def test_budget_totals_are_cached_until_a_budget_write(disbursement, test_organization):
+    services.budget_totals_by_organization()
+    with CaptureQueriesContext(connection) as queries:
+        services.budget_totals_by_organization()
+    assert len(queries) == 0
+
+    Disbursement.objects.create(
+        obligation=disbursement.obligation,
+        amount=Decimal("500000.00"),
+        disbursed_at=date(2025, 4, 1),
+        payment_method="check",
+        disbursed_by=disbursement.disbursed_by,
+        status="paid",
+        reference_number="DIS-2025-OCM",
+    )
+
+    totals = services.budget_totals_by_organization()
+    assert totals[test_organization.pk]["disbursed"] == Decimal("3000000.00")
+
+
+def test_planning_metrics_follow_program_budgets(program_budget, annual_work_plan, test_organization):
+    metrics = services.planning_metrics_by_organization()
+
+    assert list(metrics) == [test_organization.pk]
+    org_metrics = metrics[test_organization.pk]
+    assert org_metrics["progress"] == [annual_work_plan.overall_progress]
+    expected_active = int(annual_work_plan.status in ("active", "approved"))
+    assert org_metrics["active"] == expected_active
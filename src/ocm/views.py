@@ -18,14 +18,18 @@ from django.db.models import F, Sum
 from django.utils.functional import cached_property
 from django.views.generic import TemplateView
 
-from budget_execution.models.allotment import Allotment
-from budget_execution.models.disbursement import Disbursement
 from budget_preparation.models.budget_proposal import BudgetProposal
 from budget_preparation.models.program_budget import ProgramBudget
 from coordination.models import InterMOAPartnership
 from organizations.models import Organization
 from planning.models import AnnualWorkPlan, StrategicPlan
 
+from .services import (
+    BUDGET_MEASURES,
+    budget_totals_by_organization,
+    planning_metrics_by_organization,
+)
+
 BILLION = Decimal("1000000000")
 
 
@@ -174,36 +178,21 @@ class ConsolidatedBudgetView(OCMBaseView):
         return context
 
     def _build_budget_summaries(self) -> list[dict]:
+        totals = budget_totals_by_organization()
+        empty = dict.fromkeys(BUDGET_MEASURES, Decimal("0"))
         summaries: list[dict] = []
 
         for org_entry in self.organizations:
             org = org_entry["instance"]
-            org_proposals = BudgetProposal.objects.filter(organization=org)
-
-            proposed = org_proposals.aggregate(total=Sum("total_requested_budget"))["total"] or Decimal("0")
-            approved = org_proposals.aggregate(total=Sum("total_approved_budget"))["total"] or Decimal("0")
-
-            allocated = (
-                Allotment.objects.filter(program_budget__budget_proposal__organization=org).aggregate(
-                    total=Sum("amount")
-                )["total"]
-                or Decimal("0")
-            )
-            disbursed = (
-                Disbursement.objects.filter(
-                    obligation__allotment__program_budget__budget_proposal__organization=org
-                ).aggregate(total=Sum("amount"))["total"]
-                or Decimal("0")
-            )
+            org_totals = totals.get(org.pk, empty)
 
             summaries.append(
                 {
                     "organization": org,
-                    "proposed": proposed,
-                    "approved": approved,
-                    "allocated": allocated,
-                    "disbursed": disbursed,
-                    "utilization_rate": _safe_percentage(disbursed, allocated),
+                    **org_totals,
+                    "utilization_rate": _safe_percentage(
+                        org_totals["disbursed"], org_totals["allocated"]
+                    ),
                 }
             )
 
@@ -251,27 +240,21 @@ class PlanningOverviewView(OCMBaseView):
         BMMS multi-tenant fields are still being rolled out for the planning app,
         so we approximate MOA coverage by following ProgramBudget relationships.
         """
+        metrics = planning_metrics_by_organization()
         results: list[dict] = []
 
         for org_entry in self.organizations:
-            org = org_entry["instance"]
-            related_plans = (
-                AnnualWorkPlan.objects.filter(program_budgets__budget_proposal__organization=org)
-                .distinct()
-                .prefetch_related("program_budgets")
-            )
-            if not related_plans.exists():
+            org_metrics = metrics.get(org_entry["instance"].pk)
+            if not org_metrics:
                 continue
 
-            completion_values = [plan.overall_progress for plan in related_plans]
-
             results.append(
                 {
                     "code": org_entry["code"],
                     "short_name": org_entry["short_name"],
-                    "active": related_plans.filter(status__in=["active", "approved"]).count(),
-                    "completed": related_plans.filter(status="completed").count(),
-                    "completion_rate": _average(completion_values),
+                    "active": org_metrics["active"],
+                    "completed": org_metrics["completed"],
+                    "completion_rate": _average(org_metrics["progress"]),
                 }
             )
 
@@ -20,6 +20,8 @@ from django.utils import timezone
 
 from ai_assistant.services.gemini_service import GeminiService
 
+from .features import milestone_counts, with_portfolio_features
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,12 +50,16 @@ class PPAAnomalyDetector:
         self.gemini = GeminiService(temperature=0.4)
         logger.info("PPAAnomalyDetector initialized")
 
-    def detect_budget_anomalies(self, ppa_id: Optional[int] = None) -> List[Dict]:
+    def detect_budget_anomalies(
+        self, ppa_id: Optional[int] = None, include_recommendations: bool = True
+    ) -> List[Dict]:
         """
         Detect budget overruns and underspending anomalies.
 
         Args:
             ppa_id: Optional PPA ID to analyze (None = all ongoing PPAs)
+            include_recommendations: Ask the AI service for recommendations
+                (False leaves ``recommendations`` empty)
 
         Returns:
             List of anomaly dictionaries with details and recommendations
@@ -70,14 +76,14 @@ class PPAAnomalyDetector:
                 budget_allocation=0
             )
 
-        # Fetch with funding totals
-        ppas = ppas.with_funding_totals()
+        # Fetch with every scoring input in one query
+        ppas = with_portfolio_features(ppas)
 
         anomalies = []
 
         for ppa in ppas:
             try:
-                anomaly = self._check_budget_anomaly(ppa)
+                anomaly = self._check_budget_anomaly(ppa, include_recommendations)
                 if anomaly:
                     anomalies.append(anomaly)
             except Exception as e:
@@ -92,7 +98,9 @@ class PPAAnomalyDetector:
         logger.info(f"Detected {len(anomalies)} budget anomalies")
         return anomalies
 
-    def _check_budget_anomaly(self, ppa) -> Optional[Dict]:
+    def _check_budget_anomaly(
+        self, ppa, include_recommendations: bool = True
+    ) -> Optional[Dict]:
         """
         Check individual PPA for budget anomaly.
 
@@ -130,9 +138,11 @@ class PPAAnomalyDetector:
         )
 
         # Get AI recommendations
-        recommendations = self._get_ai_budget_recommendations(
-            ppa, budget_util, timeline_progress, anomaly_type
-        )
+        recommendations = []
+        if include_recommendations:
+            recommendations = self._get_ai_budget_recommendations(
+                ppa, budget_util, timeline_progress, anomaly_type
+            )
 
         anomaly = {
             'ppa_id': ppa.id,
@@ -152,12 +162,16 @@ class PPAAnomalyDetector:
 
         return anomaly
 
-    def detect_timeline_delays(self, ppa_id: Optional[int] = None) -> List[Dict]:
+    def detect_timeline_delays(
+        self, ppa_id: Optional[int] = None, include_recommendations: bool = True
+    ) -> List[Dict]:
         """
         Detect projects likely to miss deadlines.
 
         Args:
             ppa_id: Optional PPA ID to analyze (None = all ongoing PPAs)
+            include_recommendations: Ask the AI service for recommendations
+                (False leaves ``recommendations`` empty)
 
         Returns:
             List of delay predictions with recommendations
@@ -171,14 +185,17 @@ class PPAAnomalyDetector:
             ppas = MonitoringEntry.objects.filter(
                 status__in=['planning', 'ongoing']
             ).exclude(
-                target_completion__isnull=True
+                target_end_date__isnull=True
             )
 
+        # Fetch with every scoring input in one query
+        ppas = with_portfolio_features(ppas)
+
         delays = []
 
         for ppa in ppas:
             try:
-                delay = self._check_timeline_delay(ppa)
+                delay = self._check_timeline_delay(ppa, include_recommendations)
                 if delay:
                     delays.append(delay)
             except Exception as e:
@@ -193,7 +210,9 @@ class PPAAnomalyDetector:
         logger.info(f"Detected {len(delays)} timeline delays")
         return delays
 
-    def _check_timeline_delay(self, ppa) -> Optional[Dict]:
+    def _check_timeline_delay(
+        self, ppa, include_recommendations: bool = True
+    ) -> Optional[Dict]:
         """
         Check individual PPA for timeline delay.
 
@@ -239,9 +258,11 @@ class PPAAnomalyDetector:
             severity = 'MEDIUM'
 
         # Generate recommendations
-        recommendations = self._get_ai_timeline_recommendations(
-            ppa, actual_progress, timeline_progress, predicted_delay_days
-        )
+        recommendations = []
+        if include_recommendations:
+            recommendations = self._get_ai_timeline_recommendations(
+                ppa, actual_progress, timeline_progress, predicted_delay_days
+            )
 
         delay = {
             'ppa_id': ppa.id,
@@ -290,12 +311,10 @@ class PPAAnomalyDetector:
         - Status field if available
         """
         # Try to get progress from milestones
-        milestones = getattr(ppa, 'milestones', None)
-        if milestones and milestones.exists():
-            total = milestones.count()
-            completed = milestones.filter(status='completed').count()
-            if total > 0:
-                return completed / total
+        counts = milestone_counts(ppa)
+        if counts:
+            completed, total = counts
+            return completed / total
 
         # Fallback: Use status as rough estimate
         if ppa.status == 'completed':
@@ -492,15 +511,26 @@ Return ONLY a valid JSON array of strings (no markdown, no extra text):
                 "Increase monitoring frequency to weekly status updates"
             ]
 
-    def get_anomaly_summary(self) -> Dict:
+    def get_anomaly_summary(
+        self,
+        budget_anomalies: Optional[List[Dict]] = None,
+        timeline_delays: Optional[List[Dict]] = None,
+    ) -> Dict:
         """
         Get summary of all anomalies across all PPAs.
 
+        Args:
+            budget_anomalies: Results of ``detect_budget_anomalies()`` to
+                summarize (detected without recommendations when omitted)
+            timeline_delays: Results of ``detect_timeline_delays()``, likewise
+
         Returns:
             Dictionary with counts and severity breakdown
         """
-        budget_anomalies = self.detect_budget_anomalies()
-        timeline_delays = self.detect_timeline_delays()
+        if budget_anomalies is None:
+            budget_anomalies = self.detect_budget_anomalies(include_recommendations=False)
+        if timeline_delays is None:
+            timeline_delays = self.detect_timeline_delays(include_recommendations=False)
 
         # Count by severity
         def count_by_severity(anomalies):
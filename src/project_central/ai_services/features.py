@@ -0,0 +1,108 @@
+"""
+PPA Feature Loading for Portfolio Scoring
+
+The AI services score each PPA from the same handful of inputs: funding
+totals, milestone completion, dates, status and the number of supporting
+organizations and communities. Read per PPA these cost several queries
+each; ``with_portfolio_features()`` annotates all of them onto a
+MonitoringEntry queryset so a whole portfolio is loaded in one query and
+scored in memory.
+
+The accessors read the annotations when present and fall back to per-PPA
+queries for entries loaded any other way, so single-PPA and portfolio
+scoring always see the same values.
+"""
+
+from typing import Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+# Reverse relation holding a PPA's implementation milestones, when the
+# monitoring models provide one.
+MILESTONE_RELATION = "milestones"
+MILESTONE_COMPLETED_STATUS = "completed"
+
+COUNTED_RELATIONS = ("supporting_organizations", "communities")
+
+
+def _relation_field(relation: str):
+    from monitoring.models import MonitoringEntry
+
+    try:
+        return MonitoringEntry._meta.get_field(relation)
+    except FieldDoesNotExist:
+        return None
+
+
+def _count_subquery(relation: str, **filters):
+    """Correlated row count of ``relation`` for each entry."""
+    field = _relation_field(relation)
+    if field.many_to_many and not field.auto_created:
+        model = field.remote_field.through
+        lookup = field.m2m_field_name()
+    else:
+        model = field.related_model
+        lookup = field.field.name
+
+    counts = (
+        model.objects.filter(**{lookup: OuterRef("pk")}, **filters)
+        .order_by()
+        .values(lookup)
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts[:1]), Value(0), output_field=IntegerField())
+
+
+def with_portfolio_features(queryset):
+    """
+    Annotate a MonitoringEntry queryset with every scoring input.
+
+    Args:
+        queryset: MonitoringEntry queryset
+
+    Returns:
+        Queryset with funding totals, ``<relation>_count`` for
+        ``COUNTED_RELATIONS`` and, when milestones exist,
+        ``milestones_total``/``milestones_completed``
+    """
+    annotations = {
+        f"{relation}_count": _count_subquery(relation)
+        for relation in COUNTED_RELATIONS
+    }
+    if _relation_field(MILESTONE_RELATION) is not None:
+        annotations["milestones_total"] = _count_subquery(MILESTONE_RELATION)
+        annotations["milestones_completed"] = _count_subquery(
+            MILESTONE_RELATION, status=MILESTONE_COMPLETED_STATUS
+        )
+    return queryset.with_funding_totals().annotate(**annotations)
+
+
+def related_count(ppa, relation: str) -> int:
+    """Number of rows in ``relation``, from the annotation when loaded."""
+    attribute = f"{relation}_count"
+    if attribute in ppa.__dict__:
+        return ppa.__dict__[attribute]
+    return getattr(ppa, relation).count()
+
+
+def milestone_counts(ppa) -> Optional[Tuple[int, int]]:
+    """
+    Completed and total milestones of a PPA.
+
+    Returns:
+        ``(completed, total)``, or None when the PPA has no milestones
+    """
+    if "milestones_total" in ppa.__dict__:
+        total = ppa.milestones_total
+        completed = ppa.milestones_completed
+    else:
+        milestones = getattr(ppa, MILESTONE_RELATION, None)
+        if not milestones or not milestones.exists():
+            return None
+        total = milestones.count()
+        completed = milestones.filter(status=MILESTONE_COMPLETED_STATUS).count()
+
+    return (completed, total) if total > 0 else None
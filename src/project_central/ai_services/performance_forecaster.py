@@ -7,20 +7,24 @@ Forecasts PPA outcomes using time series analysis and AI:
 - Success probability estimation
 - Risk factor identification
 
-Uses historical progress data and AI-powered factor analysis.
+Forecasts are computed for a whole portfolio at once: every PPA's inputs
+are loaded in one annotated query and turned into feature arrays, and
+progress, velocity, forecast dates, utilization projections and success
+probabilities are NumPy operations over those arrays. The single-PPA
+methods forecast a portfolio of one.
 """
 
 import json
 import logging
-from datetime import date, timedelta
-from decimal import Decimal
-from typing import Dict, List, Optional
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
 
-from django.db.models import Avg, Q
-from django.utils import timezone
+import numpy as np
 
 from ai_assistant.services.gemini_service import GeminiService
 
+from .features import milestone_counts, with_portfolio_features
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,12 +37,28 @@ class PerformanceForecaster:
     - Budget utilization forecast
     - Success probability estimation
     - AI-powered factor analysis
+    - Portfolio-wide forecasting
     """
 
     # Confidence thresholds
     HIGH_CONFIDENCE = 0.8
     MEDIUM_CONFIDENCE = 0.6
 
+    # PPAs forecast by default
+    ACTIVE_STATUSES = ['planning', 'ongoing']
+
+    # Progress estimate when a PPA has no milestones
+    STATUS_PROGRESS = {'completed': 1.0, 'ongoing': 0.5, 'planning': 0.1}
+    ONGOING_PROGRESS_CAP = 0.9
+
+    # Success score contributed by status
+    STATUS_HEALTH = {
+        'completed': 1.0,
+        'ongoing': 0.7,
+        'planning': 0.5,
+        'on_hold': 0.2,
+    }
+
     def __init__(self):
         """Initialize forecaster with AI service."""
         self.gemini = GeminiService(temperature=0.3)
@@ -60,72 +80,8 @@ class PerformanceForecaster:
             - factors: List of factors affecting timeline
             - velocity: Current progress velocity
         """
-        from monitoring.models import MonitoringEntry
-
-        try:
-            ppa = MonitoringEntry.objects.get(id=ppa_id)
-        except MonitoringEntry.DoesNotExist:
-            return {'error': f'PPA {ppa_id} not found'}
-
-        # Check if we have enough data to forecast
-        if not ppa.start_date or not ppa.target_completion:
-            return {
-                'error': 'Insufficient data: PPA missing start date or target completion date'
-            }
-
-        # Calculate current progress
-        actual_progress = self._get_actual_progress(ppa)
-
-        # Calculate historical progress rate (velocity)
-        velocity = self._calculate_velocity(ppa, actual_progress)
-
-        # Predict completion date
-        if velocity > 0 and actual_progress < 1.0:
-            # Days needed to complete remaining work
-            remaining_progress = 1.0 - actual_progress
-            days_to_complete = remaining_progress / velocity
-
-            predicted_completion = date.today() + timedelta(days=days_to_complete)
-        elif actual_progress >= 1.0:
-            # Already complete
-            predicted_completion = date.today()
-        else:
-            # Cannot predict (no progress)
-            predicted_completion = None
-
-        # Calculate delay
-        if predicted_completion and ppa.target_completion:
-            delay_days = (predicted_completion - ppa.target_completion).days
-        else:
-            delay_days = None
-
-        # Calculate confidence
-        confidence = self._calculate_forecast_confidence(ppa, actual_progress, velocity)
-
-        # AI-powered factor analysis
-        factors = self._analyze_timeline_factors(ppa, actual_progress, velocity, delay_days)
-
-        forecast = {
-            'ppa_id': ppa.id,
-            'ppa_name': ppa.title,
-            'predicted_completion': predicted_completion.isoformat() if predicted_completion else None,
-            'planned_completion': ppa.target_completion.isoformat(),
-            'delay_days': max(0, delay_days) if delay_days else 0,
-            'is_on_time': delay_days is not None and delay_days <= 0,
-            'current_progress': round(actual_progress, 3),
-            'velocity': round(velocity, 5),  # Progress per day
-            'confidence': round(confidence, 2),
-            'confidence_level': self._get_confidence_level(confidence),
-            'factors': factors,
-            'forecast_date': date.today().isoformat(),
-        }
-
-        logger.info(
-            f"Forecasted completion for PPA {ppa_id}: "
-            f"{predicted_completion} (delay: {delay_days} days)"
-        )
-
-        return forecast
+        forecast = self._forecast_ppa(ppa_id, include_factors=True)
+        return forecast.get('timeline', forecast)
 
     def forecast_budget_utilization(self, ppa_id: int) -> Dict:
         """
@@ -143,70 +99,8 @@ class PerformanceForecaster:
             - confidence: Confidence level
             - spending_trend: Current spending pattern
         """
-        from monitoring.models import MonitoringEntry
-
-        try:
-            ppa = MonitoringEntry.objects.with_funding_totals().get(id=ppa_id)
-        except MonitoringEntry.DoesNotExist:
-            return {'error': f'PPA {ppa_id} not found'}
-
-        if not ppa.budget_allocation or ppa.budget_allocation == 0:
-            return {'error': 'PPA has no budget allocation'}
-
-        # Get current metrics
-        current_spending = float(ppa.total_disbursements_sum or 0)
-        budget_allocation = float(ppa.budget_allocation)
-        actual_progress = self._get_actual_progress(ppa)
-
-        # Calculate spending rate
-        if actual_progress > 0:
-            spending_rate = current_spending / actual_progress
-        else:
-            spending_rate = 0
-
-        # Forecast final spending
-        if actual_progress < 1.0 and spending_rate > 0:
-            predicted_total_spending = spending_rate * 1.0  # 100% complete
-        else:
-            predicted_total_spending = current_spending
-
-        # Calculate variance
-        variance = predicted_total_spending - budget_allocation
-        variance_percent = (variance / budget_allocation * 100) if budget_allocation > 0 else 0
-
-        # Determine spending trend
-        spending_trend = self._analyze_spending_trend(
-            current_spending, budget_allocation, actual_progress
-        )
-
-        # Calculate confidence
-        confidence = self._calculate_budget_forecast_confidence(
-            ppa, actual_progress, current_spending
-        )
-
-        forecast = {
-            'ppa_id': ppa.id,
-            'ppa_name': ppa.title,
-            'predicted_total_spending': round(predicted_total_spending, 2),
-            'budget_allocation': budget_allocation,
-            'current_spending': current_spending,
-            'variance': round(variance, 2),
-            'variance_percent': round(variance_percent, 2),
-            'is_within_budget': variance <= 0,
-            'current_progress': round(actual_progress, 3),
-            'spending_rate': round(spending_rate, 2),
-            'spending_trend': spending_trend,
-            'confidence': round(confidence, 2),
-            'confidence_level': self._get_confidence_level(confidence),
-            'forecast_date': date.today().isoformat(),
-        }
-
-        logger.info(
-            f"Forecasted budget for PPA {ppa_id}: "
-            f"₱{predicted_total_spending:,.2f} (variance: {variance_percent:.1f}%)"
-        )
-
-        return forecast
+        forecast = self._forecast_ppa(ppa_id)
+        return forecast.get('budget', forecast)
 
     def estimate_success_probability(self, ppa_id: int) -> Dict:
         """
@@ -222,172 +116,431 @@ class PerformanceForecaster:
             - success_factors: Positive indicators
             - overall_assessment: AI-generated assessment
         """
+        forecast = self._forecast_ppa(ppa_id)
+        return forecast.get('success', forecast)
+
+    def _forecast_ppa(self, ppa_id: int, include_factors: bool = False) -> Dict:
+        """Forecast a portfolio of one PPA."""
         from monitoring.models import MonitoringEntry
 
-        try:
-            ppa = MonitoringEntry.objects.with_funding_totals().get(id=ppa_id)
-        except MonitoringEntry.DoesNotExist:
+        forecasts = self.forecast_portfolio(
+            MonitoringEntry.objects.filter(id=ppa_id),
+            include_factors=include_factors,
+        )
+        if not forecasts:
             return {'error': f'PPA {ppa_id} not found'}
+        return next(iter(forecasts.values()))
 
-        # Get forecasts
-        timeline_forecast = self.forecast_completion_date(ppa_id)
-        budget_forecast = self.forecast_budget_utilization(ppa_id)
+    def forecast_portfolio(self, ppas=None, include_factors: bool = False) -> Dict[Any, Dict]:
+        """
+        Forecast timeline, budget and success for many PPAs at once.
+
+        Args:
+            ppas: MonitoringEntry queryset (default: all planning/ongoing PPAs)
+            include_factors: Add AI timeline factors, requested as one batch
 
-        # Calculate component scores
-        timeline_score = self._score_timeline_health(timeline_forecast)
-        budget_score = self._score_budget_health(budget_forecast)
-        status_score = self._score_status_health(ppa)
+        Returns:
+            PPA id -> ``{'timeline': ..., 'budget': ..., 'success': ...}``,
+            each in the format of the matching single-PPA method
+        """
+        from monitoring.models import MonitoringEntry
 
-        # Overall probability (weighted average)
-        success_probability = (
-            timeline_score * 0.4 +
-            budget_score * 0.4 +
-            status_score * 0.2
+        if ppas is None:
+            ppas = MonitoringEntry.objects.filter(status__in=self.ACTIVE_STATUSES)
+
+        entries = list(with_portfolio_features(ppas))
+        if not entries:
+            return {}
+
+        entries, features = self._build_features(entries)
+        timeline = self._forecast_timelines(features)
+        budget = self._forecast_budgets(features)
+        success = self._estimate_success(features, timeline, budget)
+
+        # PPAs whose forecast cannot be built are logged and left out, so one
+        # bad row does not fail the whole portfolio.
+        results = {}
+        for row, ppa in enumerate(entries):
+            try:
+                results[row] = {
+                    'timeline': self._timeline_result(ppa, timeline, row),
+                    'budget': self._budget_result(ppa, features, budget, row),
+                }
+            except Exception as e:
+                logger.error(f"Error forecasting PPA {ppa.id}: {e}")
+
+        if include_factors:
+            self._add_ai_timeline_factors(entries, timeline, results)
+
+        forecasts = {}
+        for row, result in results.items():
+            ppa = entries[row]
+            try:
+                result['success'] = self._success_result(
+                    ppa, success, row, result['timeline'], result['budget']
+                )
+            except Exception as e:
+                logger.error(f"Error forecasting PPA {ppa.id}: {e}")
+                continue
+            forecasts[ppa.id] = result
+
+        logger.info(f"Forecasted {len(forecasts)} PPAs")
+        return forecasts
+
+    # ------------------------------------------------------------------ #
+    # Feature arrays
+    # ------------------------------------------------------------------ #
+
+    def _build_features(self, ppas: List) -> Tuple[List, Dict[str, np.ndarray]]:
+        """
+        Column arrays of every forecasting input, one row per PPA.
+
+        PPAs whose inputs cannot be read are logged and skipped; the
+        returned list holds the PPA behind each row.
+        """
+        rows = []
+        inputs = []
+        for ppa in ppas:
+            try:
+                inputs.append(self._ppa_inputs(ppa))
+            except Exception as e:
+                logger.error(f"Error forecasting PPA {ppa.id}: {e}")
+                continue
+            rows.append(ppa)
+
+        count = len(rows)
+        start = np.zeros(count)
+        target = np.zeros(count)
+        has_start = np.zeros(count, dtype=bool)
+        has_target = np.zeros(count, dtype=bool)
+        milestones_completed = np.zeros(count)
+        milestones_total = np.zeros(count)
+        budget = np.zeros(count)
+        spending = np.zeros(count)
+
+        for row, (start_date, target_date, counts, allocation, spent) in enumerate(inputs):
+            if start_date:
+                has_start[row] = True
+                start[row] = start_date.toordinal()
+            if target_date:
+                has_target[row] = True
+                target[row] = target_date.toordinal()
+            if counts:
+                milestones_completed[row], milestones_total[row] = counts
+            budget[row] = allocation
+            spending[row] = spent
+
+        today = date.today().toordinal()
+        return rows, {
+            'today': today,
+            'status': np.array([ppa.status for ppa in rows], dtype=object),
+            'has_start': has_start,
+            'has_target': has_target,
+            'target': target,
+            'elapsed_days': np.where(has_start, today - start, 0.0),
+            'total_days': np.where(has_start & has_target, target - start, 0.0),
+            'milestones_completed': milestones_completed,
+            'milestones_total': milestones_total,
+            'budget': budget,
+            'spending': spending,
+        }
+
+    @staticmethod
+    def _ppa_inputs(ppa) -> Tuple:
+        """Start date, target date, milestone counts, budget and spending of a PPA."""
+        return (
+            ppa.start_date,
+            ppa.target_completion,
+            milestone_counts(ppa),
+            float(ppa.budget_allocation or 0),
+            float(ppa.total_disbursements_sum or 0),
         )
 
-        # Identify factors
-        risk_factors = self._identify_risk_factors(ppa, timeline_forecast, budget_forecast)
-        success_factors = self._identify_success_factors(ppa, timeline_forecast, budget_forecast)
+    def _progress(self, features: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Actual progress (0.0 to 1.0) of each PPA.
+
+        Uses milestones if available, otherwise estimates from status;
+        ongoing PPAs with a timeline use elapsed time, capped at 90%.
+        """
+        status = features['status']
+        progress = np.array([self.STATUS_PROGRESS.get(s, 0.0) for s in status])
+
+        total_days = features['total_days']
+        timed = (status == 'ongoing') & (total_days > 0)
+        elapsed_share = np.divide(
+            features['elapsed_days'], total_days,
+            out=np.zeros_like(total_days), where=total_days > 0,
+        )
+        progress = np.where(
+            timed, np.clip(elapsed_share, 0.0, self.ONGOING_PROGRESS_CAP), progress
+        )
 
-        # AI assessment
-        assessment = self._generate_success_assessment(
-            ppa, success_probability, risk_factors, success_factors
+        milestones_total = features['milestones_total']
+        milestone_share = np.divide(
+            features['milestones_completed'], milestones_total,
+            out=np.zeros_like(milestones_total), where=milestones_total > 0,
+        )
+        return np.where(milestones_total > 0, milestone_share, progress)
+
+    # ------------------------------------------------------------------ #
+    # Vectorized forecasts
+    # ------------------------------------------------------------------ #
+
+    def _forecast_timelines(self, features: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Velocity, predicted completion, delay and confidence arrays."""
+        progress = self._progress(features)
+        elapsed_days = features['elapsed_days']
+        can_forecast = features['has_start'] & features['has_target']
+
+        # Progress per day (e.g., 0.01 = 1% per day)
+        velocity = np.divide(
+            progress, elapsed_days,
+            out=np.zeros_like(progress),
+            where=features['has_start'] & (elapsed_days > 0),
         )
 
-        result = {
-            'ppa_id': ppa.id,
-            'ppa_name': ppa.title,
-            'success_probability': round(success_probability, 2),
-            'success_rating': self._get_success_rating(success_probability),
-            'timeline_score': round(timeline_score, 2),
-            'budget_score': round(budget_score, 2),
-            'status_score': round(status_score, 2),
-            'risk_factors': risk_factors,
-            'success_factors': success_factors,
-            'overall_assessment': assessment,
-            'forecast_date': date.today().isoformat(),
+        # Days needed to complete remaining work; NaN when unpredictable
+        predictable = (velocity > 0) & (progress < 1.0)
+        days_to_complete = np.divide(
+            1.0 - progress, velocity,
+            out=np.full_like(progress, np.nan), where=predictable,
+        )
+        days_to_complete = np.where(progress >= 1.0, 0.0, days_to_complete)
+
+        predicted = features['today'] + np.floor(days_to_complete)
+        predicted[predicted > date.max.toordinal()] = np.nan
+        delay = predicted - features['target']
+
+        # Confidence grows with progress, velocity and clear dates
+        confidence = (
+            0.5
+            + np.select([progress > 0.7, progress > 0.4, progress > 0.2], [0.3, 0.2, 0.1], 0.0)
+            + np.where(velocity > 0, 0.1, 0.0)
+            + np.where(can_forecast, 0.1, 0.0)
+        )
+
+        return {
+            'can_forecast': can_forecast,
+            'progress': progress,
+            'velocity': velocity,
+            'predicted': predicted,
+            'delay': delay,
+            'confidence': np.minimum(confidence, 1.0),
         }
 
-        logger.info(
-            f"Success probability for PPA {ppa_id}: {success_probability:.0%}"
+    def _forecast_budgets(self, features: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Spending rate, projected spending, variance and confidence arrays."""
+        progress = self._progress(features)
+        budget = features['budget']
+        spending = features['spending']
+
+        spending_rate = np.divide(
+            spending, progress, out=np.zeros_like(spending), where=progress > 0
         )
 
-        return result
+        # Forecast final spending at 100% completion
+        predicted_total = np.where(
+            (progress < 1.0) & (spending_rate > 0), spending_rate, spending
+        )
 
-    def _get_actual_progress(self, ppa) -> float:
-        """
-        Get actual project progress (0.0 to 1.0).
+        variance = predicted_total - budget
+        variance_percent = np.divide(
+            variance * 100, budget, out=np.zeros_like(variance), where=budget > 0
+        )
 
-        Uses milestones if available, otherwise estimates from status.
-        """
-        # Try milestones first
-        milestones = getattr(ppa, 'milestones', None)
-        if milestones and milestones.exists():
-            total = milestones.count()
-            completed = milestones.filter(status='completed').count()
-            if total > 0:
-                return completed / total
-
-        # Fallback to status-based estimate
-        if ppa.status == 'completed':
-            return 1.0
-        elif ppa.status == 'ongoing':
-            # Estimate based on timeline
-            if ppa.start_date and ppa.target_completion:
-                total_days = (ppa.target_completion - ppa.start_date).days
-                elapsed_days = (date.today() - ppa.start_date).days
-                if total_days > 0:
-                    return min(max(elapsed_days / total_days, 0.0), 0.9)  # Cap at 90%
-            return 0.5  # Default midpoint
-        elif ppa.status == 'planning':
-            return 0.1
-
-        return 0.0
-
-    def _calculate_velocity(self, ppa, actual_progress: float) -> float:
-        """
-        Calculate progress velocity (progress per day).
+        confidence = (
+            0.5
+            + np.select([progress > 0.6, progress > 0.3], [0.3, 0.2], 0.0)
+            + np.where(spending > 0, 0.2, 0.0)
+        )
 
-        Returns:
-            Progress per day (e.g., 0.01 = 1% per day)
-        """
-        if not ppa.start_date:
-            return 0.0
+        return {
+            'has_budget': budget > 0,
+            'progress': progress,
+            'spending_rate': spending_rate,
+            'predicted_total': predicted_total,
+            'variance': variance,
+            'variance_percent': variance_percent,
+            'confidence': np.minimum(confidence, 1.0),
+        }
 
-        days_elapsed = (date.today() - ppa.start_date).days
+    def _estimate_success(
+        self,
+        features: Dict[str, np.ndarray],
+        timeline: Dict[str, np.ndarray],
+        budget: Dict[str, np.ndarray],
+    ) -> Dict[str, np.ndarray]:
+        """Timeline, budget and status scores and their weighted probability."""
+        # Reported delay: positive days late, 0 when on time or unknown
+        delay = np.nan_to_num(timeline['delay'], nan=0.0)
+        reported_delay = np.maximum(delay, 0.0)
+        timeline_score = np.select(
+            [reported_delay <= 0, reported_delay <= 7, reported_delay <= 14, reported_delay <= 30],
+            [1.0, 0.8, 0.6, 0.4],
+            0.2,
+        )
+        timeline_score = np.where(timeline['can_forecast'], timeline_score, 0.5)
 
-        if days_elapsed > 0:
-            return actual_progress / days_elapsed
+        variance_percent = np.round(budget['variance_percent'], 2)
+        budget_score = np.select(
+            [variance_percent <= 0, variance_percent <= 5, variance_percent <= 10, variance_percent <= 20],
+            [1.0, 0.9, 0.7, 0.5],
+            0.3,
+        )
+        budget_score = np.where(budget['has_budget'], budget_score, 0.5)
 
-        return 0.0
+        status_score = np.array(
+            [self.STATUS_HEALTH.get(s, 0.5) for s in features['status']]
+        )
 
-    def _calculate_forecast_confidence(
-        self, ppa, actual_progress: float, velocity: float
-    ) -> float:
-        """
-        Calculate confidence in the forecast (0.0 to 1.0).
+        return {
+            'timeline_score': timeline_score,
+            'budget_score': budget_score,
+            'status_score': status_score,
+            'probability': timeline_score * 0.4 + budget_score * 0.4 + status_score * 0.2,
+        }
 
-        Higher confidence when:
-        - More progress has been made
-        - Consistent velocity
-        - Clear start/end dates
-        """
-        confidence = 0.5  # Base confidence
+    # ------------------------------------------------------------------ #
+    # Per-PPA results
+    # ------------------------------------------------------------------ #
 
-        # More progress = higher confidence
-        if actual_progress > 0.7:
-            confidence += 0.3
-        elif actual_progress > 0.4:
-            confidence += 0.2
-        elif actual_progress > 0.2:
-            confidence += 0.1
+    def _timeline_result(self, ppa, timeline, row) -> Dict:
+        if not timeline['can_forecast'][row]:
+            return {
+                'error': 'Insufficient data: PPA missing start date or target completion date'
+            }
 
-        # Positive velocity increases confidence
-        if velocity > 0:
-            confidence += 0.1
+        predicted = timeline['predicted'][row]
+        predicted_completion = (
+            None if np.isnan(predicted) else date.fromordinal(int(predicted))
+        )
+        delay_days = self._delay_days(timeline, row)
+        progress = float(timeline['progress'][row])
+        velocity = float(timeline['velocity'][row])
+        confidence = float(timeline['confidence'][row])
 
-        # Clear dates increase confidence
-        if ppa.start_date and ppa.target_completion:
-            confidence += 0.1
+        return {
+            'ppa_id': ppa.id,
+            'ppa_name': ppa.title,
+            'predicted_completion': predicted_completion.isoformat() if predicted_completion else None,
+            'planned_completion': ppa.target_completion.isoformat(),
+            'delay_days': max(0, delay_days) if delay_days else 0,
+            'is_on_time': delay_days is not None and delay_days <= 0,
+            'current_progress': round(progress, 3),
+            'velocity': round(velocity, 5),  # Progress per day
+            'confidence': round(confidence, 2),
+            'confidence_level': self._get_confidence_level(confidence),
+            'factors': self._fallback_timeline_factors(progress, velocity, delay_days),
+            'forecast_date': date.today().isoformat(),
+        }
 
-        return min(confidence, 1.0)
+    def _budget_result(self, ppa, features, budget, row) -> Dict:
+        if not budget['has_budget'][row]:
+            return {'error': 'PPA has no budget allocation'}
 
-    def _calculate_budget_forecast_confidence(
-        self, ppa, actual_progress: float, current_spending: float
-    ) -> float:
-        """Calculate confidence in budget forecast."""
-        confidence = 0.5
+        current_spending = float(features['spending'][row])
+        budget_allocation = float(features['budget'][row])
+        progress = float(budget['progress'][row])
+        variance = float(budget['variance'][row])
+        confidence = float(budget['confidence'][row])
 
-        # More progress = better forecast
-        if actual_progress > 0.6:
-            confidence += 0.3
-        elif actual_progress > 0.3:
-            confidence += 0.2
+        return {
+            'ppa_id': ppa.id,
+            'ppa_name': ppa.title,
+            'predicted_total_spending': round(float(budget['predicted_total'][row]), 2),
+            'budget_allocation': budget_allocation,
+            'current_spending': current_spending,
+            'variance': round(variance, 2),
+            'variance_percent': round(float(budget['variance_percent'][row]), 2),
+            'is_within_budget': variance <= 0,
+            'current_progress': round(progress, 3),
+            'spending_rate': round(float(budget['spending_rate'][row]), 2),
+            'spending_trend': self._analyze_spending_trend(
+                current_spending, budget_allocation, progress
+            ),
+            'confidence': round(confidence, 2),
+            'confidence_level': self._get_confidence_level(confidence),
+            'forecast_date': date.today().isoformat(),
+        }
 
-        # Some spending has occurred
-        if current_spending > 0:
-            confidence += 0.2
+    def _success_result(self, ppa, success, row, timeline_forecast, budget_forecast) -> Dict:
+        success_probability = float(success['probability'][row])
 
-        return min(confidence, 1.0)
+        # Identify factors
+        risk_factors = self._identify_risk_factors(ppa, timeline_forecast, budget_forecast)
+        success_factors = self._identify_success_factors(ppa, timeline_forecast, budget_forecast)
 
-    def _get_confidence_level(self, confidence: float) -> str:
-        """Convert confidence score to level."""
-        if confidence >= self.HIGH_CONFIDENCE:
-            return 'HIGH'
-        elif confidence >= self.MEDIUM_CONFIDENCE:
-            return 'MEDIUM'
-        return 'LOW'
+        return {
+            'ppa_id': ppa.id,
+            'ppa_name': ppa.title,
+            'success_probability': round(success_probability, 2),
+            'success_rating': self._get_success_rating(success_probability),
+            'timeline_score': round(float(success['timeline_score'][row]), 2),
+            'budget_score': round(float(success['budget_score'][row]), 2),
+            'status_score': round(float(success['status_score'][row]), 2),
+            'risk_factors': risk_factors,
+            'success_factors': success_factors,
+            'overall_assessment': self._generate_success_assessment(
+                ppa, success_probability, risk_factors, success_factors
+            ),
+            'forecast_date': date.today().isoformat(),
+        }
 
-    def _analyze_timeline_factors(
-        self, ppa, actual_progress: float, velocity: float, delay_days: Optional[int]
-    ) -> List[str]:
+    @staticmethod
+    def _delay_days(timeline, row) -> Optional[int]:
+        delay = timeline['delay'][row]
+        return None if np.isnan(delay) else int(delay)
+
+    # ------------------------------------------------------------------ #
+    # Timeline factors
+    # ------------------------------------------------------------------ #
+
+    def _add_ai_timeline_factors(self, ppas, timeline, results) -> None:
         """
-        Analyze factors affecting timeline using AI.
+        Replace fallback factors with AI-generated ones.
 
-        Returns:
-            List of factor descriptions
+        Prompts for the whole portfolio are sent as one concurrent batch;
+        PPAs whose response cannot be parsed keep their fallback factors.
         """
-        prompt = f"""
+        rows = [
+            row for row, result in results.items()
+            if 'error' not in result['timeline']
+        ]
+        if not rows:
+            return
+
+        prompts = [
+            self._timeline_factors_prompt(
+                ppas[row],
+                float(timeline['progress'][row]),
+                float(timeline['velocity'][row]),
+                self._delay_days(timeline, row),
+            )
+            for row in rows
+        ]
+
+        try:
+            responses = self.gemini.generate_batch(
+                prompts,
+                use_cache=True,
+                cache_ttl=3600,  # 1 hour
+                include_cultural_context=False
+            )
+        except Exception as e:
+            logger.warning(f"AI factor analysis failed: {e}")
+            return
+
+        for row, response in zip(rows, responses):
+            factors = self._parse_timeline_factors(response)
+            if factors:
+                results[row]['timeline']['factors'] = factors
+
+    def _timeline_factors_prompt(
+        self, ppa, actual_progress: float, velocity: float, delay_days: Optional[int]
+    ) -> str:
+        """Prompt asking for factors affecting the timeline."""
+        return f"""
 Analyze timeline factors for this government project:
 
 - Project: {ppa.title}
@@ -403,14 +556,9 @@ Return ONLY valid JSON array (no markdown):
 ["Factor 1", "Factor 2", ...]
 """
 
+    def _parse_timeline_factors(self, response: Dict) -> Optional[List[str]]:
+        """Factor list from an AI response, or None when unusable."""
         try:
-            response = self.gemini.generate_text(
-                prompt,
-                use_cache=True,
-                cache_ttl=3600,  # 1 hour
-                include_cultural_context=False
-            )
-
             if response['success']:
                 text = response['text'].strip()
                 if text.startswith('```'):
@@ -426,7 +574,12 @@ Return ONLY valid JSON array (no markdown):
         except Exception as e:
             logger.warning(f"AI factor analysis failed: {e}")
 
-        # Fallback factors
+        return None
+
+    def _fallback_timeline_factors(
+        self, actual_progress: float, velocity: float, delay_days: Optional[int]
+    ) -> List[str]:
+        """Rule-based timeline factors."""
         factors = []
         if delay_days and delay_days > 0:
             factors.append(f"Current trajectory indicates {delay_days}-day delay")
@@ -437,6 +590,14 @@ Return ONLY valid JSON array (no markdown):
 
         return factors or ["Insufficient data for detailed factor analysis"]
 
+    def _get_confidence_level(self, confidence: float) -> str:
+        """Convert confidence score to level."""
+        if confidence >= self.HIGH_CONFIDENCE:
+            return 'HIGH'
+        elif confidence >= self.MEDIUM_CONFIDENCE:
+            return 'MEDIUM'
+        return 'LOW'
+
     def _analyze_spending_trend(
         self, current_spending: float, budget: float, progress: float
     ) -> str:
@@ -453,52 +614,6 @@ Return ONLY valid JSON array (no markdown):
         else:
             return "Steady (aligned with progress)"
 
-    def _score_timeline_health(self, timeline_forecast: Dict) -> float:
-        """Score timeline health (0-1)."""
-        if 'error' in timeline_forecast:
-            return 0.5
-
-        delay_days = timeline_forecast.get('delay_days', 0)
-
-        if delay_days <= 0:
-            return 1.0  # On time or early
-        elif delay_days <= 7:
-            return 0.8  # Slight delay
-        elif delay_days <= 14:
-            return 0.6  # Moderate delay
-        elif delay_days <= 30:
-            return 0.4  # Significant delay
-        else:
-            return 0.2  # Critical delay
-
-    def _score_budget_health(self, budget_forecast: Dict) -> float:
-        """Score budget health (0-1)."""
-        if 'error' in budget_forecast:
-            return 0.5
-
-        variance_percent = budget_forecast.get('variance_percent', 0)
-
-        if variance_percent <= 0:
-            return 1.0  # Under budget
-        elif variance_percent <= 5:
-            return 0.9  # Slight overrun
-        elif variance_percent <= 10:
-            return 0.7  # Moderate overrun
-        elif variance_percent <= 20:
-            return 0.5  # Significant overrun
-        else:
-            return 0.3  # Critical overrun
-
-    def _score_status_health(self, ppa) -> float:
-        """Score based on current status."""
-        status_scores = {
-            'completed': 1.0,
-            'ongoing': 0.7,
-            'planning': 0.5,
-            'on_hold': 0.2,
-        }
-        return status_scores.get(ppa.status, 0.5)
-
     def _identify_risk_factors(self, ppa, timeline_forecast, budget_forecast) -> List[str]:
         """Identify risk factors threatening success."""
         risks = []
@@ -14,7 +14,7 @@ import json
 import logging
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from django.db.models import Avg, Count, Q, Sum
 from django.utils import timezone
@@ -84,8 +84,8 @@ class MEReportGenerator:
         challenges = self._identify_challenges(ppas, stats)
 
         # Generate AI narrative sections
-        executive_summary = self._generate_executive_summary(
-            quarter, year, stats, top_projects, challenges
+        executive_summary, recommendations = self._generate_ai_sections(
+            quarter, year, stats, top_projects, challenges, underperforming
         )
 
         performance_overview = self._generate_performance_overview(
@@ -94,10 +94,6 @@ class MEReportGenerator:
 
         budget_analysis = self._generate_budget_analysis(stats)
 
-        recommendations = self._generate_recommendations(
-            stats, challenges, underperforming
-        )
-
         report = {
             'report_type': 'quarterly',
             'period': f'{quarter} {year}',
@@ -435,11 +431,49 @@ Use professional government report style. Return plain text (no JSON).
             f"on track with balanced progress"
         )
 
-    def _generate_executive_summary(
+    def _generate_ai_sections(
+        self, quarter, year, stats, top_projects, challenges, underperforming
+    ) -> Tuple[str, List[str]]:
+        """
+        Generate the executive summary and recommendations.
+
+        Both prompts are independent, so they are sent as one concurrent
+        batch; a section whose response is unusable gets its fallback.
+        """
+        prompts = [
+            self._executive_summary_prompt(quarter, year, stats, top_projects, challenges),
+            self._recommendations_prompt(stats, challenges, underperforming),
+        ]
+
+        try:
+            summary_response, recommendations_response = self.gemini.generate_batch(
+                prompts,
+                use_cache=True,
+                cache_ttl=86400,
+                include_cultural_context=False
+            )
+        except Exception as e:
+            logger.error(f"Error generating report narrative: {e}")
+            summary_response = recommendations_response = {'success': False}
+
+        if summary_response['success']:
+            executive_summary = summary_response['text']
+        else:
+            executive_summary = self._generate_fallback_executive_summary(
+                quarter, year, stats
+            )
+
+        recommendations = self._parse_recommendations(recommendations_response)
+        if recommendations is None:
+            recommendations = self._fallback_recommendations()
+
+        return executive_summary, recommendations
+
+    def _executive_summary_prompt(
         self, quarter, year, stats, top_projects, challenges
     ) -> str:
-        """Generate AI-powered executive summary."""
-        prompt = f"""
+        """Prompt for the AI-powered executive summary."""
+        return f"""
 Generate a professional executive summary for a quarterly M&E report:
 
 **Period:** {quarter} {year}
@@ -463,23 +497,6 @@ Professional government report style.
 Return plain text only.
 """
 
-        try:
-            response = self.gemini.generate_text(
-                prompt,
-                use_cache=True,
-                cache_ttl=86400,
-                include_cultural_context=False
-            )
-
-            if response['success']:
-                return response['text']
-
-        except Exception as e:
-            logger.error(f"Error generating executive summary: {e}")
-
-        # Fallback
-        return self._generate_fallback_executive_summary(quarter, year, stats)
-
     def _generate_performance_overview(self, stats, top_projects, underperforming) -> str:
         """Generate performance overview section."""
         return f"""
@@ -512,9 +529,9 @@ Return plain text only.
 The disbursement rate of {stats['disbursement_rate']:.1f}% indicates {"strong" if stats['disbursement_rate'] > 70 else "moderate" if stats['disbursement_rate'] > 50 else "weak"} financial implementation during the period.
 """
 
-    def _generate_recommendations(self, stats, challenges, underperforming) -> List[str]:
-        """Generate AI-powered recommendations."""
-        prompt = f"""
+    def _recommendations_prompt(self, stats, challenges, underperforming) -> str:
+        """Prompt for the AI-powered recommendations."""
+        return f"""
 Based on this M&E data, provide 5 specific recommendations for improving project performance:
 
 **Statistics:**
@@ -533,30 +550,30 @@ Return ONLY a valid JSON array (no markdown):
 ["Recommendation 1", "Recommendation 2", ...]
 """
 
-        try:
-            response = self.gemini.generate_text(
-                prompt,
-                use_cache=True,
-                cache_ttl=86400,
-                include_cultural_context=False
-            )
+    def _parse_recommendations(self, response: Dict) -> Optional[List[str]]:
+        """Parse recommendations from an AI response, None if unusable."""
+        if not response['success']:
+            return None
 
-            if response['success']:
-                text = response['text'].strip()
-                if text.startswith('```'):
-                    text = text.split('```')[1]
-                    if text.startswith('json'):
-                        text = text[4:]
-                    text = text.strip()
+        try:
+            text = response['text'].strip()
+            if text.startswith('```'):
+                text = text.split('```')[1]
+                if text.startswith('json'):
+                    text = text[4:]
+                text = text.strip()
 
-                recommendations = json.loads(text)
-                if isinstance(recommendations, list):
-                    return recommendations[:5]
+            recommendations = json.loads(text)
+            if isinstance(recommendations, list):
+                return recommendations[:5]
 
         except Exception as e:
             logger.error(f"Error generating recommendations: {e}")
 
-        # Fallback
+        return None
+
+    def _fallback_recommendations(self) -> List[str]:
+        """Fallback recommendations when AI fails."""
         return [
             "Accelerate disbursement processes to improve implementation rate",
             "Provide technical assistance to underperforming projects",
@@ -22,6 +22,8 @@ from django.utils import timezone
 
 from ai_assistant.services.gemini_service import GeminiService
 
+from .features import milestone_counts, related_count, with_portfolio_features
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,10 +66,34 @@ class RiskAnalyzer:
         from monitoring.models import MonitoringEntry
 
         try:
-            ppa = MonitoringEntry.objects.with_funding_totals().get(id=ppa_id)
+            ppa = with_portfolio_features(MonitoringEntry.objects.filter(id=ppa_id)).get()
         except MonitoringEntry.DoesNotExist:
             return {'error': f'PPA {ppa_id} not found'}
 
+        analysis = self._assess_ppa(ppa)
+
+        # AI-generated mitigation recommendations
+        analysis['mitigation_recommendations'] = self._generate_mitigation_recommendations(
+            ppa, analysis['identified_risks']
+        )
+        analysis['analysis_date'] = date.today().isoformat()
+
+        logger.info(
+            f"Risk analysis for PPA {ppa_id}: {analysis['risk_level']} "
+            f"(score: {analysis['overall_risk_score']:.2f})"
+        )
+
+        return analysis
+
+    def _assess_ppa(self, ppa) -> Dict:
+        """
+        Score a PPA loaded through ``with_portfolio_features()``.
+
+        Runs no queries, so a portfolio can be scored in memory.
+
+        Returns:
+            Risk scores, level, categories and top identified risks
+        """
         # Analyze different risk dimensions
         budget_risk = self._analyze_budget_risk(ppa)
         timeline_risk = self._analyze_timeline_risk(ppa)
@@ -96,12 +122,7 @@ class RiskAnalyzer:
         # Sort risks by severity
         identified_risks = self._prioritize_risks(identified_risks)
 
-        # AI-generated mitigation recommendations
-        mitigation_recommendations = self._generate_mitigation_recommendations(
-            ppa, identified_risks
-        )
-
-        analysis = {
+        return {
             'ppa_id': ppa.id,
             'ppa_name': ppa.title,
             'overall_risk_score': round(overall_risk_score, 2),
@@ -129,21 +150,16 @@ class RiskAnalyzer:
                 }
             },
             'identified_risks': identified_risks[:10],  # Top 10
-            'mitigation_recommendations': mitigation_recommendations,
-            'analysis_date': date.today().isoformat(),
         }
 
-        logger.info(
-            f"Risk analysis for PPA {ppa_id}: {risk_level} "
-            f"(score: {overall_risk_score:.2f})"
-        )
-
-        return analysis
-
     def analyze_portfolio_risks(self, ministry: Optional[str] = None) -> Dict:
         """
         Analyze risks across entire PPA portfolio.
 
+        All PPAs are loaded with their scoring inputs in one query and
+        scored in memory; per-PPA mitigation recommendations are left to
+        ``analyze_ppa_risks()``.
+
         Args:
             ministry: Filter by ministry (optional)
 
@@ -163,7 +179,8 @@ class RiskAnalyzer:
                 Q(implementing_moa__name__icontains=ministry)
             )
 
-        ppas = ppas.with_funding_totals()
+        # Load every scoring input for the portfolio in one query
+        ppas = with_portfolio_features(ppas)
 
         # Analyze each PPA
         high_risk_ppas = []
@@ -171,7 +188,7 @@ class RiskAnalyzer:
 
         for ppa in ppas:
             try:
-                analysis = self.analyze_ppa_risks(ppa.id)
+                analysis = self._assess_ppa(ppa)
                 risk_scores.append(analysis['overall_risk_score'])
 
                 if analysis['risk_level'] in ['CRITICAL', 'HIGH']:
@@ -402,7 +419,7 @@ class RiskAnalyzer:
 
         # Risk: Multiple implementing organizations (coordination complexity)
         if hasattr(ppa, 'supporting_organizations'):
-            supporting_count = ppa.supporting_organizations.count()
+            supporting_count = related_count(ppa, 'supporting_organizations')
             if supporting_count > 3:
                 risk_score += 0.15
                 risks.append({
@@ -413,7 +430,7 @@ class RiskAnalyzer:
 
         # Risk: Multi-community coverage (wider scope)
         if hasattr(ppa, 'communities'):
-            community_count = ppa.communities.count()
+            community_count = related_count(ppa, 'communities')
             if community_count > 5:
                 risk_score += 0.1
                 risks.append({
@@ -446,12 +463,10 @@ class RiskAnalyzer:
     def _get_actual_progress(self, ppa) -> float:
         """Get actual project progress (0.0 to 1.0)."""
         # Try milestones
-        milestones = getattr(ppa, 'milestones', None)
-        if milestones and milestones.exists():
-            total = milestones.count()
-            completed = milestones.filter(status='completed').count()
-            if total > 0:
-                return completed / total
+        counts = milestone_counts(ppa)
+        if counts:
+            completed, total = counts
+            return completed / total
 
         # Fallback to status
         status_progress = {
@@ -8,7 +8,7 @@ import logging
 from datetime import timedelta
 from django.utils import timezone
 from django.urls import reverse
-from django.db.models import Q, Sum, Count, F
+from django.db.models import Exists, OuterRef, Q, Sum, Count, F
 from decimal import Decimal
 
 from project_central.models import Alert, BudgetCeiling, ProjectWorkflow
@@ -32,8 +32,34 @@ class AlertService:
     - Approval bottlenecks
     - Disbursement delays
     - Under/overspending
+
+    Each generator selects its candidates with a single query that
+    anti-joins active alerts of the same type, then inserts the new alerts
+    with ``bulk_create`` in batches of ``BULK_CREATE_BATCH_SIZE``.
     """
 
+    BULK_CREATE_BATCH_SIZE = 500
+
+    @staticmethod
+    def _without_active_alert(queryset, alert_type, related_field):
+        """Exclude rows that already have an active alert of ``alert_type``."""
+        return queryset.filter(
+            ~Exists(
+                Alert.objects.filter(
+                    alert_type=alert_type,
+                    is_active=True,
+                    **{related_field: OuterRef("pk")},
+                )
+            )
+        )
+
+    @classmethod
+    def _bulk_create_alerts(cls, alerts):
+        """Insert unsaved Alert instances in batches; return how many."""
+        if alerts:
+            Alert.objects.bulk_create(alerts, batch_size=cls.BULK_CREATE_BATCH_SIZE)
+        return len(alerts)
+
     @classmethod
     def generate_daily_alerts(cls):
         """
@@ -130,175 +156,173 @@ class AlertService:
     @classmethod
     def generate_unfunded_needs_alerts(cls):
         """Generate alerts for unfunded high-priority needs."""
-        # Find high-priority needs without linked PPAs
-        unfunded_needs = Need.objects.filter(
-            Q(linked_ppa__isnull=True),
-            Q(priority_score__gte=4.0),
-            Q(status__in=["validated", "prioritized"]),
-        ).select_related("community", "assessment")
-
-        # Check if alert already exists for these needs
-        existing_alert_need_ids = Alert.objects.filter(
-            alert_type="unfunded_needs",
-            is_active=True,
-        ).values_list("related_need_id", flat=True)
+        # Find high-priority needs without linked PPAs or an active alert
+        unfunded_needs = cls._without_active_alert(
+            Need.objects.filter(
+                Q(linked_ppa__isnull=True),
+                Q(priority_score__gte=4.0),
+                Q(status__in=["validated", "prioritized"]),
+            ),
+            "unfunded_needs",
+            "related_need",
+        )
 
-        count = 0
+        expires_at = timezone.now() + timedelta(days=30)
+        alerts = []
         for need in unfunded_needs:
-            # Skip if alert already exists for this need
-            if need.id in existing_alert_need_ids:
-                continue
-
             # Calculate estimated budget
             estimated_budget = getattr(need, "estimated_cost", None) or 0
 
-            alert = Alert.create_alert(
-                alert_type="unfunded_needs",
-                severity="high" if need.priority_score >= 4.5 else "medium",
-                title=f"Unfunded High-Priority Need: {need.title}",
-                description=f"This need has priority score {need.priority_score:.1f} but no PPA has been created to address it. Estimated budget: ₱{estimated_budget:,.2f}",
-                related_need=need,
-                action_url=f"/admin/mana/need/{need.id}/change/",
-                alert_data={
-                    "need_id": need.id,
-                    "priority_score": float(need.priority_score),
-                    "estimated_budget": float(estimated_budget),
-                },
-                expires_at=timezone.now() + timedelta(days=30),
+            alerts.append(
+                Alert(
+                    alert_type="unfunded_needs",
+                    severity="high" if need.priority_score >= 4.5 else "medium",
+                    title=f"Unfunded High-Priority Need: {need.title}",
+                    description=f"This need has priority score {need.priority_score:.1f} but no PPA has been created to address it. Estimated budget: ₱{estimated_budget:,.2f}",
+                    related_need=need,
+                    action_url=f"/admin/mana/need/{need.id}/change/",
+                    alert_data={
+                        "need_id": need.id,
+                        "priority_score": float(need.priority_score),
+                        "estimated_budget": float(estimated_budget),
+                    },
+                    expires_at=expires_at,
+                )
             )
-            count += 1
-            logger.info(f"Created unfunded needs alert for need {need.id}")
 
+        count = cls._bulk_create_alerts(alerts)
+        logger.info(f"Created {count} unfunded needs alerts")
         return count
 
     @classmethod
     def generate_overdue_ppa_alerts(cls):
         """Generate alerts for overdue PPAs."""
-        # Find PPAs with missed milestones or overdue target dates
-        overdue_ppas = MonitoringEntry.objects.filter(
-            status="ongoing",
-        ).select_related("lead_organization")
+        today = timezone.now().date()
 
-        count = 0
+        # Find ongoing PPAs past their target end date without an active alert
+        overdue_ppas = cls._without_active_alert(
+            MonitoringEntry.objects.filter(
+                status="ongoing",
+                target_end_date__lt=today,
+            ),
+            "overdue_ppa",
+            "related_ppa",
+        )
+
+        alerts = []
         for ppa in overdue_ppas:
-            # Check if there's a target end date and if it's overdue
-            target_end = getattr(ppa, "target_end_date", None)
-            if target_end and target_end < timezone.now().date():
-                days_overdue = (timezone.now().date() - target_end).days
+            target_end = ppa.target_end_date
+            days_overdue = (today - target_end).days
 
-                # Check if alert already exists
-                existing_alert = Alert.objects.filter(
+            alerts.append(
+                Alert(
                     alert_type="overdue_ppa",
+                    severity="high" if days_overdue > 30 else "medium",
+                    title=f"PPA Overdue: {ppa.title}",
+                    description=f"This PPA is {days_overdue} days past its target end date ({target_end}). Current progress: {ppa.progress}%",
                     related_ppa=ppa,
-                    is_active=True,
-                ).exists()
-
-                if not existing_alert:
-                    Alert.create_alert(
-                        alert_type="overdue_ppa",
-                        severity="high" if days_overdue > 30 else "medium",
-                        title=f"PPA Overdue: {ppa.title}",
-                        description=f"This PPA is {days_overdue} days past its target end date ({target_end}). Current progress: {ppa.progress}%",
-                        related_ppa=ppa,
-                        action_url=f"/monitoring/entry/{ppa.id}/",
-                        alert_data={
-                            "ppa_id": ppa.id,
-                            "days_overdue": days_overdue,
-                            "progress": ppa.progress,
-                        },
-                    )
-                    count += 1
+                    action_url=f"/monitoring/entry/{ppa.id}/",
+                    alert_data={
+                        "ppa_id": str(ppa.id),
+                        "days_overdue": days_overdue,
+                        "progress": ppa.progress,
+                    },
+                )
+            )
 
-        return count
+        return cls._bulk_create_alerts(alerts)
 
     @classmethod
     def generate_budget_ceiling_alerts(cls):
         """Generate alerts for budget ceilings approaching limits."""
         current_year = timezone.now().year
 
+        # Alert at 90% threshold
         ceilings = BudgetCeiling.objects.filter(
             fiscal_year=current_year,
             is_active=True,
+            ceiling_amount__gt=0,
+            allocated_amount__gte=F("ceiling_amount") * Decimal("0.9"),
         )
 
-        count = 0
+        # Skip ceilings with a recent alert (within last 7 days)
+        recently_alerted = set(
+            Alert.objects.filter(
+                alert_type="budget_ceiling",
+                is_active=True,
+                created_at__gte=timezone.now() - timedelta(days=7),
+            ).values_list("alert_data__ceiling_id", flat=True)
+        )
+
+        expires_at = timezone.now() + timedelta(days=14)
+        alerts = []
         for ceiling in ceilings:
-            utilization_pct = ceiling.get_utilization_percentage()
+            if str(ceiling.id) in recently_alerted:
+                continue
 
-            # Alert at 90% threshold
-            if utilization_pct >= 90:
-                # Check if recent alert exists (within last 7 days)
-                recent_alert = Alert.objects.filter(
+            utilization_pct = ceiling.get_utilization_percentage()
+            alerts.append(
+                Alert(
                     alert_type="budget_ceiling",
-                    alert_data__ceiling_id=str(ceiling.id),
-                    is_active=True,
-                    created_at__gte=timezone.now() - timedelta(days=7),
-                ).exists()
-
-                if not recent_alert:
-                    Alert.create_alert(
-                        alert_type="budget_ceiling",
-                        severity="critical" if utilization_pct >= 98 else "high",
-                        title=f"Budget Ceiling Alert: {ceiling.name}",
-                        description=f"Budget ceiling at {utilization_pct:.1f}% utilization. Allocated: ₱{ceiling.allocated_amount:,.2f} of ₱{ceiling.ceiling_amount:,.2f}. Remaining: ₱{ceiling.get_remaining_amount():,.2f}",
-                        action_url=f"/admin/project_central/budgetceiling/{ceiling.id}/change/",
-                        alert_data={
-                            "ceiling_id": str(ceiling.id),
-                            "utilization_pct": utilization_pct,
-                            "allocated_amount": float(ceiling.allocated_amount),
-                            "ceiling_amount": float(ceiling.ceiling_amount),
-                            "remaining_amount": float(ceiling.get_remaining_amount()),
-                        },
-                        expires_at=timezone.now() + timedelta(days=14),
-                    )
-                    count += 1
+                    severity="critical" if utilization_pct >= 98 else "high",
+                    title=f"Budget Ceiling Alert: {ceiling.name}",
+                    description=f"Budget ceiling at {utilization_pct:.1f}% utilization. Allocated: ₱{ceiling.allocated_amount:,.2f} of ₱{ceiling.ceiling_amount:,.2f}. Remaining: ₱{ceiling.get_remaining_amount():,.2f}",
+                    action_url=f"/admin/project_central/budgetceiling/{ceiling.id}/change/",
+                    alert_data={
+                        "ceiling_id": str(ceiling.id),
+                        "utilization_pct": float(utilization_pct),
+                        "allocated_amount": float(ceiling.allocated_amount),
+                        "ceiling_amount": float(ceiling.ceiling_amount),
+                        "remaining_amount": float(ceiling.get_remaining_amount()),
+                    },
+                    expires_at=expires_at,
+                )
+            )
 
-        return count
+        return cls._bulk_create_alerts(alerts)
 
     @classmethod
     def generate_approval_bottleneck_alerts(cls):
         """Generate alerts for PPAs stuck in approval stages."""
         # Find PPAs in approval for more than 30 days
-        cutoff_date = timezone.now() - timedelta(days=30)
-
-        stuck_ppas = MonitoringEntry.objects.filter(
-            approval_status__in=[
-                MonitoringEntry.APPROVAL_STATUS_TECHNICAL_REVIEW,
-                MonitoringEntry.APPROVAL_STATUS_BUDGET_REVIEW,
-                MonitoringEntry.APPROVAL_STATUS_STAKEHOLDER_CONSULTATION,
-                MonitoringEntry.APPROVAL_STATUS_EXECUTIVE_APPROVAL,
-            ],
-            created_at__lt=cutoff_date,
+        now = timezone.now()
+        cutoff_date = now - timedelta(days=30)
+
+        stuck_ppas = cls._without_active_alert(
+            MonitoringEntry.objects.filter(
+                approval_status__in=[
+                    MonitoringEntry.APPROVAL_STATUS_TECHNICAL_REVIEW,
+                    MonitoringEntry.APPROVAL_STATUS_BUDGET_REVIEW,
+                    MonitoringEntry.APPROVAL_STATUS_STAKEHOLDER_CONSULTATION,
+                    MonitoringEntry.APPROVAL_STATUS_EXECUTIVE_APPROVAL,
+                ],
+                created_at__lt=cutoff_date,
+            ),
+            "approval_bottleneck",
+            "related_ppa",
         )
 
-        count = 0
+        alerts = []
         for ppa in stuck_ppas:
-            # Check if alert already exists
-            existing_alert = Alert.objects.filter(
-                alert_type="approval_bottleneck",
-                related_ppa=ppa,
-                is_active=True,
-            ).exists()
-
-            if not existing_alert:
-                days_in_approval = (timezone.now() - ppa.created_at).days
+            days_in_approval = (now - ppa.created_at).days
 
-                Alert.create_alert(
+            alerts.append(
+                Alert(
                     alert_type="approval_bottleneck",
                     severity="high" if days_in_approval > 60 else "medium",
                     title=f"Approval Bottleneck: {ppa.title}",
-                    description=f"PPA has been in {ppa.get_approval_status_display()} stage for {days_in_approval} days. Budget: ₱{ppa.budget_allocation:,.2f}",
+                    description=f"PPA has been in {ppa.get_approval_status_display()} stage for {days_in_approval} days. Budget: ₱{ppa.budget_allocation or 0:,.2f}",
                     related_ppa=ppa,
                     action_url=reverse("monitoring:monitoring_entry_detail", kwargs={"entry_id": ppa.id}),
                     alert_data={
-                        "ppa_id": ppa.id,
+                        "ppa_id": str(ppa.id),
                         "days_in_approval": days_in_approval,
                         "approval_status": ppa.approval_status,
                     },
                 )
-                count += 1
+            )
 
-        return count
+        return cls._bulk_create_alerts(alerts)
 
     @classmethod
     def generate_disbursement_delay_alerts(cls):
@@ -353,22 +377,19 @@ class AlertService:
     @classmethod
     def generate_workflow_blocked_alerts(cls):
         """Generate alerts for blocked workflows."""
-        blocked_workflows = ProjectWorkflow.objects.filter(
-            is_blocked=True,
-            is_on_track=False,
+        blocked_workflows = cls._without_active_alert(
+            ProjectWorkflow.objects.filter(
+                is_blocked=True,
+                is_on_track=False,
+            ),
+            "workflow_blocked",
+            "related_workflow",
         ).select_related("primary_need", "project_lead")
 
-        count = 0
+        alerts = []
         for workflow in blocked_workflows:
-            # Check if alert already exists
-            existing_alert = Alert.objects.filter(
-                alert_type="workflow_blocked",
-                related_workflow=workflow,
-                is_active=True,
-            ).exists()
-
-            if not existing_alert:
-                Alert.create_alert(
+            alerts.append(
+                Alert(
                     alert_type="workflow_blocked",
                     severity="high",
                     title=f"Workflow Blocked: {workflow.primary_need.title}",
@@ -380,9 +401,9 @@ class AlertService:
                         "current_stage": workflow.current_stage,
                     },
                 )
-                count += 1
+            )
 
-        return count
+        return cls._bulk_create_alerts(alerts)
 
     @classmethod
     def deactivate_resolved_alerts(cls):
@@ -46,7 +46,7 @@ class AnalyticsService:
 
     @classmethod
     def _monitoring_queryset(cls, fiscal_year: Optional[int] = None):
-        qs = MonitoringEntry.objects.all()
+        qs = MonitoringEntry.objects.with_funding_totals()
         if fiscal_year:
             qs = qs.filter(fiscal_year=fiscal_year)
         return qs.select_related("coverage_region")
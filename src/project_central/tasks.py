@@ -634,7 +634,7 @@ def detect_daily_anomalies_task():
         timeline_delays = detector.detect_timeline_delays()
 
         # Get summary
-        summary = detector.get_anomaly_summary()
+        summary = detector.get_anomaly_summary(budget_anomalies, timeline_delays)
 
         # Cache results for dashboard (24 hours)
         cache.set('ppa_budget_anomalies', budget_anomalies, timeout=86400)
@@ -834,19 +834,18 @@ def update_ppa_forecasts_task():
             status__in=['planning', 'ongoing']
         )
 
-        timeline_forecasts = {}
-        budget_forecasts = {}
-        success_estimates = {}
+        # Generate forecasts for the whole portfolio at once
+        forecasts = forecaster.forecast_portfolio(ppas, include_factors=True)
 
-        for ppa in ppas:
-            try:
-                # Generate forecasts
-                timeline_forecasts[ppa.id] = forecaster.forecast_completion_date(ppa.id)
-                budget_forecasts[ppa.id] = forecaster.forecast_budget_utilization(ppa.id)
-                success_estimates[ppa.id] = forecaster.estimate_success_probability(ppa.id)
-
-            except Exception as e:
-                logger.error(f"[AI FORECAST] Error forecasting PPA {ppa.id}: {e}")
+        timeline_forecasts = {
+            ppa_id: forecast['timeline'] for ppa_id, forecast in forecasts.items()
+        }
+        budget_forecasts = {
+            ppa_id: forecast['budget'] for ppa_id, forecast in forecasts.items()
+        }
+        success_estimates = {
+            ppa_id: forecast['success'] for ppa_id, forecast in forecasts.items()
+        }
 
         # Cache forecasts (7 days)
         cache.set('ppa_timeline_forecasts', timeline_forecasts, timeout=604800)
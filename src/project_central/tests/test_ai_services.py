@@ -0,0 +1,311 @@
+"""
+Tests for portfolio scoring in the Project Central AI services.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from monitoring.models import MonitoringEntry, MonitoringEntryFunding
+from project_central.ai_services import PPAAnomalyDetector, RiskAnalyzer
+
+
+class PortfolioScoringTestCase(TestCase):
+    """Portfolio paths score PPAs from one annotated query."""
+
+    def setUp(self):
+        patcher = patch("project_central.ai_services.risk_analyzer.GeminiService")
+        self.risk_gemini = patcher.start().return_value
+        self.risk_gemini.generate_text.return_value = {"success": False}
+        self.addCleanup(patcher.stop)
+
+        patcher = patch("project_central.ai_services.anomaly_detector.GeminiService")
+        self.anomaly_gemini = patcher.start().return_value
+        self.anomaly_gemini.generate_text.return_value = {"success": False}
+        self.addCleanup(patcher.stop)
+
+    def create_ppa(
+        self, title, spent, days_elapsed=200, days_total=300, status="ongoing", **extra
+    ):
+        today = date.today()
+        ppa = MonitoringEntry.objects.create(
+            title=title,
+            category="project",
+            status=status,
+            sector="infrastructure",
+            budget_allocation=Decimal("2000000.00"),
+            start_date=today - timedelta(days=days_elapsed),
+            target_end_date=today - timedelta(days=days_elapsed) + timedelta(days=days_total),
+            **extra,
+        )
+        MonitoringEntryFunding.objects.create(
+            entry=ppa, tranche_type="disbursement", amount=Decimal(spent)
+        )
+        return ppa
+
+    def test_portfolio_matches_single_ppa_analysis(self):
+        """Portfolio scores are the ones analyze_ppa_risks() reports."""
+        ppas = [
+            self.create_ppa("Overspent Bridge", "1900000.00"),
+            self.create_ppa("Late Road", "100000.00", days_elapsed=400),
+            self.create_ppa(
+                "Stalled Donor Plan",
+                "2600000.00",
+                days_elapsed=400,
+                status="planning",
+                funding_source="donor",
+            ),
+        ]
+
+        analyzer = RiskAnalyzer()
+        portfolio = analyzer.analyze_portfolio_risks()
+        singles = [analyzer.analyze_ppa_risks(ppa.id) for ppa in ppas]
+
+        scores = [single["overall_risk_score"] for single in singles]
+        self.assertEqual(portfolio["total_ppas_analyzed"], 3)
+        self.assertEqual(portfolio["average_risk_score"], round(sum(scores) / 3, 2))
+        self.assertEqual(portfolio["max_risk_score"], max(scores))
+
+        high_risk = [s for s in singles if s["risk_level"] in ("CRITICAL", "HIGH")]
+        self.assertTrue(high_risk)
+        by_id = {item["ppa_id"]: item for item in portfolio["high_risk_ppas"]}
+        for single in high_risk:
+            self.assertEqual(by_id[single["ppa_id"]]["risk_score"], single["overall_risk_score"])
+            self.assertEqual(by_id[single["ppa_id"]]["top_risks"], single["identified_risks"][:3])
+
+    def test_portfolio_query_count_is_constant(self):
+        """Scoring more PPAs does not issue more queries or AI calls."""
+        self.create_ppa("PPA 1", "1900000.00")
+        analyzer = RiskAnalyzer()
+
+        with CaptureQueriesContext(connection) as baseline:
+            analyzer.analyze_portfolio_risks()
+
+        for index in range(5):
+            self.create_ppa(f"PPA extra {index}", "1900000.00")
+
+        with CaptureQueriesContext(connection) as queries:
+            portfolio = analyzer.analyze_portfolio_risks()
+
+        self.assertEqual(portfolio["total_ppas_analyzed"], 6)
+        self.assertEqual(len(queries), len(baseline))
+        self.risk_gemini.generate_text.assert_not_called()
+
+    def test_anomaly_summary_skips_recommendations(self):
+        """The summary counts anomalies without asking for recommendations."""
+        self.create_ppa("Overspent Bridge", "1900000.00")
+        self.create_ppa("Slow School", "10000.00", days_elapsed=280, status="planning")
+
+        detector = PPAAnomalyDetector()
+        with CaptureQueriesContext(connection) as queries:
+            summary = detector.get_anomaly_summary()
+
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(summary["total_budget_anomalies"], 2)
+        self.assertEqual(summary["total_timeline_delays"], 2)
+        self.anomaly_gemini.generate_text.assert_not_called()
+
+    def test_detected_anomalies_keep_recommendations(self):
+        """Direct detection still returns (fallback) recommendations."""
+        self.create_ppa("Overspent Bridge", "1900000.00")
+
+        anomalies = PPAAnomalyDetector().detect_budget_anomalies()
+
+        self.assertEqual(anomalies[0]["anomaly_type"], "budget_overrun")
+        self.assertTrue(anomalies[0]["recommendations"])
+
+
+class PortfolioForecastTestCase(TestCase):
+    """PerformanceForecaster forecasts whole portfolios with array operations."""
+
+    def setUp(self):
+        patcher = patch("project_central.ai_services.performance_forecaster.GeminiService")
+        self.gemini = patcher.start().return_value
+        self.gemini.generate_batch.side_effect = lambda prompts, **kwargs: [
+            {"success": True, "text": '["AI factor"]'} for _ in prompts
+        ]
+        self.addCleanup(patcher.stop)
+
+        from project_central.ai_services import PerformanceForecaster
+
+        self.forecaster = PerformanceForecaster()
+
+    def create_ppa(self, title, spent="600000.00", status="ongoing", **extra):
+        today = date.today()
+        defaults = {
+            "start_date": today - timedelta(days=100),
+            "target_end_date": today + timedelta(days=100),
+            "budget_allocation": Decimal("2000000.00"),
+        }
+        defaults.update(extra)
+        ppa = MonitoringEntry.objects.create(
+            title=title, category="project", status=status, **defaults
+        )
+        MonitoringEntryFunding.objects.create(
+            entry=ppa, tranche_type="disbursement", amount=Decimal(spent)
+        )
+        return ppa
+
+    def test_forecast_values(self):
+        """Progress, velocity, dates and spending follow the forecasting rules."""
+        ppa = self.create_ppa("On Track Road")
+
+        forecast = self.forecaster.forecast_portfolio()[ppa.id]
+
+        timeline = forecast["timeline"]
+        self.assertEqual(timeline["current_progress"], 0.5)
+        self.assertEqual(timeline["velocity"], 0.005)
+        self.assertEqual(
+            timeline["predicted_completion"], (date.today() + timedelta(days=100)).isoformat()
+        )
+        self.assertTrue(timeline["is_on_time"])
+        self.assertEqual(timeline["confidence"], 0.9)
+
+        budget = forecast["budget"]
+        self.assertEqual(budget["predicted_total_spending"], 1200000.0)
+        self.assertEqual(budget["variance_percent"], -40.0)
+        self.assertTrue(budget["is_within_budget"])
+
+        success = forecast["success"]
+        self.assertEqual(success["success_probability"], 0.94)
+        self.assertEqual(success["success_rating"], "EXCELLENT")
+
+    def test_single_ppa_methods_are_views_of_the_portfolio(self):
+        """Single-PPA methods return exactly the portfolio entries."""
+        late = self.create_ppa(
+            "Late Bridge",
+            spent="1900000.00",
+            start_date=date.today() - timedelta(days=300),
+            target_end_date=date.today() - timedelta(days=10),
+        )
+        undated = self.create_ppa("Undated Plan", status="planning", start_date=None)
+        unfunded = self.create_ppa("Unfunded Survey", budget_allocation=None)
+
+        portfolio = self.forecaster.forecast_portfolio(include_factors=True)
+
+        for ppa in (late, undated, unfunded):
+            self.assertEqual(
+                self.forecaster.forecast_completion_date(ppa.id), portfolio[ppa.id]["timeline"]
+            )
+            self.assertEqual(
+                self.forecaster.forecast_budget_utilization(ppa.id), portfolio[ppa.id]["budget"]
+            )
+            self.assertEqual(
+                self.forecaster.estimate_success_probability(ppa.id), portfolio[ppa.id]["success"]
+            )
+
+        self.assertIn("error", portfolio[undated.id]["timeline"])
+        self.assertIn("error", portfolio[unfunded.id]["budget"])
+        self.assertEqual(portfolio[late.id]["timeline"]["factors"], ["AI factor"])
+        self.assertGreater(portfolio[late.id]["timeline"]["delay_days"], 0)
+
+    def test_portfolio_cost_does_not_grow_with_ppas(self):
+        """One query and one AI batch regardless of portfolio size."""
+        for index in range(6):
+            self.create_ppa(f"PPA {index}")
+
+        with CaptureQueriesContext(connection) as queries:
+            forecasts = self.forecaster.forecast_portfolio(include_factors=True)
+
+        self.assertEqual(len(forecasts), 6)
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(self.gemini.generate_batch.call_count, 1)
+        self.assertEqual(len(self.gemini.generate_batch.call_args[0][0]), 6)
+
+    def test_failing_ppas_are_skipped(self):
+        """A PPA whose forecast raises is logged and left out of the portfolio."""
+        healthy = self.create_ppa("Healthy Road")
+        bad_inputs = self.create_ppa("Bad Inputs")
+        bad_result = self.create_ppa("Bad Result")
+
+        def counts(ppa):
+            if ppa.id == bad_inputs.id:
+                raise ValueError("corrupt milestones")
+            return None
+
+        identify = self.forecaster._identify_risk_factors
+
+        def risk_factors(ppa, *args):
+            if ppa.id == bad_result.id:
+                raise ValueError("corrupt forecast")
+            return identify(ppa, *args)
+
+        with patch(
+            "project_central.ai_services.performance_forecaster.milestone_counts",
+            side_effect=counts,
+        ), patch.object(
+            self.forecaster, "_identify_risk_factors", side_effect=risk_factors
+        ), self.assertLogs(
+            "project_central.ai_services.performance_forecaster", "ERROR"
+        ) as logs:
+            forecasts = self.forecaster.forecast_portfolio(include_factors=True)
+
+        self.assertEqual(list(forecasts), [healthy.id])
+        self.assertEqual(len(logs.records), 2)
+
+    def test_missing_ppa(self):
+        """Unknown PPAs report an error."""
+        self.assertIn("error", self.forecaster.forecast_completion_date(999999))
+
+
+class QuarterlyReportTestCase(TestCase):
+    """MEReportGenerator requests the report narrative as one AI batch."""
+
+    def setUp(self):
+        patcher = patch("project_central.ai_services.report_generator.GeminiService")
+        self.gemini = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+
+        from project_central.ai_services import MEReportGenerator
+
+        self.generator = MEReportGenerator()
+
+    def generate_sections(self):
+        stats = {
+            "total_ppas": 4,
+            "status_breakdown": {"planning": 0, "ongoing": 3, "completed": 1, "on_hold": 0},
+            "total_budget": Decimal("4000000.00"),
+            "disbursement_rate": 55.0,
+            "average_budget_utilization": 48.0,
+        }
+        return self.generator._generate_ai_sections(
+            "Q1", 2025, stats, [], ["Slow procurement"], []
+        )
+
+    def test_narrative_sections_share_one_batch(self):
+        """The summary and recommendations come from a single batch call."""
+        self.gemini.generate_batch.return_value = [
+            {"success": True, "text": "AI summary"},
+            {"success": True, "text": '```json\n["Do this", "Do that"]\n```'},
+        ]
+
+        summary, recommendations = self.generate_sections()
+
+        self.assertEqual(self.gemini.generate_batch.call_count, 1)
+        self.assertEqual(len(self.gemini.generate_batch.call_args[0][0]), 2)
+        self.gemini.generate_text.assert_not_called()
+        self.assertEqual(summary, "AI summary")
+        self.assertEqual(recommendations, ["Do this", "Do that"])
+
+    def test_failed_sections_fall_back(self):
+        """Each section falls back on its own when its response is unusable."""
+        self.gemini.generate_batch.return_value = [
+            {"success": True, "text": "AI summary"},
+            {"success": False, "text": "", "error": "quota"},
+        ]
+
+        summary, recommendations = self.generate_sections()
+
+        self.assertEqual(summary, "AI summary")
+        self.assertEqual(len(recommendations), 5)
+
+        self.gemini.generate_batch.side_effect = RuntimeError("unavailable")
+
+        summary, recommendations = self.generate_sections()
+
+        self.assertIn("Executive Summary - Q1 2025", summary)
+        self.assertEqual(len(recommendations), 5)
@@ -7,6 +7,7 @@ All tests pass without complex dependencies.
 Run: cd src && ../venv/bin/python manage.py test project_central.tests
 """
 
+from datetime import timedelta
 from decimal import Decimal
 
 import pytest
@@ -126,6 +127,93 @@ class AlertServiceTestCase(TestCase):
         self.assertTrue(hasattr(AlertService, "deactivate_resolved_alerts"))
 
 
+class AlertGenerationTestCase(TestCase):
+    """Tests for set-based alert generation."""
+
+    def create_overdue_ppa(self, title, days_overdue):
+        today = timezone.now().date()
+        return MonitoringEntry.objects.create(
+            title=title,
+            category="project",
+            status="ongoing",
+            progress=40,
+            budget_allocation=Decimal("100000.00"),
+            start_date=today - timedelta(days=400),
+            target_end_date=today - timedelta(days=days_overdue),
+        )
+
+    def test_overdue_ppa_alerts_are_created_in_bulk(self):
+        """Overdue PPAs get one alert each, with unchanged severity rules."""
+        late = self.create_overdue_ppa("Late Project", 45)
+        recent = self.create_overdue_ppa("Recently Late Project", 5)
+        for index in range(5):
+            self.create_overdue_ppa(f"Late Project {index}", 10)
+
+        with self.assertNumQueries(2):  # candidates + one batched insert
+            count = AlertService.generate_overdue_ppa_alerts()
+
+        self.assertEqual(count, 7)
+        self.assertEqual(Alert.objects.get(related_ppa=late).severity, "high")
+        self.assertEqual(Alert.objects.get(related_ppa=recent).severity, "medium")
+        self.assertEqual(
+            Alert.objects.get(related_ppa=late).alert_data["days_overdue"], 45
+        )
+
+    def test_active_alerts_are_not_duplicated(self):
+        """PPAs with an active alert are skipped; inactive alerts do not count."""
+        alerted = self.create_overdue_ppa("Alerted Project", 10)
+        resolved = self.create_overdue_ppa("Resolved Project", 10)
+        Alert.create_alert(
+            alert_type="overdue_ppa",
+            severity="medium",
+            title="Existing",
+            description="Existing",
+            related_ppa=alerted,
+        )
+        Alert.create_alert(
+            alert_type="overdue_ppa",
+            severity="medium",
+            title="Old",
+            description="Old",
+            related_ppa=resolved,
+            is_active=False,
+        )
+
+        self.assertEqual(AlertService.generate_overdue_ppa_alerts(), 1)
+        self.assertEqual(AlertService.generate_overdue_ppa_alerts(), 0)
+        self.assertEqual(
+            Alert.objects.filter(related_ppa=resolved, is_active=True).count(), 1
+        )
+
+    def test_budget_ceiling_alerts_respect_threshold_and_recent_alerts(self):
+        """Ceilings at 90%+ are alerted once per week; 98%+ is critical."""
+        year = timezone.now().year
+        critical = BudgetCeiling.objects.create(
+            name="Critical Ceiling",
+            fiscal_year=year,
+            ceiling_amount=Decimal("1000.00"),
+            allocated_amount=Decimal("990.00"),
+        )
+        BudgetCeiling.objects.create(
+            name="High Ceiling",
+            fiscal_year=year,
+            ceiling_amount=Decimal("1000.00"),
+            allocated_amount=Decimal("900.00"),
+        )
+        BudgetCeiling.objects.create(
+            name="Healthy Ceiling",
+            fiscal_year=year,
+            ceiling_amount=Decimal("1000.00"),
+            allocated_amount=Decimal("899.99"),
+        )
+
+        self.assertEqual(AlertService.generate_budget_ceiling_alerts(), 2)
+        self.assertEqual(AlertService.generate_budget_ceiling_alerts(), 0)
+        alert = Alert.objects.get(alert_data__ceiling_id=str(critical.id))
+        self.assertEqual(alert.severity, "critical")
+        self.assertEqual(alert.alert_data["utilization_pct"], 99.0)
+
+
 class AnalyticsServiceTestCase(TestCase):
     """Tests for AnalyticsService."""
 